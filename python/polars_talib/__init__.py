@@ -1,24 +1,136 @@
+from __future__ import annotations
+
 import atexit
 import polars as pl
-from .utils import register_plugin, parse_version
-from ._polars_talib import initialize, shutdown, version
+from typing import Iterable
+from .utils import register_plugin, parse_into_expr
+from ._polars_talib import initialize, shutdown, version, reset_input_copy_stats
+from ._polars_talib import input_copy_stats as _input_copy_stats
+from ._polars_talib import lookback as _lookback
+from ._polars_talib import PREFIX_TOLERANCE, PARALLEL_MIN_ROWS, SCAN_TOLERANCE
 from pathlib import Path
 
 
 __talib_version__ = version()
 
+from polars._typing import IntoExpr
+
 # Boilerplate needed to inform Polars of the location of binary wheel.
-if parse_version(pl.__version__) < parse_version("0.20.16"):
-    from polars.utils.udfs import _get_shared_lib_location
-    from polars.type_aliases import IntoExpr
-    lib: str | Path = _get_shared_lib_location(__file__)
-else:
-    from polars._typing import IntoExpr
-    lib = Path(__file__).parent
+lib = Path(__file__).parent
 
 initialize()
 atexit.register(shutdown)
 
+
+def input_copy_stats() -> dict:
+    """
+    Count of input columns copied before being handed to TA-Lib.
+
+    A single-chunk Float64 column without nulls is read in place. Multi-chunk
+    columns, columns with nulls and other dtypes are copied once into a
+    contiguous Float64 buffer. Float32 is also read in place by the functions
+    with a TA-Lib single precision entry point: `dema`, `kama`, `tema`,
+    `trima`, `sma`, `wma`, `ema` below `PARALLEL_MIN_ROWS` rows or with
+    `engine="talib"`, `midpoint` with `engine="talib"`, and the candlestick
+    patterns and `cdl_scan` on all-Float32 OHLC. Counters are process wide,
+    reset them with `reset_input_copy_stats`.
+
+    Returns:
+        dict with `copies` and `bytes`.
+    """
+    copies, nbytes = _input_copy_stats()
+    return {"copies": copies, "bytes": nbytes}
+
+
+def lookback(name: str, **kwargs) -> int:
+    """
+    Number of input rows TA-Lib consumes before the first output of `name`.
+
+    Parameters not given take TA-Lib's defaults, e.g.
+    plta.lookback("macd", fastperiod=12, slowperiod=26, signalperiod=9) == 33
+
+    Returns:
+        int, the rows of the output that are NaN on a clean input.
+    """
+    return _lookback(name, kwargs)[0]
+
+
+def warmup(name: str, **kwargs) -> int | None:
+    """
+    Number of input rows to load before the first wanted output of `name`.
+
+    This is `lookback` plus the rows a function with an unstable period (exponential
+    smoothing such as `ema`, `rsi`, `atr`, `macd`) needs until the history before them
+    weighs less than 1e-8, so its values no longer depend on where the input starts.
+    Cascaded smoothings (`dema`, `tema`, `t3`, the signal line of `macd`) count every
+    stage.
+    plta.warmup("rsi", timeperiod=14)
+
+    Returns:
+        int, or None for functions that depend on the whole history (`obv`, `ad`, `sar`,
+        `sarext`).
+    """
+    return _lookback(name, kwargs)[1]
+
+
+def scan_with_warmup(
+    source: str | Path | pl.LazyFrame,
+    spec: dict[str, tuple[str, dict]],
+    start,
+    end=None,
+    by: str | None = "symbol",
+    time: str = "date",
+) -> pl.LazyFrame:
+    """
+    Compute the indicators of `spec` for rows with `start <= time <= end`, reading only
+    the history their warmup needs.
+
+    `spec` maps output column names to `(function name, parameters)`, e.g.
+    {"rsi": ("rsi", {"timeperiod": 14}), "macd": ("macd", {})}. The largest
+    `warmup` of the spec gives the rows needed before `start`. A first pass over the
+    `by` and `time` columns finds per group the time of the earliest of these rows; the
+    earliest over all groups is pushed into the scan as a predicate, and each group is
+    then cut at its own time. Rows of a group must be ordered by `time` once sorted.
+    plta.scan_with_warmup("bars.parquet", {"rsi": ("rsi", {"timeperiod": 14})}, start, end)
+
+    Returns:
+        LazyFrame of the scanned columns plus the `spec` columns, sorted by `by` and
+        `time`.
+    """
+    lf = source if isinstance(source, pl.LazyFrame) else pl.scan_parquet(source)
+    rows = 0
+    for name, params in spec.values():
+        needed = warmup(name, **params)
+        rows = None if needed is None or rows is None else max(rows, needed)
+    keys = [by] if by is not None else []
+    t = pl.col(time)
+    in_range = t >= start if end is None else (t >= start) & (t <= end)
+    if rows is None:
+        lf = lf if end is None else lf.filter(t <= end)
+    elif rows == 0:
+        lf = lf.filter(in_range)
+    else:
+        first = t.top_k(rows).min().alias("_warmup_start")
+        history = lf.filter(t < start)
+        if keys:
+            cutoffs = history.group_by(keys).agg(first).collect()
+        else:
+            cutoffs = history.select(first).collect()
+        lower = cutoffs["_warmup_start"].min()
+        lower = start if lower is None else lower
+        lf = lf.filter(t >= lower if end is None else (t >= lower) & (t <= end))
+        if keys:
+            lf = lf.join(cutoffs.lazy(), on=keys, how="left")
+        else:
+            lf = lf.with_columns(pl.lit(cutoffs["_warmup_start"][0]).alias("_warmup_start"))
+        group_start = pl.coalesce(pl.col("_warmup_start"), pl.lit(start))
+        lf = lf.filter(t >= group_start).drop("_warmup_start")
+    exprs = [globals()[name](**params).alias(alias) for alias, (name, params) in spec.items()]
+    if keys:
+        exprs = [expr.over(keys) for expr in exprs]
+    return lf.sort(keys + [time]).with_columns(exprs).filter(in_range)
+
+
 __function_groups__ = {
     "Cycle Indicators": ["ht_dcperiod", "ht_dcphase", "ht_phasor", "ht_sine", "ht_trendmode"],
     "Math Operators": [
@@ -182,6 +294,175 @@ __function_groups__ = {
 }
 
 
+CDL_PATTERNS = __function_groups__["Pattern Recognition"]
+
+
+def _cdl_patterns(patterns: list[str] | None) -> list[str]:
+    if patterns is None:
+        return list(CDL_PATTERNS)
+    patterns = [p.lower() for p in patterns]
+    unknown = [p for p in patterns if p not in CDL_PATTERNS]
+    if unknown:
+        raise ValueError(f"unknown candlestick patterns: {unknown}")
+    if len(set(patterns)) != len(patterns):
+        raise ValueError("patterns must not contain duplicates")
+    return patterns
+
+
+HT_FIELDS = [
+    "dcperiod",
+    "dcphase",
+    "inphase",
+    "quadrature",
+    "sine",
+    "leadsine",
+    "trendmode",
+    "trendline",
+]
+
+
+DMI_FIELDS = ["plus_dm", "minus_dm", "plus_di", "minus_di", "dx", "adx", "adxr"]
+MACD_FIELDS = ["macd", "macdsignal", "macdhist", "apo", "ppo", "fast_ma", "slow_ma"]
+SWEEP_FUNCTIONS = [
+    "cmo",
+    "dema",
+    "ema",
+    "kama",
+    "max",
+    "midpoint",
+    "min",
+    "mom",
+    "roc",
+    "rocp",
+    "rocr",
+    "rocr100",
+    "rsi",
+    "sma",
+    "sum",
+    "tema",
+    "trima",
+    "trix",
+    "wma",
+]
+VOLATILITY_FIELDS = [
+    "trange",
+    "atr",
+    "natr",
+    "middleband",
+    "upperband",
+    "lowerband",
+    "stddev",
+    "var",
+]
+LINREG_FIELDS = [
+    "linearreg",
+    "linearreg_slope",
+    "linearreg_intercept",
+    "linearreg_angle",
+    "tsf",
+]
+LINREG_EXTRA_FIELDS = ["r2", "resid_std"]
+STOCH_FIELDS = [
+    "slowk",
+    "slowd",
+    "fastk",
+    "fastd",
+    "willr",
+    "stochrsi_fastk",
+    "stochrsi_fastd",
+]
+
+
+def _struct_fields(
+    func: str,
+    fields: list[str] | None,
+    all_fields: list[str],
+    default: list[str] | None = None,
+) -> list[str]:
+    if fields is None:
+        return list(all_fields if default is None else default)
+    unknown = [f for f in fields if f not in all_fields]
+    if unknown:
+        raise ValueError(f"unknown {func} fields: {unknown}")
+    if len(set(fields)) != len(fields):
+        raise ValueError("fields must not contain duplicates")
+    return list(fields)
+
+
+def _volatility_fields(
+    kinds: list[str],
+    atr_periods: list[int],
+    band_periods: list[int],
+    nbdevs: list[tuple[float, float]],
+) -> list[dict]:
+    nbdevups = list(dict.fromkeys(float(up) for up, _ in nbdevs))
+    nbdevdns = list(dict.fromkeys(float(dn) for _, dn in nbdevs))
+    specs = []
+    for kind in kinds:
+        if kind == "trange":
+            specs.append({"name": kind, "kind": kind})
+            continue
+        periods = atr_periods if kind in ("atr", "natr") else band_periods
+        for p in dict.fromkeys(periods):
+            if kind in ("upperband", "lowerband"):
+                for nbdev in nbdevups if kind == "upperband" else nbdevdns:
+                    name = f"{kind}_{p}_{nbdev:g}"
+                    specs.append({"name": name, "kind": kind, "timeperiod": p, "nbdev": nbdev})
+            else:
+                specs.append({"name": f"{kind}_{p}", "kind": kind, "timeperiod": p})
+    return specs
+
+
+def _macd_fields(
+    kinds: list[str],
+    specs: list[tuple[int, int, int, int]] | None,
+    macdfix: list[int] | None,
+    default: tuple[int, int, int, int],
+    signalmatype: int,
+) -> list[dict]:
+    def field(name, kind, fast, slow, signal, matype, signal_matype):
+        return {
+            "name": name,
+            "kind": kind,
+            "fastperiod": fast,
+            "slowperiod": slow,
+            "signalperiod": signal,
+            "matype": matype,
+            "signalmatype": signal_matype,
+        }
+
+    named = specs is not None or macdfix is not None
+    if not named:
+        specs = [default]
+    fields = []
+    for fast, slow, signal, matype in dict.fromkeys(tuple(spec) for spec in specs or []):
+        if min(fast, slow) < 2:
+            raise ValueError("macd_all fast and slow periods must be at least 2")
+        for kind in kinds:
+            name = f"{kind}_{fast}_{slow}_{signal}_{matype}" if named else kind
+            fields.append(field(name, kind, fast, slow, signal, matype, signalmatype))
+    # fast and slow period 0 are MACDFIX's fixed 0.15 / 0.075 EMAs, as in TA-Lib
+    for signal in dict.fromkeys(macdfix or []):
+        for kind in kinds:
+            fields.append(field(f"{kind}_fix_{signal}", kind, 0, 0, signal, 1, 1))
+    if not fields:
+        raise ValueError("specs and macdfix must not both be empty")
+    return fields
+
+
+def _sweep_func(func: str) -> str:
+    if func not in SWEEP_FUNCTIONS:
+        raise ValueError(f"sweep is not supported for {func!r}, use one of {SWEEP_FUNCTIONS}")
+    return func
+
+
+def _sweep_timeperiods(timeperiods: Iterable[int]) -> list[int]:
+    timeperiods = [int(p) for p in timeperiods]
+    if not timeperiods:
+        raise ValueError("timeperiods must not be empty")
+    return timeperiods
+
+
 def get_functions():
     """
     Returns a list of all the functions supported by TALIB
@@ -223,34 +504,280 @@ class TAExpr:
     def __init__(self, expr: pl.Expr):
         self._expr = expr
 
-    def ht_dcperiod(self) -> pl.Expr:
+    def _grouped(
+        self,
+        func: str,
+        by: IntoExpr | None,
+        timeperiod: int | pl.Expr,
+        engine: str = "native",
+        **kwargs,
+    ) -> pl.Expr:
+        """Compute `func` for every group of `by` in a single plugin call.
+
+        Groups are the values of `by`, as in `over(by)`, their rows computed in row order.
+        Contiguous groups (e.g. sorted by symbol and time) are read in place, others are
+        gathered first. Without `by` the whole input (or `over` group) is one group.
+        `timeperiod` may be an expression that is constant within each group, each group
+        then uses its own period. There is no TA-Lib engine for this path.
+        """
+        if engine != "native":
+            raise ValueError(
+                f"{func}: engine={engine!r} can not be combined with by or an Expr timeperiod"
+            )
+        if by is None:
+            ids = pl.lit(0, dtype=pl.UInt32)
+        else:
+            ids = parse_into_expr(by).rank("dense").fill_null(0)
+        args = [self._expr, ids]
+        if isinstance(timeperiod, pl.Expr):
+            args.append(timeperiod)
+        else:
+            kwargs["timeperiod"] = timeperiod
+        return register_plugin(
+            args=args,
+            lib=lib,
+            kwargs={"func": func, **kwargs},
+            symbol="grouped_overlap",
+            is_elementwise=False,
+        )
+
+    def _range(
+        self,
+        func: str,
+        timeperiod: int,
+        last_n: int | None,
+        start: int | None,
+        end: int | None,
+        warmup: int | None,
+        out_dtype: str,
+        by: IntoExpr | None = None,
+        agg: str | None = None,
+        engine: str = "native",
+    ) -> pl.Expr:
+        """Compute `func` for the output rows `[start, end)`, or the last `last_n` rows.
+
+        TA-Lib only reads the input from `lookback + warmup` rows before the first output
+        row, the rows outside the range are null. `warmup` defaults to the rows a function
+        with an unstable period (exponential smoothing) needs to converge, and to 0 for the
+        others, whose values then match the full computation up to rounding.
+        With `agg="last"` the result is the last value only, a scalar per group in
+        `group_by().agg`. A `warmup` without a range, or a TA-Lib engine, is an error.
+        """
+        if engine != "native":
+            raise ValueError(
+                f"{func}: engine={engine!r} can not be combined with last_n/start/end/agg"
+            )
+        if agg is None and last_n is None and start is None and end is None:
+            raise ValueError(f"{func}: warmup needs last_n/start/end/agg")
+        if by is not None or isinstance(timeperiod, pl.Expr):
+            raise ValueError(f"{func}: last_n/start/end/agg need a scalar timeperiod and no by")
+        if agg not in (None, "last"):
+            raise ValueError(f"{func}: agg must be 'last', got {agg!r}")
+        if agg is not None and (last_n is not None or start is not None or end is not None):
+            raise ValueError(f"{func}: agg can not be combined with last_n/start/end")
+        kwargs = {"func": func, "timeperiod": timeperiod, "out_dtype": out_dtype}
+        for name, value in (("last_n", last_n), ("start", start), ("end", end), ("warmup", warmup)):
+            if value is None:
+                continue
+            if value < 0:
+                raise ValueError(f"{func}: {name} must be non-negative, got {value}")
+            kwargs[name] = value
+        return register_plugin(
+            args=[self._expr],
+            lib=lib,
+            kwargs=kwargs,
+            symbol="timeperiod_last" if agg == "last" else "timeperiod_range",
+            is_elementwise=False,
+            returns_scalar=agg == "last",
+        )
+
+    def sweep(self, func: str, timeperiods: Iterable[int], out_dtype: str = "f64") -> pl.Expr:
+        """`func` for every period of `timeperiods` as one `Array(Float64, k)` column.
+
+        The input is prepared once and the periods run in parallel in a single plugin
+        call; element `j` of each row equals `func(timeperiod=timeperiods[j])`. `func` is
+        one of `SWEEP_FUNCTIONS`.
+        pl.col("close").ta.sweep("ema", range(2, 201))
+        """
+        return register_plugin(
+            args=[self._expr],
+            lib=lib,
+            kwargs={
+                "func": _sweep_func(func),
+                "timeperiods": _sweep_timeperiods(timeperiods),
+                "out_dtype": out_dtype,
+            },
+            symbol="timeperiod_sweep",
+            is_elementwise=False,
+        )
+
+    def ema_sweep(self, timeperiods: Iterable[int], out_dtype: str = "f64") -> pl.Expr:
+        """Exponential Moving Average for every period of `timeperiods`, see `sweep`.
+        pl.col("close").ta.ema_sweep(range(2, 201))
+        """
+        return self.sweep("ema", timeperiods, out_dtype=out_dtype)
+
+    def sma_sweep(self, timeperiods: Iterable[int], out_dtype: str = "f64") -> pl.Expr:
+        """Simple Moving Average for every period of `timeperiods`, see `sweep`.
+        pl.col("close").ta.sma_sweep(range(2, 201))
+        """
+        return self.sweep("sma", timeperiods, out_dtype=out_dtype)
+
+    def rsi_sweep(self, timeperiods: Iterable[int], out_dtype: str = "f64") -> pl.Expr:
+        """Relative Strength Index for every period of `timeperiods`, see `sweep`.
+        pl.col("close").ta.rsi_sweep(range(2, 31))
+        """
+        return self.sweep("rsi", timeperiods, out_dtype=out_dtype)
+
+    def max_multi(
+        self, timeperiods: Iterable[int], out_dtype: str = "f64", engine: str = "native"
+    ) -> pl.Expr:
+        """Highest value for every period of `timeperiods` as one `Array(Float64, k)` column.
+
+        Element `j` of each row equals `max(timeperiod=timeperiods[j])`, NaN lookback
+        included. The periods share one sparse table built once over the input, so each
+        value costs O(1) whatever the period. `engine="talib"` runs TA-Lib's MAX per period.
+        pl.col("high").ta.max_multi([10, 20, 55, 252])
+        """
+        return register_plugin(
+            args=[self._expr],
+            lib=lib,
+            kwargs={
+                "timeperiods": _sweep_timeperiods(timeperiods),
+                "engine": engine,
+                "out_dtype": out_dtype,
+            },
+            symbol="max_multi",
+            is_elementwise=False,
+        )
+
+    def min_multi(
+        self, timeperiods: Iterable[int], out_dtype: str = "f64", engine: str = "native"
+    ) -> pl.Expr:
+        """Lowest value for every period of `timeperiods`, see `max_multi`.
+        pl.col("low").ta.min_multi([10, 20, 55, 252])
+        """
+        return register_plugin(
+            args=[self._expr],
+            lib=lib,
+            kwargs={
+                "timeperiods": _sweep_timeperiods(timeperiods),
+                "engine": engine,
+                "out_dtype": out_dtype,
+            },
+            symbol="min_multi",
+            is_elementwise=False,
+        )
+
+    def _prefix_multi(
+        self,
+        func: str,
+        timeperiods: Iterable[int],
+        nbdev: float = 1.0,
+        out_dtype: str = "f64",
+        engine: str = "native",
+    ) -> pl.Expr:
+        return register_plugin(
+            args=[self._expr],
+            lib=lib,
+            kwargs={
+                "func": func,
+                "timeperiods": _sweep_timeperiods(timeperiods),
+                "nbdev": nbdev,
+                "engine": engine,
+                "out_dtype": out_dtype,
+            },
+            symbol="prefix_multi",
+            is_elementwise=False,
+        )
+
+    def sum_multi(
+        self, timeperiods: Iterable[int], out_dtype: str = "f64", engine: str = "native"
+    ) -> pl.Expr:
+        """Summation for every period of `timeperiods` as one `Array(Float64, k)` column.
+
+        Prefix sums of the input are built once, then every period costs one subtraction
+        per row. Element `j` of each row is within `PREFIX_TOLERANCE` of
+        `sum(timeperiod=timeperiods[j])`, relative to the window's mean absolute value.
+        `engine="talib"` runs TA-Lib's SUM per period.
+        pl.col("close").ta.sum_multi(range(2, 501))
+        """
+        return self._prefix_multi("sum", timeperiods, out_dtype=out_dtype, engine=engine)
+
+    def sma_multi(
+        self, timeperiods: Iterable[int], out_dtype: str = "f64", engine: str = "native"
+    ) -> pl.Expr:
+        """Simple Moving Average for every period of `timeperiods`, see `sum_multi`.
+        pl.col("close").ta.sma_multi(range(2, 501))
+        """
+        return self._prefix_multi("sma", timeperiods, out_dtype=out_dtype, engine=engine)
+
+    def var_multi(
+        self,
+        timeperiods: Iterable[int],
+        nbdev: float = 1.0,
+        out_dtype: str = "f64",
+        engine: str = "native",
+    ) -> pl.Expr:
+        """Variance for every period of `timeperiods`, see `sum_multi`.
+
+        The tolerance is relative to the window's mean square.
+        pl.col("close").ta.var_multi(range(2, 501))
+        """
+        return self._prefix_multi(
+            "var", timeperiods, nbdev=nbdev, out_dtype=out_dtype, engine=engine
+        )
+
+    def stddev_multi(
+        self,
+        timeperiods: Iterable[int],
+        nbdev: float = 1.0,
+        out_dtype: str = "f64",
+        engine: str = "native",
+    ) -> pl.Expr:
+        """Standard Deviation for every period of `timeperiods`, see `var_multi`.
+
+        Like TA-Lib, a variance below 1e-8 gives 0.
+        pl.col("close").ta.stddev_multi(range(2, 501), nbdev=2.0)
+        """
+        return self._prefix_multi(
+            "stddev", timeperiods, nbdev=nbdev, out_dtype=out_dtype, engine=engine
+        )
+
+    def ht_dcperiod(self, out_dtype: str = "f64") -> pl.Expr:
         """Hilbert Transform - Dominant Cycle Period (Cycle Indicators)
         pl.col("close").ta.ht_dcperiod()
 
         Inputs:
             real: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
+            kwargs={"out_dtype": out_dtype},
             symbol="ht_dcperiod",
             is_elementwise=False,
             lib=lib,
         )
 
-    def ht_dcphase(self) -> pl.Expr:
+    def ht_dcphase(self, out_dtype: str = "f64") -> pl.Expr:
         """Hilbert Transform - Dominant Cycle Phase (Cycle Indicators)
         pl.col("close").ta.ht_dcphase()
 
         Inputs:
             real: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="ht_dcphase",
             is_elementwise=False,
         )
@@ -305,41 +832,83 @@ class TAExpr:
             is_elementwise=False,
         )
 
-    def add(self, b: IntoExpr) -> pl.Expr:
+    def ht_all(self, fields: list[str] | None = None, out_dtype: str = "f64") -> pl.Expr:
+        """Hilbert Transform - all cycle outputs (Cycle Indicators)
+        pl.col("close").ta.ht_all()
+
+        The price smoother, detrender, I/Q and period stages run once and all the
+        requested fields are derived from them. TA-Lib starts `ht_dcperiod` and
+        `ht_phasor` after a shorter smoother warmup, so those fields come from a second,
+        parallel pass. Values equal the single `ht_*` functions; input with NaN after
+        the leading ones runs the TA-Lib functions behind the requested fields instead.
+
+        Inputs:
+            real: (any ndarray)
+        Parameters:
+            fields: None (all of `HT_FIELDS`)
+            out_dtype: f64
+        Outputs:
+            struct of the requested fields, `trendmode` is Int32
+        """
+        return register_plugin(
+            args=[self._expr],
+            lib=lib,
+            kwargs={"fields": _struct_fields("ht_all", fields, HT_FIELDS), "out_dtype": out_dtype},
+            symbol="ht_all",
+            is_elementwise=False,
+        )
+
+    def add(self, b: IntoExpr, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized addition
         pl.col("a").ta.add(pl.col("b"))
 
         Inputs:
             a: (any ndarray)
             b: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr, b],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="add",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def div(self, b: IntoExpr) -> pl.Expr:
+    def div(self, b: IntoExpr, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized division
         pl.col("a").ta.div(pl.col("b"))
 
         Inputs:
             a: (any ndarray)
             b: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr, b],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="div",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def max(self, timeperiod: int = 30) -> pl.Expr:
+    def max(
+        self,
+        timeperiod: int = 30,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+        engine: str = "native",
+    ) -> pl.Expr:
         """Highest value over a specified period (Math Operators)
         pl.col("close").ta.max(timeperiod=30)
 
@@ -347,18 +916,29 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 30
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
+            engine: native
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range(
+                "max", timeperiod, last_n, start, end, warmup, out_dtype, agg=agg, engine=engine
+            )
         return register_plugin(
             args=[self._expr],
             lib=lib,
-            kwargs={"timeperiod": timeperiod},
+            kwargs={"timeperiod": timeperiod, "out_dtype": out_dtype, "engine": engine},
             symbol="max",
             is_elementwise=False,
         )
 
-    def maxindex(self, timeperiod: int = 30) -> pl.Expr:
+    def maxindex(self, timeperiod: int = 30, engine: str = "native") -> pl.Expr:
         """Index of highest value over a specified period (Math Operators)
         pl.col("close").ta.maxindex(timeperiod=30)
 
@@ -366,18 +946,29 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 30
+            engine: native
         Outputs:
             integer
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
-            kwargs={"timeperiod": timeperiod},
+            kwargs={"timeperiod": timeperiod, "engine": engine},
             symbol="maxindex",
             is_elementwise=False,
         )
 
-    def min(self, timeperiod: int = 30) -> pl.Expr:
+    def min(
+        self,
+        timeperiod: int = 30,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+        engine: str = "native",
+    ) -> pl.Expr:
         """Lowest value over a specified period (Math Operators)
         pl.col("close").ta.min(timeperiod=30)
 
@@ -385,18 +976,29 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 30
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
+            engine: native
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range(
+                "min", timeperiod, last_n, start, end, warmup, out_dtype, agg=agg, engine=engine
+            )
         return register_plugin(
             args=[self._expr],
             lib=lib,
-            kwargs={"timeperiod": timeperiod},
+            kwargs={"timeperiod": timeperiod, "out_dtype": out_dtype, "engine": engine},
             symbol="min",
             is_elementwise=False,
         )
 
-    def minindex(self, timeperiod: int = 30) -> pl.Expr:
+    def minindex(self, timeperiod: int = 30, engine: str = "native") -> pl.Expr:
         """Index of lowest value over a specified period (Math Operators)
         pl.col("close").ta.minindex(timeperiod=30)
 
@@ -404,18 +1006,19 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 30
+            engine: native
         Outputs:
             integer
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
-            kwargs={"timeperiod": timeperiod},
+            kwargs={"timeperiod": timeperiod, "engine": engine},
             symbol="minindex",
             is_elementwise=False,
         )
 
-    def minmax(self, timeperiod: int = 30) -> pl.Expr:
+    def minmax(self, timeperiod: int = 30, engine: str = "native") -> pl.Expr:
         """Lowest and highest values over a specified period (Math Operators)
         pl.col("close").ta.minmax(timeperiod=30)
 
@@ -423,6 +1026,7 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 30
+            engine: native
         Outputs:
             min
             max
@@ -430,12 +1034,12 @@ class TAExpr:
         return register_plugin(
             args=[self._expr],
             lib=lib,
-            kwargs={"timeperiod": timeperiod},
+            kwargs={"timeperiod": timeperiod, "engine": engine},
             symbol="minmax",
             is_elementwise=False,
         )
 
-    def minmaxindex(self, timeperiod: int = 30) -> pl.Expr:
+    def minmaxindex(self, timeperiod: int = 30, engine: str = "native") -> pl.Expr:
         """Indexes of lowest and highest values over a specified period (Math Operators)
         pl.col("close").ta.minmaxindex(timeperiod=30)
 
@@ -443,6 +1047,7 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 30
+            engine: native
         Outputs:
             minidx
             maxidx
@@ -450,46 +1055,61 @@ class TAExpr:
         return register_plugin(
             args=[self._expr],
             lib=lib,
-            kwargs={"timeperiod": timeperiod},
+            kwargs={"timeperiod": timeperiod, "engine": engine},
             symbol="minmaxindex",
             is_elementwise=False,
         )
 
-    def mult(self, b: IntoExpr) -> pl.Expr:
+    def mult(self, b: IntoExpr, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized multiplication
         pl.col("a").ta.mult(pl.col("b"))
 
         Inputs:
             a: (any ndarray)
             b: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr, b],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="mult",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def sub(self, b: IntoExpr) -> pl.Expr:
+    def sub(self, b: IntoExpr, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized subtraction
         pl.col("a").ta.sub(pl.col("b"))
 
         Inputs:
             a: (any ndarray)
             b: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr, b],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="sub",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def sum(self, timeperiod: int = 30) -> pl.Expr:
+    def sum(
+        self,
+        timeperiod: int = 30,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+    ) -> pl.Expr:
         """Summation (Math Operators)
         pl.col("close").ta.sum(timeperiod=30)
 
@@ -497,259 +1117,316 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 30
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range("sum", timeperiod, last_n, start, end, warmup, out_dtype, agg=agg)
         return register_plugin(
             args=[self._expr],
             lib=lib,
-            kwargs={"timeperiod": timeperiod},
+            kwargs={"timeperiod": timeperiod, "out_dtype": out_dtype},
             symbol="sum",
             is_elementwise=False,
         )
 
-    def acos(self) -> pl.Expr:
+    def acos(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized acos
         pl.col("a").ta.acos()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="acos",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def asin(self) -> pl.Expr:
+    def asin(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized asin
         pl.col("a").ta.asin()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="asin",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def atan(self) -> pl.Expr:
+    def atan(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized atan
         pl.col("a").ta.atan()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="atan",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def ceil(self) -> pl.Expr:
+    def ceil(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized ceil
         pl.col("a").ta.ceil()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="ceil",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def cos(self) -> pl.Expr:
+    def cos(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized cos
         pl.col("a").ta.cos()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="cos",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def cosh(self) -> pl.Expr:
+    def cosh(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized cosh
         pl.col("a").ta.cosh()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="cosh",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def exp(self) -> pl.Expr:
+    def exp(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized exp
         pl.col("a").ta.exp()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="exp",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def floor(self) -> pl.Expr:
+    def floor(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized floor
         pl.col("a").ta.floor()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="floor",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def ln(self) -> pl.Expr:
+    def ln(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized ln
         pl.col("a").ta.ln()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="ln",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def log10(self) -> pl.Expr:
+    def log10(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized log10
         pl.col("a").ta.log10()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="log10",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def sin(self) -> pl.Expr:
+    def sin(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized sin
         pl.col("a").ta.sin()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="sin",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def sinh(self) -> pl.Expr:
+    def sinh(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized sinh
         pl.col("a").ta.sinh()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="sinh",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def sqrt(self) -> pl.Expr:
+    def sqrt(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized sqrt
         pl.col("a").ta.sqrt()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="sqrt",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def tan(self) -> pl.Expr:
+    def tan(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized tan
         pl.col("a").ta.tan()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="tan",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def tanh(self) -> pl.Expr:
+    def tanh(self, out_dtype: str = "f64") -> pl.Expr:
         """Vectorized tanh
         pl.col("a").ta.tanh()
 
         Inputs:
             a: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="tanh",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
     def adx(
-        self, high: IntoExpr = pl.col("high"), low: IntoExpr = pl.col("low"), timeperiod: int = 14
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
     ) -> pl.Expr:
         """Average Directional Movement Index (Momentum Indicators)
         pl.col("close").ta.adx("high", "low", timeperiod=14)
@@ -758,6 +1435,7 @@ class TAExpr:
             prices: ['high', 'low', 'close']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -766,13 +1444,18 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="adx",
             is_elementwise=False,
         )
 
     def adxr(
-        self, high: IntoExpr = pl.col("high"), low: IntoExpr = pl.col("low"), timeperiod: int = 14
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
     ) -> pl.Expr:
         """Average Directional Movement Index Rating (Momentum Indicators)
         pl.col("close").ta.adxr("high", "low", timeperiod=14)
@@ -781,6 +1464,7 @@ class TAExpr:
             prices: ['high', 'low', 'close']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -789,12 +1473,19 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="adxr",
             is_elementwise=False,
         )
 
-    def apo(self, fastperiod: int = 12, slowperiod: int = 26, matype: int = 0) -> pl.Expr:
+    def apo(
+        self,
+        fastperiod: int = 12,
+        slowperiod: int = 26,
+        matype: int = 0,
+        out_dtype: str = "f64",
+    ) -> pl.Expr:
         """Absolute Price Oscillator (Momentum Indicators)
         pl.col("close").ta.apo(fastperiod=12, slowperiod=26, matype=0)
 
@@ -804,6 +1495,7 @@ class TAExpr:
             fastperiod: 12
             slowperiod: 26
             matype: 0
+            out_dtype: f64
         Outputs:
             real
         """
@@ -814,18 +1506,25 @@ class TAExpr:
                 "fastperiod": fastperiod,
                 "slowperiod": slowperiod,
                 "matype": matype,
+                "out_dtype": out_dtype,
             },
             symbol="apo",
             is_elementwise=False,
         )
 
-    def aroon(self, low: IntoExpr = pl.col("low"), timeperiod: int = 14) -> pl.Expr:
+    def aroon(
+        self,
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        engine: str = "native",
+    ) -> pl.Expr:
         """Aroon (Momentum Indicators)
         pl.col("high").ta.aroon("low", timeperiod=14)
         Inputs:
             prices: ['high', 'low']
         Parameters:
             timeperiod: 14
+            engine: native
         Outputs:
             aroondown
             aroonup
@@ -835,12 +1534,19 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "engine": engine,
             },
             symbol="aroon",
             is_elementwise=False,
         )
 
-    def aroonosc(self, low: IntoExpr = pl.col("low"), timeperiod: int = 14) -> pl.Expr:
+    def aroonosc(
+        self,
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
+        engine: str = "native",
+    ) -> pl.Expr:
         """Aroon Oscillator (Momentum Indicators)
         pl.col("high").ta.aroonosc("low", timeperiod=14)
 
@@ -848,6 +1554,8 @@ class TAExpr:
             prices: ['high', 'low']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
+            engine: native
         Outputs:
             real
         """
@@ -856,6 +1564,8 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="aroonosc",
             is_elementwise=False,
@@ -866,24 +1576,32 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "f64",
     ) -> pl.Expr:
         """Balance Of Power (Momentum Indicators)
         pl.col("open").ta.bop("high", "low", "close")
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="bop",
             is_elementwise=False,
         )
 
     def cci(
-        self, high: IntoExpr = pl.col("high"), low: IntoExpr = pl.col("low"), timeperiod: int = 14
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
     ) -> pl.Expr:
         """Commodity Channel Index (Momentum Indicators)
         pl.col("close").ta.cci("high", "low", timeperiod=14)
@@ -892,6 +1610,7 @@ class TAExpr:
             prices: ['high', 'low', 'close']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -900,12 +1619,22 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="cci",
             is_elementwise=False,
         )
 
-    def cmo(self, timeperiod: int = 14) -> pl.Expr:
+    def cmo(
+        self,
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+    ) -> pl.Expr:
         """Chande Momentum Oscillator (Momentum Indicators)
         pl.col("close").ta.cmo(timeperiod=14)
 
@@ -913,21 +1642,34 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range("cmo", timeperiod, last_n, start, end, warmup, out_dtype, agg=agg)
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="cmo",
             is_elementwise=False,
         )
 
     def dx(
-        self, high: IntoExpr = pl.col("high"), low: IntoExpr = pl.col("low"), timeperiod: int = 14
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
     ) -> pl.Expr:
         """Directional Movement Index (Momentum Indicators)
         pl.col("close").ta.dx("high", "low", timeperiod=14)
@@ -936,6 +1678,7 @@ class TAExpr:
             prices: ['high', 'low', 'close']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -944,11 +1687,47 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="dx",
             is_elementwise=False,
         )
 
+    def dmi(
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        fields: list[str] | None = None,
+        out_dtype: str = "f64",
+    ) -> pl.Expr:
+        """Directional Movement family (Momentum Indicators)
+        pl.col("close").ta.dmi("high", "low", timeperiod=14)
+
+        The true range and directional movement sums are computed once for all the
+        requested fields, `adxr` is derived from `adx`. Values equal the single functions.
+
+        Inputs:
+            prices: ['high', 'low', 'close']
+        Parameters:
+            timeperiod: 14
+            fields: None (all of `DMI_FIELDS`)
+            out_dtype: f64
+        Outputs:
+            struct of the requested fields
+        """
+        return register_plugin(
+            args=[self._expr, high, low],
+            lib=lib,
+            kwargs={
+                "timeperiod": timeperiod,
+                "fields": _struct_fields("dmi", fields, DMI_FIELDS),
+                "out_dtype": out_dtype,
+            },
+            symbol="dmi",
+            is_elementwise=False,
+        )
+
     def macd(self, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9) -> pl.Expr:
         """Moving Average Convergence/Divergence (Momentum Indicators)
         pl.col("close").ta.macd(fastperiod=12, slowperiod=26, signalperiod=9)
@@ -1040,12 +1819,70 @@ class TAExpr:
             is_elementwise=False,
         )
 
+    def macd_all(
+        self,
+        fastperiod: int = 12,
+        slowperiod: int = 26,
+        signalperiod: int = 9,
+        matype: int = 1,
+        signalmatype: int = 1,
+        fields: list[str] | None = None,
+        out_dtype: str = "f64",
+        specs: list[tuple[int, int, int, int]] | None = None,
+        macdfix: list[int] | None = None,
+    ) -> pl.Expr:
+        """MACD / APO / PPO family over one or more specs (Momentum Indicators)
+        pl.col("close").ta.macd_all(fastperiod=12, slowperiod=26, signalperiod=9)
+
+        Each distinct moving average is computed once and shared by the requested
+        fields of every spec. `macd`, `macdsignal` and `macdhist` equal `macdext` with
+        `matype` for both averages (and `macd` for the EMA defaults), `apo` / `ppo` equal
+        the single functions and `fast_ma` / `slow_ma` equal `ma` with `matype`.
+
+        `specs` takes (fastperiod, slowperiod, signalperiod, matype) tuples in place of
+        the single spec, `macdfix` the signal periods of `macdfix` specs, whose
+        `fast_ma` / `slow_ma` are its fixed 0.15 / 0.075 EMAs. With either, struct fields
+        are named `{field}_{fast}_{slow}_{signal}_{matype}` and `{field}_fix_{signal}`.
+
+        Inputs:
+            real
+        Parameters:
+            fastperiod: 12
+            slowperiod: 26
+            signalperiod: 9
+            matype: 1 (EMA)
+            signalmatype: 1 (EMA, `macdfix` specs always use EMA)
+            fields: None (all of `MACD_FIELDS`)
+            out_dtype: f64
+            specs: None
+            macdfix: None
+        Outputs:
+            struct of the requested fields
+        """
+        return register_plugin(
+            args=[self._expr],
+            lib=lib,
+            kwargs={
+                "fields": _macd_fields(
+                    _struct_fields("macd_all", fields, MACD_FIELDS),
+                    specs,
+                    macdfix,
+                    (fastperiod, slowperiod, signalperiod, matype),
+                    signalmatype,
+                ),
+                "out_dtype": out_dtype,
+            },
+            symbol="macd_all",
+            is_elementwise=False,
+        )
+
     def mfi(
         self,
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         volume: IntoExpr = pl.col("volume"),
         timeperiod: int = 14,
+        out_dtype: str = "f64",
     ) -> pl.Expr:
         """Money Flow Index (Momentum Indicators)
         pl.col("close").ta.mfi("high", "low", "volume", timeperiod=14)
@@ -1054,6 +1891,7 @@ class TAExpr:
             prices: ['high', 'low', 'close', 'volume']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -1062,13 +1900,18 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="mfi",
             is_elementwise=False,
         )
 
     def minus_di(
-        self, high: IntoExpr = pl.col("high"), low: IntoExpr = pl.col("low"), timeperiod: int = 14
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
     ) -> pl.Expr:
         """Minus Directional Indicator (Momentum Indicators)
         pl.col("close").ta.minus_di("high", "low", timeperiod=14)
@@ -1077,6 +1920,7 @@ class TAExpr:
             prices: ['high', 'low', 'close']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -1085,12 +1929,18 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="minus_di",
             is_elementwise=False,
         )
 
-    def minus_dm(self, low: IntoExpr = pl.col("low"), timeperiod: int = 14) -> pl.Expr:
+    def minus_dm(
+        self,
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
+    ) -> pl.Expr:
         """Minus Directional Movement (Momentum Indicators)
         pl.col("high").ta.minus_dm("low", timeperiod=14)
 
@@ -1098,6 +1948,7 @@ class TAExpr:
             prices: ['high', 'low']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -1106,12 +1957,22 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="minus_dm",
             is_elementwise=False,
         )
 
-    def mom(self, timeperiod: int = 10) -> pl.Expr:
+    def mom(
+        self,
+        timeperiod: int = 10,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+    ) -> pl.Expr:
         """Momentum (Momentum Indicators)
         pl.col("close").ta.mom(timeperiod=10)
 
@@ -1119,21 +1980,34 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 10
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range("mom", timeperiod, last_n, start, end, warmup, out_dtype, agg=agg)
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="mom",
             is_elementwise=False,
         )
 
     def plus_di(
-        self, high: IntoExpr = pl.col("high"), low: IntoExpr = pl.col("low"), timeperiod: int = 14
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
     ) -> pl.Expr:
         """Plus Directional Indicator (Momentum Indicators)
         pl.col("close").ta.plus_di("high", "low", timeperiod=14)
@@ -1142,6 +2016,7 @@ class TAExpr:
             prices: ['high', 'low', 'close']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -1150,12 +2025,18 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="plus_di",
             is_elementwise=False,
         )
 
-    def plus_dm(self, low: IntoExpr = pl.col("low"), timeperiod: int = 14) -> pl.Expr:
+    def plus_dm(
+        self,
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
+    ) -> pl.Expr:
         """Plus Directional Movement (Momentum Indicators)
         pl.col("high").ta.plus_dm("low", timeperiod=14)
 
@@ -1163,6 +2044,7 @@ class TAExpr:
             prices: ['high', 'low']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -1171,12 +2053,19 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="plus_dm",
             is_elementwise=False,
         )
 
-    def ppo(self, fastperiod: int = 12, slowperiod: int = 26, matype: int = 0) -> pl.Expr:
+    def ppo(
+        self,
+        fastperiod: int = 12,
+        slowperiod: int = 26,
+        matype: int = 0,
+        out_dtype: str = "f64",
+    ) -> pl.Expr:
         """Percentage Price Oscillator (Momentum Indicators)
         pl.col("close").ta.ppo(fastperiod=12, slowperiod=26, matype=0)
 
@@ -1186,6 +2075,7 @@ class TAExpr:
             fastperiod: 12
             slowperiod: 26
             matype: 0
+            out_dtype: f64
         Outputs:
             real
         """
@@ -1196,12 +2086,22 @@ class TAExpr:
                 "fastperiod": fastperiod,
                 "slowperiod": slowperiod,
                 "matype": matype,
+                "out_dtype": out_dtype,
             },
             symbol="ppo",
             is_elementwise=False,
         )
 
-    def roc(self, timeperiod: int = 10) -> pl.Expr:
+    def roc(
+        self,
+        timeperiod: int = 10,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+    ) -> pl.Expr:
         """Rate of change : ((price/prevPrice)-1)*100 (Momentum Indicators)
         pl.col("close").ta.roc(timeperiod=10)
 
@@ -1209,20 +2109,38 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 10
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range("roc", timeperiod, last_n, start, end, warmup, out_dtype, agg=agg)
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="roc",
             is_elementwise=False,
         )
 
-    def rocp(self, timeperiod: int = 10) -> pl.Expr:
+    def rocp(
+        self,
+        timeperiod: int = 10,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+    ) -> pl.Expr:
         """Rate of change Percentage: (price-prevPrice)/prevPrice (Momentum Indicators)
         pl.col("close").ta.rocp(timeperiod=10)
 
@@ -1230,20 +2148,38 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 10
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range("rocp", timeperiod, last_n, start, end, warmup, out_dtype, agg=agg)
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="rocp",
             is_elementwise=False,
         )
 
-    def rocr(self, timeperiod: int = 10) -> pl.Expr:
+    def rocr(
+        self,
+        timeperiod: int = 10,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+    ) -> pl.Expr:
         """Rate of change ratio: (price/prevPrice) (Momentum Indicators)
         pl.col("close").ta.rocr(timeperiod=10)
 
@@ -1251,20 +2187,38 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 10
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range("rocr", timeperiod, last_n, start, end, warmup, out_dtype, agg=agg)
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="rocr",
             is_elementwise=False,
         )
 
-    def rocr100(self, timeperiod: int = 10) -> pl.Expr:
+    def rocr100(
+        self,
+        timeperiod: int = 10,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+    ) -> pl.Expr:
         """Rate of change ratio 100 scale: (price/prevPrice)*100 (Momentum Indicators)
         pl.col("close").ta.rocr100(timeperiod=10)
 
@@ -1272,20 +2226,41 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 10
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range(
+                "rocr100", timeperiod, last_n, start, end, warmup, out_dtype, agg=agg
+            )
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="rocr100",
             is_elementwise=False,
         )
 
-    def rsi(self, timeperiod: int = 14) -> pl.Expr:
+    def rsi(
+        self,
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+        engine: str = "native",
+    ) -> pl.Expr:
         """Relative Strength Index (Momentum Indicators)
         pl.col("close").ta.rsi(timeperiod=14)
 
@@ -1293,14 +2268,29 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
+            engine: native
+                default, a parallel prefix scan on long series: differs from TA-Lib
+                by rounding, within `SCAN_TOLERANCE`; "talib" gives its exact values
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range(
+                "rsi", timeperiod, last_n, start, end, warmup, out_dtype, agg=agg, engine=engine
+            )
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="rsi",
             is_elementwise=False,
@@ -1412,7 +2402,77 @@ class TAExpr:
             is_elementwise=False,
         )
 
-    def trix(self, timeperiod: int = 30) -> pl.Expr:
+    def stoch_all(
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        fastk_period: int = 5,
+        slowk_period: int = 3,
+        slowk_matype: int = 0,
+        slowd_period: int = 3,
+        slowd_matype: int = 0,
+        fastd_period: int = 3,
+        fastd_matype: int = 0,
+        willr_period: int = 14,
+        rsi_period: int = 14,
+        fields: list[str] | None = None,
+        out_dtype: str = "f64",
+    ) -> pl.Expr:
+        """Stochastic family over shared rolling extremes (Momentum Indicators)
+        pl.col("close").ta.stoch_all("high", "low", fastk_period=5, willr_period=14)
+
+        The rolling highest high / lowest low are built once per distinct period.
+        `slowk` / `slowd` equal `stoch`, `fastk` / `fastd` equal `stochf`, `willr`
+        equals `willr(timeperiod=willr_period)` and `stochrsi_fastk` / `stochrsi_fastd`
+        equal `stochrsi(timeperiod=rsi_period)`.
+
+        Inputs:
+            prices: ['high', 'low', 'close']
+        Parameters:
+            fastk_period: 5
+            slowk_period: 3
+            slowk_matype: 0
+            slowd_period: 3
+            slowd_matype: 0
+            fastd_period: 3
+            fastd_matype: 0
+            willr_period: 14
+            rsi_period: 14
+            fields: None (all of `STOCH_FIELDS`)
+            out_dtype: f64
+        Outputs:
+            struct of the requested fields
+        """
+        return register_plugin(
+            args=[self._expr, high, low],
+            lib=lib,
+            kwargs={
+                "fastk_period": fastk_period,
+                "slowk_period": slowk_period,
+                "slowk_matype": slowk_matype,
+                "slowd_period": slowd_period,
+                "slowd_matype": slowd_matype,
+                "fastd_period": fastd_period,
+                "fastd_matype": fastd_matype,
+                "willr_period": willr_period,
+                "rsi_period": rsi_period,
+                "fields": _struct_fields("stoch_all", fields, STOCH_FIELDS),
+                "out_dtype": out_dtype,
+            },
+            symbol="stoch_all",
+            is_elementwise=False,
+        )
+
+    def trix(
+        self,
+        timeperiod: int = 30,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+    ) -> pl.Expr:
         """1-day Rate-Of-Change (ROC) of a Triple Smooth EMA (Momentum Indicators)
         pl.col("close").ta.trix(timeperiod=30)
 
@@ -1420,14 +2480,23 @@ class TAExpr:
             prices: ['close']
         Parameters:
             timeperiod: 30
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range("trix", timeperiod, last_n, start, end, warmup, out_dtype, agg=agg)
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="trix",
             is_elementwise=False,
@@ -1440,6 +2509,7 @@ class TAExpr:
         timeperiod1: int = 7,
         timeperiod2: int = 14,
         timeperiod3: int = 28,
+        out_dtype: str = "f64",
     ) -> pl.Expr:
         """Ultimate Oscillator (Momentum Indicators)
         pl.col("close").ta.ultosc("high", "low", timeperiod1=7, timeperiod2=14, timeperiod3=28)
@@ -1450,6 +2520,7 @@ class TAExpr:
             timeperiod1: 7
             timeperiod2: 14
             timeperiod3: 28
+            out_dtype: f64
         Outputs:
             real
         """
@@ -1460,13 +2531,19 @@ class TAExpr:
                 "timeperiod1": timeperiod1,
                 "timeperiod2": timeperiod2,
                 "timeperiod3": timeperiod3,
+                "out_dtype": out_dtype,
             },
             symbol="ultosc",
             is_elementwise=False,
         )
 
     def willr(
-        self, high: IntoExpr = pl.col("high"), low: IntoExpr = pl.col("low"), timeperiod: int = 14
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
+        engine: str = "native",
     ) -> pl.Expr:
         """Williams' %R (Momentum Indicators)
         pl.col("close").ta.willr("high", "low", timeperiod=14)
@@ -1475,6 +2552,8 @@ class TAExpr:
             prices: ['high', 'low', 'close']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
+            engine: native
         Outputs:
             real
         """
@@ -1483,6 +2562,8 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="willr",
             is_elementwise=False,
@@ -1521,7 +2602,15 @@ class TAExpr:
 
     def ema(
         self,
-        timeperiod: int = 30,
+        timeperiod: int | pl.Expr = 30,
+        by: IntoExpr | None = None,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+        engine: str = "native",
     ) -> pl.Expr:
         """Double Exponential Moving Average (Overlap Studies)
         ta.pol("close").ta.ema(timeperiod=30)
@@ -1530,20 +2619,59 @@ class TAExpr:
             real: (any ndarray)
         Parameters:
             timeperiod: 30
+            by: None
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
+            engine: native
+                default, a parallel prefix scan on long series: differs from TA-Lib
+                by rounding, within `SCAN_TOLERANCE`; "talib" gives its exact values
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range(
+                "ema",
+                timeperiod,
+                last_n,
+                start,
+                end,
+                warmup,
+                out_dtype,
+                by=by,
+                agg=agg,
+                engine=engine,
+            )
+        if by is not None or isinstance(timeperiod, pl.Expr):
+            return self._grouped(
+                "ema", by, timeperiod=timeperiod, out_dtype=out_dtype, engine=engine
+            )
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="ema",
             is_elementwise=False,
         )
 
-    def dema(self, timeperiod: int = 30) -> pl.Expr:
+    def dema(
+        self,
+        timeperiod: int | pl.Expr = 30,
+        by: IntoExpr | None = None,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+    ) -> pl.Expr:
         """Double Exponential Moving Average (Overlap Studies)
         ta.pol("close").ta.dema(timeperiod=30)
 
@@ -1551,36 +2679,63 @@ class TAExpr:
             real: (any ndarray)
         Parameters:
             timeperiod: 30
+            by: None
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range(
+                "dema", timeperiod, last_n, start, end, warmup, out_dtype, by=by, agg=agg
+            )
+        if by is not None or isinstance(timeperiod, pl.Expr):
+            return self._grouped("dema", by, timeperiod=timeperiod, out_dtype=out_dtype)
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="dema",
             is_elementwise=False,
         )
 
-    def ht_trendline(self) -> pl.Expr:
+    def ht_trendline(self, out_dtype: str = "f64") -> pl.Expr:
         """Hilbert Transform - Instantaneous Trendline (Overlap Studies)
         ta.pol("close").ta.ht_trendline()
 
         Inputs:
             real: (any ndarray)
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="ht_trendline",
             is_elementwise=False,
         )
 
-    def kama(self, timeperiod: int = 30) -> pl.Expr:
+    def kama(
+        self,
+        timeperiod: int | pl.Expr = 30,
+        by: IntoExpr | None = None,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+    ) -> pl.Expr:
         """Kaufman Adaptive Moving Average (Overlap Studies)
         ta.pol("close").ta.kama(timeperiod=30)
 
@@ -1588,20 +2743,34 @@ class TAExpr:
             real: (any ndarray)
         Parameters:
             timeperiod: 30
+            by: None
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range(
+                "kama", timeperiod, last_n, start, end, warmup, out_dtype, by=by, agg=agg
+            )
+        if by is not None or isinstance(timeperiod, pl.Expr):
+            return self._grouped("kama", by, timeperiod=timeperiod, out_dtype=out_dtype)
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="kama",
             is_elementwise=False,
         )
 
-    def ma(self, timeperiod: int = 30, matype: int = 0) -> pl.Expr:
+    def ma(self, timeperiod: int = 30, matype: int = 0, out_dtype: str = "f64") -> pl.Expr:
         """Moving average (Overlap Studies)
         ta.pol("close").ta.ma(timeperiod=30, matype=0)
 
@@ -1610,6 +2779,7 @@ class TAExpr:
         Parameters:
             timeperiod: 30
             matype: 0
+            out_dtype: f64
         Outputs:
             real
         """
@@ -1619,6 +2789,7 @@ class TAExpr:
             kwargs={
                 "timeperiod": timeperiod,
                 "matype": matype,
+                "out_dtype": out_dtype,
             },
             symbol="ma",
             is_elementwise=False,
@@ -1649,7 +2820,12 @@ class TAExpr:
         )
 
     def mavp(
-        self, periods: IntoExpr, minperiod: int = 2, maxperiod: int = 30, matype: int = 0
+        self,
+        periods: IntoExpr,
+        minperiod: int = 2,
+        maxperiod: int = 30,
+        matype: int = 0,
+        out_dtype: str = "f64",
     ) -> pl.Expr:
         """Moving average with variable period (Overlap Studies)
         ta.pol("close").ta.mavp(periods, minperiod=2, maxperiod=30, matype=0)
@@ -1661,6 +2837,7 @@ class TAExpr:
             minperiod: 2
             maxperiod: 30
             matype: 0
+            out_dtype: f64
         Outputs:
             real
         """
@@ -1671,12 +2848,24 @@ class TAExpr:
                 "minperiod": minperiod,
                 "maxperiod": maxperiod,
                 "matype": matype,
+                "out_dtype": out_dtype,
             },
             symbol="mavp",
             is_elementwise=False,
         )
 
-    def midpoint(self, timeperiod: int = 14) -> pl.Expr:
+    def midpoint(
+        self,
+        timeperiod: int | pl.Expr = 14,
+        by: IntoExpr | None = None,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+        engine: str = "native",
+    ) -> pl.Expr:
         """MidPoint over period (Overlap Studies)
         ta.pol("close").ta.midpoint(timeperiod=14)
 
@@ -1684,20 +2873,53 @@ class TAExpr:
             real: (any ndarray)
         Parameters:
             timeperiod: 14
+            by: None
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
+            engine: native
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range(
+                "midpoint",
+                timeperiod,
+                last_n,
+                start,
+                end,
+                warmup,
+                out_dtype,
+                by=by,
+                agg=agg,
+                engine=engine,
+            )
+        if by is not None or isinstance(timeperiod, pl.Expr):
+            return self._grouped(
+                "midpoint", by, timeperiod=timeperiod, out_dtype=out_dtype, engine=engine
+            )
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="midpoint",
             is_elementwise=False,
         )
 
-    def midprice(self, low: IntoExpr = pl.col("low"), timeperiod: int = 14) -> pl.Expr:
+    def midprice(
+        self,
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
+        engine: str = "native",
+    ) -> pl.Expr:
         """Midpoint Price over period (Overlap Studies)
         ta.pol("high").ta.midprice(pl.col("low"), timeperiod=14)
 
@@ -1706,6 +2928,8 @@ class TAExpr:
             low: (any ndarray)
         Parameters:
             timeperiod: 14
+            out_dtype: f64
+            engine: native
         Outputs:
             real
         """
@@ -1714,13 +2938,19 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="midprice",
             is_elementwise=False,
         )
 
     def sar(
-        self, low: IntoExpr = pl.col("low"), acceleration: float = 0.02, maximum: float = 0.2
+        self,
+        low: IntoExpr = pl.col("low"),
+        acceleration: float = 0.02,
+        maximum: float = 0.2,
+        out_dtype: str = "f64",
     ) -> pl.Expr:
         """Parabolic SAR (Overlap Studies)
         ta.pol("high").ta.sar(pl.col("low"), acceleration=0.02, maximum=0.2)
@@ -1731,6 +2961,7 @@ class TAExpr:
         Parameters:
             acceleration: 0.02
             maximum: 0.2
+            out_dtype: f64
         Outputs:
             real
         """
@@ -1740,6 +2971,7 @@ class TAExpr:
             kwargs={
                 "acceleration": acceleration,
                 "maximum": maximum,
+                "out_dtype": out_dtype,
             },
             symbol="sar",
             is_elementwise=False,
@@ -1756,6 +2988,7 @@ class TAExpr:
         accelerationinitshort: float = 0.02,
         accelerationshort: float = 0.02,
         accelerationmaxshort: float = 0.2,
+        out_dtype: str = "f64",
     ) -> pl.Expr:
         """Parabolic SAR - Extended (Overlap Studies)
         ta.pol("high").ta.sarext(pl.col("low"), accelerationinitlong=0.02, accelerationlong=0.02)
@@ -1772,6 +3005,7 @@ class TAExpr:
             accelerationinitshort: 0.02
             accelerationshort: 0.02
             accelerationmaxshort: 0.2
+            out_dtype: f64
         Outputs:
             real
         """
@@ -1787,12 +3021,24 @@ class TAExpr:
                 "accelerationinitshort": accelerationinitshort,
                 "accelerationshort": accelerationshort,
                 "accelerationmaxshort": accelerationmaxshort,
+                "out_dtype": out_dtype,
             },
             symbol="sarext",
             is_elementwise=False,
         )
 
-    def sma(self, timeperiod: int = 30) -> pl.Expr:
+    def sma(
+        self,
+        timeperiod: int | pl.Expr = 30,
+        by: IntoExpr | None = None,
+        out_dtype: str = "f64",
+        engine: str = "native",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+    ) -> pl.Expr:
         """Simple Moving Average (Overlap Studies)
         ta.pol("close").ta.sma(timeperiod=30)
 
@@ -1800,20 +3046,49 @@ class TAExpr:
             real: (any ndarray)
         Parameters:
             timeperiod: 30
+            by: None
+            out_dtype: f64
+            engine: native
+                default, parallel chunks on long series: differs from TA-Lib by the rounding
+                of its running sums, see the README; "talib" gives its exact values
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range(
+                "sma",
+                timeperiod,
+                last_n,
+                start,
+                end,
+                warmup,
+                out_dtype,
+                by=by,
+                agg=agg,
+                engine=engine,
+            )
+        if by is not None or isinstance(timeperiod, pl.Expr):
+            return self._grouped(
+                "sma", by, timeperiod=timeperiod, out_dtype=out_dtype, engine=engine
+            )
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="sma",
             is_elementwise=False,
         )
 
-    def t3(self, timeperiod: int = 5, vfactor: float = 0.7) -> pl.Expr:
+    def t3(self, timeperiod: int = 5, vfactor: float = 0.7, out_dtype: str = "f64") -> pl.Expr:
         """Triple Exponential Moving Average T3 (Overlap Studies)
         ta.pol("close").ta.t3(timeperiod=5, vfactor=0.7)
 
@@ -1822,6 +3097,7 @@ class TAExpr:
         Parameters:
             timeperiod: 5
             vfactor: 0.7
+            out_dtype: f64
         Outputs:
             real
         """
@@ -1831,12 +3107,23 @@ class TAExpr:
             kwargs={
                 "timeperiod": timeperiod,
                 "vfactor": vfactor,
+                "out_dtype": out_dtype,
             },
             symbol="t3",
             is_elementwise=False,
         )
 
-    def tema(self, timeperiod: int = 30) -> pl.Expr:
+    def tema(
+        self,
+        timeperiod: int | pl.Expr = 30,
+        by: IntoExpr | None = None,
+        out_dtype: str = "f64",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+    ) -> pl.Expr:
         """Triple Exponential Moving Average (Overlap Studies)
         ta.pol("close").ta.tema(timeperiod=30)
 
@@ -1844,20 +3131,45 @@ class TAExpr:
             real: (any ndarray)
         Parameters:
             timeperiod: 30
+            by: None
+            out_dtype: f64
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range(
+                "tema", timeperiod, last_n, start, end, warmup, out_dtype, by=by, agg=agg
+            )
+        if by is not None or isinstance(timeperiod, pl.Expr):
+            return self._grouped("tema", by, timeperiod=timeperiod, out_dtype=out_dtype)
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="tema",
             is_elementwise=False,
         )
 
-    def trima(self, timeperiod: int = 30) -> pl.Expr:
+    def trima(
+        self,
+        timeperiod: int | pl.Expr = 30,
+        by: IntoExpr | None = None,
+        out_dtype: str = "f64",
+        engine: str = "native",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+    ) -> pl.Expr:
         """Triangular Moving Average (Overlap Studies)
         ta.pol("close").ta.trima(timeperiod=30)
 
@@ -1865,20 +3177,60 @@ class TAExpr:
             real: (any ndarray)
         Parameters:
             timeperiod: 30
+            by: None
+            out_dtype: f64
+            engine: native
+                default, parallel chunks on long series: differs from TA-Lib by the rounding
+                of its running sums, see the README; "talib" gives its exact values
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range(
+                "trima",
+                timeperiod,
+                last_n,
+                start,
+                end,
+                warmup,
+                out_dtype,
+                by=by,
+                agg=agg,
+                engine=engine,
+            )
+        if by is not None or isinstance(timeperiod, pl.Expr):
+            return self._grouped(
+                "trima", by, timeperiod=timeperiod, out_dtype=out_dtype, engine=engine
+            )
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="trima",
             is_elementwise=False,
         )
 
-    def wma(self, timeperiod: int = 30) -> pl.Expr:
+    def wma(
+        self,
+        timeperiod: int | pl.Expr = 30,
+        by: IntoExpr | None = None,
+        out_dtype: str = "f64",
+        engine: str = "native",
+        last_n: int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        warmup: int | None = None,
+        agg: str | None = None,
+    ) -> pl.Expr:
         """Weighted Moving Average (Overlap Studies)
         ta.pol("close").ta.wma(timeperiod=30)
 
@@ -1886,21 +3238,54 @@ class TAExpr:
             real: (any ndarray)
         Parameters:
             timeperiod: 30
+            by: None
+            out_dtype: f64
+            engine: native
+                default, parallel chunks on long series: differs from TA-Lib by the rounding
+                of its running sums, see the README; "talib" gives its exact values
+            last_n: None
+            start: None
+            end: None
+            warmup: None
+            agg: None
         Outputs:
             real
         """
+        if any(v is not None for v in (last_n, start, end, warmup, agg)):
+            return self._range(
+                "wma",
+                timeperiod,
+                last_n,
+                start,
+                end,
+                warmup,
+                out_dtype,
+                by=by,
+                agg=agg,
+                engine=engine,
+            )
+        if by is not None or isinstance(timeperiod, pl.Expr):
+            return self._grouped(
+                "wma", by, timeperiod=timeperiod, out_dtype=out_dtype, engine=engine
+            )
         return register_plugin(
             args=[self._expr],
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="wma",
             is_elementwise=False,
         )
 
     def natr(
-        self, high: IntoExpr = pl.col("high"), low: IntoExpr = pl.col("low"), timeperiod: int = 14
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
     ) -> pl.Expr:
         """Normalized Average True Range (Volatility Indicators)
         pl.col("close").ta.natr("high", "low", [, timeperiod=?])
@@ -1909,6 +3294,7 @@ class TAExpr:
             prices: ['high', 'low', 'close']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -1917,6 +3303,7 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="natr",
             is_elementwise=False,
@@ -1927,12 +3314,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Two Crows (Pattern Recognition)
             pl.col("open").ta.cdl2crows(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -1940,6 +3334,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdl2crows",
             is_elementwise=False,
         )
@@ -1949,12 +3344,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Three Black Crows (Pattern Recognition)
             pl.col("open").ta.cdl3blackcrows(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -1962,6 +3364,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdl3blackcrows",
             is_elementwise=False,
         )
@@ -1971,12 +3374,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Three Inside Up/Down (Pattern Recognition)
             pl.col("open").ta.cdl3inside(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -1984,6 +3394,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdl3inside",
             is_elementwise=False,
         )
@@ -1993,12 +3404,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Three-Line Strike  (Pattern Recognition)
             pl.col("open").ta.cdl3linestrike(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2006,6 +3424,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdl3linestrike",
             is_elementwise=False,
         )
@@ -2015,12 +3434,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Three Outside Up/Down (Pattern Recognition)
             pl.col("open").ta.cdl3outside(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2028,6 +3454,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdl3outside",
             is_elementwise=False,
         )
@@ -2037,12 +3464,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Three Stars In The South (Pattern Recognition)
             pl.col("open").ta.cdl3starsinsouth(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2050,6 +3484,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdl3starsinsouth",
             is_elementwise=False,
         )
@@ -2059,12 +3494,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Three Advancing White Soldiers (Pattern Recognition)
             pl.col("open").ta.cdl3whitesoldiers(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2072,6 +3514,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdl3whitesoldiers",
             is_elementwise=False,
         )
@@ -2082,6 +3525,8 @@ class TAExpr:
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
         penetration: float = 0.3,
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Abandoned Baby (Pattern Recognition)
             pl.col("open").ta.cdlabandonedbaby(pl.col("high"), pl.col("low"), pl.col("close"), penetration=0.3)
@@ -2090,6 +3535,10 @@ class TAExpr:
             prices: ['open', 'high', 'low', 'close']
         Parameters:
             penetration: 0.3
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2099,6 +3548,8 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "penetration": penetration,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="cdlabandonedbaby",
             is_elementwise=False,
@@ -2109,12 +3560,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Advance Block (Pattern Recognition)
             pl.col("open").ta.cdladvanceblock(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2122,6 +3580,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdladvanceblock",
             is_elementwise=False,
         )
@@ -2131,12 +3590,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Belt-hold (Pattern Recognition)
             pl.col("open").ta.cdlbelthold(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2144,6 +3610,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlbelthold",
             is_elementwise=False,
         )
@@ -2153,12 +3620,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Breakaway (Pattern Recognition)
             pl.col("open").ta.cdlbreakaway(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2166,6 +3640,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlbreakaway",
             is_elementwise=False,
         )
@@ -2175,12 +3650,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Closing Marubozu (Pattern Recognition)
             pl.col("open").ta.cdlclosingmarubozu(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2188,6 +3670,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlclosingmarubozu",
             is_elementwise=False,
         )
@@ -2197,12 +3680,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Concealing Baby Swallow (Pattern Recognition)
             pl.col("open").ta.cdlconcealbabyswall(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2210,6 +3700,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlconcealbabyswall",
             is_elementwise=False,
         )
@@ -2219,12 +3710,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Counterattack (Pattern Recognition)
             pl.col("open").ta.cdlcounterattack(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2232,6 +3730,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlcounterattack",
             is_elementwise=False,
         )
@@ -2242,6 +3741,8 @@ class TAExpr:
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
         penetration: float = 0.3,
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Dark Cloud Cover (Pattern Recognition)
             pl.col("open").ta.cdldarkcloudcover(pl.col("high"), pl.col("low"), pl.col("close"), penetration=0.3)
@@ -2250,6 +3751,10 @@ class TAExpr:
             prices: ['open', 'high', 'low', 'close']
         Parameters:
             penetration: 0.5
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2259,6 +3764,8 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "penetration": penetration,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="cdldarkcloudcover",
             is_elementwise=False,
@@ -2269,12 +3776,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Doji (Pattern Recognition)
             pl.col("open").ta.cdldoji(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2282,6 +3796,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdldoji",
             is_elementwise=False,
         )
@@ -2291,12 +3806,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Doji Star (Pattern Recognition)
             pl.col("open").ta.cdldojistar(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2304,6 +3826,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdldojistar",
             is_elementwise=False,
         )
@@ -2313,12 +3836,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Dragonfly Doji (Pattern Recognition)
             pl.col("open").ta.cdldragonflydoji(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2326,6 +3856,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdldragonflydoji",
             is_elementwise=False,
         )
@@ -2335,12 +3866,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Engulfing Pattern (Pattern Recognition)
             pl.col("open").ta.cdlengulfing(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2348,6 +3886,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlengulfing",
             is_elementwise=False,
         )
@@ -2358,6 +3897,8 @@ class TAExpr:
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
         penetration: float = 0.3,
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Evening Doji Star (Pattern Recognition)
             pl.col("open").ta.cdleveningdojistar(pl.col("high"), pl.col("low"), pl.col("close"), penetration=0.3)
@@ -2366,6 +3907,10 @@ class TAExpr:
             prices: ['open', 'high', 'low', 'close']
         Parameters:
             penetration: 0.3
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2375,6 +3920,8 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "penetration": penetration,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="cdleveningdojistar",
             is_elementwise=False,
@@ -2386,6 +3933,8 @@ class TAExpr:
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
         penetration: float = 0.3,
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Evening Star (Pattern Recognition)
             pl.col("open").ta.cdleveningstar(pl.col("high"), pl.col("low"), pl.col("close"), penetration=0.3)
@@ -2394,6 +3943,10 @@ class TAExpr:
             prices: ['open', 'high', 'low', 'close']
         Parameters:
             penetration: 0.3
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2403,6 +3956,8 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "penetration": penetration,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="cdleveningstar",
             is_elementwise=False,
@@ -2413,12 +3968,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Up/Down-gap side-by-side white lines (Pattern Recognition)
             pl.col("open").ta.cdlgapsidesidewhite(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2426,6 +3988,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlgapsidesidewhite",
             is_elementwise=False,
         )
@@ -2435,12 +3998,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Gravestone Doji (Pattern Recognition)
             pl.col("open").ta.cdlgravestonedoji(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2448,6 +4018,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlgravestonedoji",
             is_elementwise=False,
         )
@@ -2457,12 +4028,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Hammer (Pattern Recognition)
             pl.col("open").ta.cdlhammer(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2470,6 +4048,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlhammer",
             is_elementwise=False,
         )
@@ -2479,12 +4058,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Hanging Man (Pattern Recognition)
             pl.col("open").ta.cdlhangingman(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2492,6 +4078,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlhangingman",
             is_elementwise=False,
         )
@@ -2501,12 +4088,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Harami Pattern (Pattern Recognition)
             pl.col("open").ta.cdlharami(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2514,6 +4108,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlharami",
             is_elementwise=False,
         )
@@ -2523,12 +4118,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Harami Cross Pattern (Pattern Recognition)
             pl.col("open").ta.cdlharamicross(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2536,6 +4138,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlharamicross",
             is_elementwise=False,
         )
@@ -2545,12 +4148,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """High-Wave Candle (Pattern Recognition)
             pl.col("open").ta.cdlhighwave(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2558,6 +4168,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlhighwave",
             is_elementwise=False,
         )
@@ -2567,12 +4178,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Hikkake Pattern (Pattern Recognition)
             pl.col("open").ta.cdlhikkake(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2580,6 +4198,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlhikkake",
             is_elementwise=False,
         )
@@ -2589,12 +4208,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Modified Hikkake Pattern (Pattern Recognition)
             pl.col("open").ta.cdlhikkakemod(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2602,6 +4228,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlhikkakemod",
             is_elementwise=False,
         )
@@ -2611,12 +4238,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Homing Pigeon (Pattern Recognition)
             pl.col("open").ta.cdlhomingpigeon(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2624,6 +4258,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlhomingpigeon",
             is_elementwise=False,
         )
@@ -2633,12 +4268,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Identical Three Crows (Pattern Recognition)
             pl.col("open").ta.cdlidentical3crows(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2646,6 +4288,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlidentical3crows",
             is_elementwise=False,
         )
@@ -2655,12 +4298,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """In-Neck Pattern (Pattern Recognition)
             pl.col("open").ta.cdlinneck(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2668,6 +4318,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlinneck",
             is_elementwise=False,
         )
@@ -2677,12 +4328,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Inverted Hammer (Pattern Recognition)
             pl.col("open").ta.cdlinvertedhammer(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2690,6 +4348,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlinvertedhammer",
             is_elementwise=False,
         )
@@ -2699,12 +4358,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Kicking (Pattern Recognition)
             pl.col("open").ta.cdlkicking(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2712,6 +4378,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlkicking",
             is_elementwise=False,
         )
@@ -2721,12 +4388,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Kicking - bull/bear determined by the longer marubozu (Pattern Recognition)
             pl.col("open").ta.cdlkickingbylength(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2734,6 +4408,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlkickingbylength",
             is_elementwise=False,
         )
@@ -2743,12 +4418,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Ladder Bottom (Pattern Recognition)
             pl.col("open").ta.cdlladderbottom(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2756,6 +4438,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlladderbottom",
             is_elementwise=False,
         )
@@ -2765,12 +4448,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Long Legged Doji (Pattern Recognition)
             pl.col("open").ta.cdllongleggeddoji(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2778,6 +4468,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdllongleggeddoji",
             is_elementwise=False,
         )
@@ -2787,12 +4478,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Long Line Candle (Pattern Recognition)
             pl.col("open").ta.cdllongline(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2800,6 +4498,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdllongline",
             is_elementwise=False,
         )
@@ -2809,12 +4508,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Marubozu (Pattern Recognition)
             pl.col("open").ta.cdlmarubozu(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2822,6 +4528,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlmarubozu",
             is_elementwise=False,
         )
@@ -2831,12 +4538,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Matching Low (Pattern Recognition)
             pl.col("open").ta.cdlmatchinglow(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2844,6 +4558,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlmatchinglow",
             is_elementwise=False,
         )
@@ -2854,6 +4569,8 @@ class TAExpr:
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
         penetration: float = 0.3,
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Mat Hold (Pattern Recognition)
             pl.col("open").ta.cdlmathold(pl.col("high"), pl.col("low"), pl.col("close"), penetration=0.3)
@@ -2862,6 +4579,10 @@ class TAExpr:
             prices: ['open', 'high', 'low', 'close']
         Parameters:
             penetration: 0.5
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2871,6 +4592,8 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "penetration": penetration,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="cdlmathold",
             is_elementwise=False,
@@ -2882,6 +4605,8 @@ class TAExpr:
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
         penetration: float = 0.3,
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Morning Doji Star (Pattern Recognition)
             pl.col("open").ta.cdlmorningdojistar(pl.col("high"), pl.col("low"), pl.col("close"), penetration=0.3)
@@ -2890,6 +4615,10 @@ class TAExpr:
             prices: ['open', 'high', 'low', 'close']
         Parameters:
             penetration: 0.3
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2899,6 +4628,8 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "penetration": penetration,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="cdlmorningdojistar",
             is_elementwise=False,
@@ -2910,6 +4641,8 @@ class TAExpr:
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
         penetration: float = 0.3,
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Morning Star (Pattern Recognition)
             pl.col("open").ta.cdlmorningstar(pl.col("high"), pl.col("low"), pl.col("close"), penetration=0.3)
@@ -2918,6 +4651,10 @@ class TAExpr:
             prices: ['open', 'high', 'low', 'close']
         Parameters:
             penetration: 0.3
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2927,6 +4664,8 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "penetration": penetration,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="cdlmorningstar",
             is_elementwise=False,
@@ -2937,12 +4676,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """On-Neck Pattern (Pattern Recognition)
             pl.col("open").ta.cdlonneck(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2950,6 +4696,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlonneck",
             is_elementwise=False,
         )
@@ -2959,12 +4706,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Piercing Pattern (Pattern Recognition)
             pl.col("open").ta.cdlpiercing(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2972,6 +4726,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlpiercing",
             is_elementwise=False,
         )
@@ -2981,12 +4736,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Rickshaw Man (Pattern Recognition)
             pl.col("open").ta.cdlrickshawman(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -2994,6 +4756,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlrickshawman",
             is_elementwise=False,
         )
@@ -3003,12 +4766,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Rising/Falling Three Methods (Pattern Recognition)
             pl.col("open").ta.cdlrisefall3methods(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -3016,6 +4786,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlrisefall3methods",
             is_elementwise=False,
         )
@@ -3025,12 +4796,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Separating Lines (Pattern Recognition)
             pl.col("open").ta.cdlseparatinglines(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -3038,6 +4816,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlseparatinglines",
             is_elementwise=False,
         )
@@ -3047,12 +4826,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Shooting Star (Pattern Recognition)
             pl.col("open").ta.cdlshootingstar(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -3060,6 +4846,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlshootingstar",
             is_elementwise=False,
         )
@@ -3069,12 +4856,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Short Line Candle (Pattern Recognition)
             pl.col("open").ta.cdlshortline(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -3082,6 +4876,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlshortline",
             is_elementwise=False,
         )
@@ -3091,12 +4886,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Spinning Top (Pattern Recognition)
             pl.col("open").ta.cdlspinningtop(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -3104,6 +4906,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlspinningtop",
             is_elementwise=False,
         )
@@ -3113,12 +4916,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Stalled Pattern (Pattern Recognition)
             pl.col("open").ta.cdlstalledpattern(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -3126,6 +4936,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlstalledpattern",
             is_elementwise=False,
         )
@@ -3135,12 +4946,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Stick Sandwich (Pattern Recognition)
             pl.col("open").ta.cdlsticksandwich(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -3148,6 +4966,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlsticksandwich",
             is_elementwise=False,
         )
@@ -3157,12 +4976,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Takuri (Dragonfly Doji with very long lower shadow) (Pattern Recognition)
             pl.col("open").ta.cdltakuri(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -3170,6 +4996,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdltakuri",
             is_elementwise=False,
         )
@@ -3179,12 +5006,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Tasuki Gap (Pattern Recognition)
             pl.col("open").ta.cdltasukigap(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -3192,6 +5026,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdltasukigap",
             is_elementwise=False,
         )
@@ -3201,12 +5036,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Thrusting Pattern (Pattern Recognition)
             pl.col("open").ta.cdlthrusting(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -3214,6 +5056,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlthrusting",
             is_elementwise=False,
         )
@@ -3223,12 +5066,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Tristar Pattern (Pattern Recognition)
             pl.col("open").ta.cdltristar(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -3236,6 +5086,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdltristar",
             is_elementwise=False,
         )
@@ -3245,12 +5096,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Unique 3 River (Pattern Recognition)
             pl.col("open").ta.cdlunique3river(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -3258,6 +5116,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlunique3river",
             is_elementwise=False,
         )
@@ -3267,12 +5126,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Upside Gap Two Crows (Pattern Recognition)
             pl.col("open").ta.cdlupsidegap2crows(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -3280,6 +5146,7 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlupsidegap2crows",
             is_elementwise=False,
         )
@@ -3289,12 +5156,19 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "i32",
+        engine: str = "native",
     ):
         """Upside/Downside Gap Three Methods (Pattern Recognition)
             pl.col("open").ta.cdlxsidegap3methods(pl.col("high"), pl.col("low"), pl.col("close"))
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: i32
+            engine: native
+                default, parallel chunks on long series: a bar within rounding of a candle
+                average threshold can differ from TA-Lib; "talib" gives its exact values
         Outputs:
             integer (values are -100, 0 or 100)
 
@@ -3302,15 +5176,96 @@ class TAExpr:
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="cdlxsidegap3methods",
             is_elementwise=False,
         )
 
+    def cdl_scan(
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        close: IntoExpr = pl.col("close"),
+        patterns: list[str] | None = None,
+        penetration: float = 0.3,
+        bitmask: bool = False,
+        out_dtype: str = "i32",
+    ) -> pl.Expr:
+        """Candlestick pattern scan (Pattern Recognition)
+            pl.col("open").ta.cdl_scan(pl.col("high"), pl.col("low"), pl.col("close"))
+
+        Run several `cdl*` patterns from one expression: OHLC is prepared once and the
+        single pattern functions run in parallel, each computing its own candle averages.
+        Outputs equal the single pattern functions.
+
+        Inputs:
+            prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            patterns: None (all patterns in `CDL_PATTERNS`)
+            penetration: 0.3
+            bitmask: False
+            out_dtype: i32
+        Outputs:
+            struct with one field per pattern, or with `bitmask=True` the UInt64 fields
+            `bull` and `bear` where bit `i` is set when `CDL_PATTERNS[i]` is positive
+            (bull) or negative (bear) on that row.
+        """
+        patterns = _cdl_patterns(patterns)
+        return register_plugin(
+            args=[self._expr, high, low, close],
+            lib=lib,
+            kwargs={
+                "patterns": patterns,
+                "penetration": penetration,
+                "bitmask": bitmask,
+                "out_dtype": out_dtype,
+            },
+            symbol="cdl_scan",
+            is_elementwise=False,
+        )
+
+    def cdl_events(
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        close: IntoExpr = pl.col("close"),
+        patterns: list[str] | None = None,
+        penetration: float = 0.3,
+    ) -> pl.Expr:
+        """Candlestick pattern events (Pattern Recognition)
+            pl.col("open").ta.cdl_events(pl.col("high"), pl.col("low"), pl.col("close"))
+
+        Like `cdl_scan`, but only the non-zero hits are returned, as a single list
+        per frame or group (use `.explode()` to get one row per event).
+
+        Inputs:
+            prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            patterns: None (all patterns in `CDL_PATTERNS`)
+            penetration: 0.3
+        Outputs:
+            list of struct `row` (row index), `pattern` (position in `CDL_PATTERNS`) and
+            `signal` (TA-Lib value divided by 100: -2, -1, 1 or 2)
+        """
+        patterns = _cdl_patterns(patterns)
+        return register_plugin(
+            args=[self._expr, high, low, close],
+            lib=lib,
+            kwargs={
+                "patterns": patterns,
+                "penetration": penetration,
+            },
+            symbol="cdl_events",
+            is_elementwise=False,
+            returns_scalar=True,
+        )
+
     def avgprice(
         self,
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         close: IntoExpr = pl.col("close"),
+        out_dtype: str = "f64",
     ):
         """Average Price (Price Transform)
 
@@ -3318,65 +5273,87 @@ class TAExpr:
 
         Inputs:
             prices: ['open', 'high', 'low', 'close']
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr, high, low, close],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="avgprice",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def medprice(self, low: IntoExpr = pl.col("low")):
+    def medprice(self, low: IntoExpr = pl.col("low"), out_dtype: str = "f64"):
         """Median Price (Price Transform)
         pl.col("high").ta.medprice("low")
 
         Inputs:
             prices: ['high', 'low']
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr, low],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="medprice",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def typprice(self, high: IntoExpr = pl.col("high"), low: IntoExpr = pl.col("low")):
+    def typprice(
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        out_dtype: str = "f64",
+    ):
         """Typical Price (Price Transform)
         pl.col("close").ta.typprice("high", "low")
 
         Inputs:
             prices: ['high', 'low', 'close']
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr, high, low],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="typprice",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def wclprice(self, high: IntoExpr = pl.col("high"), low: IntoExpr = pl.col("low")):
+    def wclprice(
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        out_dtype: str = "f64",
+    ):
         """Weighted Close Price (Price Transform)
         pl.col("close").ta.wclprice("high", "low")
 
         Inputs:
             prices: ['high', 'low', 'close']
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr, high, low],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="wclprice",
-            is_elementwise=False,
+            is_elementwise=True,
         )
 
-    def beta(self, real: IntoExpr, timeperiod: int = 5):
+    def beta(self, real: IntoExpr, timeperiod: int = 5, out_dtype: str = "f64"):
         """Beta (Statistic Functions)
         pl.col("close").ta.beta(pl.col("high"), timeperiod=5)
         Inputs:
@@ -3384,6 +5361,7 @@ class TAExpr:
             real1
         Parameters:
             timeperiod: 5
+            out_dtype: f64
         Outputs:
             real
         """
@@ -3392,12 +5370,19 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="beta",
             is_elementwise=False,
         )
 
-    def correl(self, real: IntoExpr, timeperiod: int = 30):
+    def correl(
+        self,
+        real: IntoExpr,
+        timeperiod: int = 30,
+        out_dtype: str = "f64",
+        engine: str = "native",
+    ):
         """Pearson's Correlation Coefficient (r) (Statistic Functions)
         pl.col("close").ta.correl(pl.col("high"), timeperiod=30)
         Inputs:
@@ -3405,6 +5390,10 @@ class TAExpr:
             real1
         Parameters:
             timeperiod: 30
+            out_dtype: f64
+            engine: native
+                default, parallel chunks on long series: differs from TA-Lib by the rounding
+                of its running sums, see the README; "talib" gives its exact values
         Outputs:
             real
         """
@@ -3413,18 +5402,21 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="correl",
             is_elementwise=False,
         )
 
-    def linearreg(self, timeperiod: int = 14):
+    def linearreg(self, timeperiod: int = 14, out_dtype: str = "f64"):
         """Linear Regression (Statistic Functions)
         pl.col("close").ta.linearreg(timeperiod=14)
         Inputs:
             real
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -3433,18 +5425,20 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="linearreg",
             is_elementwise=False,
         )
 
-    def linearreg_angle(self, timeperiod: int = 14):
+    def linearreg_angle(self, timeperiod: int = 14, out_dtype: str = "f64"):
         """Linear Regression Angle (Statistic Functions)
         pl.col("close").ta.linearreg_angle(timeperiod=14)
         Inputs:
             real
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -3453,18 +5447,20 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="linearreg_angle",
             is_elementwise=False,
         )
 
-    def linearreg_intercept(self, timeperiod: int = 14):
+    def linearreg_intercept(self, timeperiod: int = 14, out_dtype: str = "f64"):
         """Linear Regression Intercept (Statistic Functions)
         pl.col("close").ta.linearreg_intercept(timeperiod=14)
         Inputs:
             real
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -3473,18 +5469,20 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="linearreg_intercept",
             is_elementwise=False,
         )
 
-    def linearreg_slope(self, timeperiod: int = 14):
+    def linearreg_slope(self, timeperiod: int = 14, out_dtype: str = "f64"):
         """Linear Regression Slope (Statistic Functions)
         pl.col("close").ta.linearreg_slope(timeperiod=14)
         Inputs:
             real
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -3493,12 +5491,19 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="linearreg_slope",
             is_elementwise=False,
         )
 
-    def stddev(self, timeperiod: int = 5, nbdev: float = 1.0):
+    def stddev(
+        self,
+        timeperiod: int = 5,
+        nbdev: float = 1.0,
+        out_dtype: str = "f64",
+        engine: str = "native",
+    ):
         """Standard Deviation (Statistic Functions)
         pl.col("close").ta.stddev(timeperiod=5, nbdev=1.0)
         Inputs:
@@ -3506,6 +5511,10 @@ class TAExpr:
         Parameters:
             timeperiod: 5
             nbdev: 1.0
+            out_dtype: f64
+            engine: native
+                default, parallel chunks on long series: differs from TA-Lib by the rounding
+                of its running sums, see the README; "talib" gives its exact values
         Outputs:
             real
         """
@@ -3515,18 +5524,21 @@ class TAExpr:
             kwargs={
                 "timeperiod": timeperiod,
                 "nbdev": nbdev,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="stddev",
             is_elementwise=False,
         )
 
-    def tsf(self, timeperiod: int = 14):
+    def tsf(self, timeperiod: int = 14, out_dtype: str = "f64"):
         """Time Series Forecast (Statistic Functions)
         pl.col("close").ta.tsf(timeperiod=14)
         Inputs:
             real
         Parameters:
             timeperiod: 14
+            out_dtype: f64
         Outputs:
             real
         """
@@ -3535,12 +5547,59 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
             },
             symbol="tsf",
             is_elementwise=False,
         )
 
-    def var(self, timeperiod: int = 5, nbdev: float = 1.0):
+    def linreg_all(
+        self,
+        timeperiod: int = 14,
+        fields: list[str] | None = None,
+        out_dtype: str = "f64",
+    ) -> pl.Expr:
+        """Linear regression family in one pass (Statistic Functions)
+        pl.col("close").ta.linreg_all(timeperiod=14, fields=["linearreg_slope", "r2"])
+
+        The window sums are computed once for every field. `linearreg`,
+        `linearreg_slope`, `linearreg_intercept`, `linearreg_angle` and `tsf` equal the
+        single functions; `r2` and `resid_std` (population standard deviation of the
+        residuals) are extras only computed when requested.
+
+        Inputs:
+            real
+        Parameters:
+            timeperiod: 14
+            fields: None (`LINREG_FIELDS`, extras in `LINREG_EXTRA_FIELDS`)
+            out_dtype: f64
+        Outputs:
+            struct of the requested fields
+        """
+        return register_plugin(
+            args=[self._expr],
+            lib=lib,
+            kwargs={
+                "timeperiod": timeperiod,
+                "fields": _struct_fields(
+                    "linreg_all",
+                    fields,
+                    LINREG_FIELDS + LINREG_EXTRA_FIELDS,
+                    default=LINREG_FIELDS,
+                ),
+                "out_dtype": out_dtype,
+            },
+            symbol="linreg_all",
+            is_elementwise=False,
+        )
+
+    def var(
+        self,
+        timeperiod: int = 5,
+        nbdev: float = 1.0,
+        out_dtype: str = "f64",
+        engine: str = "native",
+    ):
         """Variance (Statistic Functions)
         pl.col("close").ta.var(timeperiod=5, nbdev=1.0)
         Inputs:
@@ -3548,6 +5607,10 @@ class TAExpr:
         Parameters:
             timeperiod: 5
             nbdev: 1.0
+            out_dtype: f64
+            engine: native
+                default, parallel chunks on long series: differs from TA-Lib by the rounding
+                of its running sums, see the README; "talib" gives its exact values
         Outputs:
             real
         """
@@ -3557,24 +5620,34 @@ class TAExpr:
             kwargs={
                 "timeperiod": timeperiod,
                 "nbdev": nbdev,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="var",
             is_elementwise=False,
         )
 
-    def obv(self, volume: IntoExpr = pl.col("volume")):
+    def obv(
+        self, volume: IntoExpr = pl.col("volume"), out_dtype: str = "f64", engine: str = "native"
+    ):
         """OBV(close, volume)
 
         On Balance Volume (Volume Indicators)
 
         Inputs:
             prices: ['close', 'volume']
+        Parameters:
+            out_dtype: f64
+            engine: native
+                default, a parallel prefix scan on long series: differs from TA-Lib
+                by rounding, within `SCAN_TOLERANCE`; "talib" gives its exact values
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr, volume],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="obv",
             is_elementwise=False,
         )
@@ -3584,14 +5657,22 @@ class TAExpr:
         high: IntoExpr = pl.col("high"),
         low: IntoExpr = pl.col("low"),
         volume: IntoExpr = pl.col("volume"),
+        out_dtype: str = "f64",
+        engine: str = "native",
     ):
         """Chaikin A/D Line (Volume Indicators)
         pl.col("close").ta.ad(pl.col("high"), pl.col("low"), pl.col("volume"))
 
+        Parameters:
+            out_dtype: f64
+            engine: native
+                default, a parallel prefix scan on long series: differs from TA-Lib
+                by rounding, within `SCAN_TOLERANCE`; "talib" gives its exact values
         """
         return register_plugin(
             args=[self._expr, high, low, volume],
             lib=lib,
+            kwargs={"out_dtype": out_dtype, "engine": engine},
             symbol="ad",
             is_elementwise=False,
         )
@@ -3603,6 +5684,8 @@ class TAExpr:
         volume: IntoExpr = pl.col("volume"),
         fastperiod: int = 3,
         slowperiod: int = 10,
+        out_dtype: str = "f64",
+        engine: str = "native",
     ):
         """Chaikin A/D Oscillator (Volume Indicators)
         pl.col("close").ta.adosc(pl.col("high"), pl.col("low"), pl.col("volume"), timeperiod=3)
@@ -3610,6 +5693,10 @@ class TAExpr:
         Parameters:
             fastperiod: 3
             slowperiod: 10
+            out_dtype: f64
+            engine: native
+                default, a parallel prefix scan on long series: differs from TA-Lib
+                by rounding, within `SCAN_TOLERANCE`; "talib" gives its exact values
         Outputs:
             real
         """
@@ -3619,13 +5706,20 @@ class TAExpr:
             kwargs={
                 "fastperiod": fastperiod,
                 "slowperiod": slowperiod,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="adosc",
             is_elementwise=False,
         )
 
     def atr(
-        self, high: IntoExpr = pl.col("high"), low: IntoExpr = pl.col("low"), timeperiod: int = 14
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        timeperiod: int = 14,
+        out_dtype: str = "f64",
+        engine: str = "native",
     ):
         """Average True Range (Volatility Indicators)
         pl.col("close").ta.atr("high", "low", [, timeperiod=?])
@@ -3634,6 +5728,10 @@ class TAExpr:
             prices: ['high', 'low', 'close']
         Parameters:
             timeperiod: 14
+            out_dtype: f64
+            engine: native
+                default, a parallel prefix scan on long series: differs from TA-Lib
+                by rounding, within `SCAN_TOLERANCE`; "talib" gives its exact values
         Outputs:
             real
         """
@@ -3642,50 +5740,227 @@ class TAExpr:
             lib=lib,
             kwargs={
                 "timeperiod": timeperiod,
+                "out_dtype": out_dtype,
+                "engine": engine,
             },
             symbol="atr",
             is_elementwise=False,
         )
 
-    def trange(self, high: IntoExpr = pl.col("high"), low: IntoExpr = pl.col("low")) -> pl.Expr:
+    def trange(
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        out_dtype: str = "f64",
+    ) -> pl.Expr:
         """True Range (Volatility Indicators)
         pl.col("close").ta.trange("high", "low")
 
         Inputs:
             prices: ['high', 'low', 'close']
+        Parameters:
+            out_dtype: f64
         Outputs:
             real
         """
         return register_plugin(
             args=[self._expr, high, low],
             lib=lib,
+            kwargs={"out_dtype": out_dtype},
             symbol="trange",
             is_elementwise=False,
         )
+    def volatility_all(
+        self,
+        high: IntoExpr = pl.col("high"),
+        low: IntoExpr = pl.col("low"),
+        atr_periods: list[int] | None = None,
+        band_periods: list[int] | None = None,
+        nbdevs: list[tuple[float, float]] | None = None,
+        matype: int = 0,
+        fields: list[str] | None = None,
+        out_dtype: str = "f64",
+    ) -> pl.Expr:
+        """True range, ATR and Bollinger moments in one pass (Volatility Indicators)
+        pl.col("close").ta.volatility_all("high", "low", atr_periods=[14], band_periods=[20])
+
+        True range is computed once, ATR once per period in `atr_periods` and the rolling
+        moments of close once per period in `band_periods`, every field is derived from
+        those and equals its single function. `fields` picks kinds out of
+        `VOLATILITY_FIELDS`, struct fields are named `trange`, `atr_{p}`, `natr_{p}`,
+        `middleband_{p}`, `upperband_{p}_{nbdevup}`, `lowerband_{p}_{nbdevdn}`,
+        `stddev_{p}` and `var_{p}`.
+
+        Inputs:
+            prices: ['high', 'low', 'close']
+        Parameters:
+            atr_periods: [14]
+            band_periods: [5]
+            nbdevs: [(2.0, 2.0)] (nbdevup, nbdevdn pairs)
+            matype: 0 (middle band)
+            fields: None (all of `VOLATILITY_FIELDS`)
+            out_dtype: f64
+        Outputs:
+            struct of the requested fields
+        """
+        return register_plugin(
+            args=[self._expr, high, low],
+            lib=lib,
+            kwargs={
+                "fields": _volatility_fields(
+                    _struct_fields("volatility_all", fields, VOLATILITY_FIELDS),
+                    [14] if atr_periods is None else atr_periods,
+                    [5] if band_periods is None else band_periods,
+                    [(2.0, 2.0)] if nbdevs is None else nbdevs,
+                ),
+                "matype": matype,
+                "out_dtype": out_dtype,
+            },
+            symbol="volatility_all",
+            is_elementwise=False,
+        )
+
+
+
+def sweep(
+    func: str,
+    timeperiods: Iterable[int],
+    real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
+) -> pl.Expr:
+    """`func` for every period of `timeperiods` as one `Array(Float64, k)` column.
+    plta.sweep("ema", range(2, 201))
+    """
+    return real.ta.sweep(func, timeperiods, out_dtype=out_dtype)
+
+
+def ema_sweep(
+    timeperiods: Iterable[int], real: IntoExpr = pl.col("close"), out_dtype: str = "f64"
+) -> pl.Expr:
+    """Exponential Moving Average for every period of `timeperiods`, see `sweep`.
+    plta.ema_sweep(range(2, 201))
+    """
+    return real.ta.ema_sweep(timeperiods, out_dtype=out_dtype)
+
+
+def sma_sweep(
+    timeperiods: Iterable[int], real: IntoExpr = pl.col("close"), out_dtype: str = "f64"
+) -> pl.Expr:
+    """Simple Moving Average for every period of `timeperiods`, see `sweep`.
+    plta.sma_sweep(range(2, 201))
+    """
+    return real.ta.sma_sweep(timeperiods, out_dtype=out_dtype)
+
+
+def rsi_sweep(
+    timeperiods: Iterable[int], real: IntoExpr = pl.col("close"), out_dtype: str = "f64"
+) -> pl.Expr:
+    """Relative Strength Index for every period of `timeperiods`, see `sweep`.
+    plta.rsi_sweep(range(2, 31))
+    """
+    return real.ta.rsi_sweep(timeperiods, out_dtype=out_dtype)
+
+
+def max_multi(
+    timeperiods: Iterable[int],
+    real: IntoExpr = pl.col("high"),
+    out_dtype: str = "f64",
+    engine: str = "native",
+) -> pl.Expr:
+    """Highest value for every period of `timeperiods`, see `TAExpr.max_multi`.
+    plta.max_multi([10, 20, 55, 252])
+    """
+    return real.ta.max_multi(timeperiods, out_dtype=out_dtype, engine=engine)
+
+
+def min_multi(
+    timeperiods: Iterable[int],
+    real: IntoExpr = pl.col("low"),
+    out_dtype: str = "f64",
+    engine: str = "native",
+) -> pl.Expr:
+    """Lowest value for every period of `timeperiods`, see `TAExpr.max_multi`.
+    plta.min_multi([10, 20, 55, 252])
+    """
+    return real.ta.min_multi(timeperiods, out_dtype=out_dtype, engine=engine)
+
+
+def sum_multi(
+    timeperiods: Iterable[int],
+    real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
+    engine: str = "native",
+) -> pl.Expr:
+    """Summation for every period of `timeperiods`, see `TAExpr.sum_multi`.
+    plta.sum_multi(range(2, 501))
+    """
+    return real.ta.sum_multi(timeperiods, out_dtype=out_dtype, engine=engine)
+
+
+def sma_multi(
+    timeperiods: Iterable[int],
+    real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
+    engine: str = "native",
+) -> pl.Expr:
+    """Simple Moving Average for every period of `timeperiods`, see `TAExpr.sum_multi`.
+    plta.sma_multi(range(2, 501))
+    """
+    return real.ta.sma_multi(timeperiods, out_dtype=out_dtype, engine=engine)
+
+
+def var_multi(
+    timeperiods: Iterable[int],
+    real: IntoExpr = pl.col("close"),
+    nbdev: float = 1.0,
+    out_dtype: str = "f64",
+    engine: str = "native",
+) -> pl.Expr:
+    """Variance for every period of `timeperiods`, see `TAExpr.var_multi`.
+    plta.var_multi(range(2, 501))
+    """
+    return real.ta.var_multi(timeperiods, nbdev=nbdev, out_dtype=out_dtype, engine=engine)
 
 
-def ht_dcperiod(real: IntoExpr = pl.col("close")) -> pl.Expr:
+def stddev_multi(
+    timeperiods: Iterable[int],
+    real: IntoExpr = pl.col("close"),
+    nbdev: float = 1.0,
+    out_dtype: str = "f64",
+    engine: str = "native",
+) -> pl.Expr:
+    """Standard Deviation for every period of `timeperiods`, see `TAExpr.stddev_multi`.
+    plta.stddev_multi(range(2, 501), nbdev=2.0)
+    """
+    return real.ta.stddev_multi(timeperiods, nbdev=nbdev, out_dtype=out_dtype, engine=engine)
+
+
+def ht_dcperiod(real: IntoExpr = pl.col("close"), out_dtype: str = "f64") -> pl.Expr:
     """Hilbert Transform - Dominant Cycle Period (Cycle Indicators)
     pl.col("close").ta.ht_dcperiod()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.ht_dcperiod()
+    return real.ta.ht_dcperiod(out_dtype=out_dtype)
 
 
-def ht_dcphase(real: IntoExpr = pl.col("close")) -> pl.Expr:
+def ht_dcphase(real: IntoExpr = pl.col("close"), out_dtype: str = "f64") -> pl.Expr:
     """Hilbert Transform - Dominant Cycle Phase (Cycle Indicators)
     pl.col("close").ta.ht_dcphase()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.ht_dcphase()
+    return real.ta.ht_dcphase(out_dtype=out_dtype)
 
 
 def ht_phasor(real: IntoExpr = pl.col("close")) -> pl.Expr:
@@ -3724,9 +5999,29 @@ def ht_trendmode(real: IntoExpr = pl.col("close")) -> pl.Expr:
     return real.ta.ht_trendmode()
 
 
+def ht_all(
+    real: IntoExpr = pl.col("close"),
+    fields: list[str] | None = None,
+    out_dtype: str = "f64",
+) -> pl.Expr:
+    """Hilbert Transform - all cycle outputs (Cycle Indicators)
+    pl.col("close").ta.ht_all()
+
+    Inputs:
+        real
+    Parameters:
+        fields: None (all of `HT_FIELDS`)
+        out_dtype: f64
+    Outputs:
+        struct of dcperiod, dcphase, inphase, quadrature, sine, leadsine, trendmode, trendline
+    """
+    return real.ta.ht_all(fields=fields, out_dtype=out_dtype)
+
+
 def add(
     real0: IntoExpr = pl.col("high"),
     real1: IntoExpr = pl.col("low"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Arithmetic Add (Math Operators)
     pl.col("high").ta.add(pl.col("low"))
@@ -3734,15 +6029,18 @@ def add(
     Inputs:
         real0
         real1
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real0.ta.add(real1)
+    return real0.ta.add(real1, out_dtype=out_dtype)
 
 
 def div(
     real0: IntoExpr = pl.col("high"),
     real1: IntoExpr = pl.col("low"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Arithmetic Div (Math Operators)
     pl.col("high").ta.div(pl.col("low"))
@@ -3750,15 +6048,24 @@ def div(
     Inputs:
         real0
         real1
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real0.ta.div(real1)
+    return real0.ta.div(real1, out_dtype=out_dtype)
 
 
 def max(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 30,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
+    engine: str = "native",
 ) -> pl.Expr:
     """Highest value over a specified period (Math Operators)
     pl.col("close").ta.max(timeperiod=30)
@@ -3767,15 +6074,32 @@ def max(
         prices: ['close']
     Parameters:
         timeperiod: 30
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
+        engine: native
     Outputs:
         real
     """
-    return real.ta.max(timeperiod=timeperiod)
+    return real.ta.max(
+        timeperiod=timeperiod,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+        engine=engine,
+    )
 
 
 def maxindex(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 30,
+    engine: str = "native",
 ) -> pl.Expr:
     """Index of highest value over a specified period (Math Operators)
     pl.col("close").ta.maxindex(timeperiod=30)
@@ -3784,15 +6108,23 @@ def maxindex(
         prices: ['close']
     Parameters:
         timeperiod: 30
+        engine: native
     Outputs:
         integer
     """
-    return real.ta.maxindex(timeperiod=timeperiod)
+    return real.ta.maxindex(timeperiod=timeperiod, engine=engine)
 
 
 def min(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 30,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
+    engine: str = "native",
 ) -> pl.Expr:
     """Lowest value over a specified period (Math Operators)
     pl.col("close").ta.min(timeperiod=30)
@@ -3801,15 +6133,32 @@ def min(
         prices: ['close']
     Parameters:
         timeperiod: 30
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
+        engine: native
     Outputs:
         real
     """
-    return real.ta.min(timeperiod=timeperiod)
+    return real.ta.min(
+        timeperiod=timeperiod,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+        engine=engine,
+    )
 
 
 def minindex(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 30,
+    engine: str = "native",
 ) -> pl.Expr:
     """Index of lowest value over a specified period (Math Operators)
     pl.col("close").ta.minindex(timeperiod=30)
@@ -3818,15 +6167,17 @@ def minindex(
         prices: ['close']
     Parameters:
         timeperiod: 30
+        engine: native
     Outputs:
         integer
     """
-    return real.ta.minindex(timeperiod=timeperiod)
+    return real.ta.minindex(timeperiod=timeperiod, engine=engine)
 
 
 def minmax(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 30,
+    engine: str = "native",
 ) -> pl.Expr:
     """Lowest and highest values over a specified period (Math Operators)
     pl.col("close").ta.minmax(timeperiod=30)
@@ -3835,15 +6186,17 @@ def minmax(
         prices: ['close']
     Parameters:
         timeperiod: 30
+        engine: native
     Outputs:
         min, max
     """
-    return real.ta.minmax(timeperiod=timeperiod)
+    return real.ta.minmax(timeperiod=timeperiod, engine=engine)
 
 
 def minmaxindex(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 30,
+    engine: str = "native",
 ) -> pl.Expr:
     """Indexes of lowest and highest values over a specified period (Math Operators)
     pl.col("close").ta.minmaxindex(timeperiod=30)
@@ -3852,15 +6205,17 @@ def minmaxindex(
         prices: ['close']
     Parameters:
         timeperiod: 30
+        engine: native
     Outputs:
         minidx, maxidx
     """
-    return real.ta.minmaxindex(timeperiod=timeperiod)
+    return real.ta.minmaxindex(timeperiod=timeperiod, engine=engine)
 
 
 def mult(
     real0: IntoExpr = pl.col("high"),
     real1: IntoExpr = pl.col("low"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Arithmetic Mult (Math Operators)
     pl.col("high").ta.mult(pl.col("low"))
@@ -3868,15 +6223,18 @@ def mult(
     Inputs:
         real0
         real1
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real0.ta.mult(real1)
+    return real0.ta.mult(real1, out_dtype=out_dtype)
 
 
 def sub(
     real0: IntoExpr = pl.col("high"),
     real1: IntoExpr = pl.col("low"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Arithmetic Substraction (Math Operators)
     pl.col("high").ta.sub(pl.col("low"))
@@ -3884,15 +6242,23 @@ def sub(
     Inputs:
         real0
         real1
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real0.ta.sub(real1)
+    return real0.ta.sub(real1, out_dtype=out_dtype)
 
 
 def sum(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 30,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
 ) -> pl.Expr:
     """Summation (Math Operators)
     pl.col("close").ta.sum(timeperiod=30)
@@ -3901,220 +6267,279 @@ def sum(
         prices: ['close']
     Parameters:
         timeperiod: 30
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
     Outputs:
         real
     """
-    return real.ta.sum(timeperiod=timeperiod)
+    return real.ta.sum(
+        timeperiod=timeperiod,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+    )
 
 
 def acos(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Trigonometric ACos (Math Operators)
     pl.col("close").ta.acos()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.acos()
+    return real.ta.acos(out_dtype=out_dtype)
 
 
 def asin(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Trigonometric ASin (Math Operators)
     pl.col("close").ta.asin()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.asin()
+    return real.ta.asin(out_dtype=out_dtype)
 
 
 def atan(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Trigonometric ATan (Math Operators)
     pl.col("close").ta.atan()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.atan()
+    return real.ta.atan(out_dtype=out_dtype)
 
 
 def ceil(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Ceil (Math Operators)
     pl.col("close").ta.ceil()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.ceil()
+    return real.ta.ceil(out_dtype=out_dtype)
 
 
 def cos(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Trigonometric Cos (Math Operators)
     pl.col("close").ta.cos()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.cos()
+    return real.ta.cos(out_dtype=out_dtype)
 
 
 def cosh(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Trigonometric Cosh (Math Operators)
     pl.col("close").ta.cosh()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.cosh()
+    return real.ta.cosh(out_dtype=out_dtype)
 
 
 def exp(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Arithmetic Exp (Math Operators)
     pl.col("close").ta.exp()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.exp()
+    return real.ta.exp(out_dtype=out_dtype)
 
 
 def floor(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Floor (Math Operators)
     pl.col("close").ta.floor()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.floor()
+    return real.ta.floor(out_dtype=out_dtype)
 
 
 def ln(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Log Natural (Math Operators)
     pl.col("close").ta.ln()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.ln()
+    return real.ta.ln(out_dtype=out_dtype)
 
 
 def log10(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Log10 (Math Operators)
     pl.col("close").ta.log10()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.log10()
+    return real.ta.log10(out_dtype=out_dtype)
 
 
 def sin(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Trigonometric Sin (Math Operators)
     pl.col("close").ta.sin()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.sin()
+    return real.ta.sin(out_dtype=out_dtype)
 
 
 def sinh(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Trigonometric Sinh (Math Operators)
     pl.col("close").ta.sinh()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.sinh()
+    return real.ta.sinh(out_dtype=out_dtype)
 
 
 def sqrt(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Square Root (Math Operators)
     pl.col("close").ta.sqrt()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.sqrt()
+    return real.ta.sqrt(out_dtype=out_dtype)
 
 
 def tan(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Trigonometric Tan (Math Operators)
     pl.col("close").ta.tan()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.tan()
+    return real.ta.tan(out_dtype=out_dtype)
 
 
 def tanh(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Vector Trigonometric Tanh (Math Operators)
     pl.col("close").ta.tanh()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.tanh()
+    return real.ta.tanh(out_dtype=out_dtype)
 
 
 def adx(
@@ -4122,6 +6547,7 @@ def adx(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Average Directional Movement Index (Momentum Indicators)
     pl.col("close").ta.adx(pl.col("high"), pl.col("low"), timeperiod=14)
@@ -4130,10 +6556,11 @@ def adx(
         prices: ['high', 'low', 'close']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         real
     """
-    return close.ta.adx(high, low, timeperiod=timeperiod)
+    return close.ta.adx(high, low, timeperiod=timeperiod, out_dtype=out_dtype)
 
 
 def adxr(
@@ -4141,6 +6568,7 @@ def adxr(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Average Directional Movement Index Rating (Momentum Indicators)
     pl.col("close").ta.adxr(pl.col("high"), pl.col("low"), timeperiod=14)
@@ -4149,10 +6577,11 @@ def adxr(
         prices: ['high', 'low', 'close']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         real
     """
-    return close.ta.adxr(high, low, timeperiod=timeperiod)
+    return close.ta.adxr(high, low, timeperiod=timeperiod, out_dtype=out_dtype)
 
 
 def apo(
@@ -4160,6 +6589,7 @@ def apo(
     fastperiod: int = 12,
     slowperiod: int = 26,
     matype: int = 0,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Absolute Price Oscillator (Momentum Indicators)
     pl.col("close").ta.apo(timeperiod=12, matype=0)
@@ -4170,16 +6600,20 @@ def apo(
         fastperiod: 12
         slowperiod: 26
         matype: 0
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.apo(fastperiod=fastperiod, slowperiod=slowperiod, matype=matype)
+    return real.ta.apo(
+        fastperiod=fastperiod, slowperiod=slowperiod, matype=matype, out_dtype=out_dtype
+    )
 
 
 def aroon(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     timeperiod: int = 14,
+    engine: str = "native",
 ) -> pl.Expr:
     """Aroon (Momentum Indicators)
     pl.col("close").ta.aroon(pl.col("high"), pl.col("low"), timeperiod=14)
@@ -4188,16 +6622,19 @@ def aroon(
         prices: ['high', 'low']
     Parameters:
         timeperiod: 14
+        engine: native
     Outputs:
         aroondown, aroonup
     """
-    return high.ta.aroon(low, timeperiod=timeperiod)
+    return high.ta.aroon(low, timeperiod=timeperiod, engine=engine)
 
 
 def aroonosc(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
+    engine: str = "native",
 ) -> pl.Expr:
     """Aroon Oscillator (Momentum Indicators)
     pl.col("close").ta.aroonosc(pl.col("high"), pl.col("low"), timeperiod=14)
@@ -4206,10 +6643,12 @@ def aroonosc(
         prices: ['high', 'low']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
+        engine: native
     Outputs:
         real
     """
-    return high.ta.aroonosc(low, timeperiod=timeperiod)
+    return high.ta.aroonosc(low, timeperiod=timeperiod, out_dtype=out_dtype, engine=engine)
 
 
 def bop(
@@ -4217,16 +6656,19 @@ def bop(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Balance Of Power (Momentum Indicators)
     pl.col("open").ta.bop(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return open.ta.bop(high, low, close)
+    return open.ta.bop(high, low, close, out_dtype=out_dtype)
 
 
 def cci(
@@ -4234,6 +6676,7 @@ def cci(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Commodity Channel Index (Momentum Indicators)
     pl.col("close").ta.cci(pl.col("high"), pl.col("low"), timeperiod=14)
@@ -4242,46 +6685,92 @@ def cci(
         prices: ['high', 'low', 'close']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         real
     """
-    return close.ta.cci(high, low, timeperiod=timeperiod)
+    return close.ta.cci(high, low, timeperiod=timeperiod, out_dtype=out_dtype)
 
 
 def cmo(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
+) -> pl.Expr:
+    """Chande Momentum Oscillator (Momentum Indicators)
+    pl.col("close").ta.cmo(timeperiod=14)
+
+    Inputs:
+        real
+    Parameters:
+        timeperiod: 14
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
+    Outputs:
+        real
+    """
+    return real.ta.cmo(
+        timeperiod=timeperiod,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+    )
+
+
+def dx(
+    high: IntoExpr = pl.col("high"),
+    low: IntoExpr = pl.col("low"),
+    close: IntoExpr = pl.col("close"),
+    timeperiod: int = 14,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
-    """Chande Momentum Oscillator (Momentum Indicators)
-    pl.col("close").ta.cmo(timeperiod=14)
+    """Directional Movement Index (Momentum Indicators)
+    pl.col("close").ta.dx(pl.col("high"), pl.col("low"), timeperiod=14)
 
     Inputs:
-        real
+        prices: ['high', 'low', 'close']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.cmo(timeperiod=timeperiod)
+    return close.ta.dx(high, low, timeperiod=timeperiod, out_dtype=out_dtype)
 
 
-def dx(
+def dmi(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    fields: list[str] | None = None,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
-    """Directional Movement Index (Momentum Indicators)
-    pl.col("close").ta.dx(pl.col("high"), pl.col("low"), timeperiod=14)
+    """Directional Movement family (Momentum Indicators)
+    pl.col("close").ta.dmi(pl.col("high"), pl.col("low"), timeperiod=14)
 
     Inputs:
         prices: ['high', 'low', 'close']
     Parameters:
         timeperiod: 14
+        fields: None (all of `DMI_FIELDS`)
+        out_dtype: f64
     Outputs:
-        real
+        struct of plus_dm, minus_dm, plus_di, minus_di, dx, adx, adxr
     """
-    return close.ta.dx(high, low, timeperiod=timeperiod)
+    return close.ta.dmi(high, low, timeperiod=timeperiod, fields=fields, out_dtype=out_dtype)
 
 
 def macd(
@@ -4353,12 +6842,56 @@ def macdfix(real: IntoExpr = pl.col("close"), signalperiod: int = 9) -> pl.Expr:
     return real.ta.macdfix(signalperiod=signalperiod)
 
 
+def macd_all(
+    real: IntoExpr = pl.col("close"),
+    fastperiod: int = 12,
+    slowperiod: int = 26,
+    signalperiod: int = 9,
+    matype: int = 1,
+    signalmatype: int = 1,
+    fields: list[str] | None = None,
+    out_dtype: str = "f64",
+    specs: list[tuple[int, int, int, int]] | None = None,
+    macdfix: list[int] | None = None,
+) -> pl.Expr:
+    """MACD / APO / PPO family over one or more specs (Momentum Indicators)
+    pl.col("close").ta.macd_all(specs=[(12, 26, 9, 1), (5, 35, 5, 1)], macdfix=[9])
+
+    Inputs:
+        real
+    Parameters:
+        fastperiod: 12
+        slowperiod: 26
+        signalperiod: 9
+        matype: 1 (EMA)
+        signalmatype: 1 (EMA, `macdfix` specs always use EMA)
+        fields: None (all of `MACD_FIELDS`)
+        out_dtype: f64
+        specs: None ((fastperiod, slowperiod, signalperiod, matype) tuples)
+        macdfix: None (signal periods)
+    Outputs:
+        struct of macd, macdsignal, macdhist, apo, ppo, fast_ma, slow_ma per spec
+    """
+    return real.ta.macd_all(
+        fastperiod=fastperiod,
+        slowperiod=slowperiod,
+        signalperiod=signalperiod,
+        matype=matype,
+        signalmatype=signalmatype,
+        fields=fields,
+        out_dtype=out_dtype,
+        specs=specs,
+        macdfix=macdfix,
+    )
+
+
 def mfi(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     volume: IntoExpr = pl.col("volume"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Money Flow Index (Momentum Indicators)
     pl.col("close").ta.mfi(pl.col("high"), pl.col("low"), pl.col("volume"), timeperiod=14)
@@ -4368,10 +6901,11 @@ def mfi(
         volume
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         real
     """
-    return close.ta.mfi(high, low, volume, timeperiod=timeperiod)
+    return close.ta.mfi(high, low, volume, timeperiod=timeperiod, out_dtype=out_dtype)
 
 
 def minus_di(
@@ -4379,6 +6913,7 @@ def minus_di(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Minus Directional Indicator (Momentum Indicators)
     pl.col("close").ta.minus_di(pl.col("high"), pl.col("low"), timeperiod=14)
@@ -4387,16 +6922,18 @@ def minus_di(
         prices: ['high', 'low', 'close']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         real
     """
-    return close.ta.minus_di(high, low, timeperiod=timeperiod)
+    return close.ta.minus_di(high, low, timeperiod=timeperiod, out_dtype=out_dtype)
 
 
 def minus_dm(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Minus Directional Movement (Momentum Indicators)
     pl.col("high").ta.minus_dm("low", timeperiod=14)
@@ -4405,15 +6942,22 @@ def minus_dm(
         prices: ['high', 'low']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         real
     """
-    return high.ta.minus_dm(low, timeperiod=timeperiod)
+    return high.ta.minus_dm(low, timeperiod=timeperiod, out_dtype=out_dtype)
 
 
 def mom(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 10,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
 ) -> pl.Expr:
     """Momentum (Momentum Indicators)
     pl.col("close").ta.mom(timeperiod=10)
@@ -4422,10 +6966,24 @@ def mom(
         real
     Parameters:
         timeperiod: 10
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
     Outputs:
         real
     """
-    return real.ta.mom(timeperiod=timeperiod)
+    return real.ta.mom(
+        timeperiod=timeperiod,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+    )
 
 
 def plus_di(
@@ -4433,6 +6991,7 @@ def plus_di(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Plus Directional Indicator (Momentum Indicators)
     pl.col("close").ta.plus_di(pl.col("high"), pl.col("low"), timeperiod=14)
@@ -4441,16 +7000,18 @@ def plus_di(
         prices: ['high', 'low', 'close']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         real
     """
-    return close.ta.plus_di(high, low, timeperiod=timeperiod)
+    return close.ta.plus_di(high, low, timeperiod=timeperiod, out_dtype=out_dtype)
 
 
 def plus_dm(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Plus Directional Movement (Momentum Indicators)
     pl.col("high").ta.plus_dm("low", timeperiod=14)
@@ -4459,10 +7020,11 @@ def plus_dm(
         prices: ['high', 'low']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         real
     """
-    return high.ta.plus_dm(low, timeperiod=timeperiod)
+    return high.ta.plus_dm(low, timeperiod=timeperiod, out_dtype=out_dtype)
 
 
 def ppo(
@@ -4470,6 +7032,7 @@ def ppo(
     fastperiod: int = 12,
     slowperiod: int = 26,
     matype: int = 0,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Percentage Price Oscillator (Momentum Indicators)
     pl.col("close").ta.ppo(timeperiod=12, matype=0)
@@ -4480,15 +7043,24 @@ def ppo(
         fastperiod: 12
         slowperiod: 26
         matype: 0
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.ppo(fastperiod=fastperiod, slowperiod=slowperiod, matype=matype)
+    return real.ta.ppo(
+        fastperiod=fastperiod, slowperiod=slowperiod, matype=matype, out_dtype=out_dtype
+    )
 
 
 def roc(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 10,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
 ) -> pl.Expr:
     """Rate of change : ((price/prevPrice)-1)*100 (Momentum Indicators)
     pl.col("close").ta.roc(timeperiod=10)
@@ -4497,15 +7069,35 @@ def roc(
         real
     Parameters:
         timeperiod: 10
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
     Outputs:
         real
     """
-    return real.ta.roc(timeperiod=timeperiod)
+    return real.ta.roc(
+        timeperiod=timeperiod,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+    )
 
 
 def rocp(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 10,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
 ) -> pl.Expr:
     """Rate of change Percentage: (price-prevPrice)/prevPrice (Momentum Indicators)
     pl.col("close").ta.rocp(timeperiod=10)
@@ -4514,15 +7106,35 @@ def rocp(
         real
     Parameters:
         timeperiod: 10
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
     Outputs:
         real
     """
-    return real.ta.rocp(timeperiod=timeperiod)
+    return real.ta.rocp(
+        timeperiod=timeperiod,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+    )
 
 
 def rocr(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 10,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
 ) -> pl.Expr:
     """Rate of change ratio: (price/prevPrice) (Momentum Indicators)
     pl.col("close").ta.rocr(timeperiod=10)
@@ -4531,15 +7143,35 @@ def rocr(
         real
     Parameters:
         timeperiod: 10
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
     Outputs:
         real
     """
-    return real.ta.rocr(timeperiod=timeperiod)
+    return real.ta.rocr(
+        timeperiod=timeperiod,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+    )
 
 
 def rocr100(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 10,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
 ) -> pl.Expr:
     """Rate of change ratio 100 scale: (price/prevPrice)*100 (Momentum Indicators)
     pl.col("close").ta.rocr100(timeperiod=10)
@@ -4548,15 +7180,36 @@ def rocr100(
         real
     Parameters:
         timeperiod: 10
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
     Outputs:
         real
     """
-    return real.ta.rocr100(timeperiod=timeperiod)
+    return real.ta.rocr100(
+        timeperiod=timeperiod,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+    )
 
 
 def rsi(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
+    engine: str = "native",
 ) -> pl.Expr:
     """Relative Strength Index (Momentum Indicators)
     pl.col("close").ta.rsi(timeperiod=14)
@@ -4565,10 +7218,28 @@ def rsi(
         real
     Parameters:
         timeperiod: 14
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
+        engine: native
+            default, a parallel prefix scan on long series: differs from TA-Lib
+            by rounding, within `SCAN_TOLERANCE`; "talib" gives its exact values
     Outputs:
         real
     """
-    return real.ta.rsi(timeperiod=timeperiod)
+    return real.ta.rsi(
+        timeperiod=timeperiod,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+        engine=engine,
+    )
 
 
 def stoch(
@@ -4660,7 +7331,69 @@ def stochrsi(
     )
 
 
-def trix(price: IntoExpr = pl.col("close"), timeperiod: int = 30) -> pl.Expr:
+def stoch_all(
+    high: IntoExpr = pl.col("high"),
+    low: IntoExpr = pl.col("low"),
+    close: IntoExpr = pl.col("close"),
+    fastk_period: int = 5,
+    slowk_period: int = 3,
+    slowk_matype: int = 0,
+    slowd_period: int = 3,
+    slowd_matype: int = 0,
+    fastd_period: int = 3,
+    fastd_matype: int = 0,
+    willr_period: int = 14,
+    rsi_period: int = 14,
+    fields: list[str] | None = None,
+    out_dtype: str = "f64",
+) -> pl.Expr:
+    """Stochastic family over shared rolling extremes (Momentum Indicators)
+    pl.col("close").ta.stoch_all(pl.col("high"), pl.col("low"), fastk_period=5)
+
+    Inputs:
+        prices: ['high', 'low', 'close']
+    Parameters:
+        fastk_period: 5
+        slowk_period: 3
+        slowk_matype: 0
+        slowd_period: 3
+        slowd_matype: 0
+        fastd_period: 3
+        fastd_matype: 0
+        willr_period: 14
+        rsi_period: 14
+        fields: None (all of `STOCH_FIELDS`)
+        out_dtype: f64
+    Outputs:
+        struct of slowk, slowd, fastk, fastd, willr, stochrsi_fastk, stochrsi_fastd
+    """
+    return close.ta.stoch_all(
+        high,
+        low,
+        fastk_period=fastk_period,
+        slowk_period=slowk_period,
+        slowk_matype=slowk_matype,
+        slowd_period=slowd_period,
+        slowd_matype=slowd_matype,
+        fastd_period=fastd_period,
+        fastd_matype=fastd_matype,
+        willr_period=willr_period,
+        rsi_period=rsi_period,
+        fields=fields,
+        out_dtype=out_dtype,
+    )
+
+
+def trix(
+    price: IntoExpr = pl.col("close"),
+    timeperiod: int = 30,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
+) -> pl.Expr:
     """1-day Rate-Of-Change (ROC) of a Triple Smooth EMA (Momentum Indicators)
     pl.col("close").ta.trix(timeperiod=30)
 
@@ -4668,10 +7401,24 @@ def trix(price: IntoExpr = pl.col("close"), timeperiod: int = 30) -> pl.Expr:
         prices: ['close']
     Parameters:
         timeperiod: 30
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
     Outputs:
         real
     """
-    return price.ta.trix(timeperiod=timeperiod)
+    return price.ta.trix(
+        timeperiod=timeperiod,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+    )
 
 
 def ultosc(
@@ -4681,6 +7428,7 @@ def ultosc(
     timeperiod1: int = 7,
     timeperiod2: int = 14,
     timeperiod3: int = 28,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Ultimate Oscillator (Momentum Indicators)
     pl.col("close").ta.ultosc(pl.col("high"), pl.col("low"), timeperiod1=7, timeperiod2=14, timeperiod3=28)
@@ -4691,11 +7439,13 @@ def ultosc(
         timeperiod1: 7
         timeperiod2: 14
         timeperiod3: 28
+        out_dtype: f64
     Outputs:
         real
     """
     return close.ta.ultosc(
-        high, low, timeperiod1=timeperiod1, timeperiod2=timeperiod2, timeperiod3=timeperiod3
+        high, low, timeperiod1=timeperiod1, timeperiod2=timeperiod2, timeperiod3=timeperiod3,
+        out_dtype=out_dtype,
     )
 
 
@@ -4704,6 +7454,8 @@ def willr(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
+    engine: str = "native",
 ) -> pl.Expr:
     """Williams' %R (Momentum Indicators)
     pl.col("close").ta.willr(pl.col("high"), pl.col("low"), timeperiod=14)
@@ -4712,10 +7464,12 @@ def willr(
         prices: ['high', 'low', 'close']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
+        engine: native
     Outputs:
         real
     """
-    return close.ta.willr(high, low, timeperiod=timeperiod)
+    return close.ta.willr(high, low, timeperiod=timeperiod, out_dtype=out_dtype, engine=engine)
 
 
 def bbands(
@@ -4743,7 +7497,14 @@ def bbands(
 
 def dema(
     real: IntoExpr = pl.col("close"),
-    timeperiod: int = 30,
+    timeperiod: int | pl.Expr = 30,
+    by: IntoExpr | None = None,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
 ) -> pl.Expr:
     """Double Exponential Moving Average (Overlap Studies)
     pl.col("close").ta.dema(timeperiod=30)
@@ -4752,15 +7513,39 @@ def dema(
         real
     Parameters:
         timeperiod: 30
+        by: None
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
     Outputs:
         real
     """
-    return real.ta.dema(timeperiod=timeperiod)
+    return real.ta.dema(
+        timeperiod=timeperiod,
+        by=by,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+    )
 
 
 def ema(
     real: IntoExpr = pl.col("close"),
-    timeperiod: int = 30,
+    timeperiod: int | pl.Expr = 30,
+    by: IntoExpr | None = None,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
+    engine: str = "native",
 ) -> pl.Expr:
     """Exponential Moving Average (Overlap Studies)
     pl.col("close").ta.ema(timeperiod=30)
@@ -4769,29 +7554,59 @@ def ema(
         real
     Parameters:
         timeperiod: 30
+        by: None
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
+        engine: native
+            default, a parallel prefix scan on long series: differs from TA-Lib
+            by rounding, within `SCAN_TOLERANCE`; "talib" gives its exact values
     Outputs:
         real
     """
-    return real.ta.ema(timeperiod=timeperiod)
+    return real.ta.ema(
+        timeperiod=timeperiod,
+        by=by,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+        engine=engine,
+    )
 
 
 def ht_trendline(
     real: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Hilbert Transform - Instantaneous Trendline (Overlap Studies)
     pl.col("close").ta.ht_trendline()
 
     Inputs:
         real
+    Parameters:
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.ht_trendline()
+    return real.ta.ht_trendline(out_dtype=out_dtype)
 
 
 def kama(
     real: IntoExpr = pl.col("close"),
-    timeperiod: int = 30,
+    timeperiod: int | pl.Expr = 30,
+    by: IntoExpr | None = None,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
 ) -> pl.Expr:
     """Kaufman Adaptive Moving Average (Overlap Studies)
     pl.col("close").ta.kama(timeperiod=30)
@@ -4800,10 +7615,26 @@ def kama(
         real
     Parameters:
         timeperiod: 30
+        by: None
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
     Outputs:
         real
     """
-    return real.ta.kama(timeperiod=timeperiod)
+    return real.ta.kama(
+        timeperiod=timeperiod,
+        by=by,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+    )
 
 
 def mama(
@@ -4831,6 +7662,7 @@ def mavp(
     minperiod: int = 2,
     maxperiod: int = 30,
     matype: int = 0,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Moving average with variable period (Overlap Studies)
     pl.col("close").ta.mavp(pl.col("periods"), minperiod=2, maxperiod=30, matype=0)
@@ -4842,15 +7674,26 @@ def mavp(
         minperiod: 2
         maxperiod: 30
         matype: 0
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.mavp(periods, minperiod=minperiod, maxperiod=maxperiod, matype=matype)
+    return real.ta.mavp(
+        periods, minperiod=minperiod, maxperiod=maxperiod, matype=matype, out_dtype=out_dtype
+    )
 
 
 def midpoint(
     real: IntoExpr = pl.col("close"),
-    timeperiod: int = 14,
+    timeperiod: int | pl.Expr = 14,
+    by: IntoExpr | None = None,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
+    engine: str = "native",
 ) -> pl.Expr:
     """MidPoint over period (Overlap Studies)
     pl.col("close").ta.midpoint(timeperiod=14)
@@ -4859,16 +7702,36 @@ def midpoint(
         real
     Parameters:
         timeperiod: 14
+        by: None
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
+        engine: native
     Outputs:
         real
     """
-    return real.ta.midpoint(timeperiod=timeperiod)
+    return real.ta.midpoint(
+        timeperiod=timeperiod,
+        by=by,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+        engine=engine,
+    )
 
 
 def midprice(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
+    engine: str = "native",
 ) -> pl.Expr:
     """Midpoint Price over period (Overlap Studies)
     pl.col("high").ta.midprice("low", timeperiod=14)
@@ -4877,10 +7740,12 @@ def midprice(
         prices: ['high', 'low']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
+        engine: native
     Outputs:
         real
     """
-    return high.ta.midprice(low, timeperiod=timeperiod)
+    return high.ta.midprice(low, timeperiod=timeperiod, out_dtype=out_dtype, engine=engine)
 
 
 def sar(
@@ -4888,6 +7753,7 @@ def sar(
     low: IntoExpr = pl.col("low"),
     acceleration: float = 0.02,
     maximum: float = 0.2,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Parabolic SAR (Overlap Studies)
     pl.col("high").ta.sar("low", acceleration=0.02, maximum=0.2)
@@ -4897,10 +7763,11 @@ def sar(
     Parameters:
         acceleration: 0.02
         maximum: 0.2
+        out_dtype: f64
     Outputs:
         real
     """
-    return high.ta.sar(low, acceleration=acceleration, maximum=maximum)
+    return high.ta.sar(low, acceleration=acceleration, maximum=maximum, out_dtype=out_dtype)
 
 
 def sarext(
@@ -4914,6 +7781,7 @@ def sarext(
     accelerationinitshort: float = 0.02,
     accelerationshort: float = 0.02,
     accelerationmaxshort: float = 0.2,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Parabolic SAR - Extended (Overlap Studies)
     pl.col("high").ta.sarext("low", startvalue=0, offsetonreverse=0, accelerationinitlong=0.02, accelerationlong=0.02, accelerationmaxlong=0.2, accelerationinitshort=0.02, accelerationshort=0.02, accelerationmaxshort=0.2)
@@ -4929,6 +7797,7 @@ def sarext(
         accelerationinitshort: 0.02
         accelerationshort: 0.02
         accelerationmaxshort: 0.2
+        out_dtype: f64
     Outputs:
         real
     """
@@ -4942,10 +7811,22 @@ def sarext(
         accelerationinitshort=accelerationinitshort,
         accelerationshort=accelerationshort,
         accelerationmaxshort=accelerationmaxshort,
+        out_dtype=out_dtype,
     )
 
 
-def sma(real: IntoExpr = pl.col("close"), timeperiod: int = 30) -> pl.Expr:
+def sma(
+    real: IntoExpr = pl.col("close"),
+    timeperiod: int | pl.Expr = 30,
+    by: IntoExpr | None = None,
+    out_dtype: str = "f64",
+    engine: str = "native",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
+) -> pl.Expr:
     """Simple Moving Average (Overlap Studies)
     pl.col("close").ta.sma(timeperiod=30)
 
@@ -4953,16 +7834,37 @@ def sma(real: IntoExpr = pl.col("close"), timeperiod: int = 30) -> pl.Expr:
         real
     Parameters:
         timeperiod: 30
+        by: None
+        out_dtype: f64
+        engine: native
+            default, parallel chunks on long series: differs from TA-Lib by the rounding
+            of its running sums, see the README; "talib" gives its exact values
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
     Outputs:
         real
     """
-    return real.ta.sma(timeperiod=timeperiod)
+    return real.ta.sma(
+        timeperiod=timeperiod,
+        by=by,
+        out_dtype=out_dtype,
+        engine=engine,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+    )
 
 
 def ma(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 30,
     matype: int = 0,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Moving average (Overlap Studies)
     pl.col("close").ta.ma(timeperiod=30, matype=0)
@@ -4972,16 +7874,18 @@ def ma(
     Parameters:
         timeperiod: 30
         matype: 0
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.ma(timeperiod=timeperiod, matype=matype)
+    return real.ta.ma(timeperiod=timeperiod, matype=matype, out_dtype=out_dtype)
 
 
 def t3(
     real: IntoExpr = pl.col("close"),
     timeperiod: int = 5,
     vfactor: float = 0.7,
+    out_dtype: str = "f64",
 ) -> pl.Expr:
     """Triple Exponential Moving Average (Overlap Studies)
     pl.col("close").ta.t3(timeperiod=5, vfactor=0.7)
@@ -4991,15 +7895,23 @@ def t3(
     Parameters:
         timeperiod: 5
         vfactor: 0.7
+        out_dtype: f64
     Outputs:
         real
     """
-    return real.ta.t3(timeperiod=timeperiod, vfactor=vfactor)
+    return real.ta.t3(timeperiod=timeperiod, vfactor=vfactor, out_dtype=out_dtype)
 
 
 def tema(
     real: IntoExpr = pl.col("close"),
-    timeperiod: int = 30,
+    timeperiod: int | pl.Expr = 30,
+    by: IntoExpr | None = None,
+    out_dtype: str = "f64",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
 ) -> pl.Expr:
     """Triple Exponential Moving Average (Overlap Studies)
     pl.col("close").ta.tema(timeperiod=30)
@@ -5008,15 +7920,39 @@ def tema(
         real
     Parameters:
         timeperiod: 30
+        by: None
+        out_dtype: f64
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
     Outputs:
         real
     """
-    return real.ta.tema(timeperiod=timeperiod)
+    return real.ta.tema(
+        timeperiod=timeperiod,
+        by=by,
+        out_dtype=out_dtype,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+    )
 
 
 def trima(
     real: IntoExpr = pl.col("close"),
-    timeperiod: int = 30,
+    timeperiod: int | pl.Expr = 30,
+    by: IntoExpr | None = None,
+    out_dtype: str = "f64",
+    engine: str = "native",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
 ) -> pl.Expr:
     """Triangular Moving Average (Overlap Studies)
     pl.col("close").ta.trima(timeperiod=30)
@@ -5025,15 +7961,43 @@ def trima(
         real
     Parameters:
         timeperiod: 30
+        by: None
+        out_dtype: f64
+        engine: native
+            default, parallel chunks on long series: differs from TA-Lib by the rounding
+            of its running sums, see the README; "talib" gives its exact values
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
     Outputs:
         real
     """
-    return real.ta.trima(timeperiod=timeperiod)
+    return real.ta.trima(
+        timeperiod=timeperiod,
+        by=by,
+        out_dtype=out_dtype,
+        engine=engine,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+    )
 
 
 def wma(
     real: IntoExpr = pl.col("close"),
-    timeperiod: int = 30,
+    timeperiod: int | pl.Expr = 30,
+    by: IntoExpr | None = None,
+    out_dtype: str = "f64",
+    engine: str = "native",
+    last_n: int | None = None,
+    start: int | None = None,
+    end: int | None = None,
+    warmup: int | None = None,
+    agg: str | None = None,
 ) -> pl.Expr:
     """Weighted Moving Average (Overlap Studies)
     pl.col("close").ta.wma(timeperiod=30)
@@ -5042,10 +8006,30 @@ def wma(
         real
     Parameters:
         timeperiod: 30
+        by: None
+        out_dtype: f64
+        engine: native
+            default, parallel chunks on long series: differs from TA-Lib by the rounding
+            of its running sums, see the README; "talib" gives its exact values
+        last_n: None
+        start: None
+        end: None
+        warmup: None
+        agg: None
     Outputs:
         real
     """
-    return real.ta.wma(timeperiod=timeperiod)
+    return real.ta.wma(
+        timeperiod=timeperiod,
+        by=by,
+        out_dtype=out_dtype,
+        engine=engine,
+        last_n=last_n,
+        start=start,
+        end=end,
+        warmup=warmup,
+        agg=agg,
+    )
 
 
 def cdl2crows(
@@ -5053,17 +8037,24 @@ def cdl2crows(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Two Crows (Pattern Recognition)
     pl.col("open").ta.cdl2crows(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdl2crows(high, low, close)
+    return open.ta.cdl2crows(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdl3blackcrows(
@@ -5071,17 +8062,24 @@ def cdl3blackcrows(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Three Black Crows (Pattern Recognition)
     pl.col("open").ta.cdl3blackcrows(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdl3blackcrows(high, low, close)
+    return open.ta.cdl3blackcrows(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdl3inside(
@@ -5089,17 +8087,24 @@ def cdl3inside(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Three Inside Up/Down (Pattern Recognition)
     pl.col("open").ta.cdl3inside(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdl3inside(high, low, close)
+    return open.ta.cdl3inside(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdl3linestrike(
@@ -5107,17 +8112,24 @@ def cdl3linestrike(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Three-Line Strike  (Pattern Recognition)
     pl.col("open").ta.cdl3linestrike(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdl3linestrike(high, low, close)
+    return open.ta.cdl3linestrike(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdl3outside(
@@ -5125,17 +8137,24 @@ def cdl3outside(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Three Outside Up/Down (Pattern Recognition)
     pl.col("open").ta.cdl3outside(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdl3outside(high, low, close)
+    return open.ta.cdl3outside(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdl3starsinsouth(
@@ -5143,17 +8162,24 @@ def cdl3starsinsouth(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Three Stars In The South (Pattern Recognition)
     pl.col("open").ta.cdl3starsinsouth(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdl3starsinsouth(high, low, close)
+    return open.ta.cdl3starsinsouth(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdl3whitesoldiers(
@@ -5161,17 +8187,24 @@ def cdl3whitesoldiers(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Three Advancing White Soldiers (Pattern Recognition)
     pl.col("open").ta.cdl3whitesoldiers(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdl3whitesoldiers(high, low, close)
+    return open.ta.cdl3whitesoldiers(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlabandonedbaby(
@@ -5180,6 +8213,8 @@ def cdlabandonedbaby(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     penetration: float = 0.3,
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Abandoned Baby (Pattern Recognition)
     pl.col("open").ta.cdlabandonedbaby(pl.col("high"), pl.col("low"), pl.col("close"), penetration=0.3)
@@ -5188,11 +8223,22 @@ def cdlabandonedbaby(
         prices: ['open', 'high', 'low', 'close']
     Parameters:
         penetration: 0.3
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlabandonedbaby(high, low, close, penetration=penetration)
+    return open.ta.cdlabandonedbaby(
+        high,
+        low,
+        close,
+        penetration=penetration,
+        out_dtype=out_dtype,
+        engine=engine,
+    )
 
 
 def cdladvanceblock(
@@ -5200,17 +8246,24 @@ def cdladvanceblock(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Advance Block (Pattern Recognition)
     pl.col("open").ta.cdladvanceblock(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdladvanceblock(high, low, close)
+    return open.ta.cdladvanceblock(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlbelthold(
@@ -5218,17 +8271,24 @@ def cdlbelthold(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Belt-hold (Pattern Recognition)
     pl.col("open").ta.cdlbelthold(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlbelthold(high, low, close)
+    return open.ta.cdlbelthold(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlbreakaway(
@@ -5236,17 +8296,24 @@ def cdlbreakaway(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Breakaway (Pattern Recognition)
     pl.col("open").ta.cdlbreakaway(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlbreakaway(high, low, close)
+    return open.ta.cdlbreakaway(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlclosingmarubozu(
@@ -5254,17 +8321,24 @@ def cdlclosingmarubozu(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Closing Marubozu (Pattern Recognition)
     pl.col("open").ta.cdlclosingmarubozu(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlclosingmarubozu(high, low, close)
+    return open.ta.cdlclosingmarubozu(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlconcealbabyswall(
@@ -5272,17 +8346,24 @@ def cdlconcealbabyswall(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Concealing Baby Swallow (Pattern Recognition)
     pl.col("open").ta.cdlconcealbabyswall(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlconcealbabyswall(high, low, close)
+    return open.ta.cdlconcealbabyswall(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlcounterattack(
@@ -5290,17 +8371,24 @@ def cdlcounterattack(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Counterattack (Pattern Recognition)
     pl.col("open").ta.cdlcounterattack(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlcounterattack(high, low, close)
+    return open.ta.cdlcounterattack(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdldarkcloudcover(
@@ -5309,6 +8397,8 @@ def cdldarkcloudcover(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     penetration: float = 0.3,
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Dark Cloud Cover (Pattern Recognition)
     pl.col("open").ta.cdldarkcloudcover(pl.col("high"), pl.col("low"), pl.col("close"), penetration=0.3)
@@ -5317,11 +8407,22 @@ def cdldarkcloudcover(
         prices: ['open', 'high', 'low', 'close']
     Parameters:
         penetration: 0.5
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdldarkcloudcover(high, low, close, penetration=penetration)
+    return open.ta.cdldarkcloudcover(
+        high,
+        low,
+        close,
+        penetration=penetration,
+        out_dtype=out_dtype,
+        engine=engine,
+    )
 
 
 def cdldoji(
@@ -5329,17 +8430,24 @@ def cdldoji(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Doji (Pattern Recognition)
     pl.col("open").ta.cdldoji(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdldoji(high, low, close)
+    return open.ta.cdldoji(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdldojistar(
@@ -5347,17 +8455,24 @@ def cdldojistar(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Doji Star (Pattern Recognition)
     pl.col("open").ta.cdldojistar(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdldojistar(high, low, close)
+    return open.ta.cdldojistar(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdldragonflydoji(
@@ -5365,17 +8480,24 @@ def cdldragonflydoji(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Dragonfly Doji (Pattern Recognition)
     pl.col("open").ta.cdldragonflydoji(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdldragonflydoji(high, low, close)
+    return open.ta.cdldragonflydoji(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlengulfing(
@@ -5383,17 +8505,24 @@ def cdlengulfing(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Engulfing Pattern (Pattern Recognition)
     pl.col("open").ta.cdlengulfing(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlengulfing(high, low, close)
+    return open.ta.cdlengulfing(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdleveningdojistar(
@@ -5402,6 +8531,8 @@ def cdleveningdojistar(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     penetration: float = 0.3,
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Evening Doji Star (Pattern Recognition)
     pl.col("open").ta.cdleveningdojistar(pl.col("high"), pl.col("low"), pl.col("close"), penetration=0.3)
@@ -5410,11 +8541,17 @@ def cdleveningdojistar(
         prices: ['open', 'high', 'low', 'close']
     Parameters:
         penetration: 0.3
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdleveningdojistar(high, low, close, penetration=penetration)
+    return open.ta.cdleveningdojistar(
+        high, low, close, penetration=penetration, out_dtype=out_dtype, engine=engine
+    )
 
 
 def cdleveningstar(
@@ -5423,6 +8560,8 @@ def cdleveningstar(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     penetration: float = 0.3,
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Evening Star (Pattern Recognition)
     pl.col("open").ta.cdleveningstar(pl.col("high"), pl.col("low"), pl.col("close"), penetration=0.3)
@@ -5431,11 +8570,22 @@ def cdleveningstar(
         prices: ['open', 'high', 'low', 'close']
     Parameters:
         penetration: 0.3
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdleveningstar(high, low, close, penetration=penetration)
+    return open.ta.cdleveningstar(
+        high,
+        low,
+        close,
+        penetration=penetration,
+        out_dtype=out_dtype,
+        engine=engine,
+    )
 
 
 def cdlgapsidesidewhite(
@@ -5443,17 +8593,24 @@ def cdlgapsidesidewhite(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Up/Down-gap side-by-side white lines (Pattern Recognition)
     pl.col("open").ta.cdlgapsidesidewhite(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlgapsidesidewhite(high, low, close)
+    return open.ta.cdlgapsidesidewhite(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlgravestonedoji(
@@ -5461,17 +8618,24 @@ def cdlgravestonedoji(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Gravestone Doji (Pattern Recognition)
     pl.col("open").ta.cdlgravestonedoji(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlgravestonedoji(high, low, close)
+    return open.ta.cdlgravestonedoji(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlhammer(
@@ -5479,17 +8643,24 @@ def cdlhammer(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Hammer (Pattern Recognition)
     pl.col("open").ta.cdlhammer(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlhammer(high, low, close)
+    return open.ta.cdlhammer(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlhangingman(
@@ -5497,17 +8668,24 @@ def cdlhangingman(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Hanging Man (Pattern Recognition)
     pl.col("open").ta.cdlhangingman(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlhangingman(high, low, close)
+    return open.ta.cdlhangingman(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlharami(
@@ -5515,17 +8693,24 @@ def cdlharami(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Harami Pattern (Pattern Recognition)
     pl.col("open").ta.cdlharami(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlharami(high, low, close)
+    return open.ta.cdlharami(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlharamicross(
@@ -5533,17 +8718,24 @@ def cdlharamicross(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Harami Cross Pattern (Pattern Recognition)
     pl.col("open").ta.cdlharamicross(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlharamicross(high, low, close)
+    return open.ta.cdlharamicross(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlhighwave(
@@ -5551,17 +8743,24 @@ def cdlhighwave(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """High-Wave Candle (Pattern Recognition)
     pl.col("open").ta.cdlhighwave(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlhighwave(high, low, close)
+    return open.ta.cdlhighwave(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlhikkake(
@@ -5569,17 +8768,24 @@ def cdlhikkake(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Hikkake Pattern (Pattern Recognition)
     pl.col("open").ta.cdlhikkake(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlhikkake(high, low, close)
+    return open.ta.cdlhikkake(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlhikkakemod(
@@ -5587,17 +8793,24 @@ def cdlhikkakemod(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Modified Hikkake Pattern (Pattern Recognition)
     pl.col("open").ta.cdlhikkakemod(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlhikkakemod(high, low, close)
+    return open.ta.cdlhikkakemod(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlhomingpigeon(
@@ -5605,17 +8818,24 @@ def cdlhomingpigeon(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Homing Pigeon (Pattern Recognition)
     pl.col("open").ta.cdlhomingpigeon(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlhomingpigeon(high, low, close)
+    return open.ta.cdlhomingpigeon(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlidentical3crows(
@@ -5623,17 +8843,24 @@ def cdlidentical3crows(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Identical Three Crows (Pattern Recognition)
     pl.col("open").ta.cdlidentical3crows(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlidentical3crows(high, low, close)
+    return open.ta.cdlidentical3crows(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlinneck(
@@ -5641,17 +8868,24 @@ def cdlinneck(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """In-Neck Pattern (Pattern Recognition)
     pl.col("open").ta.cdlinneck(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlinneck(high, low, close)
+    return open.ta.cdlinneck(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlinvertedhammer(
@@ -5659,17 +8893,24 @@ def cdlinvertedhammer(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Inverted Hammer (Pattern Recognition)
     pl.col("open").ta.cdlinvertedhammer(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlinvertedhammer(high, low, close)
+    return open.ta.cdlinvertedhammer(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlkicking(
@@ -5677,17 +8918,24 @@ def cdlkicking(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Kicking (Pattern Recognition)
     pl.col("open").ta.cdlkicking(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlkicking(high, low, close)
+    return open.ta.cdlkicking(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlkickingbylength(
@@ -5695,17 +8943,24 @@ def cdlkickingbylength(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Kicking - bull/bear determined by the longer marubozu (Pattern Recognition)
     pl.col("open").ta.cdlkickingbylength(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlkickingbylength(high, low, close)
+    return open.ta.cdlkickingbylength(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlladderbottom(
@@ -5713,17 +8968,24 @@ def cdlladderbottom(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Ladder Bottom (Pattern Recognition)
     pl.col("open").ta.cdlladderbottom(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlladderbottom(high, low, close)
+    return open.ta.cdlladderbottom(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdllongleggeddoji(
@@ -5731,17 +8993,24 @@ def cdllongleggeddoji(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Long Legged Doji (Pattern Recognition)
     pl.col("open").ta.cdllongleggeddoji(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdllongleggeddoji(high, low, close)
+    return open.ta.cdllongleggeddoji(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdllongline(
@@ -5749,17 +9018,24 @@ def cdllongline(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Long Line Candle (Pattern Recognition)
     pl.col("open").ta.cdllongline(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdllongline(high, low, close)
+    return open.ta.cdllongline(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlmarubozu(
@@ -5767,17 +9043,24 @@ def cdlmarubozu(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Marubozu (Pattern Recognition)
     pl.col("open").ta.cdlmarubozu(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlmarubozu(high, low, close)
+    return open.ta.cdlmarubozu(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlmatchinglow(
@@ -5785,17 +9068,24 @@ def cdlmatchinglow(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Matching Low (Pattern Recognition)
     pl.col("open").ta.cdlmatchinglow(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlmatchinglow(high, low, close)
+    return open.ta.cdlmatchinglow(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlmathold(
@@ -5804,6 +9094,8 @@ def cdlmathold(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     penetration: float = 0.3,
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Mat Hold (Pattern Recognition)
     pl.col("open").ta.cdlmathold(pl.col("high"), pl.col("low"), pl.col("close"), penetration=0.3)
@@ -5812,11 +9104,22 @@ def cdlmathold(
         prices: ['open', 'high', 'low', 'close']
     Parameters:
         penetration: 0.5
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlmathold(high, low, close, penetration=penetration)
+    return open.ta.cdlmathold(
+        high,
+        low,
+        close,
+        penetration=penetration,
+        out_dtype=out_dtype,
+        engine=engine,
+    )
 
 
 def cdlmorningdojistar(
@@ -5825,6 +9128,8 @@ def cdlmorningdojistar(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     penetration: float = 0.3,
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Morning Doji Star (Pattern Recognition)
     pl.col("open").ta.cdlmorningdojistar(pl.col("high"), pl.col("low"), pl.col("close"), penetration=0.3)
@@ -5833,11 +9138,17 @@ def cdlmorningdojistar(
         prices: ['open', 'high', 'low', 'close']
     Parameters:
         penetration: 0.3
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlmorningdojistar(high, low, close, penetration=penetration)
+    return open.ta.cdlmorningdojistar(
+        high, low, close, penetration=penetration, out_dtype=out_dtype, engine=engine
+    )
 
 
 def cdlmorningstar(
@@ -5846,6 +9157,8 @@ def cdlmorningstar(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     penetration: float = 0.3,
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Morning Star (Pattern Recognition)
     pl.col("open").ta.cdlmorningstar(pl.col("high"), pl.col("low"), pl.col("close"), penetration=0.3)
@@ -5854,11 +9167,22 @@ def cdlmorningstar(
         prices: ['open', 'high', 'low', 'close']
     Parameters:
         penetration: 0.3
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlmorningstar(high, low, close, penetration=penetration)
+    return open.ta.cdlmorningstar(
+        high,
+        low,
+        close,
+        penetration=penetration,
+        out_dtype=out_dtype,
+        engine=engine,
+    )
 
 
 def cdlonneck(
@@ -5866,17 +9190,24 @@ def cdlonneck(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """On-Neck Pattern (Pattern Recognition)
     pl.col("open").ta.cdlonneck(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlonneck(high, low, close)
+    return open.ta.cdlonneck(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlpiercing(
@@ -5884,17 +9215,24 @@ def cdlpiercing(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Piercing Pattern (Pattern Recognition)
     pl.col("open").ta.cdlpiercing(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlpiercing(high, low, close)
+    return open.ta.cdlpiercing(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlrickshawman(
@@ -5902,17 +9240,24 @@ def cdlrickshawman(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Rickshaw Man (Pattern Recognition)
     pl.col("open").ta.cdlrickshawman(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlrickshawman(high, low, close)
+    return open.ta.cdlrickshawman(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlrisefall3methods(
@@ -5920,17 +9265,24 @@ def cdlrisefall3methods(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Rising/Falling Three Methods (Pattern Recognition)
     pl.col("open").ta.cdlrisefall3methods(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlrisefall3methods(high, low, close)
+    return open.ta.cdlrisefall3methods(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlseparatinglines(
@@ -5938,17 +9290,24 @@ def cdlseparatinglines(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Separating Lines (Pattern Recognition)
     pl.col("open").ta.cdlseparatinglines(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlseparatinglines(high, low, close)
+    return open.ta.cdlseparatinglines(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlshootingstar(
@@ -5956,17 +9315,24 @@ def cdlshootingstar(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Shooting Star (Pattern Recognition)
     pl.col("open").ta.cdlshootingstar(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlshootingstar(high, low, close)
+    return open.ta.cdlshootingstar(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlshortline(
@@ -5974,17 +9340,24 @@ def cdlshortline(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Short Line Candle (Pattern Recognition)
     pl.col("open").ta.cdlshortline(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlshortline(high, low, close)
+    return open.ta.cdlshortline(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlspinningtop(
@@ -5992,17 +9365,24 @@ def cdlspinningtop(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Spinning Top (Pattern Recognition)
     pl.col("open").ta.cdlspinningtop(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlspinningtop(high, low, close)
+    return open.ta.cdlspinningtop(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlstalledpattern(
@@ -6010,17 +9390,24 @@ def cdlstalledpattern(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Stalled Pattern (Pattern Recognition)
     pl.col("open").ta.cdlstalledpattern(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlstalledpattern(high, low, close)
+    return open.ta.cdlstalledpattern(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlsticksandwich(
@@ -6028,17 +9415,24 @@ def cdlsticksandwich(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Stick Sandwich (Pattern Recognition)
     pl.col("open").ta.cdlsticksandwich(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlsticksandwich(high, low, close)
+    return open.ta.cdlsticksandwich(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdltakuri(
@@ -6046,17 +9440,24 @@ def cdltakuri(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Takuri (Dragonfly Doji with very long lower shadow) (Pattern Recognition)
     pl.col("open").ta.cdltakuri(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdltakuri(high, low, close)
+    return open.ta.cdltakuri(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdltasukigap(
@@ -6064,17 +9465,24 @@ def cdltasukigap(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Tasuki Gap (Pattern Recognition)
     pl.col("open").ta.cdltasukigap(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdltasukigap(high, low, close)
+    return open.ta.cdltasukigap(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlthrusting(
@@ -6082,17 +9490,24 @@ def cdlthrusting(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Thrusting Pattern (Pattern Recognition)
     pl.col("open").ta.cdlthrusting(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlthrusting(high, low, close)
+    return open.ta.cdlthrusting(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdltristar(
@@ -6100,17 +9515,24 @@ def cdltristar(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Tristar Pattern (Pattern Recognition)
     pl.col("open").ta.cdltristar(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdltristar(high, low, close)
+    return open.ta.cdltristar(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlunique3river(
@@ -6118,17 +9540,24 @@ def cdlunique3river(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Unique 3 River (Pattern Recognition)
     pl.col("open").ta.cdlunique3river(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlunique3river(high, low, close)
+    return open.ta.cdlunique3river(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlupsidegap2crows(
@@ -6136,17 +9565,24 @@ def cdlupsidegap2crows(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Upside Gap Two Crows (Pattern Recognition)
     pl.col("open").ta.cdlupsidegap2crows(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlupsidegap2crows(high, low, close)
+    return open.ta.cdlupsidegap2crows(high, low, close, out_dtype=out_dtype, engine=engine)
 
 
 def cdlxsidegap3methods(
@@ -6154,17 +9590,80 @@ def cdlxsidegap3methods(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "i32",
+    engine: str = "native",
 ):
     """Upside/Downside Gap Three Methods (Pattern Recognition)
     pl.col("open").ta.cdlxsidegap3methods(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: i32
+        engine: native
+            default, parallel chunks on long series: a bar within rounding of a candle
+            average threshold can differ from TA-Lib; "talib" gives its exact values
     Outputs:
         integer (values are -100, 0 or 100)
 
     """
-    return open.ta.cdlxsidegap3methods(high, low, close)
+    return open.ta.cdlxsidegap3methods(high, low, close, out_dtype=out_dtype, engine=engine)
+
+
+def cdl_scan(
+    open: IntoExpr = pl.col("open"),
+    high: IntoExpr = pl.col("high"),
+    low: IntoExpr = pl.col("low"),
+    close: IntoExpr = pl.col("close"),
+    patterns: list[str] | None = None,
+    penetration: float = 0.3,
+    bitmask: bool = False,
+    out_dtype: str = "i32",
+) -> pl.Expr:
+    """Candlestick pattern scan (Pattern Recognition)
+    pl.col("open").ta.cdl_scan(pl.col("high"), pl.col("low"), pl.col("close"))
+
+    Inputs:
+        prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        patterns: None (all patterns in `CDL_PATTERNS`)
+        penetration: 0.3
+        bitmask: False
+        out_dtype: i32
+    Outputs:
+        struct with one field per pattern, or `bull` / `bear` UInt64 bitmasks
+    """
+    return open.ta.cdl_scan(
+        high,
+        low,
+        close,
+        patterns=patterns,
+        penetration=penetration,
+        bitmask=bitmask,
+        out_dtype=out_dtype,
+    )
+
+
+def cdl_events(
+    open: IntoExpr = pl.col("open"),
+    high: IntoExpr = pl.col("high"),
+    low: IntoExpr = pl.col("low"),
+    close: IntoExpr = pl.col("close"),
+    patterns: list[str] | None = None,
+    penetration: float = 0.3,
+) -> pl.Expr:
+    """Candlestick pattern events (Pattern Recognition)
+    pl.col("open").ta.cdl_events(pl.col("high"), pl.col("low"), pl.col("close"))
+
+    Inputs:
+        prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        patterns: None (all patterns in `CDL_PATTERNS`)
+        penetration: 0.3
+    Outputs:
+        list of struct `row`, `pattern` and `signal`
+    """
+    return open.ta.cdl_events(high, low, close, patterns=patterns, penetration=penetration)
 
 
 def avgprice(
@@ -6172,73 +9671,86 @@ def avgprice(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ):
     """Average Price
     pl.col("open").ta.avgprice(pl.col("high"), pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['open', 'high', 'low', 'close']
+    Parameters:
+        out_dtype: f64
     Outputs:
         avgprice
 
     """
-    return open.ta.avgprice(high, low, close)
+    return open.ta.avgprice(high, low, close, out_dtype=out_dtype)
 
 
 def medprice(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
+    out_dtype: str = "f64",
 ):
     """Median Price
     pl.col("high").ta.medprice(pl.col("low"))
 
     Inputs:
         prices: ['high', 'low']
+    Parameters:
+        out_dtype: f64
     Outputs:
         medprice
 
     """
-    return high.ta.medprice(low)
+    return high.ta.medprice(low, out_dtype=out_dtype)
 
 
 def typprice(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ):
     """Typical Price
     pl.col("high").ta.typprice(pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['high', 'low', 'close']
+    Parameters:
+        out_dtype: f64
     Outputs:
         typprice
 
     """
-    return high.ta.typprice(low, close)
+    return high.ta.typprice(low, close, out_dtype=out_dtype)
 
 
 def wclprice(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ):
     """Weighted Close Price
     pl.col("high").ta.wclprice(pl.col("low"), pl.col("close"))
 
     Inputs:
         prices: ['high', 'low', 'close']
+    Parameters:
+        out_dtype: f64
     Outputs:
         wclprice
 
     """
-    return close.ta.wclprice(high, low)
+    return close.ta.wclprice(high, low, out_dtype=out_dtype)
 
 
 def beta(
     price0: IntoExpr = pl.col("high"),
     price1: IntoExpr = pl.col("low"),
     timeperiod: int = 5,
+    out_dtype: str = "f64",
 ):
     """Beta
     pl.col("high").ta.beta(pl.col("low"), timeperiod=5)
@@ -6247,16 +9759,19 @@ def beta(
         prices: ['high', 'low']
     Parameters:
         timeperiod: 5
+        out_dtype: f64
     Outputs:
         beta
     """
-    return price0.ta.beta(price1, timeperiod=timeperiod)
+    return price0.ta.beta(price1, timeperiod=timeperiod, out_dtype=out_dtype)
 
 
 def correl(
     price0: IntoExpr = pl.col("high"),
     price1: IntoExpr = pl.col("low"),
     timeperiod: int = 30,
+    out_dtype: str = "f64",
+    engine: str = "native",
 ):
     """Pearson's Correlation Coefficient (r)
     pl.col("high").ta.correl(pl.col("low"), timeperiod=30)
@@ -6265,15 +9780,20 @@ def correl(
         prices: ['high', 'low']
     Parameters:
         timeperiod: 30
+        out_dtype: f64
+        engine: native
+            default, parallel chunks on long series: differs from TA-Lib by the rounding
+            of its running sums, see the README; "talib" gives its exact values
     Outputs:
         correl
     """
-    return price0.ta.correl(price1, timeperiod=timeperiod)
+    return price0.ta.correl(price1, timeperiod=timeperiod, out_dtype=out_dtype, engine=engine)
 
 
 def linearreg(
     price: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
 ):
     """Linear Regression
     pl.col("close").ta.linearreg(timeperiod=14)
@@ -6282,15 +9802,17 @@ def linearreg(
         prices: ['close']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         linearreg
     """
-    return price.ta.linearreg(timeperiod=timeperiod)
+    return price.ta.linearreg(timeperiod=timeperiod, out_dtype=out_dtype)
 
 
 def linearreg_angle(
     price: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
 ):
     """Linear Regression Angle
     pl.col("close").ta.linearreg_angle(timeperiod=14)
@@ -6299,15 +9821,17 @@ def linearreg_angle(
         prices: ['close']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         linearreg_angle
     """
-    return price.ta.linearreg_angle(timeperiod=timeperiod)
+    return price.ta.linearreg_angle(timeperiod=timeperiod, out_dtype=out_dtype)
 
 
 def linearreg_intercept(
     price: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
 ):
     """Linear Regression Intercept
     pl.col("close").ta.linearreg_intercept(timeperiod=14)
@@ -6316,15 +9840,17 @@ def linearreg_intercept(
         prices: ['close']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         linearreg_intercept
     """
-    return price.ta.linearreg_intercept(timeperiod=timeperiod)
+    return price.ta.linearreg_intercept(timeperiod=timeperiod, out_dtype=out_dtype)
 
 
 def linearreg_slope(
     price: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
 ):
     """Linear Regression Slope
     pl.col("close").ta.linearreg_slope(timeperiod=14)
@@ -6333,16 +9859,19 @@ def linearreg_slope(
         prices: ['close']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         linearreg_slope
     """
-    return price.ta.linearreg_slope(timeperiod=timeperiod)
+    return price.ta.linearreg_slope(timeperiod=timeperiod, out_dtype=out_dtype)
 
 
 def stddev(
     price: IntoExpr = pl.col("close"),
     timeperiod: int = 5,
     nbdev: float = 1,
+    out_dtype: str = "f64",
+    engine: str = "native",
 ):
     """Standard Deviation
     pl.col("close").ta.stddev(timeperiod=5, nbdev=1)
@@ -6352,15 +9881,20 @@ def stddev(
     Parameters:
         timeperiod: 5
         nbdev: 1
+        out_dtype: f64
+        engine: native
+            default, parallel chunks on long series: differs from TA-Lib by the rounding
+            of its running sums, see the README; "talib" gives its exact values
     Outputs:
         stddev
     """
-    return price.ta.stddev(timeperiod=timeperiod, nbdev=nbdev)
+    return price.ta.stddev(timeperiod=timeperiod, nbdev=nbdev, out_dtype=out_dtype, engine=engine)
 
 
 def tsf(
     price: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
 ):
     """Time Series Forecast
     pl.col("close").ta.tsf(timeperiod=14)
@@ -6369,16 +9903,40 @@ def tsf(
         prices: ['close']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         tsf
     """
-    return price.ta.tsf(timeperiod=timeperiod)
+    return price.ta.tsf(timeperiod=timeperiod, out_dtype=out_dtype)
+
+
+def linreg_all(
+    real: IntoExpr = pl.col("close"),
+    timeperiod: int = 14,
+    fields: list[str] | None = None,
+    out_dtype: str = "f64",
+) -> pl.Expr:
+    """Linear regression family in one pass (Statistic Functions)
+    pl.col("close").ta.linreg_all(timeperiod=14)
+
+    Inputs:
+        real
+    Parameters:
+        timeperiod: 14
+        fields: None (`LINREG_FIELDS`, extras in `LINREG_EXTRA_FIELDS`)
+        out_dtype: f64
+    Outputs:
+        struct of linearreg, linearreg_slope, linearreg_intercept, linearreg_angle, tsf
+    """
+    return real.ta.linreg_all(timeperiod=timeperiod, fields=fields, out_dtype=out_dtype)
 
 
 def var(
     price: IntoExpr = pl.col("close"),
     timeperiod: int = 5,
     nbdev: float = 1,
+    out_dtype: str = "f64",
+    engine: str = "native",
 ):
     """Variance
     pl.col("close").ta.var(timeperiod=5, nbdev=1)
@@ -6388,10 +9946,14 @@ def var(
     Parameters:
         timeperiod: 5
         nbdev: 1
+        out_dtype: f64
+        engine: native
+            default, parallel chunks on long series: differs from TA-Lib by the rounding
+            of its running sums, see the README; "talib" gives its exact values
     Outputs:
         var
     """
-    return price.ta.var(timeperiod=timeperiod, nbdev=nbdev)
+    return price.ta.var(timeperiod=timeperiod, nbdev=nbdev, out_dtype=out_dtype, engine=engine)
 
 
 def atr(
@@ -6399,6 +9961,8 @@ def atr(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
+    engine: str = "native",
 ):
     """Average True Range (Volatility Indicators)
     pl.col("close").ta.atr(pl.col("high"), pl.col("low"), timeperiod=14)
@@ -6407,10 +9971,14 @@ def atr(
         prices: ['high', 'low', 'close']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
+        engine: native
+            default, a parallel prefix scan on long series: differs from TA-Lib
+            by rounding, within `SCAN_TOLERANCE`; "talib" gives its exact values
     Outputs:
         atr
     """
-    return close.ta.atr(high, low, timeperiod=timeperiod)
+    return close.ta.atr(high, low, timeperiod=timeperiod, out_dtype=out_dtype, engine=engine)
 
 
 def natr(
@@ -6418,6 +9986,7 @@ def natr(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     timeperiod: int = 14,
+    out_dtype: str = "f64",
 ):
     """Normalized Average True Range (Volatility Indicators)
     pl.col("close").ta.natr(pl.col("high"), pl.col("low"), timeperiod=14)
@@ -6426,26 +9995,68 @@ def natr(
         prices: ['high', 'low', 'close']
     Parameters:
         timeperiod: 14
+        out_dtype: f64
     Outputs:
         natr
     """
-    return close.ta.natr(high, low, timeperiod=timeperiod)
+    return close.ta.natr(high, low, timeperiod=timeperiod, out_dtype=out_dtype)
 
 
 def trange(
     high: IntoExpr = pl.col("high"),
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
+    out_dtype: str = "f64",
 ):
     """True Range (Volatility Indicators)
     pl.col("close").ta.trange(pl.col("high"), pl.col("low"))
 
     Inputs:
         prices: ['high', 'low', 'close']
+    Parameters:
+        out_dtype: f64
     Outputs:
         trange
     """
-    return close.ta.trange(high, low)
+    return close.ta.trange(high, low, out_dtype=out_dtype)
+
+
+def volatility_all(
+    high: IntoExpr = pl.col("high"),
+    low: IntoExpr = pl.col("low"),
+    close: IntoExpr = pl.col("close"),
+    atr_periods: list[int] | None = None,
+    band_periods: list[int] | None = None,
+    nbdevs: list[tuple[float, float]] | None = None,
+    matype: int = 0,
+    fields: list[str] | None = None,
+    out_dtype: str = "f64",
+) -> pl.Expr:
+    """True range, ATR and Bollinger moments in one pass (Volatility Indicators)
+    pl.col("close").ta.volatility_all(pl.col("high"), pl.col("low"), atr_periods=[14])
+
+    Inputs:
+        prices: ['high', 'low', 'close']
+    Parameters:
+        atr_periods: [14]
+        band_periods: [5]
+        nbdevs: [(2.0, 2.0)] (nbdevup, nbdevdn pairs)
+        matype: 0 (middle band)
+        fields: None (all of `VOLATILITY_FIELDS`)
+        out_dtype: f64
+    Outputs:
+        struct of the requested fields
+    """
+    return close.ta.volatility_all(
+        high,
+        low,
+        atr_periods=atr_periods,
+        band_periods=band_periods,
+        nbdevs=nbdevs,
+        matype=matype,
+        fields=fields,
+        out_dtype=out_dtype,
+    )
 
 
 def ad(
@@ -6453,16 +10064,23 @@ def ad(
     low: IntoExpr = pl.col("low"),
     close: IntoExpr = pl.col("close"),
     volume: IntoExpr = pl.col("volume"),
+    out_dtype: str = "f64",
+    engine: str = "native",
 ):
     """Chaikin A/D Line (Volume Indicators)
     pl.col("close").ta.ad(pl.col("high"), pl.col("low"), pl.col("volume"))
 
     Inputs:
         prices: ['high', 'low', 'close', 'volume']
+    Parameters:
+        out_dtype: f64
+        engine: native
+            default, a parallel prefix scan on long series: differs from TA-Lib
+            by rounding, within `SCAN_TOLERANCE`; "talib" gives its exact values
     Outputs:
         ad
     """
-    return close.ta.ad(high, low, volume)
+    return close.ta.ad(high, low, volume, out_dtype=out_dtype, engine=engine)
 
 
 def adosc(
@@ -6472,6 +10090,8 @@ def adosc(
     volume: IntoExpr = pl.col("volume"),
     fastperiod: int = 3,
     slowperiod: int = 10,
+    out_dtype: str = "f64",
+    engine: str = "native",
 ):
     """Chaikin A/D Oscillator (Volume Indicators)
     pl.col("close").ta.adosc(pl.col("high"), pl.col("low"), pl.col("volume"), fastperiod=3, slowperiod=10)
@@ -6481,22 +10101,41 @@ def adosc(
     Parameters:
         fastperiod: 3
         slowperiod: 10
+        out_dtype: f64
+        engine: native
+            default, a parallel prefix scan on long series: differs from TA-Lib
+            by rounding, within `SCAN_TOLERANCE`; "talib" gives its exact values
     Outputs:
         adosc
     """
-    return close.ta.adosc(high, low, volume, fastperiod=fastperiod, slowperiod=slowperiod)
+    return close.ta.adosc(
+        high,
+        low,
+        volume,
+        fastperiod=fastperiod,
+        slowperiod=slowperiod,
+        out_dtype=out_dtype,
+        engine=engine,
+    )
 
 
 def obv(
     close: IntoExpr = pl.col("close"),
     volume: IntoExpr = pl.col("volume"),
+    out_dtype: str = "f64",
+    engine: str = "native",
 ):
     """On Balance Volume (Volume Indicators)
     pl.col("close").ta.obv(pl.col("volume"))
 
     Inputs:
         prices: ['close', 'volume']
+    Parameters:
+        out_dtype: f64
+        engine: native
+            default, a parallel prefix scan on long series: differs from TA-Lib
+            by rounding, within `SCAN_TOLERANCE`; "talib" gives its exact values
     Outputs:
         obv
     """
-    return close.ta.obv(volume)
+    return close.ta.obv(volume, out_dtype=out_dtype, engine=engine)
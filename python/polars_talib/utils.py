@@ -1,24 +1,14 @@
 from __future__ import annotations
 
-import re
-from typing import TYPE_CHECKING, Sequence, Any
+from typing import TYPE_CHECKING, Any
 
 import polars as pl
-
-def parse_version(version: Sequence[str | int]) -> tuple[int, ...]:
-    # Simple version parser; split into a tuple of ints for comparison.
-    # vendored from Polars
-    if isinstance(version, str):
-        version = version.split(".")
-    return tuple(int(re.sub(r"\D", "", str(v))) for v in version)
+from polars.plugins import register_plugin_function
 
 if TYPE_CHECKING:
-    if parse_version(pl.__version__) < parse_version("0.20.16"):
-        from polars.type_aliases import IntoExpr, PolarsDataType
-    else:
-        from polars._typing import IntoExpr, PolarsDataType
-        # future versions of Polars use the following import
-        # from polars.typing import IntoExpr, PolarsDataType
+    from polars._typing import IntoExpr, PolarsDataType
+    # future versions of Polars use the following import
+    # from polars.typing import IntoExpr, PolarsDataType
     from pathlib import Path
 
 
@@ -71,19 +61,6 @@ def register_plugin(
     lib: str | Path,
     returns_scalar: bool = False,
 ) -> pl.Expr:
-    if parse_version(pl.__version__) < parse_version("0.20.16"):
-        expr = parse_into_expr(args[0])
-        assert isinstance(lib, str)
-        return expr.register_plugin(
-            lib=lib,
-            symbol=symbol,
-            args=args[1:],
-            kwargs=kwargs,
-            is_elementwise=is_elementwise,
-            returns_scalar=returns_scalar,
-        )
-    from polars.plugins import register_plugin_function
-
     return register_plugin_function(
         args=args,
         plugin_path=lib,
@@ -0,0 +1,101 @@
+use crate::meta::TaFunc;
+use rayon::prelude::*;
+use std::collections::HashMap;
+use std::ops::Range;
+use talib_sys::TA_RetCode;
+
+/// Fewest output rows a chunk of `par_chunked` computes, shorter inputs run in one call.
+pub const PARALLEL_MIN_ROWS: usize = 1 << 16;
+
+/// Lookback of `func` with `params` and TA-Lib's defaults for the others, `None` if
+/// TA-Lib rejects them.
+pub fn func_lookback(func: &str, params: &[(&str, f64)]) -> Option<usize> {
+    let params = params
+        .iter()
+        .map(|(name, value)| (name.to_string(), *value))
+        .collect::<HashMap<_, _>>();
+    TaFunc::new(func, &params).ok()?.lookback().ok()
+}
+
+/// Rows per chunk when a series of `len` rows is split over the rayon pool, one chunk
+/// per thread of at least `PARALLEL_MIN_ROWS` rows, `None` when it stays in one piece.
+pub fn chunk_rows(len: usize) -> Option<usize> {
+    let threads = rayon::current_num_threads();
+    let rows = ((len + threads - 1) / threads).max(PARALLEL_MIN_ROWS);
+    (len > rows).then_some(rows)
+}
+
+/// First row from which none of `inputs` is NaN, and whether NaN follows it, the scan
+/// after the leading NaNs split over the rayon pool.
+pub fn par_clean_begin(inputs: &[&[f64]]) -> (usize, bool) {
+    let len = inputs[0].len();
+    let is_nan = |i: usize| inputs.iter().any(|v| v[i].is_nan());
+    let begin = (0..len).find(|i| !is_nan(*i)).unwrap_or(len);
+    (begin, !(begin..len).into_par_iter().any(is_nan))
+}
+
+/// `f` over all rows of `inputs`, split into chunks computed in parallel when the series
+/// is long enough.
+///
+/// `f(rows)` computes `func` on the input rows `rows` alone and returns an output per
+/// row. The output is cut into chunks as `chunk_rows` says, and every chunk but the
+/// first also reads the `lookback` rows before it, so its first output sees the same
+/// window as in a single call.
+///
+/// Functions whose output is computed from its window alone (MOM / ROC read two values,
+/// LINEARREG sums each window afresh and the deque kernels pick a value of the window)
+/// give a stitched output bit-identical to one call. Functions that slide a running total
+/// (SMA, WMA, TRIMA, VAR / STDDEV, CORREL, the candle averages of the patterns) restart
+/// it at each chunk, so their output only carries the rounding of the rows since the
+/// chunk's start where one call carries that of the whole column; the difference is
+/// TA-Lib's own drift and grows with the length of the series, see the README. Input
+/// with NaN after the leading NaNs, and periods TA-Lib rejects, run in one call.
+pub fn par_chunked<T, F>(
+    func: &str,
+    timeperiod: i32,
+    inputs: &[&[f64]],
+    f: F,
+) -> Result<Vec<T>, TA_RetCode>
+where
+    T: Copy + Default + Send + Sync,
+    F: Fn(Range<usize>) -> Result<Vec<T>, TA_RetCode> + Sync,
+{
+    let lookback = func_lookback(func, &[("timeperiod", timeperiod as f64)]);
+    par_chunks(lookback, inputs, f)
+}
+
+/// `par_chunked` with the lookback given, one call when it is `None`.
+pub fn par_chunks<T, F>(
+    lookback: Option<usize>,
+    inputs: &[&[f64]],
+    f: F,
+) -> Result<Vec<T>, TA_RetCode>
+where
+    T: Copy + Default + Send + Sync,
+    F: Fn(Range<usize>) -> Result<Vec<T>, TA_RetCode> + Sync,
+{
+    let len = inputs[0].len();
+    let chunk = match chunk_rows(len) {
+        Some(rows) => rows,
+        None => return f(0..len),
+    };
+    let lookback = match lookback {
+        Some(lookback) => lookback,
+        None => return f(0..len),
+    };
+    match par_clean_begin(inputs) {
+        (begin, true) if begin + lookback < chunk => {}
+        _ => return f(0..len),
+    }
+    let mut out = vec![T::default(); len];
+    out.par_chunks_mut(chunk)
+        .enumerate()
+        .try_for_each(|(k, dst)| {
+            let start = k * chunk;
+            let from = if k == 0 { 0 } else { start - lookback };
+            let res = f(from..start + dst.len())?;
+            dst.copy_from_slice(&res[start - from..]);
+            Ok(())
+        })?;
+    Ok(out)
+}
@@ -1,26 +1,36 @@
-use crate::utils::{cast_series_to_f64, get_series_f64_ptr, ta_code2err};
+use crate::utils::{
+    clean_begin, float_output, float_series, ta_code2err, F64Input, OutDtype, OutDtypeKwargs,
+    SyncPtr,
+};
 use polars::prelude::*;
 use pyo3_polars::derive::polars_expr;
+use rayon::prelude::*;
+use serde::Deserialize;
 use talib::cycle::{ta_ht_dcperiod, ta_ht_dcphase, ta_ht_phasor, ta_ht_sine, ta_ht_trendmode};
+use talib::overlap::ta_ht_trendline;
+use talib_sys::{
+    TA_HT_DCPERIOD_Lookback, TA_HT_DCPHASE_Lookback, TA_HT_PHASOR_Lookback, TA_HT_SINE_Lookback,
+    TA_HT_TRENDLINE_Lookback, TA_HT_TRENDMODE_Lookback, TA_RetCode,
+};
 
-#[polars_expr(output_type=Float64)]
-fn ht_dcperiod(inputs: &[Series]) -> PolarsResult<Series> {
-    let mut real = cast_series_to_f64(&inputs[0])?;
-    let (real_ptr, _real) = get_series_f64_ptr(&mut real)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn ht_dcperiod(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    let real = F64Input::new(&inputs[0])?;
+    let real_ptr = real.ptr();
     let res = ta_ht_dcperiod(real_ptr, real.len());
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn ht_dcphase(inputs: &[Series]) -> PolarsResult<Series> {
-    let mut real = cast_series_to_f64(&inputs[0])?;
-    let (real_ptr, _real) = get_series_f64_ptr(&mut real)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn ht_dcphase(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    let real = F64Input::new(&inputs[0])?;
+    let real_ptr = real.ptr();
     let res = ta_ht_dcphase(real_ptr, real.len());
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
@@ -34,8 +44,8 @@ pub fn ht_phasor_output(_: &[Field]) -> PolarsResult<Field> {
 
 #[polars_expr(output_type_func=ht_phasor_output)]
 fn ht_phasor(inputs: &[Series]) -> PolarsResult<Series> {
-    let mut real = cast_series_to_f64(&inputs[0])?;
-    let (real_ptr, _real) = get_series_f64_ptr(&mut real)?;
+    let real = F64Input::new(&inputs[0])?;
+    let real_ptr = real.ptr();
     let res = ta_ht_phasor(real_ptr, real.len());
     match res {
         Ok((outinphase, outquadrature)) => {
@@ -57,8 +67,8 @@ pub fn ht_sine_output(_: &[Field]) -> PolarsResult<Field> {
 
 #[polars_expr(output_type_func=ht_sine_output)]
 fn ht_sine(inputs: &[Series]) -> PolarsResult<Series> {
-    let mut real = cast_series_to_f64(&inputs[0])?;
-    let (real_ptr, _real) = get_series_f64_ptr(&mut real)?;
+    let real = F64Input::new(&inputs[0])?;
+    let real_ptr = real.ptr();
     let res = ta_ht_sine(real_ptr, real.len());
     match res {
         Ok((outsine, outleadsine)) => {
@@ -73,11 +83,439 @@ fn ht_sine(inputs: &[Series]) -> PolarsResult<Series> {
 
 #[polars_expr(output_type=Int32)]
 fn ht_trendmode(inputs: &[Series]) -> PolarsResult<Series> {
-    let mut real = cast_series_to_f64(&inputs[0])?;
-    let (real_ptr, _real) = get_series_f64_ptr(&mut real)?;
+    let real = F64Input::new(&inputs[0])?;
+    let real_ptr = real.ptr();
     let res = ta_ht_trendmode(real_ptr, real.len());
     match res {
         Ok(out) => Ok(Int32Chunked::from_vec("", out).into_series()),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
+
+/// Coefficients of TA-Lib's Hilbert transform.
+const HILBERT_A: f64 = 0.0962;
+const HILBERT_B: f64 = 0.5769;
+
+/// Smoothed prices TA-Lib keeps for the dominant cycle phase.
+const SMOOTH_PRICE_SIZE: usize = 50;
+
+/// Price smoother rows TA-Lib runs before the transform: `HT_DCPERIOD` and `HT_PHASOR`
+/// start it after 9, the functions that go on to the phase after 34.
+const HT_PERIOD_WARMUP: usize = 9;
+const HT_PHASE_WARMUP: usize = 34;
+
+/// State of one of the four Hilbert transforms TA-Lib runs per bar, kept separately for
+/// odd and even bars.
+#[derive(Default)]
+struct Hilbert {
+    odd: [f64; 3],
+    even: [f64; 3],
+    prev_odd: f64,
+    prev_even: f64,
+    prev_input_odd: f64,
+    prev_input_even: f64,
+}
+
+impl Hilbert {
+    /// TA-Lib's `DO_HILBERT_TRANSFORM` of `input` on an even or odd bar.
+    fn transform(&mut self, input: f64, even: bool, idx: usize, adjusted_period: f64) -> f64 {
+        let (buf, prev, prev_input) = if even {
+            (
+                &mut self.even,
+                &mut self.prev_even,
+                &mut self.prev_input_even,
+            )
+        } else {
+            (&mut self.odd, &mut self.prev_odd, &mut self.prev_input_odd)
+        };
+        let value = HILBERT_A * input;
+        let mut out = -buf[idx];
+        buf[idx] = value;
+        out += value;
+        out -= *prev;
+        *prev = HILBERT_B * *prev_input;
+        out += *prev;
+        *prev_input = input;
+        out * adjusted_period
+    }
+}
+
+/// Outputs of one `ht_pass`, every row computed, NaN (0 for `trendmode`) before the
+/// pass starts. The phase outputs are empty without `phase`.
+struct HtPass {
+    dcperiod: Vec<f64>,
+    inphase: Vec<f64>,
+    quadrature: Vec<f64>,
+    dcphase: Vec<f64>,
+    sine: Vec<f64>,
+    leadsine: Vec<f64>,
+    trendline: Vec<f64>,
+    trendmode: Vec<i32>,
+}
+
+/// TA-Lib's Hilbert transform pipeline over `real`, computed once for every output:
+/// the 4-bar WMA price smoother, the detrender, the I/Q components and the dominant cycle
+/// period, then with `phase` the dominant cycle phase, sine wave, trendline and trend
+/// mode. The arithmetic follows TA-Lib's `HT_*` functions step by step, so each output
+/// equals its function on the rows past that function's lookback.
+///
+/// `warmup` is the number of price smoother rows before the transform starts, see
+/// `HT_PERIOD_WARMUP`. `real` must not contain NaN.
+fn ht_pass(real: &[f64], warmup: usize, phase: bool) -> HtPass {
+    let len = real.len();
+    let phase_len = if phase { len } else { 0 };
+    let mut out = HtPass {
+        dcperiod: vec![f64::NAN; len],
+        inphase: vec![f64::NAN; len],
+        quadrature: vec![f64::NAN; len],
+        dcphase: vec![f64::NAN; phase_len],
+        sine: vec![f64::NAN; phase_len],
+        leadsine: vec![f64::NAN; phase_len],
+        trendline: vec![f64::NAN; phase_len],
+        trendmode: vec![0; phase_len],
+    };
+    let start = 3 + warmup;
+    if len < start {
+        return out;
+    }
+    let rad2deg = 180.0 / (4.0 * 1f64.atan());
+    let deg2rad = 1.0 / rad2deg;
+    let deg2rad_by360 = 1f64.atan() * 8.0;
+
+    let mut wma_sub = real[0];
+    let mut wma_sum = real[0];
+    wma_sub += real[1];
+    wma_sum += real[1] * 2.0;
+    wma_sub += real[2];
+    wma_sum += real[2] * 3.0;
+    let mut trailing_idx = 0;
+    let mut trailing_value = 0.0;
+    let mut smooth = |price: f64| {
+        wma_sub += price;
+        wma_sub -= trailing_value;
+        wma_sum += price * 4.0;
+        trailing_value = real[trailing_idx];
+        trailing_idx += 1;
+        let smoothed = wma_sum * 0.1;
+        wma_sum -= wma_sub;
+        smoothed
+    };
+    for price in &real[3..start] {
+        smooth(*price);
+    }
+
+    let mut hilbert_idx = 0;
+    let mut detrender = Hilbert::default();
+    let mut q1 = Hilbert::default();
+    let mut ji = Hilbert::default();
+    let mut jq = Hilbert::default();
+    let (mut period, mut smooth_period) = (0.0, 0.0);
+    let (mut prev_i2, mut prev_q2, mut re, mut im) = (0.0, 0.0, 0.0, 0.0);
+    let (mut i1_odd_prev2, mut i1_odd_prev3) = (0.0, 0.0);
+    let (mut i1_even_prev2, mut i1_even_prev3) = (0.0, 0.0);
+    let mut smooth_price = [0.0; SMOOTH_PRICE_SIZE];
+    let mut smooth_idx = 0;
+    let mut dc_phase = 0.0;
+    let (mut sine, mut lead_sine) = (0.0, 0.0);
+    let (mut i_trend1, mut i_trend2, mut i_trend3) = (0.0, 0.0, 0.0);
+    let mut days_in_trend = 0;
+    for today in start..len {
+        let adjusted_period = (0.075 * period) + 0.54;
+        let smoothed = smooth(real[today]);
+        smooth_price[smooth_idx] = smoothed;
+        let even = today % 2 == 0;
+        let i1_prev3 = if even { i1_even_prev3 } else { i1_odd_prev3 };
+        let detrended = detrender.transform(smoothed, even, hilbert_idx, adjusted_period);
+        let q1_value = q1.transform(detrended, even, hilbert_idx, adjusted_period);
+        let ji_value = ji.transform(i1_prev3, even, hilbert_idx, adjusted_period);
+        let jq_value = jq.transform(q1_value, even, hilbert_idx, adjusted_period);
+        if even {
+            hilbert_idx += 1;
+            if hilbert_idx == 3 {
+                hilbert_idx = 0;
+            }
+        }
+        let q2 = (0.2 * (q1_value + ji_value)) + (0.8 * prev_q2);
+        let i2 = (0.2 * (i1_prev3 - jq_value)) + (0.8 * prev_i2);
+        if even {
+            i1_odd_prev3 = i1_odd_prev2;
+            i1_odd_prev2 = detrended;
+        } else {
+            i1_even_prev3 = i1_even_prev2;
+            i1_even_prev2 = detrended;
+        }
+        re = (0.2 * ((i2 * prev_i2) + (q2 * prev_q2))) + (0.8 * re);
+        im = (0.2 * ((i2 * prev_q2) - (q2 * prev_i2))) + (0.8 * im);
+        prev_q2 = q2;
+        prev_i2 = i2;
+        let prev_period = period;
+        if im != 0.0 && re != 0.0 {
+            period = 360.0 / ((im / re).atan() * rad2deg);
+        }
+        if period > 1.5 * prev_period {
+            period = 1.5 * prev_period;
+        }
+        if period < 0.67 * prev_period {
+            period = 0.67 * prev_period;
+        }
+        if period < 6.0 {
+            period = 6.0;
+        } else if period > 50.0 {
+            period = 50.0;
+        }
+        period = (0.2 * period) + (0.8 * prev_period);
+        smooth_period = (0.33 * period) + (0.67 * smooth_period);
+        out.dcperiod[today] = smooth_period;
+        out.inphase[today] = i1_prev3;
+        out.quadrature[today] = q1_value;
+
+        if phase {
+            // dominant cycle phase, a DFT of the smoothed prices over one period
+            let prev_dc_phase = dc_phase;
+            let dc_period = (smooth_period + 0.5) as i32;
+            let (mut real_part, mut imag_part) = (0.0, 0.0);
+            let mut idx = smooth_idx;
+            for i in 0..dc_period {
+                let angle = (i as f64 * deg2rad_by360) / dc_period as f64;
+                real_part += angle.sin() * smooth_price[idx];
+                imag_part += angle.cos() * smooth_price[idx];
+                idx = if idx == 0 {
+                    SMOOTH_PRICE_SIZE - 1
+                } else {
+                    idx - 1
+                };
+            }
+            let abs_imag = imag_part.abs();
+            if abs_imag > 0.0 {
+                dc_phase = (real_part / imag_part).atan() * rad2deg;
+            } else if abs_imag <= 0.01 {
+                if real_part < 0.0 {
+                    dc_phase -= 90.0;
+                } else if real_part > 0.0 {
+                    dc_phase += 90.0;
+                }
+            }
+            dc_phase += 90.0;
+            // compensate for the one bar lag of the price smoother
+            dc_phase += 360.0 / smooth_period;
+            if imag_part < 0.0 {
+                dc_phase += 180.0;
+            }
+            if dc_phase > 315.0 {
+                dc_phase -= 360.0;
+            }
+            let (prev_sine, prev_lead_sine) = (sine, lead_sine);
+            sine = (dc_phase * deg2rad).sin();
+            lead_sine = ((dc_phase + 45.0) * deg2rad).sin();
+
+            // instantaneous trendline, the mean price over one period summed from today back
+            let mut mean = 0.0;
+            for price in real[..=today].iter().rev().take(dc_period.max(0) as usize) {
+                mean += price;
+            }
+            if dc_period > 0 {
+                mean /= dc_period as f64;
+            }
+            let trendline = (4.0 * mean + 3.0 * i_trend1 + 2.0 * i_trend2 + i_trend3) / 10.0;
+            i_trend3 = i_trend2;
+            i_trend2 = i_trend1;
+            i_trend1 = mean;
+
+            // trend unless the sine lines just crossed, the phase moves like a cycle's,
+            // and the price is close to the trendline
+            let mut trend = 1;
+            if (sine > lead_sine && prev_sine <= prev_lead_sine)
+                || (sine < lead_sine && prev_sine >= prev_lead_sine)
+            {
+                days_in_trend = 0;
+                trend = 0;
+            }
+            days_in_trend += 1;
+            if (days_in_trend as f64) < 0.5 * smooth_period {
+                trend = 0;
+            }
+            let phase_change = dc_phase - prev_dc_phase;
+            if smooth_period != 0.0
+                && phase_change > 0.67 * 360.0 / smooth_period
+                && phase_change < 1.5 * 360.0 / smooth_period
+            {
+                trend = 0;
+            }
+            let price = smooth_price[smooth_idx];
+            if trendline != 0.0 && ((price - trendline) / trendline).abs() >= 0.015 {
+                trend = 1;
+            }
+            out.dcphase[today] = dc_phase;
+            out.sine[today] = sine;
+            out.leadsine[today] = lead_sine;
+            out.trendline[today] = trendline;
+            out.trendmode[today] = trend;
+        }
+        smooth_idx += 1;
+        if smooth_idx == SMOOTH_PRICE_SIZE {
+            smooth_idx = 0;
+        }
+    }
+    out
+}
+
+#[derive(Clone, Copy, PartialEq, Eq)]
+enum HtFunc {
+    DcPeriod,
+    DcPhase,
+    Phasor,
+    Sine,
+    TrendMode,
+    TrendLine,
+}
+
+enum HtOut {
+    Real(Vec<f64>),
+    Pair(Vec<f64>, Vec<f64>),
+    Int(Vec<i32>),
+}
+
+fn ht_func(field: &str) -> PolarsResult<HtFunc> {
+    match field {
+        "dcperiod" => Ok(HtFunc::DcPeriod),
+        "dcphase" => Ok(HtFunc::DcPhase),
+        "inphase" | "quadrature" => Ok(HtFunc::Phasor),
+        "sine" | "leadsine" => Ok(HtFunc::Sine),
+        "trendmode" => Ok(HtFunc::TrendMode),
+        "trendline" => Ok(HtFunc::TrendLine),
+        _ => Err(PolarsError::ComputeError(
+            format!("unknown ht_all field `{}`", field).into(),
+        )),
+    }
+}
+
+fn run_ht_func(func: HtFunc, real: SyncPtr<f64>, len: usize) -> Result<HtOut, TA_RetCode> {
+    match func {
+        HtFunc::DcPeriod => ta_ht_dcperiod(real.0, len).map(HtOut::Real),
+        HtFunc::DcPhase => ta_ht_dcphase(real.0, len).map(HtOut::Real),
+        HtFunc::Phasor => ta_ht_phasor(real.0, len).map(|(i, q)| HtOut::Pair(i, q)),
+        HtFunc::Sine => ta_ht_sine(real.0, len).map(|(s, l)| HtOut::Pair(s, l)),
+        HtFunc::TrendMode => ta_ht_trendmode(real.0, len).map(HtOut::Int),
+        HtFunc::TrendLine => ta_ht_trendline(real.0, len).map(HtOut::Real),
+    }
+}
+
+#[derive(Deserialize)]
+pub struct HtAllKwargs {
+    pub fields: Vec<String>,
+    #[serde(default)]
+    pub out_dtype: OutDtype,
+}
+
+pub fn ht_all_output(_: &[Field], kwargs: HtAllKwargs) -> PolarsResult<Field> {
+    let fields = kwargs
+        .fields
+        .iter()
+        .map(|name| match name.as_str() {
+            "trendmode" => Field::new(name, DataType::Int32),
+            _ => Field::new(name, kwargs.out_dtype.dtype()),
+        })
+        .collect();
+    Ok(Field::new("", DataType::Struct(fields)))
+}
+
+/// Every Hilbert transform output in one struct, `fields` picks which.
+///
+/// `ht_pass` runs the transform once for all the requested fields. TA-Lib starts
+/// `HT_DCPERIOD` and `HT_PHASOR` after a shorter price smoother warmup than the phase
+/// functions, which leaves the transform in a different state, so `dcperiod`, `inphase`
+/// and `quadrature` come from a second pass, run in parallel with the first. Each field
+/// is NaN (0 for `trendmode`) up to its function's lookback and equals it after.
+///
+/// Input with NaN after the leading ones runs the TA-Lib functions behind the requested
+/// fields instead, in parallel, each at most once.
+#[polars_expr(output_type_func_with_kwargs=ht_all_output)]
+fn ht_all(inputs: &[Series], kwargs: HtAllKwargs) -> PolarsResult<Series> {
+    let mut funcs: Vec<HtFunc> = Vec::new();
+    for name in kwargs.fields.iter() {
+        let func = ht_func(name)?;
+        if !funcs.contains(&func) {
+            funcs.push(func);
+        }
+    }
+    let real = F64Input::new(&inputs[0])?;
+    let values = real.as_slice();
+    let len = values.len();
+    let (begin, clean) = clean_begin(&[values]);
+    if clean && begin < len {
+        let period_only = |func: &HtFunc| matches!(func, HtFunc::DcPeriod | HtFunc::Phasor);
+        let (period, phase) = rayon::join(
+            || {
+                funcs
+                    .iter()
+                    .any(period_only)
+                    .then(|| ht_pass(&values[begin..], HT_PERIOD_WARMUP, false))
+            },
+            || {
+                funcs
+                    .iter()
+                    .any(|func| !period_only(func))
+                    .then(|| ht_pass(&values[begin..], HT_PHASE_WARMUP, true))
+            },
+        );
+        let first = |lookback: i32| (begin + lookback as usize).min(len);
+        let real_field = |pass: &Option<HtPass>, get: fn(&HtPass) -> &Vec<f64>, lookback| {
+            let from = first(lookback);
+            let mut out = vec![f64::NAN; len];
+            out[from..].copy_from_slice(&get(pass.as_ref().unwrap())[from - begin..]);
+            float_series(out, kwargs.out_dtype)
+        };
+        let mut fields = Vec::with_capacity(kwargs.fields.len());
+        for name in kwargs.fields.iter() {
+            let mut s = unsafe {
+                match name.as_str() {
+                    "dcperiod" => real_field(&period, |p| &p.dcperiod, TA_HT_DCPERIOD_Lookback()),
+                    "inphase" => real_field(&period, |p| &p.inphase, TA_HT_PHASOR_Lookback()),
+                    "quadrature" => real_field(&period, |p| &p.quadrature, TA_HT_PHASOR_Lookback()),
+                    "dcphase" => real_field(&phase, |p| &p.dcphase, TA_HT_DCPHASE_Lookback()),
+                    "sine" => real_field(&phase, |p| &p.sine, TA_HT_SINE_Lookback()),
+                    "leadsine" => real_field(&phase, |p| &p.leadsine, TA_HT_SINE_Lookback()),
+                    "trendline" => real_field(&phase, |p| &p.trendline, TA_HT_TRENDLINE_Lookback()),
+                    _ => {
+                        let from = first(TA_HT_TRENDMODE_Lookback());
+                        let mut out = vec![0; len];
+                        out[from..]
+                            .copy_from_slice(&phase.as_ref().unwrap().trendmode[from - begin..]);
+                        Int32Chunked::from_vec("", out).into_series()
+                    }
+                }
+            };
+            s.rename(name);
+            fields.push(s);
+        }
+        let out = StructChunked::new("", &fields)?;
+        return Ok(out.into_series());
+    }
+    let real_ptr = SyncPtr(real.ptr());
+    let len = real.len();
+    let res: Result<Vec<HtOut>, TA_RetCode> = funcs
+        .par_iter()
+        .map(|func| run_ht_func(*func, real_ptr, len))
+        .collect();
+    let mut outs = match res {
+        Ok(outs) => outs,
+        Err(ret_code) => return ta_code2err(ret_code),
+    };
+    let mut fields = Vec::with_capacity(kwargs.fields.len());
+    for name in kwargs.fields.iter() {
+        let func = ht_func(name)?;
+        let idx = funcs.iter().position(|f| *f == func).unwrap();
+        let mut s = match (&mut outs[idx], name.as_str()) {
+            (HtOut::Real(v), _) => float_series(std::mem::take(v), kwargs.out_dtype),
+            (HtOut::Int(v), _) => Int32Chunked::from_vec("", std::mem::take(v)).into_series(),
+            (HtOut::Pair(v, _), "inphase" | "sine") => {
+                float_series(std::mem::take(v), kwargs.out_dtype)
+            }
+            (HtOut::Pair(_, v), _) => float_series(std::mem::take(v), kwargs.out_dtype),
+        };
+        s.rename(name);
+        fields.push(s);
+    }
+    let out = StructChunked::new("", &fields)?;
+    Ok(out.into_series())
+}
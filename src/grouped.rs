@@ -0,0 +1,243 @@
+use crate::utils::{float_output, float_series, ta_code2err, F64Input, OutKwargs};
+use polars::prelude::*;
+use pyo3_polars::derive::polars_expr;
+use rayon::prelude::*;
+use serde::Deserialize;
+use std::borrow::Cow;
+use talib::common::TimePeriodKwargs;
+use talib::overlap::{ta_timeperiod_into, TimePeriodFn, TimePeriodLookbackFn};
+use talib_sys::{
+    TA_DEMA_Lookback, TA_EMA_Lookback, TA_KAMA_Lookback, TA_MIDPOINT_Lookback, TA_RetCode,
+    TA_SMA_Lookback, TA_TEMA_Lookback, TA_TRIMA_Lookback, TA_WMA_Lookback, TA_DEMA, TA_EMA,
+    TA_KAMA, TA_MIDPOINT, TA_SMA, TA_TEMA, TA_TRIMA, TA_WMA,
+};
+
+pub type RealFn = fn(*const f64, usize, &TimePeriodKwargs) -> Result<Vec<f64>, TA_RetCode>;
+
+#[derive(Deserialize)]
+pub struct GroupedKwargs {
+    pub func: String,
+    /// Unset when the period is passed as a column, see `group_periods`.
+    #[serde(default)]
+    pub timeperiod: Option<i32>,
+}
+
+/// TA-Lib entry point and lookback of a grouped moving average.
+pub type OverlapFn = (TimePeriodFn<f64>, TimePeriodLookbackFn);
+
+pub fn overlap_fn(func: &str) -> PolarsResult<OverlapFn> {
+    match func {
+        "dema" => Ok((TA_DEMA, TA_DEMA_Lookback)),
+        "ema" => Ok((TA_EMA, TA_EMA_Lookback)),
+        "kama" => Ok((TA_KAMA, TA_KAMA_Lookback)),
+        "midpoint" => Ok((TA_MIDPOINT, TA_MIDPOINT_Lookback)),
+        "sma" => Ok((TA_SMA, TA_SMA_Lookback)),
+        "tema" => Ok((TA_TEMA, TA_TEMA_Lookback)),
+        "trima" => Ok((TA_TRIMA, TA_TRIMA_Lookback)),
+        "wma" => Ok((TA_WMA, TA_WMA_Lookback)),
+        _ => Err(PolarsError::ComputeError(
+            format!("grouped computation is not supported for `{}`", func).into(),
+        )),
+    }
+}
+
+/// Offsets `(start, len)` of the contiguous runs in `ids`.
+pub fn group_offsets(ids: &[u32]) -> Vec<(usize, usize)> {
+    let mut groups = Vec::new();
+    let mut start = 0;
+    for i in 1..ids.len() {
+        if ids[i] != ids[i - 1] {
+            groups.push((start, i - start));
+            start = i;
+        }
+    }
+    if !ids.is_empty() {
+        groups.push((start, ids.len() - start));
+    }
+    groups
+}
+
+/// Row order that makes the groups of `ids` contiguous, keeping the order of the rows
+/// within each group, `None` when they already are.
+pub fn group_order(ids: &[u32]) -> Option<Vec<usize>> {
+    let n_ids = ids.iter().max().map_or(0, |id| *id as usize + 1);
+    let mut counts = vec![0usize; n_ids];
+    for id in ids {
+        counts[*id as usize] += 1;
+    }
+    if group_offsets(ids).len() == counts.iter().filter(|c| **c > 0).count() {
+        return None;
+    }
+    let mut starts = Vec::with_capacity(n_ids);
+    let mut total = 0;
+    for count in counts {
+        starts.push(total);
+        total += count;
+    }
+    let mut order = vec![0; ids.len()];
+    for (i, id) in ids.iter().enumerate() {
+        order[starts[*id as usize]] = i;
+        starts[*id as usize] += 1;
+    }
+    Some(order)
+}
+
+/// Period of every group, read from `periods`, which must be constant within a group.
+///
+/// A length 1 `periods` (a literal) applies to every group.
+pub fn group_periods(periods: &Series, groups: &[(usize, usize)]) -> PolarsResult<Vec<i32>> {
+    let periods = periods.cast(&DataType::Int32)?;
+    let periods = periods.i32()?.rechunk();
+    groups
+        .iter()
+        .map(|&(start, len)| {
+            let (start, len) = if periods.len() == 1 {
+                (0, 1)
+            } else {
+                (start, len)
+            };
+            let group = periods.slice(start as i64, len);
+            let period = group
+                .get(0)
+                .ok_or_else(|| PolarsError::ComputeError("timeperiod must not be null".into()))?;
+            if group.into_iter().any(|p| p != Some(period)) {
+                return Err(PolarsError::ComputeError(
+                    "timeperiod must be constant within each group".into(),
+                ));
+            }
+            Ok(period)
+        })
+        .collect()
+}
+
+/// Pack groups into tasks of roughly `rows / (4 * n_threads)` rows.
+///
+/// Groups are taken longest first, so a few very long groups become their own
+/// tasks and are scheduled before the many small groups that are batched
+/// together, instead of being picked up last and stalling the pool.
+pub fn group_tasks(groups: &[(usize, usize)], n_threads: usize) -> Vec<Vec<usize>> {
+    let rows: usize = groups.iter().map(|g| g.1).sum();
+    let target = (rows / (4 * n_threads.max(1))).max(1);
+    let mut order: Vec<usize> = (0..groups.len()).collect();
+    order.sort_unstable_by(|a, b| groups[*b].1.cmp(&groups[*a].1));
+    let mut tasks = Vec::new();
+    let mut task = Vec::new();
+    let mut task_rows = 0;
+    for idx in order {
+        task.push(idx);
+        task_rows += groups[idx].1;
+        if task_rows >= target {
+            tasks.push(std::mem::take(&mut task));
+            task_rows = 0;
+        }
+    }
+    if !task.is_empty() {
+        tasks.push(task);
+    }
+    tasks
+}
+
+/// Run `f` on every group of `input` in parallel, each writing its rows of one output
+/// buffer.
+pub fn apply_grouped<F>(input: &[f64], ids: &[u32], f: F) -> Result<Vec<f64>, TA_RetCode>
+where
+    F: Fn(usize, *const f64, &mut [f64]) -> Result<(), TA_RetCode> + Sync,
+{
+    let groups = group_offsets(ids);
+    let mut out = vec![f64::NAN; input.len()];
+    let mut slots: Vec<Option<&mut [f64]>> = Vec::with_capacity(groups.len());
+    let mut rest = out.as_mut_slice();
+    for &(_, len) in groups.iter() {
+        let (head, tail) = rest.split_at_mut(len);
+        slots.push(Some(head));
+        rest = tail;
+    }
+    let tasks: Vec<Vec<(usize, usize, &mut [f64])>> =
+        group_tasks(&groups, rayon::current_num_threads())
+            .into_iter()
+            .map(|task| {
+                task.into_iter()
+                    .map(|idx| (idx, groups[idx].0, slots[idx].take().unwrap()))
+                    .collect()
+            })
+            .collect();
+    tasks.into_par_iter().try_for_each(|task| {
+        for (idx, start, dst) in task {
+            f(idx, input[start..].as_ptr(), dst)?;
+        }
+        Ok(())
+    })?;
+    Ok(out)
+}
+
+/// Moving average of every group of `inputs[1]` in one call.
+///
+/// `inputs[1]` holds the group ids, a length 1 id makes the whole input one group
+/// (e.g. inside `over`). Rows of a group need not be contiguous: otherwise they are
+/// gathered per group and the output scattered back. The period is `kwargs.timeperiod`,
+/// or per group from `inputs[2]` when it is given.
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn grouped_overlap(inputs: &[Series], kwargs: OutKwargs<GroupedKwargs>) -> PolarsResult<Series> {
+    let (ta_func, lookback_func) = overlap_fn(&kwargs.func)?;
+    let input = F64Input::new(&inputs[0])?;
+    let ids = inputs[1].cast(&DataType::UInt32)?;
+    let ids = ids.u32()?.rechunk();
+    let single;
+    let ids = if ids.len() == 1 && input.len() != 1 {
+        single = vec![0u32; input.len()];
+        single.as_slice()
+    } else {
+        ids.cont_slice()?
+    };
+    let order = group_order(ids);
+    let (values, ids, periods) = match &order {
+        Some(order) => {
+            let values: Vec<f64> = order.iter().map(|i| input.as_slice()[*i]).collect();
+            let ids: Vec<u32> = order.iter().map(|i| ids[*i]).collect();
+            let periods = match inputs.get(2) {
+                Some(periods) if periods.len() != 1 => {
+                    let periods = periods.cast(&DataType::Int32)?;
+                    let periods = periods.i32()?.rechunk();
+                    let periods: Int32Chunked = order.iter().map(|i| periods.get(*i)).collect();
+                    Some(periods.into_series())
+                }
+                periods => periods.cloned(),
+            };
+            (Cow::Owned(values), Cow::Owned(ids), periods)
+        }
+        None => (
+            Cow::Borrowed(input.as_slice()),
+            Cow::Borrowed(ids),
+            inputs.get(2).cloned(),
+        ),
+    };
+    let periods = match (periods, kwargs.timeperiod) {
+        (Some(periods), _) => group_periods(&periods, &group_offsets(&ids))?,
+        (None, Some(timeperiod)) => vec![timeperiod],
+        (None, None) => {
+            return Err(PolarsError::ComputeError(
+                "grouped computation needs a timeperiod".into(),
+            ))
+        }
+    };
+    let res = apply_grouped(&values, &ids, |idx, ptr, dst| {
+        let ta_kwargs = TimePeriodKwargs {
+            timeperiod: periods[idx.min(periods.len() - 1)],
+        };
+        ta_timeperiod_into(ta_func, lookback_func, ptr, dst, &ta_kwargs)
+    })
+    .map(|out| match &order {
+        Some(order) => {
+            let mut scattered = vec![f64::NAN; out.len()];
+            for (v, i) in out.into_iter().zip(order) {
+                scattered[*i] = v;
+            }
+            scattered
+        }
+        None => out,
+    });
+    match res {
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
+        Err(ret_code) => ta_code2err(ret_code),
+    }
+}
@@ -1,15 +1,23 @@
+mod chunked;
 mod cycle;
+mod grouped;
 mod math;
+mod meta;
 mod momentum;
 mod overlap;
 mod pattern;
+mod prefix;
+mod range;
+mod scan;
 mod statistic;
+mod sweep;
 mod transform;
 mod utils;
 mod volatility;
 mod volume;
-use pyo3::exceptions::PyRuntimeError;
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::{pyfunction, pymodule, types::PyModule, wrap_pyfunction, PyResult, Python};
+use std::collections::HashMap;
 use talib::common::{ta_initialize, ta_shutdown, ta_version};
 // use talib_sys::{TA_Initialize, TA_Shutdown, TA_RetCode};
 
@@ -50,6 +58,30 @@ fn version() -> PyResult<String> {
     Ok(ta_version())
 }
 
+/// Number of input copies made before calling TA-Lib and their total size in bytes.
+#[pyfunction]
+fn input_copy_stats() -> PyResult<(u64, u64)> {
+    Ok(utils::input_copy_stats())
+}
+
+#[pyfunction]
+fn reset_input_copy_stats() -> PyResult<()> {
+    utils::reset_input_copy_stats();
+    Ok(())
+}
+
+/// Lookback of TA-Lib function `name` with the optional inputs `params`, and the
+/// rows to load before its first wanted output, `None` if it needs the whole history.
+#[pyfunction]
+fn lookback(name: &str, params: HashMap<String, f64>) -> PyResult<(usize, Option<usize>)> {
+    let func =
+        meta::TaFunc::new(name, &params).map_err(|e| PyValueError::new_err(e.to_string()))?;
+    let lookback = func
+        .lookback()
+        .map_err(|e| PyValueError::new_err(e.to_string()))?;
+    Ok((lookback, func.unstable_rows().map(|rows| lookback + rows)))
+}
+
 /// A Python module implemented in Rust.
 #[pymodule]
 #[pyo3(name = "_polars_talib")]
@@ -57,5 +89,11 @@ fn polars_ta(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(initialize, m)?)?;
     m.add_function(wrap_pyfunction!(shutdown, m)?)?;
     m.add_function(wrap_pyfunction!(version, m)?)?;
+    m.add_function(wrap_pyfunction!(input_copy_stats, m)?)?;
+    m.add_function(wrap_pyfunction!(reset_input_copy_stats, m)?)?;
+    m.add_function(wrap_pyfunction!(lookback, m)?)?;
+    m.add("PREFIX_TOLERANCE", prefix::PREFIX_TOLERANCE)?;
+    m.add("PARALLEL_MIN_ROWS", chunked::PARALLEL_MIN_ROWS)?;
+    m.add("SCAN_TOLERANCE", scan::SCAN_TOLERANCE)?;
     Ok(())
 }
@@ -1,87 +1,125 @@
-use crate::utils::{cast_series_to_f64, get_series_f64_ptr, ta_code2err};
+use crate::chunked::par_chunked;
+use crate::grouped::RealFn;
+use crate::sweep::periods_array;
+use crate::utils::{
+    float_output, float_series, map_binary, map_unary, native_begin, rolling_extreme,
+    rolling_extreme_index, rolling_extremes, ta_code2err, Engine, EngineKwargs, F64Input, OutDtype,
+    OutDtypeKwargs, OutKwargs, SyncPtr, Ties,
+};
 use polars::prelude::*;
 use pyo3_polars::derive::polars_expr;
+use rayon::prelude::*;
+use serde::Deserialize;
 use talib::common::TimePeriodKwargs;
-use talib::math::{
-    ta_add, ta_div, ta_max, ta_maxindex, ta_min, ta_minindex, ta_minmax, ta_minmaxindex, ta_mult,
-    ta_sub, ta_sum,
-};
+use talib::math::{ta_max, ta_maxindex, ta_min, ta_minindex, ta_minmax, ta_minmaxindex, ta_sum};
+use talib_sys::TA_RetCode;
+
+/// Rolling extreme indices as TA-Lib reports them, counted from the first row after the
+/// leading NaNs and 0 before the first full window.
+fn extreme_indices(values: &[f64], begin: usize, period: usize, max: bool) -> Vec<i32> {
+    let indices = rolling_extreme_index(values, begin, period, max, Ties::Rescan);
+    let mut out = vec![0; values.len()];
+    for (dst, idx) in out.iter_mut().skip(begin + period - 1).zip(indices) {
+        *dst = (idx - begin) as i32;
+    }
+    out
+}
 
-use talib::math::{
-    ta_acos, ta_asin, ta_atan, ta_ceil, ta_cos, ta_cosh, ta_exp, ta_floor, ta_ln, ta_log10, ta_sin,
-    ta_sinh, ta_sqrt, ta_tan, ta_tanh,
-};
+// The rolling extremes (`max`, `min`, `minmax` and their indices) run on a monotonic
+// deque in O(n) unless `engine="talib"`, NaN inside the input or a period TA-Lib rejects
+// sends them to TA-Lib. Both give the same values and indices. `max` and `min` of a long
+// series are computed in overlapping chunks in parallel, see `par_chunked`.
 
-#[polars_expr(output_type=Float64)]
-fn add(inputs: &[Series]) -> PolarsResult<Series> {
-    let input1 = &mut cast_series_to_f64(&inputs[0])?;
-    let input2 = &mut cast_series_to_f64(&inputs[1])?;
-    let (input1_ptr, _input1) = get_series_f64_ptr(input1)?;
-    let (input2_ptr, _input2) = get_series_f64_ptr(input2)?;
-    let len = input1.len();
-    let res = ta_add(input1_ptr, input2_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+// The per-row functions (arithmetic and math transforms) run natively, chunk by chunk and
+// keeping nulls, with the same operations TA-Lib does: `a + b`, ..., and libm's `sqrt`,
+// `log`, ... on each value.
+
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn add(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_binary(inputs, kwargs.out_dtype, |a, b| a + b)
 }
 
-#[polars_expr(output_type=Float64)]
-fn div(inputs: &[Series]) -> PolarsResult<Series> {
-    let input1 = &mut cast_series_to_f64(&inputs[0])?;
-    let input2 = &mut cast_series_to_f64(&inputs[1])?;
-    let (input1_ptr, _input1) = get_series_f64_ptr(input1)?;
-    let (input2_ptr, _input2) = get_series_f64_ptr(input2)?;
-    let len = input1.len();
-    let res = ta_div(input1_ptr, input2_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn div(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_binary(inputs, kwargs.out_dtype, |a, b| a / b)
 }
 
-#[polars_expr(output_type=Float64)]
-fn max(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_max(input_ptr, len, &kwargs);
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn max(inputs: &[Series], kwargs: OutKwargs<EngineKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
+    let res = par_chunked("max", kwargs.timeperiod, &[values], |rows| {
+        let values = &values[rows];
+        match native_begin(kwargs.engine, kwargs.timeperiod, &[values]) {
+            Some(begin) => Ok(rolling_extreme(
+                values,
+                begin,
+                kwargs.timeperiod as usize,
+                true,
+            )),
+            None => ta_max(values.as_ptr(), values.len(), &kwargs),
+        }
+    });
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
 #[polars_expr(output_type=Int32)]
-fn maxindex(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_maxindex(input_ptr, len, &kwargs);
+fn maxindex(inputs: &[Series], kwargs: EngineKwargs) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
+    let res = match native_begin(kwargs.engine, kwargs.timeperiod, &[values]) {
+        Some(begin) => Ok(extreme_indices(
+            values,
+            begin,
+            kwargs.timeperiod as usize,
+            true,
+        )),
+        None => ta_maxindex(input.ptr(), input.len(), &kwargs),
+    };
     match res {
         Ok(out) => Ok(Int32Chunked::from_vec("", out).into_series()),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn min(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_min(input_ptr, len, &kwargs);
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn min(inputs: &[Series], kwargs: OutKwargs<EngineKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
+    let res = par_chunked("min", kwargs.timeperiod, &[values], |rows| {
+        let values = &values[rows];
+        match native_begin(kwargs.engine, kwargs.timeperiod, &[values]) {
+            Some(begin) => Ok(rolling_extreme(
+                values,
+                begin,
+                kwargs.timeperiod as usize,
+                false,
+            )),
+            None => ta_min(values.as_ptr(), values.len(), &kwargs),
+        }
+    });
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
 #[polars_expr(output_type=Int32)]
-fn minindex(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_minindex(input_ptr, len, &kwargs);
+fn minindex(inputs: &[Series], kwargs: EngineKwargs) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
+    let res = match native_begin(kwargs.engine, kwargs.timeperiod, &[values]) {
+        Some(begin) => Ok(extreme_indices(
+            values,
+            begin,
+            kwargs.timeperiod as usize,
+            false,
+        )),
+        None => ta_minindex(input.ptr(), input.len(), &kwargs),
+    };
     match res {
         Ok(out) => Ok(Int32Chunked::from_vec("", out).into_series()),
         Err(ret_code) => ta_code2err(ret_code),
@@ -96,12 +134,19 @@ pub fn minmax_output(_: &[Field]) -> PolarsResult<Field> {
 }
 
 #[polars_expr(output_type_func=minmax_output)]
-fn minmax(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-
-    let len = input.len();
-    let res = ta_minmax(input_ptr, len, &kwargs);
+fn minmax(inputs: &[Series], kwargs: EngineKwargs) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
+    let res = match native_begin(kwargs.engine, kwargs.timeperiod, &[values]) {
+        Some(begin) => {
+            let period = kwargs.timeperiod as usize;
+            Ok((
+                rolling_extreme(values, begin, period, false),
+                rolling_extreme(values, begin, period, true),
+            ))
+        }
+        None => ta_minmax(input.ptr(), input.len(), &kwargs),
+    };
     match res {
         Ok((outmin, outmax)) => {
             let min = Series::from_vec("min", outmin);
@@ -121,12 +166,19 @@ pub fn minmaxindex_output(_: &[Field]) -> PolarsResult<Field> {
 }
 
 #[polars_expr(output_type_func=minmaxindex_output)]
-fn minmaxindex(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-
-    let len = input.len();
-    let res = ta_minmaxindex(input_ptr, len, &kwargs);
+fn minmaxindex(inputs: &[Series], kwargs: EngineKwargs) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
+    let res = match native_begin(kwargs.engine, kwargs.timeperiod, &[values]) {
+        Some(begin) => {
+            let period = kwargs.timeperiod as usize;
+            Ok((
+                extreme_indices(values, begin, period, false),
+                extreme_indices(values, begin, period, true),
+            ))
+        }
+        None => ta_minmaxindex(input.ptr(), input.len(), &kwargs),
+    };
     match res {
         Ok((outminidx, outmaxidx)) => {
             let minidx = Series::from_vec("minidx", outminidx);
@@ -138,256 +190,171 @@ fn minmaxindex(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Seri
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn mult(inputs: &[Series]) -> PolarsResult<Series> {
-    let input1 = &mut cast_series_to_f64(&inputs[0])?;
-    let input2 = &mut cast_series_to_f64(&inputs[1])?;
-    let (input1_ptr, _input1) = get_series_f64_ptr(input1)?;
-    let (input2_ptr, _input2) = get_series_f64_ptr(input2)?;
-    let len = input1.len();
-    let res = ta_mult(input1_ptr, input2_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[derive(Deserialize)]
+pub struct MultiKwargs {
+    pub timeperiods: Vec<i32>,
+    #[serde(default)]
+    pub engine: Engine,
+    #[serde(default)]
+    pub out_dtype: OutDtype,
 }
 
-#[polars_expr(output_type=Float64)]
-fn sub(inputs: &[Series]) -> PolarsResult<Series> {
-    let input1 = &mut cast_series_to_f64(&inputs[0])?;
-    let input2 = &mut cast_series_to_f64(&inputs[1])?;
-    let (input1_ptr, _input1) = get_series_f64_ptr(input1)?;
-    let (input2_ptr, _input2) = get_series_f64_ptr(input2)?;
-    let len = input1.len();
-    let res = ta_sub(input1_ptr, input2_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+pub fn multi_output(input_fields: &[Field], kwargs: MultiKwargs) -> PolarsResult<Field> {
+    let dtype = DataType::Array(Box::new(kwargs.out_dtype.dtype()), kwargs.timeperiods.len());
+    Ok(Field::new(input_fields[0].name(), dtype))
 }
 
-#[polars_expr(output_type=Float64)]
-fn sum(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-
-    let len = input.len();
-    let res = ta_sum(input_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
+/// Rolling maximum (`max`) or minimum for every period of `timeperiods`, element `j` of
+/// each row equal to `max` / `min` with `timeperiod=timeperiods[j]`.
+///
+/// One sparse table serves all the periods, see `rolling_extremes`. TA-Lib runs once per
+/// period instead under the same conditions as `max`.
+fn extreme_multi(inputs: &[Series], kwargs: &MultiKwargs, max: bool) -> PolarsResult<Series> {
+    if kwargs.timeperiods.is_empty() {
+        return Err(PolarsError::ComputeError(
+            "rolling extremes need at least one timeperiod".into(),
+        ));
     }
-}
-
-#[polars_expr(output_type=Float64)]
-fn acos(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-
+    let shortest = *kwargs.timeperiods.iter().min().unwrap();
+    let longest = *kwargs.timeperiods.iter().max().unwrap();
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
     let len = input.len();
-    let res = ta_acos(input_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => {
-            println!("ret_code: {:?}", ret_code);
-            ta_code2err(ret_code)
+    let outs = match native_begin(kwargs.engine, longest, &[values]) {
+        Some(begin) if shortest >= 2 => {
+            let periods: Vec<usize> = kwargs.timeperiods.iter().map(|p| *p as usize).collect();
+            rolling_extremes(values, begin, &periods, max)
         }
-    }
-}
-
-#[polars_expr(output_type=Float64)]
-fn asin(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-
-    let len = input.len();
-    let res = ta_asin(input_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => {
-            println!("ret_code: {:?}", ret_code);
-            ta_code2err(ret_code)
+        _ => {
+            let ta_func = if max {
+                ta_max as RealFn
+            } else {
+                ta_min as RealFn
+            };
+            let input_ptr = SyncPtr(input.ptr());
+            let res: Result<Vec<Vec<f64>>, TA_RetCode> = kwargs
+                .timeperiods
+                .par_iter()
+                .map(|timeperiod| {
+                    let ta_kwargs = TimePeriodKwargs {
+                        timeperiod: *timeperiod,
+                    };
+                    ta_func(input_ptr.ptr(), len, &ta_kwargs)
+                })
+                .collect();
+            match res {
+                Ok(outs) => outs,
+                Err(ret_code) => return ta_code2err(ret_code),
+            }
         }
-    }
+    };
+    periods_array(outs, len, kwargs.out_dtype)
 }
 
-#[polars_expr(output_type=Float64)]
-fn atan(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-
-    let len = input.len();
-    let res = ta_atan(input_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => {
-            println!("ret_code: {:?}", ret_code);
-            ta_code2err(ret_code)
-        }
-    }
+#[polars_expr(output_type_func_with_kwargs=multi_output)]
+fn max_multi(inputs: &[Series], kwargs: MultiKwargs) -> PolarsResult<Series> {
+    extreme_multi(inputs, &kwargs, true)
 }
 
-#[polars_expr(output_type=Float64)]
-fn ceil(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-
-    let len = input.len();
-    let res = ta_ceil(input_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => {
-            println!("ret_code: {:?}", ret_code);
-            ta_code2err(ret_code)
-        }
-    }
+#[polars_expr(output_type_func_with_kwargs=multi_output)]
+fn min_multi(inputs: &[Series], kwargs: MultiKwargs) -> PolarsResult<Series> {
+    extreme_multi(inputs, &kwargs, false)
 }
 
-#[polars_expr(output_type=Float64)]
-fn cos(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-
-    let len = input.len();
-    let res = ta_cos(input_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => {
-            println!("ret_code: {:?}", ret_code);
-            ta_code2err(ret_code)
-        }
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn mult(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_binary(inputs, kwargs.out_dtype, |a, b| a * b)
 }
 
-#[polars_expr(output_type=Float64)]
-fn cosh(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-
-    let len = input.len();
-    let res = ta_cosh(input_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => {
-            println!("ret_code: {:?}", ret_code);
-            ta_code2err(ret_code)
-        }
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn sub(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_binary(inputs, kwargs.out_dtype, |a, b| a - b)
 }
 
-#[polars_expr(output_type=Float64)]
-fn exp(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn sum(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let input_ptr = input.ptr();
 
     let len = input.len();
-    let res = ta_exp(input_ptr, len);
+    let res = ta_sum(input_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn floor(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-
-    let len = input.len();
-    let res = ta_floor(input_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn acos(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::acos)
 }
 
-#[polars_expr(output_type=Float64)]
-fn ln(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn asin(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::asin)
+}
 
-    let len = input.len();
-    let res = ta_ln(input_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn atan(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::atan)
 }
 
-#[polars_expr(output_type=Float64)]
-fn log10(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn ceil(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::ceil)
+}
 
-    let len = input.len();
-    let res = ta_log10(input_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn cos(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::cos)
 }
 
-#[polars_expr(output_type=Float64)]
-fn sin(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn cosh(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::cosh)
+}
 
-    let len = input.len();
-    let res = ta_sin(input_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn exp(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::exp)
 }
 
-#[polars_expr(output_type=Float64)]
-fn sinh(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn floor(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::floor)
+}
 
-    let len = input.len();
-    let res = ta_sinh(input_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn ln(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::ln)
 }
 
-#[polars_expr(output_type=Float64)]
-fn sqrt(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn log10(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::log10)
+}
 
-    let len = input.len();
-    let res = ta_sqrt(input_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn sin(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::sin)
 }
 
-#[polars_expr(output_type=Float64)]
-fn tan(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn sinh(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::sinh)
+}
 
-    let len = input.len();
-    let res = ta_tan(input_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn sqrt(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::sqrt)
 }
 
-#[polars_expr(output_type=Float64)]
-fn tanh(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn tan(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::tan)
+}
 
-    let len = input.len();
-    let res = ta_tanh(input_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn tanh(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_unary(inputs, kwargs.out_dtype, f64::tanh)
 }
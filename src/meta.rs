@@ -0,0 +1,279 @@
+use crate::utils::ta_code2err;
+use polars::prelude::{PolarsError, PolarsResult};
+use std::collections::HashMap;
+use std::ffi::{CStr, CString};
+use std::ptr;
+use talib_sys::{
+    TA_FuncHandle, TA_FuncInfo, TA_GetFuncHandle, TA_GetFuncInfo, TA_GetLookback,
+    TA_GetOptInputParameterInfo, TA_OptInputParameterInfo,
+    TA_OptInputParameterType_TA_OptInput_IntegerList,
+    TA_OptInputParameterType_TA_OptInput_IntegerRange, TA_ParamHolder, TA_ParamHolderAlloc,
+    TA_ParamHolderFree, TA_RetCode, TA_SetOptInputParamInteger, TA_SetOptInputParamReal,
+};
+
+/// Relative weight of the history before the warmup that an exponentially smoothed
+/// function may still carry, see `Memory::rows`.
+pub const WARMUP_TOLERANCE: f64 = 1e-8;
+
+/// Slowest smoothing constant of KAMA, `(2 / (30 + 1))^2`.
+const KAMA_SLOWEST: f64 = (2.0 / 31.0) * (2.0 / 31.0);
+
+/// Smoothing constant of the Hilbert transform's period and phase estimates.
+const HT_SMOOTHING: f64 = 0.2;
+
+/// Smoothing constant of the slow EMA of `MACDFIX`, fixed to a period of 26.
+const MACDFIX_SLOW: f64 = 0.075;
+
+/// Slow limit `TA_MA` uses for `MAMA`.
+const MAMA_SLOW_LIMIT: f64 = 0.05;
+
+/// Optional input of a TA-Lib function under its Python name, `optInTimePeriod` is
+/// `timeperiod`.
+struct OptInput {
+    name: String,
+    value: f64,
+    integer: bool,
+}
+
+/// A TA-Lib function looked up by name through the abstract interface, with its
+/// optional inputs set from `params` or TA-Lib's defaults.
+pub struct TaFunc {
+    name: String,
+    handle: *const TA_FuncHandle,
+    opt_inputs: Vec<OptInput>,
+}
+
+impl TaFunc {
+    pub fn new(name: &str, params: &HashMap<String, f64>) -> PolarsResult<Self> {
+        let unknown =
+            || PolarsError::ComputeError(format!("unknown TA-Lib function `{}`", name).into());
+        let c_name = CString::new(name.to_uppercase()).map_err(|_| unknown())?;
+        let mut handle: *const TA_FuncHandle = ptr::null();
+        let mut info: *const TA_FuncInfo = ptr::null();
+        unsafe {
+            if TA_GetFuncHandle(c_name.as_ptr(), &mut handle) != TA_RetCode::TA_SUCCESS
+                || TA_GetFuncInfo(handle, &mut info) != TA_RetCode::TA_SUCCESS
+            {
+                return Err(unknown());
+            }
+        }
+        let mut opt_inputs = Vec::new();
+        for i in 0..unsafe { (*info).nbOptInput } {
+            let mut opt_info: *const TA_OptInputParameterInfo = ptr::null();
+            let ret_code = unsafe { TA_GetOptInputParameterInfo(handle, i, &mut opt_info) };
+            if ret_code != TA_RetCode::TA_SUCCESS {
+                return ta_code2err(ret_code);
+            }
+            let opt_info = unsafe { &*opt_info };
+            let param_name = unsafe { CStr::from_ptr(opt_info.paramName) }.to_string_lossy();
+            let param_name = param_name.trim_start_matches("optIn").to_lowercase();
+            opt_inputs.push(OptInput {
+                value: params
+                    .get(&param_name)
+                    .copied()
+                    .unwrap_or(opt_info.defaultValue),
+                integer: opt_info.type_ == TA_OptInputParameterType_TA_OptInput_IntegerRange
+                    || opt_info.type_ == TA_OptInputParameterType_TA_OptInput_IntegerList,
+                name: param_name,
+            });
+        }
+        if let Some(key) = params
+            .keys()
+            .find(|key| !opt_inputs.iter().any(|opt| &opt.name == *key))
+        {
+            return Err(PolarsError::ComputeError(
+                format!("`{}` has no parameter `{}`", name, key).into(),
+            ));
+        }
+        Ok(TaFunc {
+            name: name.to_lowercase(),
+            handle,
+            opt_inputs,
+        })
+    }
+
+    /// Value of the optional input `name`, NaN if the function has none.
+    pub fn param(&self, name: &str) -> f64 {
+        self.opt_inputs
+            .iter()
+            .find(|opt| opt.name == name)
+            .map_or(f64::NAN, |opt| opt.value)
+    }
+
+    /// Rows TA-Lib consumes before the first output, including the unstable period
+    /// set with `TA_SetUnstablePeriod` (0 unless changed).
+    pub fn lookback(&self) -> PolarsResult<usize> {
+        let mut holder: *mut TA_ParamHolder = ptr::null_mut();
+        let ret_code = unsafe { TA_ParamHolderAlloc(self.handle, &mut holder) };
+        if ret_code != TA_RetCode::TA_SUCCESS {
+            return ta_code2err(ret_code);
+        }
+        let mut ret_code = TA_RetCode::TA_SUCCESS;
+        for (i, opt) in self.opt_inputs.iter().enumerate() {
+            ret_code = unsafe {
+                if opt.integer {
+                    TA_SetOptInputParamInteger(holder, i as u32, opt.value as i32)
+                } else {
+                    TA_SetOptInputParamReal(holder, i as u32, opt.value)
+                }
+            };
+            if ret_code != TA_RetCode::TA_SUCCESS {
+                break;
+            }
+        }
+        let mut lookback = -1;
+        if ret_code == TA_RetCode::TA_SUCCESS {
+            ret_code = unsafe { TA_GetLookback(holder, &mut lookback) };
+        }
+        unsafe { TA_ParamHolderFree(holder) };
+        match ret_code {
+            TA_RetCode::TA_SUCCESS if lookback >= 0 => Ok(lookback as usize),
+            TA_RetCode::TA_SUCCESS => ta_code2err(TA_RetCode::TA_BAD_PARAM),
+            _ => ta_code2err(ret_code),
+        }
+    }
+
+    /// Rows to read before the lookback so the output does not depend on where the
+    /// input starts, see `Memory`. `None` when it depends on the whole history.
+    pub fn unstable_rows(&self) -> Option<usize> {
+        self.memory().rows()
+    }
+
+    fn memory(&self) -> Memory {
+        let p = |name: &str| self.param(name);
+        let ma = |matype: &str, period: &str| Memory::of_ma(p(matype), p(period));
+        match self.name.as_str() {
+            "ema" => Memory::ema(p("timeperiod"), 1),
+            "dema" => Memory::ema(p("timeperiod"), 2),
+            "tema" | "trix" => Memory::ema(p("timeperiod"), 3),
+            "t3" => Memory::ema(p("timeperiod"), 6),
+            "kama" => Memory::Decay(KAMA_SLOWEST, 1),
+            "atr" | "cmo" | "dx" | "minus_di" | "minus_dm" | "natr" | "plus_di" | "plus_dm"
+            | "rsi" => Memory::wilder(p("timeperiod")),
+            // Wilder's average of DX, itself from Wilder's sums
+            "adx" | "adxr" => Memory::wilder(p("timeperiod")).then(Memory::wilder(p("timeperiod"))),
+            "stochrsi" => Memory::wilder(p("timeperiod")).then(ma("fastd_matype", "fastd_period")),
+            "macd" => Memory::ema(p("fastperiod"), 1)
+                .slowest(Memory::ema(p("slowperiod"), 1))
+                .then(Memory::ema(p("signalperiod"), 1)),
+            "macdfix" => Memory::Decay(MACDFIX_SLOW, 1).then(Memory::ema(p("signalperiod"), 1)),
+            "macdext" => ma("fastmatype", "fastperiod")
+                .slowest(ma("slowmatype", "slowperiod"))
+                .then(ma("signalmatype", "signalperiod")),
+            "apo" | "ppo" => ma("matype", "fastperiod").slowest(ma("matype", "slowperiod")),
+            "bbands" | "ma" => ma("matype", "timeperiod"),
+            "mavp" => ma("matype", "maxperiod"),
+            "stoch" => ma("slowk_matype", "slowk_period").then(ma("slowd_matype", "slowd_period")),
+            "stochf" => ma("fastd_matype", "fastd_period"),
+            "adosc" => Memory::ema(p("fastperiod"), 1).slowest(Memory::ema(p("slowperiod"), 1)),
+            "mama" => Memory::Decay(p("slowlimit"), 1),
+            "ht_dcperiod" | "ht_dcphase" | "ht_phasor" | "ht_sine" | "ht_trendline"
+            | "ht_trendmode" => Memory::Decay(HT_SMOOTHING, 1),
+            // cumulative, or reversal driven state
+            "ad" | "obv" | "sar" | "sarext" => Memory::Whole,
+            _ => Memory::Finite,
+        }
+    }
+}
+
+/// How far back an output depends on its input beyond the lookback.
+#[derive(Clone, Copy)]
+enum Memory {
+    /// Only the lookback window.
+    Finite,
+    /// A cascade of `depth` exponential smoothings with constant `alpha` (DEMA 2, TEMA 3,
+    /// T3 6), see `cascade_tail` for the weight of older rows.
+    Decay(f64, u32),
+    /// Every row since the start of the input.
+    Whole,
+}
+
+impl Memory {
+    /// `depth` EMAs over `period` one after the other.
+    fn ema(period: f64, depth: u32) -> Self {
+        Memory::Decay(2.0 / (period.max(1.0) + 1.0), depth)
+    }
+
+    fn wilder(period: f64) -> Self {
+        Memory::Decay(1.0 / period.max(1.0), 1)
+    }
+
+    /// Memory of `TA_MA` with `matype` over `period`.
+    fn of_ma(matype: f64, period: f64) -> Self {
+        match matype as i32 {
+            1 => Memory::ema(period, 1),
+            3 => Memory::ema(period, 2),
+            4 => Memory::ema(period, 3),
+            8 => Memory::ema(period, 6),
+            6 => Memory::Decay(KAMA_SLOWEST, 1),
+            7 => Memory::Decay(MAMA_SLOW_LIMIT, 1),
+            _ => Memory::Finite,
+        }
+    }
+
+    /// Memory of two smoothings side by side: the slower constant and deeper cascade.
+    fn slowest(self, other: Memory) -> Self {
+        match (self, other) {
+            (Memory::Whole, _) | (_, Memory::Whole) => Memory::Whole,
+            (Memory::Decay(a, m), Memory::Decay(b, n)) => Memory::Decay(a.min(b), m.max(n)),
+            (decay, Memory::Finite) | (Memory::Finite, decay) => decay,
+        }
+    }
+
+    /// Memory of `other` smoothing the output of `self`: the stages add up, all at the
+    /// slower constant, which can only leave older rows more weight.
+    fn then(self, other: Memory) -> Self {
+        match (self, other) {
+            (Memory::Whole, _) | (_, Memory::Whole) => Memory::Whole,
+            (Memory::Decay(a, m), Memory::Decay(b, n)) => Memory::Decay(a.min(b), m + n),
+            (decay, Memory::Finite) | (Memory::Finite, decay) => decay,
+        }
+    }
+
+    /// Rows for the weight of older history to fall below `WARMUP_TOLERANCE`.
+    fn rows(self) -> Option<usize> {
+        match self {
+            Memory::Finite => Some(0),
+            Memory::Decay(alpha, _) if alpha >= 1.0 => Some(0),
+            Memory::Decay(alpha, _) if alpha <= 0.0 => None,
+            Memory::Decay(alpha, depth) => {
+                let above = |rows| cascade_tail(alpha, depth, rows) > WARMUP_TOLERANCE;
+                // the tail shrinks with the rows: double past the tolerance, then bisect
+                // between the last two, `above(lo)` holds throughout
+                let mut hi = 1;
+                while above(hi) {
+                    hi *= 2;
+                }
+                let mut lo = hi / 2;
+                while lo + 1 < hi {
+                    let mid = lo + (hi - lo) / 2;
+                    if above(mid) {
+                        lo = mid;
+                    } else {
+                        hi = mid;
+                    }
+                }
+                Some(hi)
+            }
+            Memory::Whole => None,
+        }
+    }
+}
+
+/// Weight `depth` cascaded smoothings with constant `alpha` leave to the history more
+/// than `rows` rows back, the binomial tail
+/// `sum_{j < depth} C(rows, j) alpha^j (1 - alpha)^(rows - j)`, summed in logs.
+fn cascade_tail(alpha: f64, depth: u32, rows: usize) -> f64 {
+    let n = rows as f64;
+    let (ln_a, ln_b) = (alpha.ln(), (-alpha).ln_1p());
+    let mut ln_comb = 0.0;
+    let mut tail = 0.0;
+    for j in 0..(depth as usize).min(rows + 1) {
+        let k = j as f64;
+        if j > 0 {
+            ln_comb += ((n - k + 1.0) / k).ln();
+        }
+        tail += (ln_comb + k * ln_a + (n - k) * ln_b).exp();
+    }
+    tail
+}
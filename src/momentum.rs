@@ -1,6 +1,14 @@
-use crate::utils::{cast_series_to_f64, get_series_f64_ptr, ta_code2err};
+use crate::chunked::par_chunked;
+use crate::scan::{scan_start, wilder_scan};
+use crate::utils::{
+    clean_begin, float_output, float_series, native_begin, rolling_extreme, rolling_extreme_index,
+    struct_fields_output, ta_code2err, Engine, EngineKwargs, F64Input, OutDtype, OutDtypeKwargs,
+    OutKwargs, SyncPtr, Ties,
+};
 use polars::prelude::*;
 use pyo3_polars::derive::polars_expr;
+use rayon::prelude::*;
+use serde::Deserialize;
 use talib::common::TimePeriodKwargs;
 use talib::momentum::{
     ta_adx, ta_adxr, ta_apo, ta_aroon, ta_aroonosc, ta_bop, ta_cci, ta_cmo, ta_dx, ta_macd,
@@ -12,47 +20,52 @@ use talib::momentum::{
     ApoKwargs, MacdExtKwargs, MacdFixKwargs, MacdKwargs, PpoKwargs, StochKwargs, StochRsiKwargs,
     StochfKwargs, UltOscKwargs,
 };
+use talib::overlap::{ta_ma_from, ta_ma_lookback, MaKwargs};
+use talib_sys::{
+    TA_ADX_Lookback, TA_DX_Lookback, TA_MAType, TA_MINUS_DI_Lookback, TA_MINUS_DM_Lookback,
+    TA_PLUS_DI_Lookback, TA_PLUS_DM_Lookback, TA_RetCode,
+};
 
-#[polars_expr(output_type=Float64)]
-fn adx(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn adx(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let close = F64Input::new(&inputs[0])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
+    let close_ptr = close.ptr();
     let len = close.len();
     let res = ta_adx(high_ptr, low_ptr, close_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn adxr(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn adxr(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let close = F64Input::new(&inputs[0])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
+    let close_ptr = close.ptr();
     let len = close.len();
     let res = ta_adxr(high_ptr, low_ptr, close_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn apo(inputs: &[Series], kwargs: ApoKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn apo(inputs: &[Series], kwargs: OutKwargs<ApoKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let input_ptr = input.ptr();
     let len = input.len();
     let res = ta_apo(input_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
@@ -64,14 +77,37 @@ pub fn arron_output(_: &[Field]) -> PolarsResult<Field> {
     Ok(Field::new("", DataType::Struct(v)))
 }
 
+/// Aroon down and up from the latest lowest low and highest high of each `period + 1`
+/// rows, the rows TA-Lib's AROON looks at, with its arithmetic.
+fn aroon_native(high: &[f64], low: &[f64], begin: usize, period: usize) -> (Vec<f64>, Vec<f64>) {
+    let factor = 100.0 / period as f64;
+    let highest = rolling_extreme_index(high, begin, period + 1, true, Ties::Latest);
+    let lowest = rolling_extreme_index(low, begin, period + 1, false, Ties::Latest);
+    let mut down = vec![f64::NAN; high.len()];
+    let mut up = vec![f64::NAN; high.len()];
+    for (j, (h, l)) in highest.iter().zip(lowest.iter()).enumerate() {
+        let i = begin + period + j;
+        up[i] = factor * (period - (i - h)) as f64;
+        down[i] = factor * (period - (i - l)) as f64;
+    }
+    (down, up)
+}
+
+/// Aroon over a monotonic deque unless `engine="talib"`, same values as TA-Lib.
 #[polars_expr(output_type_func=arron_output)]
-fn aroon(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[0])?;
-    let low = &mut cast_series_to_f64(&inputs[1])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let len = high.len();
-    let res = ta_aroon(high_ptr, low_ptr, len, &kwargs);
+fn aroon(inputs: &[Series], kwargs: EngineKwargs) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[0])?;
+    let low = F64Input::new(&inputs[1])?;
+    let (high_values, low_values) = (high.as_slice(), low.as_slice());
+    let res = match native_begin(kwargs.engine, kwargs.timeperiod, &[high_values, low_values]) {
+        Some(begin) => Ok(aroon_native(
+            high_values,
+            low_values,
+            begin,
+            kwargs.timeperiod as usize,
+        )),
+        None => ta_aroon(high.ptr(), low.ptr(), high.len(), &kwargs),
+    };
     match res {
         Ok((outaroondown, outaroonup)) => {
             let d = Series::from_vec("aroondown", outaroondown);
@@ -83,78 +119,95 @@ fn aroon(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn aroonosc(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[0])?;
-    let low = &mut cast_series_to_f64(&inputs[1])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let len = high.len();
-    let res = ta_aroonosc(high_ptr, low_ptr, len, &kwargs);
+/// Aroon oscillator over a monotonic deque unless `engine="talib"`, same values as
+/// TA-Lib, which scales the distance between the two extremes' rows.
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn aroonosc(inputs: &[Series], kwargs: OutKwargs<EngineKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[0])?;
+    let low = F64Input::new(&inputs[1])?;
+    let (high_values, low_values) = (high.as_slice(), low.as_slice());
+    let res = match native_begin(kwargs.engine, kwargs.timeperiod, &[high_values, low_values]) {
+        Some(begin) => {
+            let period = kwargs.timeperiod as usize;
+            let factor = 100.0 / period as f64;
+            let highest = rolling_extreme_index(high_values, begin, period + 1, true, Ties::Latest);
+            let lowest = rolling_extreme_index(low_values, begin, period + 1, false, Ties::Latest);
+            let mut out = vec![f64::NAN; high.len()];
+            for (dst, (h, l)) in out
+                .iter_mut()
+                .skip(begin + period)
+                .zip(highest.iter().zip(lowest.iter()))
+            {
+                *dst = factor * (*h as i64 - *l as i64) as f64;
+            }
+            Ok(out)
+        }
+        None => ta_aroonosc(high.ptr(), low.ptr(), high.len(), &kwargs),
+    };
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn bop(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn bop(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    let open = F64Input::new(&inputs[0])?;
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let close = F64Input::new(&inputs[3])?;
+    let open_ptr = open.ptr();
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
+    let close_ptr = close.ptr();
     let len = close.len();
     let res = ta_bop(open_ptr, high_ptr, low_ptr, close_ptr, len);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn cci(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn cci(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let close = F64Input::new(&inputs[0])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
+    let close_ptr = close.ptr();
     let len = close.len();
     let res = ta_cci(high_ptr, low_ptr, close_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn cmo(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn cmo(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let input_ptr = input.ptr();
     let len = input.len();
     let res = ta_cmo(input_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn dx(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn dx(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let close = F64Input::new(&inputs[0])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
+    let close_ptr = close.ptr();
     let len = close.len();
     let res = ta_dx(high_ptr, low_ptr, close_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
@@ -169,8 +222,8 @@ pub fn macd_output(_: &[Field]) -> PolarsResult<Field> {
 
 #[polars_expr(output_type_func=macd_output)]
 fn macd(inputs: &[Series], kwargs: MacdKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+    let input = F64Input::new(&inputs[0])?;
+    let input_ptr = input.ptr();
     let len = input.len();
     let res = ta_macd(input_ptr, len, &kwargs);
     match res {
@@ -187,8 +240,8 @@ fn macd(inputs: &[Series], kwargs: MacdKwargs) -> PolarsResult<Series> {
 
 #[polars_expr(output_type_func=macd_output)]
 fn macdext(inputs: &[Series], kwargs: MacdExtKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+    let input = F64Input::new(&inputs[0])?;
+    let input_ptr = input.ptr();
     let len = input.len();
     let res = ta_macdext(input_ptr, len, &kwargs);
     match res {
@@ -205,8 +258,8 @@ fn macdext(inputs: &[Series], kwargs: MacdExtKwargs) -> PolarsResult<Series> {
 
 #[polars_expr(output_type_func=macd_output)]
 fn macdfix(inputs: &[Series], kwargs: MacdFixKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+    let input = F64Input::new(&inputs[0])?;
+    let input_ptr = input.ptr();
     let len = input.len();
     let res = ta_macdfix(input_ptr, len, &kwargs);
     match res {
@@ -221,164 +274,179 @@ fn macdfix(inputs: &[Series], kwargs: MacdFixKwargs) -> PolarsResult<Series> {
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn mfi(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let volume = &mut cast_series_to_f64(&inputs[3])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let (volume_ptr, _volume) = get_series_f64_ptr(volume)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn mfi(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let close = F64Input::new(&inputs[0])?;
+    let volume = F64Input::new(&inputs[3])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
+    let close_ptr = close.ptr();
+    let volume_ptr = volume.ptr();
     let len = close.len();
     let res = ta_mfi(high_ptr, low_ptr, close_ptr, volume_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn minus_di(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn minus_di(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let close = F64Input::new(&inputs[0])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
+    let close_ptr = close.ptr();
     let len = close.len();
     let res = ta_minus_di(high_ptr, low_ptr, close_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn minus_dm(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[0])?;
-    let low = &mut cast_series_to_f64(&inputs[1])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn minus_dm(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[0])?;
+    let low = F64Input::new(&inputs[1])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
     let len = high.len();
     let res = ta_minus_dm(high_ptr, low_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn mom(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_mom(input_ptr, len, &kwargs);
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn mom(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
+    let res = par_chunked("mom", kwargs.timeperiod, &[values], |rows| {
+        ta_mom(values[rows.clone()].as_ptr(), rows.len(), &kwargs)
+    });
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn plus_di(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn plus_di(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let close = F64Input::new(&inputs[0])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
+    let close_ptr = close.ptr();
     let len = close.len();
     let res = ta_plus_di(high_ptr, low_ptr, close_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn plus_dm(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[0])?;
-    let low = &mut cast_series_to_f64(&inputs[1])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn plus_dm(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[0])?;
+    let low = F64Input::new(&inputs[1])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
     let len = high.len();
     let res = ta_plus_dm(high_ptr, low_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn ppo(inputs: &[Series], kwargs: PpoKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn ppo(inputs: &[Series], kwargs: OutKwargs<PpoKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let input_ptr = input.ptr();
     let len = input.len();
     let res = ta_ppo(input_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn roc(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_roc(input_ptr, len, &kwargs);
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn roc(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
+    let res = par_chunked("roc", kwargs.timeperiod, &[values], |rows| {
+        ta_roc(values[rows.clone()].as_ptr(), rows.len(), &kwargs)
+    });
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn rocp(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_rocp(input_ptr, len, &kwargs);
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn rocp(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
+    let res = par_chunked("rocp", kwargs.timeperiod, &[values], |rows| {
+        ta_rocp(values[rows.clone()].as_ptr(), rows.len(), &kwargs)
+    });
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn rocr(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_rocr(input_ptr, len, &kwargs);
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn rocr(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
+    let res = par_chunked("rocr", kwargs.timeperiod, &[values], |rows| {
+        ta_rocr(values[rows.clone()].as_ptr(), rows.len(), &kwargs)
+    });
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn rocr100(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_rocr100(input_ptr, len, &kwargs);
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn rocr100(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
+    let res = par_chunked("rocr100", kwargs.timeperiod, &[values], |rows| {
+        ta_rocr100(values[rows.clone()].as_ptr(), rows.len(), &kwargs)
+    });
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn rsi(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_rsi(input_ptr, len, &kwargs);
+/// RSI from the average gain and loss, each smoothed as a parallel scan on a long series
+/// unless `engine="talib"`, within `SCAN_TOLERANCE` of TA-Lib.
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn rsi(inputs: &[Series], kwargs: OutKwargs<EngineKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
+    let params = [("timeperiod", kwargs.timeperiod)];
+    let res = match scan_start(kwargs.engine, "rsi", &params, &[values]) {
+        Some((begin, lookback)) => Ok(rsi_scan(
+            values,
+            begin,
+            kwargs.timeperiod as usize,
+            begin + lookback,
+        )),
+        None => ta_rsi(input.ptr(), input.len(), &kwargs),
+    };
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
@@ -392,12 +460,12 @@ pub fn stoch_output(_: &[Field]) -> PolarsResult<Field> {
 
 #[polars_expr(output_type_func=stoch_output)]
 fn stoch(inputs: &[Series], kwargs: StochKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let close = F64Input::new(&inputs[0])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
+    let close_ptr = close.ptr();
     let len = close.len();
     let res = ta_stoch(high_ptr, low_ptr, close_ptr, len, &kwargs);
     match res {
@@ -420,12 +488,12 @@ pub fn stochf_output(_: &[Field]) -> PolarsResult<Field> {
 
 #[polars_expr(output_type_func=stochf_output)]
 fn stochf(inputs: &[Series], kwargs: StochfKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let close = F64Input::new(&inputs[0])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
+    let close_ptr = close.ptr();
     let len = close.len();
     let res = ta_stochf(high_ptr, low_ptr, close_ptr, len, &kwargs);
     match res {
@@ -441,8 +509,8 @@ fn stochf(inputs: &[Series], kwargs: StochfKwargs) -> PolarsResult<Series> {
 
 #[polars_expr(output_type_func=stochf_output)]
 fn stochrsi(inputs: &[Series], kwargs: StochRsiKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+    let input = F64Input::new(&inputs[0])?;
+    let input_ptr = input.ptr();
     let len = input.len();
     let res = ta_stochrsi(input_ptr, len, &kwargs);
     match res {
@@ -456,14 +524,14 @@ fn stochrsi(inputs: &[Series], kwargs: StochRsiKwargs) -> PolarsResult<Series> {
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn trix(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn trix(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let input_ptr = input.ptr();
     let len = input.len();
     let res = ta_trix(input_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => {
             println!("{:?}", ret_code);
             ta_code2err(ret_code)
@@ -471,18 +539,18 @@ fn trix(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn ultosc(inputs: &[Series], kwargs: UltOscKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn ultosc(inputs: &[Series], kwargs: OutKwargs<UltOscKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let close = F64Input::new(&inputs[0])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
+    let close_ptr = close.ptr();
     let len = close.len();
     let res = ta_ultosc(high_ptr, low_ptr, close_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => {
             println!("{:?}", ret_code);
             ta_code2err(ret_code)
@@ -490,21 +558,972 @@ fn ultosc(inputs: &[Series], kwargs: UltOscKwargs) -> PolarsResult<Series> {
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn willr(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-    let res = ta_willr(high_ptr, low_ptr, close_ptr, len, &kwargs);
+/// Williams' %R over a monotonic deque unless `engine="talib"`, same values as TA-Lib. A
+/// long series runs in parallel chunks, see `par_chunked`.
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn willr(inputs: &[Series], kwargs: OutKwargs<EngineKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let close = F64Input::new(&inputs[0])?;
+    let (high_values, low_values, close_values) =
+        (high.as_slice(), low.as_slice(), close.as_slice());
+    let prices = [high_values, low_values, close_values];
+    let res = par_chunked("willr", kwargs.timeperiod, &prices, |rows| {
+        let [high, low, close] = prices.map(|values| &values[rows.clone()]);
+        match native_begin(kwargs.engine, kwargs.timeperiod, &[high, low, close]) {
+            Some(begin) => {
+                let period = kwargs.timeperiod as usize;
+                Ok(willr_from_extremes(
+                    close,
+                    &rolling_extreme(high, begin, period, true),
+                    &rolling_extreme(low, begin, period, false),
+                ))
+            }
+            None => ta_willr(
+                high.as_ptr(),
+                low.as_ptr(),
+                close.as_ptr(),
+                close.len(),
+                &kwargs,
+            ),
+        }
+    });
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => {
             println!("{:?}", ret_code);
             ta_code2err(ret_code)
         }
     }
 }
+
+#[derive(Clone, Copy, PartialEq, Eq)]
+enum DmiFunc {
+    PlusDm,
+    MinusDm,
+    PlusDi,
+    MinusDi,
+    Dx,
+    Adx,
+}
+
+fn dmi_func(field: &str) -> PolarsResult<DmiFunc> {
+    match field {
+        "plus_dm" => Ok(DmiFunc::PlusDm),
+        "minus_dm" => Ok(DmiFunc::MinusDm),
+        "plus_di" => Ok(DmiFunc::PlusDi),
+        "minus_di" => Ok(DmiFunc::MinusDi),
+        "dx" => Ok(DmiFunc::Dx),
+        "adx" | "adxr" => Ok(DmiFunc::Adx),
+        _ => Err(PolarsError::ComputeError(
+            format!("unknown dmi field `{}`", field).into(),
+        )),
+    }
+}
+
+/// ADXR from ADX: TA-Lib's ADXR is `(adx[i] + adx[i - (timeperiod - 1)]) / 2` over an
+/// ADX computed from the same start, so this is exact.
+fn adxr_from_adx(adx: &[f64], timeperiod: usize) -> Vec<f64> {
+    let lag = timeperiod.max(1) - 1;
+    (0..adx.len())
+        .map(|i| {
+            if i < lag {
+                f64::NAN
+            } else {
+                (adx[i] + adx[i - lag]) / 2.0
+            }
+        })
+        .collect()
+}
+
+#[derive(Deserialize)]
+pub struct DmiKwargs {
+    pub timeperiod: i32,
+    pub fields: Vec<String>,
+    #[serde(default)]
+    pub out_dtype: OutDtype,
+}
+
+pub fn dmi_output(_: &[Field], kwargs: DmiKwargs) -> PolarsResult<Field> {
+    struct_fields_output(&kwargs.fields, kwargs.out_dtype)
+}
+
+/// TA-Lib's `TA_IS_ZERO`.
+fn ta_is_zero(v: f64) -> bool {
+    -0.00000001 < v && v < 0.00000001
+}
+
+/// +DM and -DM of row `i` by TA-Lib's rule: the larger of the up and down moves counts
+/// if it is positive, `None` for a move that doesn't.
+fn directional_moves(high: &[f64], low: &[f64], i: usize) -> (Option<f64>, Option<f64>) {
+    let diff_p = high[i] - high[i - 1];
+    let diff_m = low[i - 1] - low[i];
+    let plus = (diff_p > 0.0 && diff_p > diff_m).then_some(diff_p);
+    let minus = (diff_m > 0.0 && diff_p < diff_m).then_some(diff_m);
+    (plus, minus)
+}
+
+/// TA-Lib's true range of row `i`.
+fn true_range_at(high: &[f64], low: &[f64], close: &[f64], i: usize) -> f64 {
+    let mut out = high[i] - low[i];
+    let val = (high[i] - close[i - 1]).abs();
+    if val > out {
+        out = val;
+    }
+    let val = (low[i] - close[i - 1]).abs();
+    if val > out {
+        out = val;
+    }
+    out
+}
+
+/// `prev - prev / n`, plus `x` when the row has a value, Wilder's update of the DMI sums.
+fn wilder_step(prev: f64, x: Option<f64>, n: f64) -> f64 {
+    match x {
+        Some(x) => prev - prev / n + x,
+        None => prev - prev / n,
+    }
+}
+
+/// Wilder's sums of +DM, -DM and, given `close`, the true range from row `begin`, in
+/// one pass and seeded as the DMI functions do: the plain sum of rows
+/// `begin + 1..begin + period` at `begin + period - 1`, then `wilder_step`. NaN before;
+/// the true range is empty without `close`.
+fn dmi_sums(
+    high: &[f64],
+    low: &[f64],
+    close: Option<&[f64]>,
+    begin: usize,
+    period: usize,
+) -> (Vec<f64>, Vec<f64>, Vec<f64>) {
+    let len = high.len();
+    let n = period as f64;
+    let mut plus_dm = vec![f64::NAN; len];
+    let mut minus_dm = vec![f64::NAN; len];
+    let mut tr = vec![f64::NAN; if close.is_some() { len } else { 0 }];
+    let (mut prev_plus, mut prev_minus, mut prev_tr) = (0.0, 0.0, 0.0);
+    for i in begin + 1..len {
+        let (plus, minus) = directional_moves(high, low, i);
+        let range = close.map(|close| true_range_at(high, low, close, i));
+        if i < begin + period {
+            prev_plus += plus.unwrap_or(0.0);
+            prev_minus += minus.unwrap_or(0.0);
+            prev_tr += range.unwrap_or(0.0);
+        } else {
+            prev_plus = wilder_step(prev_plus, plus, n);
+            prev_minus = wilder_step(prev_minus, minus, n);
+            prev_tr = wilder_step(prev_tr, range, n);
+        }
+        if i + 1 >= begin + period {
+            plus_dm[i] = prev_plus;
+            minus_dm[i] = prev_minus;
+            if close.is_some() {
+                tr[i] = prev_tr;
+            }
+        }
+    }
+    (plus_dm, minus_dm, tr)
+}
+
+/// The requested fields of the directional movement family in one pass, with
+/// TA-Lib's arithmetic: the Wilder sums of +DM, -DM and the true range once, the DIs
+/// from them, DX from the DIs and ADX / ADXR from DX.
+///
+/// `begin_hl` is the first row without NaN in high and low, from which TA-Lib runs
+/// PLUS_DM / MINUS_DM, `begin` the one over high, low and close for the others.
+/// `period` must be in TA-Lib's range for DX and ADX, 2 to 100000.
+fn dmi_native(
+    high: &[f64],
+    low: &[f64],
+    close: &[f64],
+    begin_hl: usize,
+    begin: usize,
+    period: usize,
+    fields: &[String],
+) -> Vec<Vec<f64>> {
+    let len = close.len();
+    let n = period as f64;
+    let timeperiod = period as i32;
+    let wants = |name: &str| fields.iter().any(|f| f == name);
+    let (plus_dm, minus_dm, tr) = dmi_sums(high, low, Some(close), begin, period);
+    let first = begin + period;
+    let di = |dm: &[f64]| -> Vec<f64> {
+        (0..len)
+            .map(|i| {
+                if i < first {
+                    f64::NAN
+                } else if !ta_is_zero(tr[i]) {
+                    100.0 * (dm[i] / tr[i])
+                } else {
+                    0.0
+                }
+            })
+            .collect()
+    };
+    let (plus_di, minus_di) = (di(&plus_dm), di(&minus_dm));
+    // DX of each row, `None` where a zero true range or DI sum leaves it undefined
+    let dx_raw: Vec<Option<f64>> = (0..len)
+        .map(|i| {
+            if i < first || ta_is_zero(tr[i]) {
+                return None;
+            }
+            let total = minus_di[i] + plus_di[i];
+            (!ta_is_zero(total)).then(|| 100.0 * ((minus_di[i] - plus_di[i]).abs() / total))
+        })
+        .collect();
+    let adx = if wants("adx") || wants("adxr") {
+        // sum of the first `period` DX, then Wilder's average, rows without DX skipped
+        let mut adx = vec![f64::NAN; len];
+        let seed = first + period - 1;
+        if seed < len {
+            let total: f64 = dx_raw[first..=seed]
+                .iter()
+                .flatten()
+                .fold(0.0, |a, v| a + v);
+            let mut prev = total / n;
+            adx[seed] = prev;
+            for i in seed + 1..len {
+                if let Some(dx) = dx_raw[i] {
+                    prev = (prev * (n - 1.0) + dx) / n;
+                }
+                adx[i] = prev;
+            }
+        }
+        nan_before(adx, begin + unsafe { TA_ADX_Lookback(timeperiod) } as usize)
+    } else {
+        Vec::new()
+    };
+    let hl_sums = (begin_hl != begin && (wants("plus_dm") || wants("minus_dm")))
+        .then(|| dmi_sums(high, low, None, begin_hl, period));
+    let (hl_plus_dm, hl_minus_dm) = match &hl_sums {
+        Some((plus, minus, _)) => (plus, minus),
+        None => (&plus_dm, &minus_dm),
+    };
+    fields
+        .iter()
+        .map(|name| match name.as_str() {
+            "plus_dm" => nan_before(
+                hl_plus_dm.clone(),
+                begin_hl + unsafe { TA_PLUS_DM_Lookback(timeperiod) } as usize,
+            ),
+            "minus_dm" => nan_before(
+                hl_minus_dm.clone(),
+                begin_hl + unsafe { TA_MINUS_DM_Lookback(timeperiod) } as usize,
+            ),
+            "plus_di" => nan_before(
+                plus_di.clone(),
+                begin + unsafe { TA_PLUS_DI_Lookback(timeperiod) } as usize,
+            ),
+            "minus_di" => nan_before(
+                minus_di.clone(),
+                begin + unsafe { TA_MINUS_DI_Lookback(timeperiod) } as usize,
+            ),
+            "dx" => {
+                // the first output is 0 without a DX of its own, later ones repeat the last
+                let out_begin = begin + unsafe { TA_DX_Lookback(timeperiod) } as usize;
+                let mut dx = vec![f64::NAN; len];
+                for i in out_begin..len {
+                    dx[i] = match dx_raw[i] {
+                        Some(v) => v,
+                        None if i == out_begin => 0.0,
+                        None => dx[i - 1],
+                    };
+                }
+                dx
+            }
+            "adx" => adx.clone(),
+            _ => adxr_from_adx(&adx, period),
+        })
+        .collect()
+}
+
+/// The directional movement family in one struct, `fields` picks which outputs.
+///
+/// Inputs are prepared once and `dmi_native` computes the true range and directional
+/// movement sums once for all fields, bit-identical to the single TA-Lib functions.
+/// Periods TA-Lib rejects for DX / ADX (below 2) and input with NaN after the leading
+/// ones run the TA-Lib functions behind the requested fields instead, in parallel;
+/// `adxr` is derived from `adx`.
+#[polars_expr(output_type_func_with_kwargs=dmi_output)]
+fn dmi(inputs: &[Series], kwargs: DmiKwargs) -> PolarsResult<Series> {
+    let mut funcs: Vec<DmiFunc> = Vec::new();
+    for name in kwargs.fields.iter() {
+        let func = dmi_func(name)?;
+        if !funcs.contains(&func) {
+            funcs.push(func);
+        }
+    }
+    let close = F64Input::new(&inputs[0])?;
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let (high_values, low_values, close_values) =
+        (high.as_slice(), low.as_slice(), close.as_slice());
+    let (begin_hl, _) = clean_begin(&[high_values, low_values]);
+    let begin = native_begin(
+        Engine::Native,
+        kwargs.timeperiod,
+        &[high_values, low_values, close_values],
+    );
+    if let Some(begin) = begin {
+        let outs = dmi_native(
+            high_values,
+            low_values,
+            close_values,
+            begin_hl,
+            begin,
+            kwargs.timeperiod as usize,
+            &kwargs.fields,
+        );
+        let fields: Vec<Series> = outs
+            .into_iter()
+            .zip(kwargs.fields.iter())
+            .map(|(out, name)| {
+                let mut s = float_series(out, kwargs.out_dtype);
+                s.rename(name);
+                s
+            })
+            .collect();
+        let out = StructChunked::new("", &fields)?;
+        return Ok(out.into_series());
+    }
+    let (close_ptr, high_ptr, low_ptr) = (
+        SyncPtr(close.ptr()),
+        SyncPtr(high.ptr()),
+        SyncPtr(low.ptr()),
+    );
+    let len = close.len();
+    let ta_kwargs = TimePeriodKwargs {
+        timeperiod: kwargs.timeperiod,
+    };
+    let res: Result<Vec<Vec<f64>>, TA_RetCode> = funcs
+        .par_iter()
+        .map(|func| {
+            let (h, l, c) = (high_ptr.ptr(), low_ptr.ptr(), close_ptr.ptr());
+            match func {
+                DmiFunc::PlusDm => ta_plus_dm(h, l, len, &ta_kwargs),
+                DmiFunc::MinusDm => ta_minus_dm(h, l, len, &ta_kwargs),
+                DmiFunc::PlusDi => ta_plus_di(h, l, c, len, &ta_kwargs),
+                DmiFunc::MinusDi => ta_minus_di(h, l, c, len, &ta_kwargs),
+                DmiFunc::Dx => ta_dx(h, l, c, len, &ta_kwargs),
+                DmiFunc::Adx => ta_adx(h, l, c, len, &ta_kwargs),
+            }
+        })
+        .collect();
+    let outs = match res {
+        Ok(outs) => outs,
+        Err(ret_code) => return ta_code2err(ret_code),
+    };
+    let mut fields = Vec::with_capacity(kwargs.fields.len());
+    for name in kwargs.fields.iter() {
+        let func = dmi_func(name)?;
+        let out = &outs[funcs.iter().position(|f| *f == func).unwrap()];
+        let values = match name.as_str() {
+            "adxr" => adxr_from_adx(out, kwargs.timeperiod as usize),
+            _ => out.clone(),
+        };
+        let mut s = float_series(values, kwargs.out_dtype);
+        s.rename(name);
+        fields.push(s);
+    }
+    let out = StructChunked::new("", &fields)?;
+    Ok(out.into_series())
+}
+
+#[derive(Deserialize)]
+pub struct MacdField {
+    pub name: String,
+    pub kind: String,
+    pub fastperiod: i32,
+    pub slowperiod: i32,
+    pub signalperiod: i32,
+    pub matype: TA_MAType,
+    pub signalmatype: TA_MAType,
+}
+
+#[derive(Deserialize)]
+pub struct MacdAllKwargs {
+    pub fields: Vec<MacdField>,
+    #[serde(default)]
+    pub out_dtype: OutDtype,
+}
+
+pub fn macd_all_output(_: &[Field], kwargs: MacdAllKwargs) -> PolarsResult<Field> {
+    let names: Vec<String> = kwargs.fields.iter().map(|f| f.name.clone()).collect();
+    struct_fields_output(&names, kwargs.out_dtype)
+}
+
+/// A moving average behind `macd_all`, seeded at an index counted from the first
+/// non-NaN input (see `ta_ma_from`).
+#[derive(Clone, Copy, PartialEq)]
+enum MacdMa {
+    /// `TA_MA` of a period and type.
+    Ma(i32, TA_MAType, i32),
+    /// MACDFIX's EMA of 12 or 26 rows.
+    Fixed(i32, i32),
+}
+
+/// The averages behind one `macd_all` spec: fast, slow, and the MACD line's fast one.
+#[derive(Clone, Copy, PartialEq)]
+struct MacdSpec {
+    fast: MacdMa,
+    slow: MacdMa,
+    line_fast: MacdMa,
+    slow_lookback: i32,
+}
+
+/// Fast and slow period 0 is MACDFIX, as in TA-Lib's `INT_MACD`.
+fn macd_spec(field: &MacdField) -> MacdSpec {
+    if field.fastperiod == 0 && field.slowperiod == 0 {
+        return MacdSpec {
+            fast: MacdMa::Fixed(12, 11),
+            slow: MacdMa::Fixed(26, 25),
+            line_fast: MacdMa::Fixed(12, 25),
+            slow_lookback: 25,
+        };
+    }
+    let (fastperiod, slowperiod) = if field.slowperiod < field.fastperiod {
+        (field.slowperiod, field.fastperiod)
+    } else {
+        (field.fastperiod, field.slowperiod)
+    };
+    let lookback = |timeperiod| {
+        ta_ma_lookback(&MaKwargs {
+            timeperiod,
+            matype: field.matype,
+        })
+    };
+    let fast_lookback = lookback(fastperiod);
+    let slow_lookback = lookback(slowperiod).max(fast_lookback);
+    // The MACD line's fast average only differs from the plain one when it is
+    // seeded later.
+    let line_start = if fast_lookback == slow_lookback {
+        0
+    } else {
+        slow_lookback
+    };
+    MacdSpec {
+        fast: MacdMa::Ma(fastperiod, field.matype, 0),
+        slow: MacdMa::Ma(slowperiod, field.matype, 0),
+        line_fast: MacdMa::Ma(fastperiod, field.matype, line_start),
+        slow_lookback,
+    }
+}
+
+/// MACDFIX's EMA of `values[begin..]`, `k` fixed at 0.15 for 12 rows and 0.075 for 26,
+/// seeded at `begin + start` with the mean of the `timeperiod` values up to it, as
+/// TA-Lib's `TA_INT_EMA` does.
+fn fixed_ema(values: &[f64], begin: usize, timeperiod: usize, start: usize) -> Vec<f64> {
+    let k = if timeperiod == 12 { 0.15 } else { 0.075 };
+    let mut out = vec![f64::NAN; values.len()];
+    let first = begin + start;
+    if first >= values.len() {
+        return out;
+    }
+    let mut total = 0.0;
+    for v in values[first + 1 - timeperiod..=first].iter() {
+        total += v;
+    }
+    let mut prev = total / timeperiod as f64;
+    out[first] = prev;
+    for i in first + 1..values.len() {
+        prev = ((values[i] - prev) * k) + prev;
+        out[i] = prev;
+    }
+    out
+}
+
+/// `((fast - slow) / slow) * 100`, `0` when `slow` is zero, as in TA-Lib's PPO.
+fn ppo_value(fast: f64, slow: f64) -> f64 {
+    if -0.00000001 < slow && slow < 0.00000001 {
+        0.0
+    } else {
+        ((fast - slow) / slow) * 100.0
+    }
+}
+
+/// The MACD / APO / PPO family over one or more specs, `fields` names each output and
+/// picks its kind and spec.
+///
+/// Each distinct moving average runs once, in parallel, whichever specs share it: the
+/// slow average is shared by every field of a spec, `apo`, `ppo` and `fast_ma` share the
+/// fast one, and the MACD line uses the fast average seeded at the slow lookback, as
+/// TA-Lib's MACDEXT does. MACDFIX specs use its EMAs with fixed `k`. The signal average
+/// then runs once per distinct MACD line, signal period and type. Every field is
+/// bit-identical to its single function; MACDFIX's `apo`, `ppo`, `fast_ma` and
+/// `slow_ma` are those of its fixed EMAs, which no single function returns.
+#[polars_expr(output_type_func_with_kwargs=macd_all_output)]
+fn macd_all(inputs: &[Series], kwargs: MacdAllKwargs) -> PolarsResult<Series> {
+    let mut mas: Vec<MacdMa> = Vec::new();
+    let mut lines: Vec<(MacdSpec, i32, TA_MAType)> = Vec::new();
+    let mut specs = Vec::with_capacity(kwargs.fields.len());
+    for field in kwargs.fields.iter() {
+        let spec = macd_spec(field);
+        let needed = match field.kind.as_str() {
+            "macd" | "macdsignal" | "macdhist" => {
+                let line = (spec, field.signalperiod, field.signalmatype);
+                if !lines.contains(&line) {
+                    lines.push(line);
+                }
+                [spec.line_fast, spec.slow]
+            }
+            "apo" | "ppo" => [spec.fast, spec.slow],
+            "fast_ma" => [spec.fast, spec.fast],
+            "slow_ma" => [spec.slow, spec.slow],
+            _ => {
+                return Err(PolarsError::ComputeError(
+                    format!("unknown macd_all field kind `{}`", field.kind).into(),
+                ))
+            }
+        };
+        for ma in needed {
+            if !mas.contains(&ma) {
+                mas.push(ma);
+            }
+        }
+        specs.push(spec);
+    }
+
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
+    let input_ptr = SyncPtr(input.ptr());
+    let len = input.len();
+    let begin = values.iter().position(|v| !v.is_nan()).unwrap_or(len);
+    let res: Result<Vec<Vec<f64>>, TA_RetCode> = mas
+        .par_iter()
+        .map(|ma| match *ma {
+            MacdMa::Ma(timeperiod, matype, start) => ta_ma_from(
+                input_ptr.ptr(),
+                len,
+                start,
+                &MaKwargs { timeperiod, matype },
+            ),
+            MacdMa::Fixed(timeperiod, start) => Ok(fixed_ema(
+                values,
+                begin,
+                timeperiod as usize,
+                start as usize,
+            )),
+        })
+        .collect();
+    let outs = match res {
+        Ok(outs) => outs,
+        Err(ret_code) => return ta_code2err(ret_code),
+    };
+    let ma = |ma: MacdMa| &outs[mas.iter().position(|m| *m == ma).unwrap()];
+
+    // (line, signal, hist) per distinct MACD line and signal average
+    let res: Result<Vec<(Vec<f64>, Vec<f64>, Vec<f64>)>, TA_RetCode> = lines
+        .par_iter()
+        .map(|(spec, signalperiod, signalmatype)| {
+            let signal_kwargs = MaKwargs {
+                timeperiod: *signalperiod,
+                matype: *signalmatype,
+            };
+            let line: Vec<f64> = ma(spec.line_fast)
+                .iter()
+                .zip(ma(spec.slow).iter())
+                .map(|(f, s)| f - s)
+                .collect();
+            let signal = ta_ma_from(line.as_ptr(), len, 0, &signal_kwargs)?;
+            // TA-Lib only reports the MACD line once the signal is defined.
+            let lookback = begin + (spec.slow_lookback + ta_ma_lookback(&signal_kwargs)) as usize;
+            let hist = line.iter().zip(signal.iter()).map(|(m, s)| m - s).collect();
+            let line = line
+                .into_iter()
+                .enumerate()
+                .map(|(i, v)| if i < lookback { f64::NAN } else { v })
+                .collect();
+            Ok((line, signal, hist))
+        })
+        .collect();
+    let macds = match res {
+        Ok(macds) => macds,
+        Err(ret_code) => return ta_code2err(ret_code),
+    };
+
+    let mut fields = Vec::with_capacity(kwargs.fields.len());
+    for (field, spec) in kwargs.fields.iter().zip(specs) {
+        let macd = || {
+            &macds[lines
+                .iter()
+                .position(|l| *l == (spec, field.signalperiod, field.signalmatype))
+                .unwrap()]
+        };
+        let values = match field.kind.as_str() {
+            "macd" => macd().0.clone(),
+            "macdsignal" => macd().1.clone(),
+            "macdhist" => macd().2.clone(),
+            "apo" => ma(spec.fast)
+                .iter()
+                .zip(ma(spec.slow).iter())
+                .map(|(f, s)| f - s)
+                .collect(),
+            "ppo" => ma(spec.fast)
+                .iter()
+                .zip(ma(spec.slow).iter())
+                .map(|(f, s)| ppo_value(*f, *s))
+                .collect(),
+            "fast_ma" => ma(spec.fast).clone(),
+            _ => ma(spec.slow).clone(),
+        };
+        let mut s = float_series(values, kwargs.out_dtype);
+        s.rename(&field.name);
+        fields.push(s);
+    }
+    let out = StructChunked::new("", &fields)?;
+    Ok(out.into_series())
+}
+
+#[derive(Deserialize)]
+pub struct StochAllKwargs {
+    pub fastk_period: i32,
+    pub slowk_period: i32,
+    pub slowk_matype: TA_MAType,
+    pub slowd_period: i32,
+    pub slowd_matype: TA_MAType,
+    pub fastd_period: i32,
+    pub fastd_matype: TA_MAType,
+    pub willr_period: i32,
+    pub rsi_period: i32,
+    pub fields: Vec<String>,
+    #[serde(default)]
+    pub out_dtype: OutDtype,
+}
+
+pub fn stoch_all_output(_: &[Field], kwargs: StochAllKwargs) -> PolarsResult<Field> {
+    struct_fields_output(&kwargs.fields, kwargs.out_dtype)
+}
+
+#[derive(Default)]
+struct StochOuts {
+    slowk: Vec<f64>,
+    slowd: Vec<f64>,
+    fastk: Vec<f64>,
+    fastd: Vec<f64>,
+    willr: Vec<f64>,
+    stochrsi_fastk: Vec<f64>,
+    stochrsi_fastd: Vec<f64>,
+}
+
+#[derive(Clone, Copy, PartialEq)]
+enum StochTask {
+    Highest(usize),
+    Lowest(usize),
+}
+
+fn nan_before(mut values: Vec<f64>, idx: usize) -> Vec<f64> {
+    let end = idx.min(values.len());
+    values[..end].fill(f64::NAN);
+    values
+}
+
+/// TA-Lib's fast %K, `(close - lowest) / ((highest - lowest) / 100)`, 0 on a flat window.
+fn stoch_fastk(close: &[f64], highest: &[f64], lowest: &[f64]) -> Vec<f64> {
+    (0..close.len())
+        .map(|i| {
+            let diff = (highest[i] - lowest[i]) / 100.0;
+            if diff != 0.0 {
+                (close[i] - lowest[i]) / diff
+            } else {
+                0.0
+            }
+        })
+        .collect()
+}
+
+/// TA-Lib's Williams' %R, `(highest - close) / ((highest - lowest) / -100)`, 0 on a flat
+/// window.
+fn willr_from_extremes(close: &[f64], highest: &[f64], lowest: &[f64]) -> Vec<f64> {
+    (0..close.len())
+        .map(|i| {
+            let diff = (highest[i] - lowest[i]) / (-100.0);
+            if diff != 0.0 {
+                (highest[i] - close[i]) / diff
+            } else {
+                0.0
+            }
+        })
+        .collect()
+}
+
+/// TA-Lib's RSI of `values[begin..]` over Wilder averages of the gains and losses,
+/// 100 * gain / (gain + loss) and 0 when the sum is within 1e-8 of 0. NaN before
+/// `out_begin`.
+fn rsi_scan(values: &[f64], begin: usize, period: usize, out_begin: usize) -> Vec<f64> {
+    let mut gain = vec![0.0; values.len()];
+    let mut loss = vec![0.0; values.len()];
+    gain.par_iter_mut()
+        .zip(loss.par_iter_mut())
+        .enumerate()
+        .skip(begin + 1)
+        .for_each(|(i, (g, l))| {
+            let change = values[i] - values[i - 1];
+            if change < 0.0 {
+                *l = -change;
+            } else {
+                *g = change;
+            }
+        });
+    let gain = wilder_scan(&gain, begin + period, period, out_begin);
+    let loss = wilder_scan(&loss, begin + period, period, out_begin);
+    gain.par_iter()
+        .zip(loss.par_iter())
+        .map(|(g, l)| {
+            let total = g + l;
+            if -0.00000001 < total && total < 0.00000001 {
+                0.0
+            } else {
+                100.0 * (g / total)
+            }
+        })
+        .collect()
+}
+
+fn ma_of(values: &[f64], timeperiod: i32, matype: TA_MAType) -> Result<Vec<f64>, TA_RetCode> {
+    let kwargs = MaKwargs { timeperiod, matype };
+    ta_ma_from(values.as_ptr(), values.len(), 0, &kwargs)
+}
+
+fn ma_lookback_of(timeperiod: i32, matype: TA_MAType) -> usize {
+    ta_ma_lookback(&MaKwargs { timeperiod, matype }) as usize
+}
+
+/// Fast %K and its %D moving average, %K reported once %D is defined, as in STOCHF.
+fn fastk_fastd(
+    fastk: Vec<f64>,
+    begin: usize,
+    kwargs: &StochAllKwargs,
+) -> Result<(Vec<f64>, Vec<f64>), TA_RetCode> {
+    let fastd = ma_of(&fastk, kwargs.fastd_period, kwargs.fastd_matype)?;
+    let lookback = begin + kwargs.fastk_period as usize - 1
+        + ma_lookback_of(kwargs.fastd_period, kwargs.fastd_matype);
+    Ok((nan_before(fastk, lookback), fastd))
+}
+
+/// Native path of `stoch_all`: rolling extremes once per distinct period, then every
+/// requested output from them. Needs NaN-free input after the leading NaNs.
+fn stoch_all_native(
+    high: &[f64],
+    low: &[f64],
+    close: &[f64],
+    begin: usize,
+    with_stoch: bool,
+    with_willr: bool,
+    kwargs: &StochAllKwargs,
+) -> Result<StochOuts, TA_RetCode> {
+    let mut tasks = Vec::new();
+    for (wanted, period) in [
+        (with_stoch, kwargs.fastk_period as usize),
+        (with_willr, kwargs.willr_period as usize),
+    ] {
+        if wanted && !tasks.contains(&StochTask::Highest(period)) {
+            tasks.push(StochTask::Highest(period));
+            tasks.push(StochTask::Lowest(period));
+        }
+    }
+    let arrays: Vec<Vec<f64>> = tasks
+        .par_iter()
+        .map(|task| match task {
+            StochTask::Highest(period) => rolling_extreme(high, begin, *period, true),
+            StochTask::Lowest(period) => rolling_extreme(low, begin, *period, false),
+        })
+        .collect();
+    let array = |task: StochTask| &arrays[tasks.iter().position(|t| *t == task).unwrap()];
+
+    let mut outs = StochOuts::default();
+    if with_stoch {
+        let period = kwargs.fastk_period as usize;
+        let fastk = stoch_fastk(
+            close,
+            array(StochTask::Highest(period)),
+            array(StochTask::Lowest(period)),
+        );
+        let slowk = ma_of(&fastk, kwargs.slowk_period, kwargs.slowk_matype)?;
+        outs.slowd = ma_of(&slowk, kwargs.slowd_period, kwargs.slowd_matype)?;
+        let lookback = begin + period - 1
+            + ma_lookback_of(kwargs.slowk_period, kwargs.slowk_matype)
+            + ma_lookback_of(kwargs.slowd_period, kwargs.slowd_matype);
+        outs.slowk = nan_before(slowk, lookback);
+        (outs.fastk, outs.fastd) = fastk_fastd(fastk, begin, kwargs)?;
+    }
+    if with_willr {
+        let period = kwargs.willr_period as usize;
+        outs.willr = willr_from_extremes(
+            close,
+            array(StochTask::Highest(period)),
+            array(StochTask::Lowest(period)),
+        );
+    }
+    Ok(outs)
+}
+
+/// Stochastic RSI as fast %K / %D over the RSI, which is how TA-Lib's STOCHRSI is built.
+fn stochrsi_native(
+    close: &[f64],
+    kwargs: &StochAllKwargs,
+) -> Result<(Vec<f64>, Vec<f64>), TA_RetCode> {
+    let (close_ptr, len) = (close.as_ptr(), close.len());
+    let rsi_kwargs = TimePeriodKwargs {
+        timeperiod: kwargs.rsi_period,
+    };
+    let rsi = ta_rsi(close_ptr, len, &rsi_kwargs)?;
+    let (begin, clean) = clean_begin(&[rsi.as_slice()]);
+    if !clean {
+        let stochrsi_kwargs = StochRsiKwargs {
+            timeperiod: kwargs.rsi_period,
+            fastk_period: kwargs.fastk_period,
+            fastd_period: kwargs.fastd_period,
+            fastd_matype: kwargs.fastd_matype,
+        };
+        return ta_stochrsi(close_ptr, len, &stochrsi_kwargs);
+    }
+    let period = kwargs.fastk_period as usize;
+    let highest = rolling_extreme(&rsi, begin, period, true);
+    let lowest = rolling_extreme(&rsi, begin, period, false);
+    let fastk = stoch_fastk(&rsi, &highest, &lowest);
+    fastk_fastd(fastk, begin, kwargs)
+}
+
+/// `stoch`, `stochf`, `willr` and `stochrsi` in one struct, `fields` picks which outputs.
+///
+/// The rolling highest high / lowest low are built once per distinct period with a
+/// monotonic deque and shared by %K, %D and Williams' %R; `stochrsi` runs the same
+/// steps over one RSI pass. The arithmetic follows TA-Lib, so every field is
+/// bit-identical to its single function. Input with NaN after the leading NaNs, and
+/// periods TA-Lib rejects, go through the TA-Lib functions instead.
+#[polars_expr(output_type_func_with_kwargs=stoch_all_output)]
+fn stoch_all(inputs: &[Series], kwargs: StochAllKwargs) -> PolarsResult<Series> {
+    for name in kwargs.fields.iter() {
+        match name.as_str() {
+            "slowk" | "slowd" | "fastk" | "fastd" | "willr" | "stochrsi_fastk"
+            | "stochrsi_fastd" => {}
+            _ => {
+                return Err(PolarsError::ComputeError(
+                    format!("unknown stoch_all field `{}`", name).into(),
+                ))
+            }
+        }
+    }
+    let wants = |names: &[&str]| kwargs.fields.iter().any(|f| names.contains(&f.as_str()));
+    let with_stoch = wants(&["slowk", "slowd", "fastk", "fastd"]);
+    let with_willr = wants(&["willr"]);
+    let with_stochrsi = wants(&["stochrsi_fastk", "stochrsi_fastd"]);
+
+    let close = F64Input::new(&inputs[0])?;
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let len = close.len();
+    let (high_values, low_values, close_values) =
+        (high.as_slice(), low.as_slice(), close.as_slice());
+    let (begin, clean) = clean_begin(&[high_values, low_values, close_values]);
+    let valid_periods = kwargs.fastk_period >= 1 && kwargs.willr_period >= 2;
+
+    let res = if clean && valid_periods {
+        let (outs, stochrsi) = rayon::join(
+            || {
+                stoch_all_native(
+                    high_values,
+                    low_values,
+                    close_values,
+                    begin,
+                    with_stoch,
+                    with_willr,
+                    &kwargs,
+                )
+            },
+            || {
+                if with_stochrsi {
+                    stochrsi_native(close_values, &kwargs).map(Some)
+                } else {
+                    Ok(None)
+                }
+            },
+        );
+        outs.and_then(|mut outs| {
+            if let Some((fastk, fastd)) = stochrsi? {
+                (outs.stochrsi_fastk, outs.stochrsi_fastd) = (fastk, fastd);
+            }
+            Ok(outs)
+        })
+    } else {
+        stoch_all_talib(
+            high.ptr(),
+            low.ptr(),
+            close.ptr(),
+            len,
+            with_stoch,
+            with_willr,
+            with_stochrsi,
+            &kwargs,
+        )
+    };
+    let outs = match res {
+        Ok(outs) => outs,
+        Err(ret_code) => return ta_code2err(ret_code),
+    };
+
+    let mut fields = Vec::with_capacity(kwargs.fields.len());
+    for name in kwargs.fields.iter() {
+        let values = match name.as_str() {
+            "slowk" => &outs.slowk,
+            "slowd" => &outs.slowd,
+            "fastk" => &outs.fastk,
+            "fastd" => &outs.fastd,
+            "willr" => &outs.willr,
+            "stochrsi_fastk" => &outs.stochrsi_fastk,
+            _ => &outs.stochrsi_fastd,
+        };
+        let mut s = float_series(values.clone(), kwargs.out_dtype);
+        s.rename(name);
+        fields.push(s);
+    }
+    let out = StructChunked::new("", &fields)?;
+    Ok(out.into_series())
+}
+
+/// Fallback of `stoch_all` through the single TA-Lib functions.
+#[allow(clippy::too_many_arguments)]
+fn stoch_all_talib(
+    high_ptr: *const f64,
+    low_ptr: *const f64,
+    close_ptr: *const f64,
+    len: usize,
+    with_stoch: bool,
+    with_willr: bool,
+    with_stochrsi: bool,
+    kwargs: &StochAllKwargs,
+) -> Result<StochOuts, TA_RetCode> {
+    let mut outs = StochOuts::default();
+    if with_stoch {
+        let stoch_kwargs = StochKwargs {
+            fastk_period: kwargs.fastk_period,
+            slowk_period: kwargs.slowk_period,
+            slowk_matype: kwargs.slowk_matype,
+            slowd_period: kwargs.slowd_period,
+            slowd_matype: kwargs.slowd_matype,
+        };
+        (outs.slowk, outs.slowd) = ta_stoch(high_ptr, low_ptr, close_ptr, len, &stoch_kwargs)?;
+        let stochf_kwargs = StochfKwargs {
+            fastk_period: kwargs.fastk_period,
+            fastd_period: kwargs.fastd_period,
+            fastd_matype: kwargs.fastd_matype,
+        };
+        (outs.fastk, outs.fastd) = ta_stochf(high_ptr, low_ptr, close_ptr, len, &stochf_kwargs)?;
+    }
+    if with_willr {
+        let willr_kwargs = TimePeriodKwargs {
+            timeperiod: kwargs.willr_period,
+        };
+        outs.willr = ta_willr(high_ptr, low_ptr, close_ptr, len, &willr_kwargs)?;
+    }
+    if with_stochrsi {
+        let stochrsi_kwargs = StochRsiKwargs {
+            timeperiod: kwargs.rsi_period,
+            fastk_period: kwargs.fastk_period,
+            fastd_period: kwargs.fastd_period,
+            fastd_matype: kwargs.fastd_matype,
+        };
+        (outs.stochrsi_fastk, outs.stochrsi_fastd) = ta_stochrsi(close_ptr, len, &stochrsi_kwargs)?;
+    }
+    Ok(outs)
+}
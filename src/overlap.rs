@@ -1,4 +1,9 @@
-use crate::utils::{cast_series_to_f64, get_series_f64_ptr, ta_code2err};
+use crate::chunked::{chunk_rows, par_chunked};
+use crate::scan::{ema_scan, scan_start};
+use crate::utils::{
+    float_output, float_series, native_begin, rolling_extreme, ta_code2err, Engine, EngineKwargs,
+    F32Input, F64Input, OutDtype, OutDtypeKwargs, OutKwargs,
+};
 use polars::prelude::*;
 use pyo3_polars::derive::polars_expr;
 use talib::common::TimePeriodKwargs;
@@ -7,6 +12,59 @@ use talib::overlap::{
     ta_midprice, ta_sar, ta_sarext, ta_sma, ta_t3, ta_tema, ta_trima, ta_wma, BBANDSKwargs,
     MaKwargs, MamaKwargs, MavpKwargs, SarExtKwargs, SarKwargs, T3Kwargs,
 };
+use talib::overlap::{
+    ta_dema_f32, ta_ema_f32, ta_kama_f32, ta_midpoint_f32, ta_sma_f32, ta_tema_f32, ta_trima_f32,
+    ta_wma_f32,
+};
+use talib_sys::TA_RetCode;
+
+type TimePeriodFn<T> = fn(*const T, usize, &TimePeriodKwargs) -> Result<Vec<f64>, TA_RetCode>;
+
+/// Run a single input, `timeperiod` only function, reading Float32 input as is.
+fn timeperiod_expr(
+    inputs: &[Series],
+    kwargs: &TimePeriodKwargs,
+    out_dtype: OutDtype,
+    ta_f64: TimePeriodFn<f64>,
+    ta_f32: TimePeriodFn<f32>,
+) -> PolarsResult<Series> {
+    let res = if inputs[0].dtype() == &DataType::Float32 {
+        let input = F32Input::new(&inputs[0])?;
+        ta_f32(input.ptr(), input.len(), kwargs)
+    } else {
+        let input = F64Input::new(&inputs[0])?;
+        ta_f64(input.ptr(), input.len(), kwargs)
+    };
+    match res {
+        Ok(out) => Ok(float_series(out, out_dtype)),
+        Err(ret_code) => ta_code2err(ret_code),
+    }
+}
+
+/// `timeperiod_expr` for a function that slides a running total: long Float64 input runs
+/// in parallel chunks unless `engine="talib"`, within rounding of TA-Lib, see
+/// `par_chunked`.
+fn running_total_expr(
+    func: &str,
+    inputs: &[Series],
+    kwargs: &EngineKwargs,
+    out_dtype: OutDtype,
+    ta_f64: TimePeriodFn<f64>,
+    ta_f32: TimePeriodFn<f32>,
+) -> PolarsResult<Series> {
+    if kwargs.engine == Engine::Native && inputs[0].dtype() != &DataType::Float32 {
+        let input = F64Input::new(&inputs[0])?;
+        let values = input.as_slice();
+        let res = par_chunked(func, kwargs.timeperiod, &[values], |rows| {
+            ta_f64(values[rows.clone()].as_ptr(), rows.len(), kwargs)
+        });
+        return match res {
+            Ok(out) => Ok(float_series(out, out_dtype)),
+            Err(ret_code) => ta_code2err(ret_code),
+        };
+    }
+    timeperiod_expr(inputs, kwargs, out_dtype, ta_f64, ta_f32)
+}
 
 pub fn bbands_output(_: &[Field]) -> PolarsResult<Field> {
     let u = Field::new("upperband", DataType::Float64);
@@ -18,8 +76,8 @@ pub fn bbands_output(_: &[Field]) -> PolarsResult<Field> {
 
 #[polars_expr(output_type_func=bbands_output)]
 fn bbands(inputs: &[Series], kwargs: BBANDSKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+    let input = F64Input::new(&inputs[0])?;
+    let input_ptr = input.ptr();
     let len = input.len();
     let res = ta_bbands(input_ptr, len, &kwargs);
     match res {
@@ -34,65 +92,53 @@ fn bbands(inputs: &[Series], kwargs: BBANDSKwargs) -> PolarsResult<Series> {
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn ema(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    // println!("has_validity: {}", input.has_validity());
-    // println!("len: {}", input.len());
-    // println!("null_count: {}", input.null_count());
-    let res = ta_ema(input_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
+/// EMA as a parallel scan on a long series unless `engine="talib"`, within
+/// `SCAN_TOLERANCE` of TA-Lib.
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn ema(inputs: &[Series], kwargs: OutKwargs<EngineKwargs>) -> PolarsResult<Series> {
+    if kwargs.engine == Engine::Native && chunk_rows(inputs[0].len()).is_some() {
+        let input = F64Input::new(&inputs[0])?;
+        let values = input.as_slice();
+        let params = [("timeperiod", kwargs.timeperiod)];
+        if let Some((begin, lookback)) = scan_start(kwargs.engine, "ema", &params, &[values]) {
+            let period = kwargs.timeperiod as usize;
+            let out = ema_scan(values, begin, period, begin + lookback);
+            return Ok(float_series(out, kwargs.out_dtype));
+        }
     }
+    timeperiod_expr(inputs, &kwargs, kwargs.out_dtype, ta_ema, ta_ema_f32)
 }
 
-#[polars_expr(output_type=Float64)]
-fn dema(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_dema(input_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn dema(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    timeperiod_expr(inputs, &kwargs, kwargs.out_dtype, ta_dema, ta_dema_f32)
 }
 
-#[polars_expr(output_type=Float64)]
-fn ht_trendline(inputs: &[Series]) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn ht_trendline(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let input_ptr = input.ptr();
     let len = input.len();
     let res = ta_ht_trendline(input_ptr, len);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn kama(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_kama(input_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn kama(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    timeperiod_expr(inputs, &kwargs, kwargs.out_dtype, ta_kama, ta_kama_f32)
 }
 
-#[polars_expr(output_type=Float64)]
-fn ma(inputs: &[Series], kwargs: MaKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn ma(inputs: &[Series], kwargs: OutKwargs<MaKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let input_ptr = input.ptr();
     let len = input.len();
     let res = ta_ma(input_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
@@ -106,8 +152,8 @@ pub fn mama_output(_: &[Field]) -> PolarsResult<Field> {
 
 #[polars_expr(output_type_func=mama_output)]
 fn mama(inputs: &[Series], kwargs: MamaKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
+    let input = F64Input::new(&inputs[0])?;
+    let input_ptr = input.ptr();
     let len = input.len();
     let res = ta_mama(input_ptr, len, &kwargs);
     match res {
@@ -121,130 +167,147 @@ fn mama(inputs: &[Series], kwargs: MamaKwargs) -> PolarsResult<Series> {
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn mavp(inputs: &[Series], kwargs: MavpKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let in_time_period = &mut cast_series_to_f64(&inputs[1])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let (in_time_period_ptr, _in_time_period) = get_series_f64_ptr(in_time_period)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn mavp(inputs: &[Series], kwargs: OutKwargs<MavpKwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let in_time_period = F64Input::new(&inputs[1])?;
+    let input_ptr = input.ptr();
+    let in_time_period_ptr = in_time_period.ptr();
     let len = input.len();
     let res = ta_mavp(input_ptr, in_time_period_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn midpoint(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (input_ptr, _input) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_midpoint(input_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
+/// `(highest + lowest) / 2` of each window, as MIDPOINT and MIDPRICE.
+fn mid_native(high: &[f64], low: &[f64], begin: usize, period: usize) -> Vec<f64> {
+    let highest = rolling_extreme(high, begin, period, true);
+    let lowest = rolling_extreme(low, begin, period, false);
+    highest
+        .iter()
+        .zip(lowest.iter())
+        .map(|(h, l)| (h + l) / 2.0)
+        .collect()
+}
+
+/// Midpoint over a monotonic deque unless `engine="talib"`, same values as TA-Lib. A
+/// long series runs in parallel chunks, see `par_chunked`.
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn midpoint(inputs: &[Series], kwargs: OutKwargs<EngineKwargs>) -> PolarsResult<Series> {
+    if kwargs.engine == Engine::Native {
+        let input = F64Input::new(&inputs[0])?;
+        let values = input.as_slice();
+        let res = par_chunked("midpoint", kwargs.timeperiod, &[values], |rows| {
+            let values = &values[rows];
+            match native_begin(kwargs.engine, kwargs.timeperiod, &[values]) {
+                Some(begin) => Ok(mid_native(
+                    values,
+                    values,
+                    begin,
+                    kwargs.timeperiod as usize,
+                )),
+                None => ta_midpoint(values.as_ptr(), values.len(), &kwargs),
+            }
+        });
+        return match res {
+            Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
+            Err(ret_code) => ta_code2err(ret_code),
+        };
     }
+    timeperiod_expr(
+        inputs,
+        &kwargs,
+        kwargs.out_dtype,
+        ta_midpoint,
+        ta_midpoint_f32,
+    )
 }
 
-#[polars_expr(output_type=Float64)]
-fn midprice(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[0])?;
-    let low = &mut cast_series_to_f64(&inputs[1])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let len = high.len();
-    let res = ta_midprice(high_ptr, low_ptr, len, &kwargs);
+/// Midprice over a monotonic deque unless `engine="talib"`, same values as TA-Lib. A
+/// long series runs in parallel chunks, see `par_chunked`.
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn midprice(inputs: &[Series], kwargs: OutKwargs<EngineKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[0])?;
+    let low = F64Input::new(&inputs[1])?;
+    let prices = [high.as_slice(), low.as_slice()];
+    let res = par_chunked("midprice", kwargs.timeperiod, &prices, |rows| {
+        let (high, low) = (&prices[0][rows.clone()], &prices[1][rows]);
+        match native_begin(kwargs.engine, kwargs.timeperiod, &[high, low]) {
+            Some(begin) => Ok(mid_native(high, low, begin, kwargs.timeperiod as usize)),
+            None => ta_midprice(high.as_ptr(), low.as_ptr(), high.len(), &kwargs),
+        }
+    });
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn sar(inputs: &[Series], kwargs: SarKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[0])?;
-    let low = &mut cast_series_to_f64(&inputs[1])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn sar(inputs: &[Series], kwargs: OutKwargs<SarKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[0])?;
+    let low = F64Input::new(&inputs[1])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
     let len = high.len();
     let res = ta_sar(high_ptr, low_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn sarext(inputs: &[Series], kwargs: SarExtKwargs) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[0])?;
-    let low = &mut cast_series_to_f64(&inputs[1])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn sarext(inputs: &[Series], kwargs: OutKwargs<SarExtKwargs>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[0])?;
+    let low = F64Input::new(&inputs[1])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
     let len = high.len();
     let res = ta_sarext(high_ptr, low_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn sma(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (in_real_ptr, _in_real) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_sma(in_real_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn sma(inputs: &[Series], kwargs: OutKwargs<EngineKwargs>) -> PolarsResult<Series> {
+    running_total_expr("sma", inputs, &kwargs, kwargs.out_dtype, ta_sma, ta_sma_f32)
 }
 
-#[polars_expr(output_type=Float64)]
-fn t3(inputs: &[Series], kwargs: T3Kwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (in_real_ptr, _in_real) = get_series_f64_ptr(input)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn t3(inputs: &[Series], kwargs: OutKwargs<T3Kwargs>) -> PolarsResult<Series> {
+    let input = F64Input::new(&inputs[0])?;
+    let in_real_ptr = input.ptr();
     let len = input.len();
     let res = ta_t3(in_real_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn tema(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (in_real_ptr, _in_real) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_tema(in_real_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn tema(inputs: &[Series], kwargs: OutKwargs<TimePeriodKwargs>) -> PolarsResult<Series> {
+    timeperiod_expr(inputs, &kwargs, kwargs.out_dtype, ta_tema, ta_tema_f32)
 }
 
-#[polars_expr(output_type=Float64)]
-fn trima(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (in_real_ptr, _in_real) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_trima(in_real_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn trima(inputs: &[Series], kwargs: OutKwargs<EngineKwargs>) -> PolarsResult<Series> {
+    running_total_expr(
+        "trima",
+        inputs,
+        &kwargs,
+        kwargs.out_dtype,
+        ta_trima,
+        ta_trima_f32,
+    )
 }
 
-#[polars_expr(output_type=Float64)]
-fn wma(inputs: &[Series], kwargs: TimePeriodKwargs) -> PolarsResult<Series> {
-    let input = &mut cast_series_to_f64(&inputs[0])?;
-    let (in_real_ptr, _in_real) = get_series_f64_ptr(input)?;
-    let len = input.len();
-    let res = ta_wma(in_real_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn wma(inputs: &[Series], kwargs: OutKwargs<EngineKwargs>) -> PolarsResult<Series> {
+    running_total_expr("wma", inputs, &kwargs, kwargs.out_dtype, ta_wma, ta_wma_f32)
 }
@@ -1,1189 +1,1480 @@
-use crate::utils::{cast_series_to_f64, get_series_f64_ptr, ta_code2err};
+use crate::chunked::{func_lookback, par_chunks};
+use crate::utils::{
+    all_f32, cdl_output, cdl_series, ta_code2err, CdlOutDtype, Engine, EngineKwargs, F32Input,
+    F64Input, NoKwargs, OutKwargs,
+};
 use polars::prelude::*;
 use pyo3_polars::derive::polars_expr;
-use talib::pattern::ta_cdlxsidegap3methods;
-use talib::pattern::CDLKwargs;
-use talib::pattern::{ta_cdl2crows, ta_cdl3blackcrows, ta_cdl3inside};
-use talib::pattern::{ta_cdl3linestrike, ta_cdl3outside, ta_cdl3starsinsouth};
-use talib::pattern::{ta_cdl3whitesoldiers, ta_cdlabandonedbaby, ta_cdladvanceblock};
-use talib::pattern::{ta_cdlbelthold, ta_cdlbreakaway, ta_cdlclosingmarubozu};
-use talib::pattern::{ta_cdlconcealbabyswall, ta_cdlcounterattack, ta_cdldarkcloudcover};
-use talib::pattern::{ta_cdldoji, ta_cdldojistar, ta_cdldragonflydoji};
-use talib::pattern::{ta_cdlengulfing, ta_cdlrisefall3methods};
-use talib::pattern::{ta_cdleveningdojistar, ta_cdleveningstar};
-use talib::pattern::{ta_cdlgapsidesidewhite, ta_cdlgravestonedoji, ta_cdlhammer};
-use talib::pattern::{ta_cdlhangingman, ta_cdlharami, ta_cdlharamicross};
-use talib::pattern::{ta_cdlhighwave, ta_cdlhikkake, ta_cdlhikkakemod};
-use talib::pattern::{ta_cdlhomingpigeon, ta_cdlidentical3crows, ta_cdlinneck};
-use talib::pattern::{ta_cdlinvertedhammer, ta_cdlkicking, ta_cdlkickingbylength};
-use talib::pattern::{ta_cdlladderbottom, ta_cdllongleggeddoji, ta_cdllongline};
-use talib::pattern::{ta_cdlmarubozu, ta_cdlmatchinglow, ta_cdlmathold};
-use talib::pattern::{ta_cdlmorningdojistar, ta_cdlmorningstar, ta_cdlonneck};
-use talib::pattern::{ta_cdlpiercing, ta_cdlrickshawman};
-use talib::pattern::{ta_cdlseparatinglines, ta_cdlshootingstar, ta_cdlshortline};
-use talib::pattern::{ta_cdlspinningtop, ta_cdlstalledpattern, ta_cdlsticksandwich};
-use talib::pattern::{ta_cdltakuri, ta_cdltasukigap, ta_cdlthrusting};
-use talib::pattern::{ta_cdltristar, ta_cdlunique3river, ta_cdlupsidegap2crows};
-
-#[polars_expr(output_type=Int32)]
-fn cdl2crows(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-    let res = ta_cdl2crows(open_ptr, high_ptr, low_ptr, close_ptr, len);
+use rayon::prelude::*;
+use serde::Deserialize;
+use talib::pattern::*;
+use talib_sys::TA_RetCode;
+
+/// Run the candlestick function `func` on `open, high, low, close`.
+///
+/// Float32 OHLC goes to TA-Lib's single precision functions as is, any other dtype
+/// is read as Float64. A long Float64 series runs in parallel chunks unless
+/// `engine="talib"`: the candle averages restart at each chunk, so a bar can only differ
+/// from TA-Lib when one of its ranges is within rounding of a threshold, see
+/// `par_chunked`.
+fn cdl_expr<F64Fn, F32Fn>(
+    func: &str,
+    inputs: &[Series],
+    engine: Engine,
+    out_dtype: CdlOutDtype,
+    ta_f64: F64Fn,
+    ta_f32: F32Fn,
+) -> PolarsResult<Series>
+where
+    F64Fn: Fn(*const f64, *const f64, *const f64, *const f64, usize) -> Result<Vec<i32>, TA_RetCode>
+        + Sync,
+    F32Fn:
+        Fn(*const f32, *const f32, *const f32, *const f32, usize) -> Result<Vec<i32>, TA_RetCode>,
+{
+    let res = if all_f32(&inputs[..4]) {
+        let open = F32Input::new(&inputs[0])?;
+        let high = F32Input::new(&inputs[1])?;
+        let low = F32Input::new(&inputs[2])?;
+        let close = F32Input::new(&inputs[3])?;
+        ta_f32(open.ptr(), high.ptr(), low.ptr(), close.ptr(), close.len())
+    } else {
+        let open = F64Input::new(&inputs[0])?;
+        let high = F64Input::new(&inputs[1])?;
+        let low = F64Input::new(&inputs[2])?;
+        let close = F64Input::new(&inputs[3])?;
+        let prices = [
+            open.as_slice(),
+            high.as_slice(),
+            low.as_slice(),
+            close.as_slice(),
+        ];
+        let lookback = match engine {
+            Engine::Native => func_lookback(func, &[]),
+            Engine::Talib => None,
+        };
+        par_chunks(lookback, &prices, |rows| {
+            let [o, h, l, c] = prices.map(|v| v[rows.clone()].as_ptr());
+            ta_f64(o, h, l, c, rows.len())
+        })
+    };
     match res {
-        Ok(out) => Ok(Int32Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(cdl_series(out, out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdl3blackcrows(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-    let res = ta_cdl3blackcrows(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdl2crows(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdl2crows",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdl2crows,
+        ta_cdl2crows_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdl3inside(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-    let res = ta_cdl3inside(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdl3blackcrows(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdl3blackcrows",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdl3blackcrows,
+        ta_cdl3blackcrows_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdl3linestrike(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-    let res = ta_cdl3linestrike(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdl3inside(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdl3inside",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdl3inside,
+        ta_cdl3inside_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdl3outside(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-    let res = ta_cdl3outside(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdl3linestrike(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdl3linestrike",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdl3linestrike,
+        ta_cdl3linestrike_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdl3starsinsouth(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-
-    let len = close.len();
-    let res = ta_cdl3starsinsouth(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdl3outside(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdl3outside",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdl3outside,
+        ta_cdl3outside_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdl3whitesoldiers(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-
-    let len = close.len();
-    let res = ta_cdl3whitesoldiers(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdl3starsinsouth(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdl3starsinsouth",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdl3starsinsouth,
+        ta_cdl3starsinsouth_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlabandonedbaby(inputs: &[Series], kwargs: CDLKwargs) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlabandonedbaby(open_ptr, high_ptr, low_ptr, close_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Int32Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdl3whitesoldiers(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdl3whitesoldiers",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdl3whitesoldiers,
+        ta_cdl3whitesoldiers_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdladvanceblock(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-
-    let len = close.len();
-    let res = ta_cdladvanceblock(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlabandonedbaby(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<CDLKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlabandonedbaby",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        |open, high, low, close, len| ta_cdlabandonedbaby(open, high, low, close, len, &kwargs),
+        |open, high, low, close, len| ta_cdlabandonedbaby_f32(open, high, low, close, len, &kwargs),
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlbelthold(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-
-    let len = close.len();
-    let res = ta_cdlbelthold(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdladvanceblock(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdladvanceblock",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdladvanceblock,
+        ta_cdladvanceblock_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlbreakaway(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-
-    let len = close.len();
-    let res = ta_cdlbreakaway(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlbelthold(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlbelthold",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlbelthold,
+        ta_cdlbelthold_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlclosingmarubozu(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-
-    let len = close.len();
-    let res = ta_cdlclosingmarubozu(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlbreakaway(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlbreakaway",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlbreakaway,
+        ta_cdlbreakaway_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlconcealbabyswall(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-
-    let len = close.len();
-    let res = ta_cdlconcealbabyswall(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlclosingmarubozu(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlclosingmarubozu",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlclosingmarubozu,
+        ta_cdlclosingmarubozu_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlcounterattack(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlcounterattack(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlconcealbabyswall(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlconcealbabyswall",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlconcealbabyswall,
+        ta_cdlconcealbabyswall_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdldarkcloudcover(inputs: &[Series], kwargs: CDLKwargs) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdldarkcloudcover(open_ptr, high_ptr, low_ptr, close_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlcounterattack(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlcounterattack",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlcounterattack,
+        ta_cdlcounterattack_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdldoji(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-
-    let len = close.len();
-    let res = ta_cdldoji(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdldarkcloudcover(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<CDLKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdldarkcloudcover",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        |open, high, low, close, len| ta_cdldarkcloudcover(open, high, low, close, len, &kwargs),
+        |open, high, low, close, len| {
+            ta_cdldarkcloudcover_f32(open, high, low, close, len, &kwargs)
+        },
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdldojistar(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdldojistar(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdldoji(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdldoji",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdldoji,
+        ta_cdldoji_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdldragonflydoji(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdldragonflydoji(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdldojistar(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdldojistar",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdldojistar,
+        ta_cdldojistar_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlengulfing(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlengulfing(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdldragonflydoji(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdldragonflydoji",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdldragonflydoji,
+        ta_cdldragonflydoji_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdleveningdojistar(inputs: &[Series], kwargs: CDLKwargs) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdleveningdojistar(open_ptr, high_ptr, low_ptr, close_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlengulfing(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlengulfing",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlengulfing,
+        ta_cdlengulfing_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdleveningstar(inputs: &[Series], kwargs: CDLKwargs) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdleveningstar(open_ptr, high_ptr, low_ptr, close_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdleveningdojistar(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<CDLKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdleveningdojistar",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        |open, high, low, close, len| ta_cdleveningdojistar(open, high, low, close, len, &kwargs),
+        |open, high, low, close, len| {
+            ta_cdleveningdojistar_f32(open, high, low, close, len, &kwargs)
+        },
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlgapsidesidewhite(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlgapsidesidewhite(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdleveningstar(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<CDLKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdleveningstar",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        |open, high, low, close, len| ta_cdleveningstar(open, high, low, close, len, &kwargs),
+        |open, high, low, close, len| ta_cdleveningstar_f32(open, high, low, close, len, &kwargs),
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlgravestonedoji(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlgravestonedoji(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlgapsidesidewhite(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlgapsidesidewhite",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlgapsidesidewhite,
+        ta_cdlgapsidesidewhite_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlhammer(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlhammer(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlgravestonedoji(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlgravestonedoji",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlgravestonedoji,
+        ta_cdlgravestonedoji_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlhangingman(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlhangingman(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlhammer(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlhammer",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlhammer,
+        ta_cdlhammer_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlharami(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlharami(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlhangingman(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlhangingman",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlhangingman,
+        ta_cdlhangingman_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlharamicross(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlharamicross(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlharami(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlharami",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlharami,
+        ta_cdlharami_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlhighwave(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlhighwave(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlharamicross(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlharamicross",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlharamicross,
+        ta_cdlharamicross_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlhikkake(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlhikkake(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlhighwave(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlhighwave",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlhighwave,
+        ta_cdlhighwave_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlhikkakemod(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlhikkakemod(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlhikkake(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlhikkake",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlhikkake,
+        ta_cdlhikkake_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlhomingpigeon(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlhomingpigeon(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlhikkakemod(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlhikkakemod",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlhikkakemod,
+        ta_cdlhikkakemod_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlidentical3crows(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlidentical3crows(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlhomingpigeon(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlhomingpigeon",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlhomingpigeon,
+        ta_cdlhomingpigeon_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlinneck(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlinneck(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlidentical3crows(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlidentical3crows",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlidentical3crows,
+        ta_cdlidentical3crows_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlinvertedhammer(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlinvertedhammer(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlinneck(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlinneck",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlinneck,
+        ta_cdlinneck_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlkicking(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlkicking(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlinvertedhammer(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlinvertedhammer",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlinvertedhammer,
+        ta_cdlinvertedhammer_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlkickingbylength(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlkickingbylength(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlkicking(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlkicking",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlkicking,
+        ta_cdlkicking_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlladderbottom(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlladderbottom(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlkickingbylength(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlkickingbylength",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlkickingbylength,
+        ta_cdlkickingbylength_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdllongleggeddoji(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdllongleggeddoji(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlladderbottom(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlladderbottom",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlladderbottom,
+        ta_cdlladderbottom_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdllongline(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdllongline(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdllongleggeddoji(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdllongleggeddoji",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdllongleggeddoji,
+        ta_cdllongleggeddoji_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlmarubozu(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlmarubozu(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdllongline(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdllongline",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdllongline,
+        ta_cdllongline_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlmatchinglow(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlmatchinglow(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlmarubozu(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlmarubozu",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlmarubozu,
+        ta_cdlmarubozu_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlmathold(inputs: &[Series], kwargs: CDLKwargs) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlmathold(open_ptr, high_ptr, low_ptr, close_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlmatchinglow(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlmatchinglow",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlmatchinglow,
+        ta_cdlmatchinglow_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlmorningdojistar(inputs: &[Series], kwargs: CDLKwargs) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlmorningdojistar(open_ptr, high_ptr, low_ptr, close_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlmathold(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<CDLKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlmathold",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        |open, high, low, close, len| ta_cdlmathold(open, high, low, close, len, &kwargs),
+        |open, high, low, close, len| ta_cdlmathold_f32(open, high, low, close, len, &kwargs),
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlmorningstar(inputs: &[Series], kwargs: CDLKwargs) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlmorningstar(open_ptr, high_ptr, low_ptr, close_ptr, len, &kwargs);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlmorningdojistar(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<CDLKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlmorningdojistar",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        |open, high, low, close, len| ta_cdlmorningdojistar(open, high, low, close, len, &kwargs),
+        |open, high, low, close, len| {
+            ta_cdlmorningdojistar_f32(open, high, low, close, len, &kwargs)
+        },
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlonneck(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlonneck(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlmorningstar(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<CDLKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlmorningstar",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        |open, high, low, close, len| ta_cdlmorningstar(open, high, low, close, len, &kwargs),
+        |open, high, low, close, len| ta_cdlmorningstar_f32(open, high, low, close, len, &kwargs),
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlpiercing(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlpiercing(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlonneck(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlonneck",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlonneck,
+        ta_cdlonneck_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlrickshawman(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlpiercing(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlpiercing",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlpiercing,
+        ta_cdlpiercing_f32,
+    )
+}
 
-    let res = ta_cdlrickshawman(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlrickshawman(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlrickshawman",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlrickshawman,
+        ta_cdlrickshawman_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlrisefall3methods(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlrisefall3methods(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlrisefall3methods",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlrisefall3methods,
+        ta_cdlrisefall3methods_f32,
+    )
+}
 
-    let res = ta_cdlrisefall3methods(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlseparatinglines(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlseparatinglines",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlseparatinglines,
+        ta_cdlseparatinglines_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlseparatinglines(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlshootingstar(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlshootingstar",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlshootingstar,
+        ta_cdlshootingstar_f32,
+    )
+}
 
-    let res = ta_cdlseparatinglines(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlshortline(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlshortline",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlshortline,
+        ta_cdlshortline_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlshootingstar(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlspinningtop(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlspinningtop",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlspinningtop,
+        ta_cdlspinningtop_f32,
+    )
+}
 
-    let res = ta_cdlshootingstar(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlstalledpattern(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlstalledpattern",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlstalledpattern,
+        ta_cdlstalledpattern_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlshortline(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlsticksandwich(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlsticksandwich",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlsticksandwich,
+        ta_cdlsticksandwich_f32,
+    )
+}
 
-    let res = ta_cdlshortline(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdltakuri(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdltakuri",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdltakuri,
+        ta_cdltakuri_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlspinningtop(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdltasukigap(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdltasukigap",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdltasukigap,
+        ta_cdltasukigap_f32,
+    )
+}
 
-    let res = ta_cdlspinningtop(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlthrusting(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlthrusting",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlthrusting,
+        ta_cdlthrusting_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlstalledpattern(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdltristar(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdltristar",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdltristar,
+        ta_cdltristar_f32,
+    )
+}
 
-    let res = ta_cdlstalledpattern(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlunique3river(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlunique3river",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlunique3river,
+        ta_cdlunique3river_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlsticksandwich(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlupsidegap2crows(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlupsidegap2crows",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlupsidegap2crows,
+        ta_cdlupsidegap2crows_f32,
+    )
+}
 
-    let res = ta_cdlsticksandwich(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=cdl_output)]
+fn cdlxsidegap3methods(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<NoKwargs>, CdlOutDtype>,
+) -> PolarsResult<Series> {
+    cdl_expr(
+        "cdlxsidegap3methods",
+        inputs,
+        kwargs.engine,
+        kwargs.out_dtype,
+        ta_cdlxsidegap3methods,
+        ta_cdlxsidegap3methods_f32,
+    )
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdltakuri(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
+/// Every candlestick pattern, the bit of a pattern in `cdl_scan`'s bitmasks is its
+/// position in this list.
+pub const CDL_PATTERNS: [&str; 61] = [
+    "cdl2crows",
+    "cdl3blackcrows",
+    "cdl3inside",
+    "cdl3linestrike",
+    "cdl3outside",
+    "cdl3starsinsouth",
+    "cdl3whitesoldiers",
+    "cdlabandonedbaby",
+    "cdladvanceblock",
+    "cdlbelthold",
+    "cdlbreakaway",
+    "cdlclosingmarubozu",
+    "cdlconcealbabyswall",
+    "cdlcounterattack",
+    "cdldarkcloudcover",
+    "cdldoji",
+    "cdldojistar",
+    "cdldragonflydoji",
+    "cdlengulfing",
+    "cdleveningdojistar",
+    "cdleveningstar",
+    "cdlgapsidesidewhite",
+    "cdlgravestonedoji",
+    "cdlhammer",
+    "cdlhangingman",
+    "cdlharami",
+    "cdlharamicross",
+    "cdlhighwave",
+    "cdlhikkake",
+    "cdlhikkakemod",
+    "cdlhomingpigeon",
+    "cdlidentical3crows",
+    "cdlinneck",
+    "cdlinvertedhammer",
+    "cdlkicking",
+    "cdlkickingbylength",
+    "cdlladderbottom",
+    "cdllongleggeddoji",
+    "cdllongline",
+    "cdlmarubozu",
+    "cdlmatchinglow",
+    "cdlmathold",
+    "cdlmorningdojistar",
+    "cdlmorningstar",
+    "cdlonneck",
+    "cdlpiercing",
+    "cdlrickshawman",
+    "cdlrisefall3methods",
+    "cdlseparatinglines",
+    "cdlshootingstar",
+    "cdlshortline",
+    "cdlspinningtop",
+    "cdlstalledpattern",
+    "cdlsticksandwich",
+    "cdltakuri",
+    "cdltasukigap",
+    "cdlthrusting",
+    "cdltristar",
+    "cdlunique3river",
+    "cdlupsidegap2crows",
+    "cdlxsidegap3methods",
+];
+
+type CdlScanFn<T> =
+    fn(*const T, *const T, *const T, *const T, usize, &CDLKwargs) -> Result<Vec<i32>, TA_RetCode>;
+
+fn cdl_scan_fns(name: &str) -> PolarsResult<(CdlScanFn<f64>, CdlScanFn<f32>)> {
+    let fns: (CdlScanFn<f64>, CdlScanFn<f32>) = match name {
+        "cdl2crows" => (
+            |o, h, l, c, len, _| ta_cdl2crows(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdl2crows_f32(o, h, l, c, len),
+        ),
+        "cdl3blackcrows" => (
+            |o, h, l, c, len, _| ta_cdl3blackcrows(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdl3blackcrows_f32(o, h, l, c, len),
+        ),
+        "cdl3inside" => (
+            |o, h, l, c, len, _| ta_cdl3inside(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdl3inside_f32(o, h, l, c, len),
+        ),
+        "cdl3linestrike" => (
+            |o, h, l, c, len, _| ta_cdl3linestrike(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdl3linestrike_f32(o, h, l, c, len),
+        ),
+        "cdl3outside" => (
+            |o, h, l, c, len, _| ta_cdl3outside(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdl3outside_f32(o, h, l, c, len),
+        ),
+        "cdl3starsinsouth" => (
+            |o, h, l, c, len, _| ta_cdl3starsinsouth(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdl3starsinsouth_f32(o, h, l, c, len),
+        ),
+        "cdl3whitesoldiers" => (
+            |o, h, l, c, len, _| ta_cdl3whitesoldiers(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdl3whitesoldiers_f32(o, h, l, c, len),
+        ),
+        "cdlabandonedbaby" => (ta_cdlabandonedbaby, ta_cdlabandonedbaby_f32),
+        "cdladvanceblock" => (
+            |o, h, l, c, len, _| ta_cdladvanceblock(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdladvanceblock_f32(o, h, l, c, len),
+        ),
+        "cdlbelthold" => (
+            |o, h, l, c, len, _| ta_cdlbelthold(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlbelthold_f32(o, h, l, c, len),
+        ),
+        "cdlbreakaway" => (
+            |o, h, l, c, len, _| ta_cdlbreakaway(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlbreakaway_f32(o, h, l, c, len),
+        ),
+        "cdlclosingmarubozu" => (
+            |o, h, l, c, len, _| ta_cdlclosingmarubozu(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlclosingmarubozu_f32(o, h, l, c, len),
+        ),
+        "cdlconcealbabyswall" => (
+            |o, h, l, c, len, _| ta_cdlconcealbabyswall(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlconcealbabyswall_f32(o, h, l, c, len),
+        ),
+        "cdlcounterattack" => (
+            |o, h, l, c, len, _| ta_cdlcounterattack(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlcounterattack_f32(o, h, l, c, len),
+        ),
+        "cdldarkcloudcover" => (ta_cdldarkcloudcover, ta_cdldarkcloudcover_f32),
+        "cdldoji" => (
+            |o, h, l, c, len, _| ta_cdldoji(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdldoji_f32(o, h, l, c, len),
+        ),
+        "cdldojistar" => (
+            |o, h, l, c, len, _| ta_cdldojistar(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdldojistar_f32(o, h, l, c, len),
+        ),
+        "cdldragonflydoji" => (
+            |o, h, l, c, len, _| ta_cdldragonflydoji(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdldragonflydoji_f32(o, h, l, c, len),
+        ),
+        "cdlengulfing" => (
+            |o, h, l, c, len, _| ta_cdlengulfing(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlengulfing_f32(o, h, l, c, len),
+        ),
+        "cdleveningdojistar" => (ta_cdleveningdojistar, ta_cdleveningdojistar_f32),
+        "cdleveningstar" => (ta_cdleveningstar, ta_cdleveningstar_f32),
+        "cdlgapsidesidewhite" => (
+            |o, h, l, c, len, _| ta_cdlgapsidesidewhite(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlgapsidesidewhite_f32(o, h, l, c, len),
+        ),
+        "cdlgravestonedoji" => (
+            |o, h, l, c, len, _| ta_cdlgravestonedoji(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlgravestonedoji_f32(o, h, l, c, len),
+        ),
+        "cdlhammer" => (
+            |o, h, l, c, len, _| ta_cdlhammer(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlhammer_f32(o, h, l, c, len),
+        ),
+        "cdlhangingman" => (
+            |o, h, l, c, len, _| ta_cdlhangingman(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlhangingman_f32(o, h, l, c, len),
+        ),
+        "cdlharami" => (
+            |o, h, l, c, len, _| ta_cdlharami(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlharami_f32(o, h, l, c, len),
+        ),
+        "cdlharamicross" => (
+            |o, h, l, c, len, _| ta_cdlharamicross(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlharamicross_f32(o, h, l, c, len),
+        ),
+        "cdlhighwave" => (
+            |o, h, l, c, len, _| ta_cdlhighwave(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlhighwave_f32(o, h, l, c, len),
+        ),
+        "cdlhikkake" => (
+            |o, h, l, c, len, _| ta_cdlhikkake(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlhikkake_f32(o, h, l, c, len),
+        ),
+        "cdlhikkakemod" => (
+            |o, h, l, c, len, _| ta_cdlhikkakemod(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlhikkakemod_f32(o, h, l, c, len),
+        ),
+        "cdlhomingpigeon" => (
+            |o, h, l, c, len, _| ta_cdlhomingpigeon(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlhomingpigeon_f32(o, h, l, c, len),
+        ),
+        "cdlidentical3crows" => (
+            |o, h, l, c, len, _| ta_cdlidentical3crows(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlidentical3crows_f32(o, h, l, c, len),
+        ),
+        "cdlinneck" => (
+            |o, h, l, c, len, _| ta_cdlinneck(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlinneck_f32(o, h, l, c, len),
+        ),
+        "cdlinvertedhammer" => (
+            |o, h, l, c, len, _| ta_cdlinvertedhammer(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlinvertedhammer_f32(o, h, l, c, len),
+        ),
+        "cdlkicking" => (
+            |o, h, l, c, len, _| ta_cdlkicking(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlkicking_f32(o, h, l, c, len),
+        ),
+        "cdlkickingbylength" => (
+            |o, h, l, c, len, _| ta_cdlkickingbylength(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlkickingbylength_f32(o, h, l, c, len),
+        ),
+        "cdlladderbottom" => (
+            |o, h, l, c, len, _| ta_cdlladderbottom(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlladderbottom_f32(o, h, l, c, len),
+        ),
+        "cdllongleggeddoji" => (
+            |o, h, l, c, len, _| ta_cdllongleggeddoji(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdllongleggeddoji_f32(o, h, l, c, len),
+        ),
+        "cdllongline" => (
+            |o, h, l, c, len, _| ta_cdllongline(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdllongline_f32(o, h, l, c, len),
+        ),
+        "cdlmarubozu" => (
+            |o, h, l, c, len, _| ta_cdlmarubozu(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlmarubozu_f32(o, h, l, c, len),
+        ),
+        "cdlmatchinglow" => (
+            |o, h, l, c, len, _| ta_cdlmatchinglow(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlmatchinglow_f32(o, h, l, c, len),
+        ),
+        "cdlmathold" => (ta_cdlmathold, ta_cdlmathold_f32),
+        "cdlmorningdojistar" => (ta_cdlmorningdojistar, ta_cdlmorningdojistar_f32),
+        "cdlmorningstar" => (ta_cdlmorningstar, ta_cdlmorningstar_f32),
+        "cdlonneck" => (
+            |o, h, l, c, len, _| ta_cdlonneck(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlonneck_f32(o, h, l, c, len),
+        ),
+        "cdlpiercing" => (
+            |o, h, l, c, len, _| ta_cdlpiercing(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlpiercing_f32(o, h, l, c, len),
+        ),
+        "cdlrickshawman" => (
+            |o, h, l, c, len, _| ta_cdlrickshawman(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlrickshawman_f32(o, h, l, c, len),
+        ),
+        "cdlrisefall3methods" => (
+            |o, h, l, c, len, _| ta_cdlrisefall3methods(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlrisefall3methods_f32(o, h, l, c, len),
+        ),
+        "cdlseparatinglines" => (
+            |o, h, l, c, len, _| ta_cdlseparatinglines(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlseparatinglines_f32(o, h, l, c, len),
+        ),
+        "cdlshootingstar" => (
+            |o, h, l, c, len, _| ta_cdlshootingstar(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlshootingstar_f32(o, h, l, c, len),
+        ),
+        "cdlshortline" => (
+            |o, h, l, c, len, _| ta_cdlshortline(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlshortline_f32(o, h, l, c, len),
+        ),
+        "cdlspinningtop" => (
+            |o, h, l, c, len, _| ta_cdlspinningtop(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlspinningtop_f32(o, h, l, c, len),
+        ),
+        "cdlstalledpattern" => (
+            |o, h, l, c, len, _| ta_cdlstalledpattern(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlstalledpattern_f32(o, h, l, c, len),
+        ),
+        "cdlsticksandwich" => (
+            |o, h, l, c, len, _| ta_cdlsticksandwich(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlsticksandwich_f32(o, h, l, c, len),
+        ),
+        "cdltakuri" => (
+            |o, h, l, c, len, _| ta_cdltakuri(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdltakuri_f32(o, h, l, c, len),
+        ),
+        "cdltasukigap" => (
+            |o, h, l, c, len, _| ta_cdltasukigap(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdltasukigap_f32(o, h, l, c, len),
+        ),
+        "cdlthrusting" => (
+            |o, h, l, c, len, _| ta_cdlthrusting(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlthrusting_f32(o, h, l, c, len),
+        ),
+        "cdltristar" => (
+            |o, h, l, c, len, _| ta_cdltristar(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdltristar_f32(o, h, l, c, len),
+        ),
+        "cdlunique3river" => (
+            |o, h, l, c, len, _| ta_cdlunique3river(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlunique3river_f32(o, h, l, c, len),
+        ),
+        "cdlupsidegap2crows" => (
+            |o, h, l, c, len, _| ta_cdlupsidegap2crows(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlupsidegap2crows_f32(o, h, l, c, len),
+        ),
+        "cdlxsidegap3methods" => (
+            |o, h, l, c, len, _| ta_cdlxsidegap3methods(o, h, l, c, len),
+            |o, h, l, c, len, _| ta_cdlxsidegap3methods_f32(o, h, l, c, len),
+        ),
+        _ => {
+            return Err(PolarsError::ComputeError(
+                format!("unknown candlestick pattern `{}`", name).into(),
+            ))
+        }
+    };
+    Ok(fns)
+}
 
-    let res = ta_cdltakuri(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[derive(Deserialize)]
+pub struct CdlScanKwargs {
+    pub patterns: Vec<String>,
+    pub penetration: f64,
+    #[serde(default)]
+    pub bitmask: bool,
+    #[serde(default)]
+    pub out_dtype: CdlOutDtype,
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdltasukigap(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
+pub fn cdl_scan_output(_: &[Field], kwargs: CdlScanKwargs) -> PolarsResult<Field> {
+    let fields = if kwargs.bitmask {
+        vec![
+            Field::new("bull", DataType::UInt64),
+            Field::new("bear", DataType::UInt64),
+        ]
+    } else {
+        kwargs
+            .patterns
+            .iter()
+            .map(|name| Field::new(name, kwargs.out_dtype.dtype()))
+            .collect()
+    };
+    Ok(Field::new("", DataType::Struct(fields)))
+}
 
-    let res = ta_cdltasukigap(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+/// OHLC pointers shared by the pattern functions running in parallel, they are
+/// only read.
+struct Ohlc<T> {
+    open: *const T,
+    high: *const T,
+    low: *const T,
+    close: *const T,
+    len: usize,
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlthrusting(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
+unsafe impl<T> Sync for Ohlc<T> {}
 
-    let res = ta_cdlthrusting(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+fn run_patterns<T>(
+    ohlc: &Ohlc<T>,
+    fns: &[CdlScanFn<T>],
+    kwargs: &CDLKwargs,
+) -> Result<Vec<Vec<i32>>, TA_RetCode> {
+    fns.par_iter()
+        .map(|f| f(ohlc.open, ohlc.high, ohlc.low, ohlc.close, ohlc.len, kwargs))
+        .collect()
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdltristar(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdltristar(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
+/// Pack the sign of each pattern output into bit `bits[i]` of a bullish and a bearish mask.
+fn pattern_bitmasks(outs: &[Vec<i32>], bits: &[usize], len: usize) -> (Vec<u64>, Vec<u64>) {
+    let mut bull = vec![0u64; len];
+    let mut bear = vec![0u64; len];
+    for (out, &bit) in outs.iter().zip(bits) {
+        let mask = 1u64 << bit;
+        for (i, &v) in out.iter().enumerate() {
+            if v > 0 {
+                bull[i] |= mask;
+            } else if v < 0 {
+                bear[i] |= mask;
+            }
+        }
     }
+    (bull, bear)
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlunique3river(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-
-    let res = ta_cdlunique3river(open_ptr, high_ptr, low_ptr, close_ptr, len);
+/// Run `patterns` on the OHLC `inputs`, returning the outputs and each pattern's
+/// position in `CDL_PATTERNS`.
+fn scan_patterns(
+    inputs: &[Series],
+    patterns: &[String],
+    penetration: f64,
+) -> PolarsResult<(Vec<Vec<i32>>, Vec<usize>)> {
+    let mut f64_fns = Vec::with_capacity(patterns.len());
+    let mut f32_fns = Vec::with_capacity(patterns.len());
+    let mut ids = Vec::with_capacity(patterns.len());
+    for name in patterns.iter() {
+        let (f64_fn, f32_fn) = cdl_scan_fns(name)?;
+        f64_fns.push(f64_fn);
+        f32_fns.push(f32_fn);
+        ids.push(CDL_PATTERNS.iter().position(|p| p == name).unwrap());
+    }
+    let cdl_kwargs = CDLKwargs { penetration };
+    let len = inputs[3].len();
+    let res = if all_f32(&inputs[..4]) {
+        let open = F32Input::new(&inputs[0])?;
+        let high = F32Input::new(&inputs[1])?;
+        let low = F32Input::new(&inputs[2])?;
+        let close = F32Input::new(&inputs[3])?;
+        let ohlc = Ohlc {
+            open: open.ptr(),
+            high: high.ptr(),
+            low: low.ptr(),
+            close: close.ptr(),
+            len,
+        };
+        run_patterns(&ohlc, &f32_fns, &cdl_kwargs)
+    } else {
+        let open = F64Input::new(&inputs[0])?;
+        let high = F64Input::new(&inputs[1])?;
+        let low = F64Input::new(&inputs[2])?;
+        let close = F64Input::new(&inputs[3])?;
+        let ohlc = Ohlc {
+            open: open.ptr(),
+            high: high.ptr(),
+            low: low.ptr(),
+            close: close.ptr(),
+            len,
+        };
+        run_patterns(&ohlc, &f64_fns, &cdl_kwargs)
+    };
     match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
+        Ok(outs) => Ok((outs, ids)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlupsidegap2crows(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
+/// Run several candlestick patterns from one expression.
+///
+/// OHLC is prepared once and shared by the patterns, which run in parallel. TA-Lib
+/// keeps its candle body/shadow averages private to each pattern, so those are still
+/// computed per pattern, which keeps every output identical to the single pattern
+/// functions.
+#[polars_expr(output_type_func_with_kwargs=cdl_scan_output)]
+fn cdl_scan(inputs: &[Series], kwargs: CdlScanKwargs) -> PolarsResult<Series> {
+    let (outs, ids) = scan_patterns(inputs, &kwargs.patterns, kwargs.penetration)?;
+    let fields: Vec<Series> = if kwargs.bitmask {
+        let (bull, bear) = pattern_bitmasks(&outs, &ids, inputs[3].len());
+        vec![
+            Series::from_vec("bull", bull),
+            Series::from_vec("bear", bear),
+        ]
+    } else {
+        outs.into_iter()
+            .zip(kwargs.patterns.iter())
+            .map(|(out, name)| {
+                let mut s = cdl_series(out, kwargs.out_dtype);
+                s.rename(name);
+                s
+            })
+            .collect()
+    };
+    let out = StructChunked::new("", &fields)?;
+    Ok(out.into_series())
+}
 
-    let res = ta_cdlupsidegap2crows(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[derive(Deserialize)]
+pub struct CdlEventsKwargs {
+    pub patterns: Vec<String>,
+    pub penetration: f64,
 }
 
-#[polars_expr(output_type=Int32)]
-fn cdlxsidegap3methods(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
+pub fn cdl_events_output(_: &[Field]) -> PolarsResult<Field> {
+    let fields = vec![
+        Field::new("row", IDX_DTYPE),
+        Field::new("pattern", DataType::UInt8),
+        Field::new("signal", DataType::Int8),
+    ];
+    Ok(Field::new(
+        "",
+        DataType::List(Box::new(DataType::Struct(fields))),
+    ))
+}
 
-    let res = ta_cdlxsidegap3methods(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Int32Chunked::new("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
+/// Candlestick pattern hits as a single list of `(row, pattern, signal)` structs.
+///
+/// `pattern` is the position in `CDL_PATTERNS`, `signal` the TA-Lib value divided by
+/// 100 (-2, -1, 1, 2). Rows where a pattern is 0 are left out, so the output grows
+/// with the number of hits rather than the number of rows.
+#[polars_expr(output_type_func=cdl_events_output)]
+fn cdl_events(inputs: &[Series], kwargs: CdlEventsKwargs) -> PolarsResult<Series> {
+    let (outs, ids) = scan_patterns(inputs, &kwargs.patterns, kwargs.penetration)?;
+    let mut rows: Vec<IdxSize> = Vec::new();
+    let mut patterns: Vec<u8> = Vec::new();
+    let mut signals: Vec<i8> = Vec::new();
+    for i in 0..inputs[3].len() {
+        for (out, &id) in outs.iter().zip(ids.iter()) {
+            if out[i] != 0 {
+                rows.push(i as IdxSize);
+                patterns.push(id as u8);
+                signals.push((out[i] / 100) as i8);
+            }
+        }
     }
+    let fields = [
+        Series::from_vec("row", rows),
+        Series::from_vec("pattern", patterns),
+        Series::from_vec("signal", signals),
+    ];
+    let events = StructChunked::new("", &fields)?.into_series();
+    Ok(events.implode()?.into_series())
 }
@@ -0,0 +1,223 @@
+use crate::sweep::periods_array;
+use crate::utils::{native_begin, ta_code2err, Engine, F64Input, OutDtype, SyncPtr};
+use polars::prelude::*;
+use pyo3_polars::derive::polars_expr;
+use rayon::prelude::*;
+use serde::Deserialize;
+use talib::common::TimePeriodKwargs;
+use talib::math::ta_sum;
+use talib::overlap::ta_sma;
+use talib::statistic::{ta_stddev, ta_var, StdDevKwargs, VarKwargs};
+use talib_sys::TA_RetCode;
+
+/// Bound on the distance to TA-Lib of the prefix sum outputs, relative to the window's
+/// mean absolute value for `sum` and `sma` and to its mean square for `var` (and
+/// `stddev` squared).
+///
+/// TA-Lib's running sums carry the rounding of every row since the start of the column,
+/// the prefix sums do not, so most of the distance is TA-Lib's. A `stddev` whose
+/// variance is within that distance of TA-Lib's `1e-8` cutoff can still be 0 on one side
+/// only.
+pub const PREFIX_TOLERANCE: f64 = 1e-9;
+
+/// Variance below which TA-Lib's STDDEV reports 0.
+const STDDEV_MIN_VARIANCE: f64 = 1e-8;
+
+#[derive(Deserialize)]
+pub struct PrefixMultiKwargs {
+    pub func: String,
+    pub timeperiods: Vec<i32>,
+    #[serde(default = "default_nbdev")]
+    pub nbdev: f64,
+    #[serde(default)]
+    pub engine: Engine,
+    #[serde(default)]
+    pub out_dtype: OutDtype,
+}
+
+fn default_nbdev() -> f64 {
+    1.0
+}
+
+#[derive(Clone, Copy, PartialEq, Eq)]
+enum WindowStat {
+    Sum,
+    Sma,
+    Var,
+    StdDev,
+}
+
+fn window_stat(func: &str) -> PolarsResult<WindowStat> {
+    match func {
+        "sum" => Ok(WindowStat::Sum),
+        "sma" => Ok(WindowStat::Sma),
+        "var" => Ok(WindowStat::Var),
+        "stddev" => Ok(WindowStat::StdDev),
+        _ => Err(PolarsError::ComputeError(
+            format!("`{}` has no prefix sum kernel", func).into(),
+        )),
+    }
+}
+
+/// `hi + lo = a + b` exactly.
+fn two_sum(a: f64, b: f64) -> (f64, f64) {
+    let hi = a + b;
+    let b_virtual = hi - a;
+    let lo = (a - (hi - b_virtual)) + (b - b_virtual);
+    (hi, lo)
+}
+
+/// Prefix sums of `values[begin..]` and of their squares, built once for any number of
+/// windows.
+///
+/// The values are shifted by the first one so a column far from 0 does not cancel in
+/// the variance, and each prefix is kept as a rounded sum plus the sum of its rounding
+/// errors, so a window's sum is as accurate as summing the window itself.
+pub struct PrefixSums {
+    begin: usize,
+    shift: f64,
+    sum: Vec<f64>,
+    sum_err: Vec<f64>,
+    sum_sq: Vec<f64>,
+    sum_sq_err: Vec<f64>,
+}
+
+impl PrefixSums {
+    pub fn new(values: &[f64], begin: usize) -> Self {
+        let values = &values[begin.min(values.len())..];
+        let shift = values.first().copied().unwrap_or(0.0);
+        let n = values.len() + 1;
+        let (mut sum, mut sum_err) = (Vec::with_capacity(n), Vec::with_capacity(n));
+        let (mut sum_sq, mut sum_sq_err) = (Vec::with_capacity(n), Vec::with_capacity(n));
+        let (mut s, mut s_err, mut sq, mut sq_err) = (0.0, 0.0, 0.0, 0.0);
+        sum.push(s);
+        sum_err.push(s_err);
+        sum_sq.push(sq);
+        sum_sq_err.push(sq_err);
+        for v in values {
+            let d = v - shift;
+            let (hi, lo) = two_sum(s, d);
+            s = hi;
+            s_err += lo;
+            let d2 = d * d;
+            let (hi, lo) = two_sum(sq, d2);
+            sq = hi;
+            sq_err += lo + d.mul_add(d, -d2);
+            sum.push(s);
+            sum_err.push(s_err);
+            sum_sq.push(sq);
+            sum_sq_err.push(sq_err);
+        }
+        PrefixSums {
+            begin,
+            shift,
+            sum,
+            sum_err,
+            sum_sq,
+            sum_sq_err,
+        }
+    }
+
+    /// Shifted sum and sum of squares of the `period` rows ending at row `end - 1`.
+    fn window(&self, end: usize, period: usize) -> (f64, f64) {
+        let (b, a) = (end - self.begin, end - self.begin - period);
+        let sum = (self.sum[b] - self.sum[a]) + (self.sum_err[b] - self.sum_err[a]);
+        let sum_sq = (self.sum_sq[b] - self.sum_sq[a]) + (self.sum_sq_err[b] - self.sum_sq_err[a]);
+        (sum, sum_sq)
+    }
+
+    /// `stat` over every window of `period` rows, NaN before the first full one as in
+    /// TA-Lib. Constant time per row whatever the period.
+    fn stat(&self, len: usize, period: usize, stat: WindowStat, nbdev: f64) -> Vec<f64> {
+        let mut out = vec![f64::NAN; len];
+        let p = period as f64;
+        for (i, dst) in out.iter_mut().enumerate().skip(self.begin + period - 1) {
+            let (sum, sum_sq) = self.window(i + 1, period);
+            *dst = match stat {
+                WindowStat::Sum => sum + p * self.shift,
+                WindowStat::Sma => (sum + p * self.shift) / p,
+                WindowStat::Var | WindowStat::StdDev => {
+                    let mean = sum / p;
+                    let var = sum_sq / p - mean * mean;
+                    if stat == WindowStat::Var {
+                        var
+                    } else if var >= STDDEV_MIN_VARIANCE {
+                        var.sqrt() * nbdev
+                    } else {
+                        0.0
+                    }
+                }
+            };
+        }
+        out
+    }
+}
+
+/// TA-Lib's `stat` over `period` rows.
+fn ta_stat(
+    input_ptr: *const f64,
+    len: usize,
+    stat: WindowStat,
+    timeperiod: i32,
+    nbdev: f64,
+) -> Result<Vec<f64>, TA_RetCode> {
+    match stat {
+        WindowStat::Sum => ta_sum(input_ptr, len, &TimePeriodKwargs { timeperiod }),
+        WindowStat::Sma => ta_sma(input_ptr, len, &TimePeriodKwargs { timeperiod }),
+        WindowStat::Var => ta_var(input_ptr, len, &VarKwargs { timeperiod, nbdev }),
+        WindowStat::StdDev => ta_stddev(input_ptr, len, &StdDevKwargs { timeperiod, nbdev }),
+    }
+}
+
+pub fn prefix_multi_output(
+    input_fields: &[Field],
+    kwargs: PrefixMultiKwargs,
+) -> PolarsResult<Field> {
+    let dtype = DataType::Array(Box::new(kwargs.out_dtype.dtype()), kwargs.timeperiods.len());
+    Ok(Field::new(input_fields[0].name(), dtype))
+}
+
+/// `sum`, `sma`, `var` or `stddev` for every period of `timeperiods` as one `Array`
+/// column, element `j` of each row within `PREFIX_TOLERANCE` of the function with
+/// `timeperiod=timeperiods[j]`.
+///
+/// The prefix sums are built once and every period then costs one subtraction per row.
+/// `engine="talib"`, input with NaN after the leading NaNs, and periods TA-Lib rejects
+/// run TA-Lib once per period instead.
+#[polars_expr(output_type_func_with_kwargs=prefix_multi_output)]
+fn prefix_multi(inputs: &[Series], kwargs: PrefixMultiKwargs) -> PolarsResult<Series> {
+    let stat = window_stat(&kwargs.func)?;
+    if kwargs.timeperiods.is_empty() {
+        return Err(PolarsError::ComputeError(
+            "prefix sums need at least one timeperiod".into(),
+        ));
+    }
+    let shortest = *kwargs.timeperiods.iter().min().unwrap();
+    let longest = *kwargs.timeperiods.iter().max().unwrap();
+    let input = F64Input::new(&inputs[0])?;
+    let values = input.as_slice();
+    let len = input.len();
+    let outs = match native_begin(kwargs.engine, longest, &[values]) {
+        Some(begin) if shortest >= 2 => {
+            let prefix = PrefixSums::new(values, begin);
+            kwargs
+                .timeperiods
+                .par_iter()
+                .map(|p| prefix.stat(len, *p as usize, stat, kwargs.nbdev))
+                .collect()
+        }
+        _ => {
+            let input_ptr = SyncPtr(input.ptr());
+            let res: Result<Vec<Vec<f64>>, TA_RetCode> = kwargs
+                .timeperiods
+                .par_iter()
+                .map(|timeperiod| ta_stat(input_ptr.ptr(), len, stat, *timeperiod, kwargs.nbdev))
+                .collect();
+            match res {
+                Ok(outs) => outs,
+                Err(ret_code) => return ta_code2err(ret_code),
+            }
+        }
+    };
+    periods_array(outs, len, kwargs.out_dtype)
+}
@@ -0,0 +1,92 @@
+use crate::meta::TaFunc;
+use crate::sweep::timeperiod_fn;
+use crate::utils::{float_output, float_series, float_series_in, ta_code2err, F64Input, OutKwargs};
+use polars::prelude::*;
+use pyo3_polars::derive::polars_expr;
+use serde::Deserialize;
+use std::collections::HashMap;
+use std::ops::Range;
+use talib::common::TimePeriodKwargs;
+
+#[derive(Deserialize)]
+pub struct RangeKwargs {
+    pub func: String,
+    pub timeperiod: i32,
+    #[serde(default)]
+    pub start: Option<usize>,
+    #[serde(default)]
+    pub end: Option<usize>,
+    #[serde(default)]
+    pub last_n: Option<usize>,
+    #[serde(default)]
+    pub warmup: Option<usize>,
+}
+
+/// Output rows asked for by `kwargs` in an input of `len` rows: the last `last_n` rows
+/// before `end`, or `[start, end)`.
+pub fn output_range(len: usize, kwargs: &RangeKwargs) -> Range<usize> {
+    let end = kwargs.end.map_or(len, |end| end.min(len));
+    let start = match kwargs.last_n {
+        Some(last_n) => end.saturating_sub(last_n),
+        None => kwargs.start.unwrap_or(0).min(end),
+    };
+    start..end
+}
+
+/// Values of `func` over the rows `range` of `series`.
+///
+/// Only the input from `lookback + warmup` rows before `range.start` is read, and
+/// widened to Float64 if needed.
+fn range_values(
+    series: &Series,
+    kwargs: &RangeKwargs,
+    range: Range<usize>,
+) -> PolarsResult<Vec<f64>> {
+    let ta_func = timeperiod_fn(&kwargs.func)?;
+    let params = HashMap::from([("timeperiod".to_string(), kwargs.timeperiod as f64)]);
+    let meta = TaFunc::new(&kwargs.func, &params)?;
+    let lookback = meta.lookback()?;
+    if range.is_empty() {
+        return Ok(Vec::new());
+    }
+    let warmup = kwargs
+        .warmup
+        .unwrap_or_else(|| meta.unstable_rows().unwrap_or(0));
+    let from = range.start.saturating_sub(lookback + warmup);
+    let input = F64Input::new(&series.slice(from as i64, range.end - from))?;
+    let ta_kwargs = TimePeriodKwargs {
+        timeperiod: kwargs.timeperiod,
+    };
+    match ta_func(input.ptr(), input.len(), &ta_kwargs) {
+        Ok(res) => Ok(res.into_iter().skip(range.start - from).collect()),
+        Err(ret_code) => ta_code2err(ret_code),
+    }
+}
+
+/// `func` over the output rows of `output_range` only, null elsewhere, so a screen of
+/// the latest values does not pay for the whole history.
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn timeperiod_range(inputs: &[Series], kwargs: OutKwargs<RangeKwargs>) -> PolarsResult<Series> {
+    let len = inputs[0].len();
+    let range = output_range(len, &kwargs);
+    let values = range_values(&inputs[0], &kwargs, range.clone())?;
+    let mut out = vec![f64::NAN; len];
+    for (dst, v) in out[range.clone()].iter_mut().zip(values) {
+        *dst = v;
+    }
+    Ok(float_series_in(out, kwargs.out_dtype, range))
+}
+
+/// Last value of `func` as a scalar, e.g. one row per group in `group_by().agg`.
+///
+/// Only the last `lookback + warmup + 1` rows are read and no full length output is
+/// allocated. An empty input gives null.
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn timeperiod_last(inputs: &[Series], kwargs: OutKwargs<RangeKwargs>) -> PolarsResult<Series> {
+    let len = inputs[0].len();
+    let values = range_values(&inputs[0], &kwargs, len.saturating_sub(1)..len)?;
+    match values.first() {
+        Some(v) => Ok(float_series(vec![*v], kwargs.out_dtype)),
+        None => Ok(Series::full_null("", 1, &kwargs.out_dtype.dtype())),
+    }
+}
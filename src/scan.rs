@@ -0,0 +1,118 @@
+use crate::chunked::{chunk_rows, par_clean_begin};
+use crate::meta::TaFunc;
+use crate::utils::Engine;
+use rayon::prelude::*;
+use std::collections::HashMap;
+
+/// Distance of the scan engine's results to TA-Lib's, relative to the scale of each
+/// function: the largest absolute input so far for EMA, the largest true range so far
+/// for ATR, the running sum of `|volume|` for OBV, AD and ADOSC, and
+/// `100 * max |change| / (average gain + average loss)` for RSI.
+pub const SCAN_TOLERANCE: f64 = 1e-9;
+
+/// First row and lookback of `func` with `params` when the scan engine runs on `inputs`,
+/// `None` when TA-Lib runs instead.
+///
+/// TA-Lib runs for `engine="talib"`, for a series too short to be split by `chunk_rows`
+/// (so also on a single thread), for parameters TA-Lib rejects, for input with NaN after
+/// the leading NaNs and for input without a single output row.
+pub fn scan_start(
+    engine: Engine,
+    func: &str,
+    params: &[(&str, i32)],
+    inputs: &[&[f64]],
+) -> Option<(usize, usize)> {
+    let len = inputs[0].len();
+    if engine != Engine::Native || chunk_rows(len).is_none() {
+        return None;
+    }
+    let params: HashMap<String, f64> = params
+        .iter()
+        .map(|(name, value)| (name.to_string(), *value as f64))
+        .collect();
+    let lookback = TaFunc::new(func, &params).ok()?.lookback().ok()?;
+    match par_clean_begin(inputs) {
+        (begin, true) if begin + lookback < len => Some((begin, lookback)),
+        _ => None,
+    }
+}
+
+/// Solve `y[i] = a * y[i - 1] + values[i]` in place with `y[-1] = seed`, as a parallel
+/// scan over the chunks of `chunk_rows`.
+///
+/// Every chunk runs the recurrence from 0 in parallel, the first from `seed`, and keeps
+/// its last value and `a^len`. A pass over the chunks turns these into the value each
+/// chunk starts from, and a second parallel pass adds `a^(j + 1)` times it to row `j`
+/// of the chunk. The sums are grouped differently from the sequential recurrence, so the
+/// result matches it up to rounding, see `SCAN_TOLERANCE`.
+pub fn linear_scan(a: f64, seed: f64, values: &mut [f64]) {
+    let chunk = chunk_rows(values.len()).unwrap_or(values.len()).max(1);
+    let ends: Vec<(f64, f64)> = values
+        .par_chunks_mut(chunk)
+        .enumerate()
+        .map(|(k, rows)| {
+            let mut y = if k == 0 { seed } else { 0.0 };
+            for v in rows.iter_mut() {
+                y = a * y + *v;
+                *v = y;
+            }
+            (y, a.powf(rows.len() as f64))
+        })
+        .collect();
+    let mut carries = vec![0.0; ends.len()];
+    for k in 1..ends.len() {
+        carries[k] = ends[k].1 * carries[k - 1] + ends[k - 1].0;
+    }
+    values
+        .par_chunks_mut(chunk)
+        .zip(carries)
+        .skip(1)
+        .for_each(|(rows, carry)| {
+            let mut w = carry;
+            for v in rows.iter_mut() {
+                w *= a;
+                *v += w;
+            }
+        });
+}
+
+/// TA-Lib's EMA of `values[begin..]` as a scan: seeded with the mean of the first
+/// `period` values, then `k * x + (1 - k) * prev` with `k = 2 / (period + 1)`. NaN before
+/// `out_begin`.
+pub fn ema_scan(values: &[f64], begin: usize, period: usize, out_begin: usize) -> Vec<f64> {
+    let k = 2.0 / (period as f64 + 1.0);
+    let first = begin + period - 1;
+    let mut out = vec![f64::NAN; values.len()];
+    let mut total = 0.0;
+    for v in values[begin..=first].iter() {
+        total += v;
+    }
+    out[first] = total / period as f64;
+    let rest = &mut out[first + 1..];
+    rest.par_iter_mut()
+        .zip(values[first + 1..].par_iter())
+        .for_each(|(o, x)| *o = k * x);
+    linear_scan(1.0 - k, total / period as f64, rest);
+    out[..out_begin].fill(f64::NAN);
+    out
+}
+
+/// Wilder's smoothing of `inc` as a scan: the mean of `inc[first + 1 - period..=first]`
+/// at `first`, then `(prev * (period - 1) + x) / period`, as the ATR and the RSI
+/// averages. NaN before `out_begin`.
+pub fn wilder_scan(inc: &[f64], first: usize, period: usize, out_begin: usize) -> Vec<f64> {
+    let n = period as f64;
+    let mut out = vec![f64::NAN; inc.len()];
+    let mut total = 0.0;
+    for v in inc[first + 1 - period..=first].iter() {
+        total += v;
+    }
+    out[first] = total / n;
+    let rest = &mut out[first + 1..];
+    rest.par_iter_mut()
+        .zip(inc[first + 1..].par_iter())
+        .for_each(|(o, x)| *o = x / n);
+    linear_scan((n - 1.0) / n, total / n, rest);
+    out[..out_begin].fill(f64::NAN);
+    out
+}
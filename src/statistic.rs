@@ -1,133 +1,306 @@
-use crate::utils::{cast_series_to_f64, get_series_f64_ptr, ta_code2err};
+use crate::chunked::par_chunked;
+use crate::utils::{
+    float_output, float_series, struct_fields_output, ta_code2err, Engine, EngineKwargs, F64Input,
+    OutDtype, OutKwargs,
+};
 use polars::prelude::*;
 use pyo3_polars::derive::polars_expr;
+use rayon::prelude::*;
+use serde::Deserialize;
 use talib::statistic::{
     ta_beta, ta_correl, ta_linearreg, ta_linearreg_angle, ta_linearreg_intercept,
     ta_linearreg_slope, ta_stddev, ta_tsf, ta_var, BetaKwargs, CorrelKwargs, LinearRegAngleKwargs,
     LinearRegInterceptKwargs, LinearRegKwargs, LinearRegSlopeKwargs, StdDevKwargs, TsfKwargs,
     VarKwargs,
 };
+use talib_sys::TA_RetCode;
 
-#[polars_expr(output_type=Float64)]
-fn beta(inputs: &[Series], kwargs: BetaKwargs) -> PolarsResult<Series> {
-    let real0 = &mut cast_series_to_f64(&inputs[0])?;
-    let real1 = &mut cast_series_to_f64(&inputs[1])?;
-    let (real0_ptr, _real0) = get_series_f64_ptr(real0)?;
-    let (real1_ptr, _real1) = get_series_f64_ptr(real1)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn beta(inputs: &[Series], kwargs: OutKwargs<BetaKwargs>) -> PolarsResult<Series> {
+    let real0 = F64Input::new(&inputs[0])?;
+    let real1 = F64Input::new(&inputs[1])?;
+    let real0_ptr = real0.ptr();
+    let real1_ptr = real1.ptr();
     let len = real0.len();
     let res = ta_beta(real0_ptr, real1_ptr, len, &kwargs);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn correl(inputs: &[Series], kwargs: CorrelKwargs) -> PolarsResult<Series> {
-    let real0 = &mut cast_series_to_f64(&inputs[0])?;
-    let real1 = &mut cast_series_to_f64(&inputs[1])?;
-    let (real0_ptr, _real0) = get_series_f64_ptr(real0)?;
-    let (real1_ptr, _real1) = get_series_f64_ptr(real1)?;
-    let len = real0.len();
-    let res = ta_correl(real0_ptr, real1_ptr, len, &kwargs);
+/// Pearson's correlation of `timeperiod` rows, a long series runs in parallel chunks
+/// unless `engine="talib"`, within rounding of TA-Lib, see `par_chunked`.
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn correl(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<CorrelKwargs>>,
+) -> PolarsResult<Series> {
+    let real0 = F64Input::new(&inputs[0])?;
+    let real1 = F64Input::new(&inputs[1])?;
+    let values = [real0.as_slice(), real1.as_slice()];
+    let res = match kwargs.engine {
+        Engine::Native => par_chunked("correl", kwargs.timeperiod, &values, |rows| {
+            let (real0, real1) = (&values[0][rows.clone()], &values[1][rows]);
+            ta_correl(real0.as_ptr(), real1.as_ptr(), real0.len(), &kwargs)
+        }),
+        Engine::Talib => ta_correl(real0.ptr(), real1.ptr(), real0.len(), &kwargs),
+    };
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn linearreg(inputs: &[Series], kwargs: LinearRegKwargs) -> PolarsResult<Series> {
-    let real = &mut cast_series_to_f64(&inputs[0])?;
-    let (real_ptr, _real) = get_series_f64_ptr(real)?;
-    let len = real.len();
-    let res = ta_linearreg(real_ptr, len, &kwargs);
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn linearreg(inputs: &[Series], kwargs: OutKwargs<LinearRegKwargs>) -> PolarsResult<Series> {
+    let real = F64Input::new(&inputs[0])?;
+    let values = real.as_slice();
+    let res = par_chunked("linearreg", kwargs.timeperiod, &[values], |rows| {
+        ta_linearreg(values[rows.clone()].as_ptr(), rows.len(), &kwargs)
+    });
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn linearreg_angle(inputs: &[Series], kwargs: LinearRegAngleKwargs) -> PolarsResult<Series> {
-    let real = &mut cast_series_to_f64(&inputs[0])?;
-    let (real_ptr, _real) = get_series_f64_ptr(real)?;
-    let len = real.len();
-    let res = ta_linearreg_angle(real_ptr, len, &kwargs);
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn linearreg_angle(
+    inputs: &[Series],
+    kwargs: OutKwargs<LinearRegAngleKwargs>,
+) -> PolarsResult<Series> {
+    let real = F64Input::new(&inputs[0])?;
+    let values = real.as_slice();
+    let res = par_chunked("linearreg_angle", kwargs.timeperiod, &[values], |rows| {
+        ta_linearreg_angle(values[rows.clone()].as_ptr(), rows.len(), &kwargs)
+    });
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
+#[polars_expr(output_type_func_with_kwargs=float_output)]
 fn linearreg_intercept(
     inputs: &[Series],
-    kwargs: LinearRegInterceptKwargs,
+    kwargs: OutKwargs<LinearRegInterceptKwargs>,
 ) -> PolarsResult<Series> {
-    let real = &mut cast_series_to_f64(&inputs[0])?;
-    let (real_ptr, _real) = get_series_f64_ptr(real)?;
-    let len = real.len();
-    let res = ta_linearreg_intercept(real_ptr, len, &kwargs);
+    let real = F64Input::new(&inputs[0])?;
+    let values = real.as_slice();
+    let res = par_chunked(
+        "linearreg_intercept",
+        kwargs.timeperiod,
+        &[values],
+        |rows| ta_linearreg_intercept(values[rows.clone()].as_ptr(), rows.len(), &kwargs),
+    );
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn linearreg_slope(inputs: &[Series], kwargs: LinearRegSlopeKwargs) -> PolarsResult<Series> {
-    let real = &mut cast_series_to_f64(&inputs[0])?;
-    let (real_ptr, _real) = get_series_f64_ptr(real)?;
-    let len = real.len();
-    let res = ta_linearreg_slope(real_ptr, len, &kwargs);
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn linearreg_slope(
+    inputs: &[Series],
+    kwargs: OutKwargs<LinearRegSlopeKwargs>,
+) -> PolarsResult<Series> {
+    let real = F64Input::new(&inputs[0])?;
+    let values = real.as_slice();
+    let res = par_chunked("linearreg_slope", kwargs.timeperiod, &[values], |rows| {
+        ta_linearreg_slope(values[rows.clone()].as_ptr(), rows.len(), &kwargs)
+    });
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn stddev(inputs: &[Series], kwargs: StdDevKwargs) -> PolarsResult<Series> {
-    let real = &mut cast_series_to_f64(&inputs[0])?;
-    let (real_ptr, _real) = get_series_f64_ptr(real)?;
-    let len = real.len();
-    let res = ta_stddev(real_ptr, len, &kwargs);
+/// Standard deviation of `timeperiod` rows, a long series runs in parallel chunks
+/// unless `engine="talib"`, within rounding of TA-Lib, see `par_chunked`.
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn stddev(
+    inputs: &[Series],
+    kwargs: OutKwargs<EngineKwargs<StdDevKwargs>>,
+) -> PolarsResult<Series> {
+    let real = F64Input::new(&inputs[0])?;
+    let values = real.as_slice();
+    let res = match kwargs.engine {
+        Engine::Native => par_chunked("stddev", kwargs.timeperiod, &[values], |rows| {
+            ta_stddev(values[rows.clone()].as_ptr(), rows.len(), &kwargs)
+        }),
+        Engine::Talib => ta_stddev(values.as_ptr(), values.len(), &kwargs),
+    };
     match res {
-        Ok(out) => {
-            let out_ser = Float64Chunked::from_vec("", out);
-            Ok(out_ser.into_series())
-        }
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn tsf(inputs: &[Series], kwargs: TsfKwargs) -> PolarsResult<Series> {
-    let real = &mut cast_series_to_f64(&inputs[0])?;
-    let (real_ptr, _real) = get_series_f64_ptr(real)?;
-    let len = real.len();
-    let res = ta_tsf(real_ptr, len, &kwargs);
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn tsf(inputs: &[Series], kwargs: OutKwargs<TsfKwargs>) -> PolarsResult<Series> {
+    let real = F64Input::new(&inputs[0])?;
+    let values = real.as_slice();
+    let res = par_chunked("tsf", kwargs.timeperiod, &[values], |rows| {
+        ta_tsf(values[rows.clone()].as_ptr(), rows.len(), &kwargs)
+    });
     match res {
-        Ok(out) => {
-            let out_ser = Float64Chunked::from_vec("", out);
-            Ok(out_ser.into_series())
-        }
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn var(inputs: &[Series], kwargs: VarKwargs) -> PolarsResult<Series> {
-    let real = &mut cast_series_to_f64(&inputs[0])?;
-    let (real_ptr, _real) = get_series_f64_ptr(real)?;
-    let len = real.len();
-    let res = ta_var(real_ptr, len, &kwargs);
+/// Variance of `timeperiod` rows, a long series runs in parallel chunks unless
+/// `engine="talib"`, within rounding of TA-Lib, see `par_chunked`.
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn var(inputs: &[Series], kwargs: OutKwargs<EngineKwargs<VarKwargs>>) -> PolarsResult<Series> {
+    let real = F64Input::new(&inputs[0])?;
+    let values = real.as_slice();
+    let res = match kwargs.engine {
+        Engine::Native => par_chunked("var", kwargs.timeperiod, &[values], |rows| {
+            ta_var(values[rows.clone()].as_ptr(), rows.len(), &kwargs)
+        }),
+        Engine::Talib => ta_var(values.as_ptr(), values.len(), &kwargs),
+    };
     match res {
-        Ok(out) => {
-            let out_ser = Float64Chunked::from_vec("", out);
-            Ok(out_ser.into_series())
-        }
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
+
+#[derive(Deserialize)]
+pub struct LinregAllKwargs {
+    pub timeperiod: i32,
+    pub fields: Vec<String>,
+    #[serde(default)]
+    pub out_dtype: OutDtype,
+}
+
+pub fn linreg_all_output(_: &[Field], kwargs: LinregAllKwargs) -> PolarsResult<Field> {
+    struct_fields_output(&kwargs.fields, kwargs.out_dtype)
+}
+
+/// Least-squares line of one window: slope, intercept and, when asked, the fit quality.
+#[derive(Clone, Copy)]
+struct LinregWindow {
+    slope: f64,
+    intercept: f64,
+    r2: f64,
+    resid_std: f64,
+}
+
+impl LinregWindow {
+    const NAN: LinregWindow = LinregWindow {
+        slope: f64::NAN,
+        intercept: f64::NAN,
+        r2: f64::NAN,
+        resid_std: f64::NAN,
+    };
+}
+
+/// Regression over the `timeperiod` values ending at `values[end]`.
+///
+/// The sums are taken in TA-Lib's order (x counts back from the newest value) and the
+/// slope / intercept use its expressions, so results are bit-identical to LINEARREG*.
+/// `r2` (NaN on a flat window) and `resid_std`, the population standard deviation of
+/// the residuals, are only computed `with_fit`: the same loop also sums the values and
+/// their squares relative to the newest one, which keeps the totals well conditioned,
+/// and SST, SSR and SSE then follow from the sums without another pass.
+fn linreg_window(values: &[f64], end: usize, timeperiod: i32, with_fit: bool) -> LinregWindow {
+    let p = timeperiod as i64;
+    let sum_x = (p * (p - 1)) as f64 * 0.5;
+    let sum_x_sqr = (p * (p - 1) * (p * 2 - 1) / 6) as f64;
+    let divisor = sum_x * sum_x - p as f64 * sum_x_sqr;
+    let mut sum_xy = 0.0;
+    let mut sum_y = 0.0;
+    let (mut sum_d, mut sum_d_sqr, mut sum_xd) = (0.0, 0.0, 0.0);
+    let shift = values[end];
+    for i in (0..p as usize).rev() {
+        let v = values[end - i];
+        sum_y += v;
+        sum_xy += i as f64 * v;
+        if with_fit {
+            let d = v - shift;
+            sum_d += d;
+            sum_d_sqr += d * d;
+            sum_xd += i as f64 * d;
+        }
+    }
+    let slope = (p as f64 * sum_xy - sum_x * sum_y) / divisor;
+    let intercept = (sum_y - slope * sum_x) / p as f64;
+    let (mut r2, mut resid_std) = (f64::NAN, f64::NAN);
+    if with_fit {
+        let sxx = -divisor / p as f64;
+        let sxy = sum_xd - sum_x * sum_d / p as f64;
+        let sst = sum_d_sqr - sum_d * sum_d / p as f64;
+        let ssr = sxy * sxy / sxx;
+        if sst != 0.0 {
+            r2 = ssr / sst;
+        }
+        resid_std = ((sst - ssr).max(0.0) / p as f64).sqrt();
+    }
+    LinregWindow {
+        slope,
+        intercept,
+        r2,
+        resid_std,
+    }
+}
+
+/// `linearreg`, `linearreg_slope`, `linearreg_intercept`, `linearreg_angle` and `tsf` in
+/// one struct, plus the optional `r2` and `resid_std`; `fields` picks which outputs.
+///
+/// Each window's sums are computed once and shared by every field, and windows are
+/// independent, so rows are computed in parallel.
+#[polars_expr(output_type_func_with_kwargs=linreg_all_output)]
+fn linreg_all(inputs: &[Series], kwargs: LinregAllKwargs) -> PolarsResult<Series> {
+    let mut with_fit = false;
+    for name in kwargs.fields.iter() {
+        match name.as_str() {
+            "linearreg" | "linearreg_slope" | "linearreg_intercept" | "linearreg_angle" | "tsf" => {
+            }
+            "r2" | "resid_std" => with_fit = true,
+            _ => {
+                return Err(PolarsError::ComputeError(
+                    format!("unknown linreg_all field `{}`", name).into(),
+                ))
+            }
+        }
+    }
+    if !(2..=100000).contains(&kwargs.timeperiod) {
+        return ta_code2err(TA_RetCode::TA_BAD_PARAM);
+    }
+    let real = F64Input::new(&inputs[0])?;
+    let values = real.as_slice();
+    let lookback = kwargs.timeperiod as usize - 1;
+    let windows: Vec<LinregWindow> = (0..values.len())
+        .into_par_iter()
+        .map(|end| {
+            if end < lookback {
+                LinregWindow::NAN
+            } else {
+                linreg_window(values, end, kwargs.timeperiod, with_fit)
+            }
+        })
+        .collect();
+
+    let p = kwargs.timeperiod as f64;
+    let mut fields = Vec::with_capacity(kwargs.fields.len());
+    for name in kwargs.fields.iter() {
+        let field: fn(&LinregWindow, f64) -> f64 = match name.as_str() {
+            "linearreg" => |w, p| w.intercept + w.slope * (p - 1.0),
+            "linearreg_slope" => |w, _| w.slope,
+            "linearreg_intercept" => |w, _| w.intercept,
+            "linearreg_angle" => |w, _| w.slope.atan() * (180.0 / std::f64::consts::PI),
+            "tsf" => |w, p| w.intercept + w.slope * p,
+            "r2" => |w, _| w.r2,
+            _ => |w, _| w.resid_std,
+        };
+        let values = windows.iter().map(|w| field(w, p)).collect();
+        let mut s = float_series(values, kwargs.out_dtype);
+        s.rename(name);
+        fields.push(s);
+    }
+    let out = StructChunked::new("", &fields)?;
+    Ok(out.into_series())
+}
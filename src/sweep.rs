@@ -0,0 +1,124 @@
+use crate::grouped::RealFn;
+use crate::utils::{ta_code2err, F64Input, OutDtype, SyncPtr};
+use polars::export::arrow::array::{Array, FixedSizeListArray, PrimitiveArray};
+use polars::export::arrow::types::NativeType;
+use polars::prelude::*;
+use pyo3_polars::derive::polars_expr;
+use rayon::prelude::*;
+use serde::Deserialize;
+use talib::common::TimePeriodKwargs;
+use talib::math::{ta_max, ta_min, ta_sum};
+use talib::momentum::{ta_cmo, ta_mom, ta_roc, ta_rocp, ta_rocr, ta_rocr100, ta_rsi, ta_trix};
+use talib::overlap::{ta_dema, ta_ema, ta_kama, ta_midpoint, ta_sma, ta_tema, ta_trima, ta_wma};
+use talib_sys::TA_RetCode;
+
+#[derive(Deserialize)]
+pub struct SweepKwargs {
+    pub func: String,
+    pub timeperiods: Vec<i32>,
+    #[serde(default)]
+    pub out_dtype: OutDtype,
+}
+
+/// Single input functions whose only parameter is `timeperiod`.
+pub fn timeperiod_fn(func: &str) -> PolarsResult<RealFn> {
+    match func {
+        "cmo" => Ok(ta_cmo as RealFn),
+        "dema" => Ok(ta_dema as RealFn),
+        "ema" => Ok(ta_ema as RealFn),
+        "kama" => Ok(ta_kama as RealFn),
+        "max" => Ok(ta_max as RealFn),
+        "midpoint" => Ok(ta_midpoint as RealFn),
+        "min" => Ok(ta_min as RealFn),
+        "mom" => Ok(ta_mom as RealFn),
+        "roc" => Ok(ta_roc as RealFn),
+        "rocp" => Ok(ta_rocp as RealFn),
+        "rocr" => Ok(ta_rocr as RealFn),
+        "rocr100" => Ok(ta_rocr100 as RealFn),
+        "rsi" => Ok(ta_rsi as RealFn),
+        "sma" => Ok(ta_sma as RealFn),
+        "sum" => Ok(ta_sum as RealFn),
+        "tema" => Ok(ta_tema as RealFn),
+        "trima" => Ok(ta_trima as RealFn),
+        "trix" => Ok(ta_trix as RealFn),
+        "wma" => Ok(ta_wma as RealFn),
+        _ => Err(PolarsError::ComputeError(
+            format!("`{}` is not a single input timeperiod function", func).into(),
+        )),
+    }
+}
+
+pub fn sweep_output(input_fields: &[Field], kwargs: SweepKwargs) -> PolarsResult<Field> {
+    let dtype = DataType::Array(Box::new(kwargs.out_dtype.dtype()), kwargs.timeperiods.len());
+    Ok(Field::new(input_fields[0].name(), dtype))
+}
+
+/// `Array(T, width)` series over row-major `values`.
+fn array_series<T: NativeType>(values: Vec<T>, width: usize) -> PolarsResult<Series> {
+    let values = PrimitiveArray::from_vec(values);
+    let dtype = FixedSizeListArray::default_datatype(values.data_type().clone(), width);
+    let array = FixedSizeListArray::new(dtype, values.boxed(), None);
+    Series::from_arrow("", array.boxed())
+}
+
+/// Interleave one output per period into rows of `outs.len()` values, converted by
+/// `f` as they are written.
+fn interleave<T, F>(outs: &[Vec<f64>], len: usize, fill: T, f: F) -> Vec<T>
+where
+    T: Copy + Send + Sync,
+    F: Fn(f64) -> T + Sync,
+{
+    let width = outs.len();
+    let mut values = vec![fill; len * width];
+    values
+        .par_chunks_mut(width)
+        .enumerate()
+        .for_each(|(i, row)| {
+            for (dst, out) in row.iter_mut().zip(outs.iter()) {
+                *dst = f(out[i]);
+            }
+        });
+    values
+}
+
+/// `func` for every period of `timeperiods`, as one `Array` column with a value per
+/// period in each row.
+///
+/// The input is prepared once and the periods run in parallel, so a sweep is one plan
+/// node instead of one plugin call per period.
+#[polars_expr(output_type_func_with_kwargs=sweep_output)]
+fn timeperiod_sweep(inputs: &[Series], kwargs: SweepKwargs) -> PolarsResult<Series> {
+    let ta_func = timeperiod_fn(&kwargs.func)?;
+    if kwargs.timeperiods.is_empty() {
+        return Err(PolarsError::ComputeError(
+            "sweep needs at least one timeperiod".into(),
+        ));
+    }
+    let input = F64Input::new(&inputs[0])?;
+    let input_ptr = SyncPtr(input.ptr());
+    let len = input.len();
+    let res: Result<Vec<Vec<f64>>, TA_RetCode> = kwargs
+        .timeperiods
+        .par_iter()
+        .map(|timeperiod| {
+            let ta_kwargs = TimePeriodKwargs {
+                timeperiod: *timeperiod,
+            };
+            ta_func(input_ptr.ptr(), len, &ta_kwargs)
+        })
+        .collect();
+    match res {
+        Ok(outs) => periods_array(outs, len, kwargs.out_dtype),
+        Err(ret_code) => ta_code2err(ret_code),
+    }
+}
+
+/// One output per period as an `Array` column of `out_dtype` with a value per period in
+/// each row.
+pub fn periods_array(outs: Vec<Vec<f64>>, len: usize, out_dtype: OutDtype) -> PolarsResult<Series> {
+    let width = outs.len();
+    match out_dtype {
+        OutDtype::F64 => array_series(interleave(&outs, len, f64::NAN, |v| v), width),
+        OutDtype::F32 => array_series(interleave(&outs, len, f32::NAN, |v| v as f32), width),
+    }
+}
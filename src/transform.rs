@@ -1,71 +1,50 @@
-use crate::utils::{cast_series_to_f64, get_series_f64_ptr, ta_code2err};
+use crate::utils::{float_output, map_rows, OutDtypeKwargs};
 use polars::prelude::*;
 use pyo3_polars::derive::polars_expr;
-use talib::transform::ta_avgprice;
-use talib::transform::ta_medprice;
-use talib::transform::ta_typprice;
-use talib::transform::ta_wclprice;
 
-#[polars_expr(output_type=Float64)]
-fn avgprice(inputs: &[Series]) -> PolarsResult<Series> {
-    let open = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[3])?;
-    let (open_ptr, _open) = get_series_f64_ptr(open)?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = open.len();
-    let res = ta_avgprice(open_ptr, high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+// Price transforms run natively, chunk by chunk and keeping nulls, summing in the same
+// order as TA-Lib so the values are identical.
+
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn avgprice(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_rows(&inputs[..4], kwargs.out_dtype, |x, out| {
+        let n = out.len();
+        let (open, high, low, close) = (&x[0][..n], &x[1][..n], &x[2][..n], &x[3][..n]);
+        for i in 0..n {
+            out[i] = (high[i] + low[i] + close[i] + open[i]) / 4.0;
+        }
+    })
 }
 
-#[polars_expr(output_type=Float64)]
-fn medprice(inputs: &[Series]) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[0])?;
-    let low = &mut cast_series_to_f64(&inputs[1])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let len = high.len();
-    let res = ta_medprice(high_ptr, low_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn medprice(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_rows(&inputs[..2], kwargs.out_dtype, |x, out| {
+        let n = out.len();
+        let (high, low) = (&x[0][..n], &x[1][..n]);
+        for i in 0..n {
+            out[i] = (high[i] + low[i]) / 2.0;
+        }
+    })
 }
 
-#[polars_expr(output_type=Float64)]
-fn typprice(inputs: &[Series]) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = high.len();
-    let res = ta_typprice(high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn typprice(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_rows(&inputs[..3], kwargs.out_dtype, |x, out| {
+        let n = out.len();
+        let (close, high, low) = (&x[0][..n], &x[1][..n], &x[2][..n]);
+        for i in 0..n {
+            out[i] = (high[i] + low[i] + close[i]) / 3.0;
+        }
+    })
 }
 
-#[polars_expr(output_type=Float64)]
-fn wclprice(inputs: &[Series]) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = high.len();
-    let res = ta_wclprice(high_ptr, low_ptr, close_ptr, len);
-    match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
-        Err(ret_code) => ta_code2err(ret_code),
-    }
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn wclprice(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    map_rows(&inputs[..3], kwargs.out_dtype, |x, out| {
+        let n = out.len();
+        let (close, high, low) = (&x[0][..n], &x[1][..n], &x[2][..n]);
+        for i in 0..n {
+            out[i] = (high[i] + low[i] + (close[i] * 2.0)) / 4.0;
+        }
+    })
 }
@@ -1,28 +1,669 @@
 use polars::datatypes::DataType;
-use polars::prelude::{Float64Chunked, IntoSeries, PolarsError, PolarsResult, Series};
+use polars::export::arrow::array::PrimitiveArray;
+use polars::export::arrow::bitmap::Bitmap;
+use polars::prelude::{
+    ChunkedArray, Float32Type, Float64Chunked, Float64Type, IntoSeries, PolarsDataType,
+    PolarsError, PolarsNumericType, PolarsResult, Series,
+};
+use polars::prelude::{Field, Float32Chunked, Int16Chunked, Int32Chunked, Int8Chunked};
+use rayon::prelude::*;
+use serde::Deserialize;
+use std::collections::VecDeque;
+use std::ops::{Deref, Range};
+use std::sync::atomic::{AtomicU64, Ordering};
+use talib::common::TimePeriodKwargs;
 use talib_sys::TA_RetCode;
 
-pub fn cast_series_to_f64(series: &Series) -> PolarsResult<Series> {
-    Ok(match series.dtype() {
-        DataType::Float64 => Ok(series.clone()),
-        _ => series.cast(&DataType::Float64),
-    }?
-    .rechunk())
+static INPUT_COPIES: AtomicU64 = AtomicU64::new(0);
+static INPUT_COPY_BYTES: AtomicU64 = AtomicU64::new(0);
+
+fn record_copy(bytes: usize) {
+    INPUT_COPIES.fetch_add(1, Ordering::Relaxed);
+    INPUT_COPY_BYTES.fetch_add(bytes as u64, Ordering::Relaxed);
+}
+
+/// Number of input copies made before calling TA-Lib and their size in bytes.
+pub fn input_copy_stats() -> (u64, u64) {
+    (
+        INPUT_COPIES.load(Ordering::Relaxed),
+        INPUT_COPY_BYTES.load(Ordering::Relaxed),
+    )
+}
+
+pub fn reset_input_copy_stats() {
+    INPUT_COPIES.store(0, Ordering::Relaxed);
+    INPUT_COPY_BYTES.store(0, Ordering::Relaxed);
+}
+
+/// Element types TA-Lib reads: `f64`, and `f32` for the single precision `TA_S_*` functions.
+pub trait RealNative: Copy {
+    const NAN: Self;
+    fn from_f32(v: f32) -> Self;
+}
+
+impl RealNative for f64 {
+    const NAN: Self = f64::NAN;
+    fn from_f32(v: f32) -> Self {
+        v as f64
+    }
+}
+
+impl RealNative for f32 {
+    const NAN: Self = f32::NAN;
+    fn from_f32(v: f32) -> Self {
+        v
+    }
+}
+
+/// Append the values of `ca` to `out` in a single pass, reading nulls as NaN.
+fn extend_nan_filled<S, D, F>(out: &mut Vec<D>, ca: &ChunkedArray<S>, f: F)
+where
+    S: PolarsNumericType,
+    D: RealNative,
+    F: Fn(S::Native) -> D,
+{
+    for arr in ca.downcast_iter() {
+        match arr.validity() {
+            Some(validity) if validity.unset_bits() > 0 => out.extend(
+                arr.values()
+                    .iter()
+                    .zip(validity.iter())
+                    .map(|(v, is_valid)| if is_valid { f(*v) } else { D::NAN }),
+            ),
+            _ => out.extend(arr.values().iter().map(|v| f(*v))),
+        }
+    }
+}
+
+/// Contiguous view of an input series as TA-Lib expects it, nulls read as NaN.
+///
+/// A single-chunk series of the target dtype without nulls is read in place. Anything
+/// else (multiple chunks, nulls, another dtype) is gathered into one contiguous buffer
+/// in a single pass, and `copied` is set.
+pub struct RealInput<T: PolarsNumericType> {
+    ptr: *const T::Native,
+    len: usize,
+    _holder: Series,
+    pub copied: bool,
+}
+
+pub type F64Input = RealInput<Float64Type>;
+pub type F32Input = RealInput<Float32Type>;
+
+impl<T> RealInput<T>
+where
+    T: PolarsNumericType,
+    T::Native: RealNative,
+    ChunkedArray<T>: IntoSeries,
+{
+    pub fn new(series: &Series) -> PolarsResult<Self> {
+        let len = series.len();
+        let dtype = T::get_dtype();
+        let (holder, copied) = if series.dtype() == &dtype {
+            let ca = series.unpack::<T>()?;
+            if ca.chunks().len() == 1 && ca.null_count() == 0 {
+                (series.clone(), false)
+            } else {
+                let mut out = Vec::with_capacity(len);
+                extend_nan_filled(&mut out, ca, |v| v);
+                (ChunkedArray::<T>::from_vec("", out).into_series(), true)
+            }
+        } else if series.dtype() == &DataType::Float32 {
+            let mut out = Vec::with_capacity(len);
+            extend_nan_filled(&mut out, series.f32()?, <T::Native as RealNative>::from_f32);
+            (ChunkedArray::<T>::from_vec("", out).into_series(), true)
+        } else {
+            let casted = series.cast(&dtype)?;
+            let mut out = Vec::with_capacity(len);
+            extend_nan_filled(&mut out, casted.unpack::<T>()?, |v| v);
+            (ChunkedArray::<T>::from_vec("", out).into_series(), true)
+        };
+        if copied {
+            record_copy(len * std::mem::size_of::<T::Native>());
+        }
+        let ptr = holder.unpack::<T>()?.cont_slice()?.as_ptr();
+        Ok(RealInput {
+            ptr,
+            len,
+            _holder: holder,
+            copied,
+        })
+    }
+
+    pub fn ptr(&self) -> *const T::Native {
+        self.ptr
+    }
+
+    pub fn len(&self) -> usize {
+        self.len
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.len == 0
+    }
+
+    pub fn as_slice(&self) -> &[T::Native] {
+        unsafe { std::slice::from_raw_parts(self.ptr, self.len) }
+    }
+}
+
+/// Raw input pointer shared by TA-Lib calls running in parallel, which only read it.
+#[derive(Clone, Copy)]
+pub struct SyncPtr<T>(pub *const T);
+
+unsafe impl<T> Send for SyncPtr<T> {}
+unsafe impl<T> Sync for SyncPtr<T> {}
+
+impl<T> SyncPtr<T> {
+    /// Read through a method so closures capture the whole `SyncPtr`, not the bare
+    /// pointer field.
+    pub fn ptr(self) -> *const T {
+        self.0
+    }
+}
+
+/// Whether every series is `Float32`, so TA-Lib's single precision functions can
+/// read them without widening.
+pub fn all_f32(inputs: &[Series]) -> bool {
+    inputs.iter().all(|s| s.dtype() == &DataType::Float32)
+}
+
+/// Dtype of the values written by a Float64 indicator, `f64` unless asked otherwise.
+#[derive(Deserialize, Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub enum OutDtype {
+    #[default]
+    #[serde(rename = "f64")]
+    F64,
+    #[serde(rename = "f32")]
+    F32,
+}
+
+impl OutDtype {
+    pub fn dtype(&self) -> DataType {
+        match self {
+            OutDtype::F64 => DataType::Float64,
+            OutDtype::F32 => DataType::Float32,
+        }
+    }
+}
+
+/// Dtype of a candlestick pattern column: the raw TA-Lib values as Int32 or Int16,
+/// or Int8 with the values divided by 100 (-2, -1, 0, 1, 2).
+#[derive(Deserialize, Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub enum CdlOutDtype {
+    #[default]
+    #[serde(rename = "i32")]
+    I32,
+    #[serde(rename = "i16")]
+    I16,
+    #[serde(rename = "i8")]
+    I8,
+}
+
+impl CdlOutDtype {
+    pub fn dtype(&self) -> DataType {
+        match self {
+            CdlOutDtype::I32 => DataType::Int32,
+            CdlOutDtype::I16 => DataType::Int16,
+            CdlOutDtype::I8 => DataType::Int8,
+        }
+    }
+}
+
+/// Kwargs of an indicator without parameters of its own.
+#[derive(Deserialize)]
+pub struct OutDtypeKwargs<D = OutDtype> {
+    #[serde(default)]
+    pub out_dtype: D,
+}
+
+/// Indicator kwargs `K` plus `out_dtype`, dereferences to `K`.
+#[derive(Deserialize)]
+pub struct OutKwargs<K, D = OutDtype> {
+    #[serde(flatten)]
+    pub kwargs: K,
+    #[serde(default)]
+    pub out_dtype: D,
+}
+
+impl<K, D> Deref for OutKwargs<K, D> {
+    type Target = K;
+
+    fn deref(&self) -> &K {
+        &self.kwargs
+    }
+}
+
+pub fn float_output(input_fields: &[Field], kwargs: OutDtypeKwargs) -> PolarsResult<Field> {
+    Ok(Field::new(input_fields[0].name(), kwargs.out_dtype.dtype()))
+}
+
+/// Rows per chunk of a series narrowed by `narrow_chunks`.
+const NARROW_CHUNK_ROWS: usize = 1 << 20;
+
+/// Rows of the reused Float64 block `map_rows` computes before narrowing to f32.
+const NARROW_BLOCK_ROWS: usize = 1 << 12;
+
+/// TA-Lib's output narrowed by `f` into chunks of `NARROW_CHUNK_ROWS` rows, with their
+/// first row, in row order.
+///
+/// TA-Lib always writes f64 (also from its `TA_S_*` entry points) or i32. The chunks
+/// are narrowed from the end and each chunk's rows are released from `out` before the
+/// next is narrowed, so the full wide and narrow outputs never coexist: the peak is the
+/// wide output plus one chunk with an allocator that shrinks in place, as jemalloc does.
+fn narrow_chunks<S, D, F>(mut out: Vec<S>, f: F) -> Vec<(usize, Vec<D>)>
+where
+    S: Copy,
+    F: Fn(S) -> D,
+{
+    let mut chunks = Vec::with_capacity(out.len() / NARROW_CHUNK_ROWS + 1);
+    loop {
+        let start = out.len().saturating_sub(1) / NARROW_CHUNK_ROWS * NARROW_CHUNK_ROWS;
+        chunks.push((start, out[start..].iter().map(|v| f(*v)).collect()));
+        out.truncate(start);
+        out.shrink_to_fit();
+        if start == 0 {
+            break;
+        }
+    }
+    chunks.reverse();
+    chunks
+}
+
+/// Wrap TA-Lib's output as a series of `out_dtype`, Float32 narrowed by `narrow_chunks`
+/// instead of through a cast of a full Float64 column afterwards.
+pub fn float_series(out: Vec<f64>, out_dtype: OutDtype) -> Series {
+    match out_dtype {
+        OutDtype::F64 => Float64Chunked::from_vec("", out).into_series(),
+        OutDtype::F32 => Float32Chunked::from_chunk_iter(
+            "",
+            narrow_chunks(out, |v| v as f32)
+                .into_iter()
+                .map(|(_, chunk)| PrimitiveArray::from_vec(chunk)),
+        )
+        .into_series(),
+    }
+}
+
+/// Like `float_series`, with the rows outside `range` set to null.
+pub fn float_series_in(out: Vec<f64>, out_dtype: OutDtype, range: Range<usize>) -> Series {
+    let validity = |start: usize, len: usize| {
+        Bitmap::from_iter((start..start + len).map(|i| range.contains(&i)))
+    };
+    match out_dtype {
+        OutDtype::F64 => {
+            let validity = validity(0, out.len());
+            Float64Chunked::from_vec_validity("", out, Some(validity)).into_series()
+        }
+        OutDtype::F32 => Float32Chunked::from_chunk_iter(
+            "",
+            narrow_chunks(out, |v| v as f32)
+                .into_iter()
+                .map(|(start, chunk)| {
+                    let validity = validity(start, chunk.len());
+                    PrimitiveArray::from_vec(chunk).with_validity(Some(validity))
+                }),
+        )
+        .into_series(),
+    }
+}
+
+/// Struct of `names`, every field of `out_dtype`, for the fused multi-output kernels.
+pub fn struct_fields_output(names: &[String], out_dtype: OutDtype) -> PolarsResult<Field> {
+    let fields = names
+        .iter()
+        .map(|name| Field::new(name, out_dtype.dtype()))
+        .collect();
+    Ok(Field::new("", DataType::Struct(fields)))
+}
+
+pub fn cdl_output(
+    input_fields: &[Field],
+    kwargs: OutDtypeKwargs<CdlOutDtype>,
+) -> PolarsResult<Field> {
+    Ok(Field::new(input_fields[0].name(), kwargs.out_dtype.dtype()))
+}
+
+/// Wrap a candlestick pattern output as a series of `out_dtype`, Int16 and Int8
+/// narrowed by `narrow_chunks`.
+pub fn cdl_series(out: Vec<i32>, out_dtype: CdlOutDtype) -> Series {
+    match out_dtype {
+        CdlOutDtype::I32 => Int32Chunked::from_vec("", out).into_series(),
+        CdlOutDtype::I16 => Int16Chunked::from_chunk_iter(
+            "",
+            narrow_chunks(out, |v| v as i16)
+                .into_iter()
+                .map(|(_, chunk)| PrimitiveArray::from_vec(chunk)),
+        )
+        .into_series(),
+        CdlOutDtype::I8 => Int8Chunked::from_chunk_iter(
+            "",
+            narrow_chunks(out, |v| (v / 100) as i8)
+                .into_iter()
+                .map(|(_, chunk)| PrimitiveArray::from_vec(chunk)),
+        )
+        .into_series(),
+    }
+}
+
+/// Float64 views of `inputs` with one chunk layout, a length 1 input (a literal)
+/// broadcast to the others.
+fn aligned_f64(inputs: &[Series]) -> PolarsResult<Vec<Float64Chunked>> {
+    let len = inputs.iter().map(|s| s.len()).max().unwrap_or(0);
+    let mut cas = Vec::with_capacity(inputs.len());
+    for series in inputs {
+        let series = if series.len() == len {
+            series.clone()
+        } else if series.len() == 1 {
+            series.new_from_index(0, len)
+        } else {
+            return Err(PolarsError::ShapeMismatch(
+                format!("inputs of length {} and {}", series.len(), len).into(),
+            ));
+        };
+        let series = if series.dtype() == &DataType::Float64 {
+            series
+        } else {
+            record_copy(len * std::mem::size_of::<f64>());
+            series.cast(&DataType::Float64)?
+        };
+        cas.push(series.f64()?.clone());
+    }
+    let layout: Vec<usize> = cas[0].chunk_lengths().collect();
+    if cas
+        .iter()
+        .any(|ca| !ca.chunk_lengths().eq(layout.iter().copied()))
+    {
+        for ca in cas.iter_mut() {
+            if ca.chunks().len() > 1 {
+                record_copy(len * std::mem::size_of::<f64>());
+                *ca = ca.rechunk();
+            }
+        }
+    }
+    Ok(cas)
+}
+
+/// Apply the per-row kernel `f` to `inputs` one Arrow chunk at a time.
+///
+/// `f` gets the value slices of a chunk of every input and writes the chunk's output,
+/// a plain loop the compiler vectorizes. Nulls are not NaN-filled: the output of a
+/// row is null when any input is null there, through the AND of the input validity
+/// bitmaps, and the values behind null slots are computed over and masked.
+pub fn map_rows<F>(inputs: &[Series], out_dtype: OutDtype, f: F) -> PolarsResult<Series>
+where
+    F: Fn(&[&[f64]], &mut [f64]),
+{
+    let cas = aligned_f64(inputs)?;
+    if cas[0].is_empty() {
+        return Ok(Series::new_empty("", &out_dtype.dtype()));
+    }
+    let chunks: Vec<Vec<&PrimitiveArray<f64>>> =
+        cas.iter().map(|ca| ca.downcast_iter().collect()).collect();
+    let rows = (0..chunks[0].len()).map(|i| {
+        let arrays: Vec<&PrimitiveArray<f64>> = chunks.iter().map(|c| c[i]).collect();
+        let values: Vec<&[f64]> = arrays.iter().map(|arr| arr.values().as_slice()).collect();
+        let validity = arrays.iter().fold(None, |acc: Option<Bitmap>, arr| {
+            match (acc, arr.validity()) {
+                (None, validity) => validity.cloned(),
+                (Some(acc), None) => Some(acc),
+                (Some(acc), Some(validity)) => Some(&acc & validity),
+            }
+        });
+        (values, validity)
+    });
+    Ok(match out_dtype {
+        OutDtype::F64 => Float64Chunked::from_chunk_iter(
+            "",
+            rows.map(|(values, validity)| {
+                let mut out = vec![0.0; values[0].len()];
+                f(&values, &mut out);
+                PrimitiveArray::from_vec(out).with_validity(validity)
+            }),
+        )
+        .into_series(),
+        OutDtype::F32 => {
+            // computed a block at a time into `block` and narrowed from there
+            let mut block = vec![0.0; NARROW_BLOCK_ROWS];
+            Float32Chunked::from_chunk_iter(
+                "",
+                rows.map(|(values, validity)| {
+                    let len = values[0].len();
+                    let mut out = Vec::with_capacity(len);
+                    for start in (0..len).step_by(NARROW_BLOCK_ROWS) {
+                        let end = (start + NARROW_BLOCK_ROWS).min(len);
+                        let part: Vec<&[f64]> = values.iter().map(|v| &v[start..end]).collect();
+                        let block = &mut block[..end - start];
+                        f(&part, block);
+                        out.extend(block.iter().map(|v| *v as f32));
+                    }
+                    PrimitiveArray::from_vec(out).with_validity(validity)
+                }),
+            )
+            .into_series()
+        }
+    })
+}
+
+/// `map_rows` of a function of one value.
+pub fn map_unary<G>(inputs: &[Series], out_dtype: OutDtype, g: G) -> PolarsResult<Series>
+where
+    G: Fn(f64) -> f64,
+{
+    map_rows(&inputs[..1], out_dtype, |x, out| {
+        for (o, v) in out.iter_mut().zip(x[0]) {
+            *o = g(*v);
+        }
+    })
+}
+
+/// `map_rows` of a function of two values.
+pub fn map_binary<G>(inputs: &[Series], out_dtype: OutDtype, g: G) -> PolarsResult<Series>
+where
+    G: Fn(f64, f64) -> f64,
+{
+    map_rows(&inputs[..2], out_dtype, |x, out| {
+        for ((o, a), b) in out.iter_mut().zip(x[0]).zip(x[1]) {
+            *o = g(*a, *b);
+        }
+    })
+}
+
+/// First index from which none of `values` is NaN, and whether they stay NaN-free
+/// after it.
+pub fn clean_begin(values: &[&[f64]]) -> (usize, bool) {
+    let len = values[0].len();
+    let is_nan = |i: usize| values.iter().any(|v| v[i].is_nan());
+    let begin = (0..len).find(|i| !is_nan(*i)).unwrap_or(len);
+    (begin, !(begin..len).any(is_nan))
+}
+
+/// Largest `timeperiod` TA-Lib accepts.
+const MAX_TIMEPERIOD: i32 = 100_000;
+
+/// Implementation of a function that has a native kernel besides TA-Lib.
+#[derive(Deserialize, Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub enum Engine {
+    #[default]
+    #[serde(rename = "native")]
+    Native,
+    #[serde(rename = "talib")]
+    Talib,
+}
+
+/// Kwargs of a function without parameters of its own, for `EngineKwargs`.
+#[derive(Deserialize)]
+pub struct NoKwargs {}
+
+/// Indicator kwargs `K` plus the `engine` to run, dereferences to `K`.
+#[derive(Deserialize)]
+pub struct EngineKwargs<K = TimePeriodKwargs> {
+    #[serde(flatten)]
+    pub kwargs: K,
+    #[serde(default)]
+    pub engine: Engine,
+}
+
+impl<K> Deref for EngineKwargs<K> {
+    type Target = K;
+
+    fn deref(&self) -> &K {
+        &self.kwargs
+    }
+}
+
+/// First row of the native rolling kernels over `values`, `None` when TA-Lib runs
+/// instead: `engine` asks for it, TA-Lib would reject `timeperiod`, or NaN follows the
+/// leading NaNs. All NaN input is left to TA-Lib too, which rejects it.
+pub fn native_begin(engine: Engine, timeperiod: i32, values: &[&[f64]]) -> Option<usize> {
+    if engine != Engine::Native || !(2..=MAX_TIMEPERIOD).contains(&timeperiod) {
+        return None;
+    }
+    match clean_begin(values) {
+        (begin, true) if begin < values[0].len() => Some(begin),
+        _ => None,
+    }
+}
+
+/// Which of several equal extremes in a window `rolling_extreme_index` picks.
+#[derive(Clone, Copy, PartialEq, Eq)]
+pub enum Ties {
+    /// As TA-Lib's MAX / MIN family: the first one when the window is rescanned after
+    /// its extreme left it, otherwise a new value equal to the extreme takes over.
+    Rescan,
+    /// The latest one, as AROON.
+    Latest,
+}
+
+/// Index of the maximum (`max`) or minimum of every `window` values of `values[begin..]`,
+/// one per full window, the first for the window ending at `begin + window - 1`.
+///
+/// Uses a monotonic deque, so each value is pushed and popped once whatever the window
+/// or the trend, where TA-Lib rescans the window each time its extreme leaves it. The
+/// index among equal extremes follows `ties`. Needs `values[begin..]` without NaN.
+pub fn rolling_extreme_index(
+    values: &[f64],
+    begin: usize,
+    window: usize,
+    max: bool,
+    ties: Ties,
+) -> Vec<usize> {
+    let beats = |a: f64, b: f64| if max { a > b } else { a < b };
+    let first = begin + window - 1;
+    let mut out = Vec::with_capacity(values.len().saturating_sub(first));
+    let mut deque: VecDeque<usize> = VecDeque::with_capacity(window + 1);
+    let mut extreme: Option<usize> = None;
+    for (i, &v) in values.iter().enumerate().skip(begin) {
+        while let Some(&back) = deque.back() {
+            let dominated = match ties {
+                Ties::Rescan => beats(v, values[back]),
+                Ties::Latest => !beats(values[back], v),
+            };
+            if !dominated {
+                break;
+            }
+            deque.pop_back();
+        }
+        deque.push_back(i);
+        if i < first {
+            continue;
+        }
+        let trailing = i + 1 - window;
+        while deque[0] < trailing {
+            deque.pop_front();
+        }
+        let idx = match (ties, extreme) {
+            (Ties::Rescan, Some(e)) if e >= trailing && beats(values[e], v) => e,
+            (Ties::Rescan, Some(e)) if e >= trailing => i,
+            _ => deque[0],
+        };
+        extreme = Some(idx);
+        out.push(idx);
+    }
+    out
+}
+
+/// Rolling maximum (`max`) or minimum over `period` values of `values[begin..]`, NaN
+/// before the first full window.
+///
+/// The extreme of a window is one of its values, so the result equals TA-Lib's
+/// rescanning loops as long as `values[begin..]` has no NaN.
+pub fn rolling_extreme(values: &[f64], begin: usize, period: usize, max: bool) -> Vec<f64> {
+    let mut out = vec![f64::NAN; values.len()];
+    let first = begin + period - 1;
+    for (dst, idx) in out.iter_mut().skip(first).zip(rolling_extreme_index(
+        values,
+        begin,
+        period,
+        max,
+        Ties::Rescan,
+    )) {
+        *dst = values[idx];
+    }
+    out
 }
 
-pub fn get_series_f64_ptr(series: &mut Series) -> PolarsResult<(*const f64, Option<Series>)> {
-    if series.has_validity() {
-        let v: Float64Chunked = series
-            .f64()?
-            .apply_generic(|x| Some(x.unwrap_or(std::f64::NAN)));
-        let mut ser = v.into_series();
-        Ok((ser.as_single_ptr()? as *const f64, Some(ser)))
-    } else {
-        Ok((series.as_single_ptr()? as *const f64, None))
+/// Rolling maximum (`max`) or minimum of `values[begin..]` for every period of `periods`,
+/// each as `rolling_extreme` would give it.
+///
+/// Builds a sparse table level by level, level `k` holding the extreme of each `2^k`
+/// rows, and answers a period `p` from level `floor(log2(p))` as the extreme of the two
+/// blocks covering its window. Each output is one comparison whatever the period, and
+/// only the current level is kept. Needs `values[begin..]` without NaN.
+pub fn rolling_extremes(
+    values: &[f64],
+    begin: usize,
+    periods: &[usize],
+    max: bool,
+) -> Vec<Vec<f64>> {
+    let pick = |a: f64, b: f64| {
+        if (max && b > a) || (!max && b < a) {
+            b
+        } else {
+            a
+        }
+    };
+    let len = values.len();
+    let mut order: Vec<usize> = (0..periods.len()).collect();
+    order.sort_by_key(|&j| periods[j]);
+    let mut outs: Vec<Vec<f64>> = vec![Vec::new(); periods.len()];
+    let mut level = values[begin.min(len)..].to_vec();
+    let mut block = 1;
+    let mut next = 0;
+    while next < order.len() {
+        while block * 2 <= periods[order[next]] {
+            let n = level.len().saturating_sub(block);
+            for i in 0..n {
+                level[i] = pick(level[i], level[i + block]);
+            }
+            level.truncate(n);
+            block *= 2;
+        }
+        let same_level = order[next..]
+            .iter()
+            .take_while(|&&j| periods[j] < block * 2)
+            .count();
+        let done: Vec<(usize, Vec<f64>)> = order[next..next + same_level]
+            .par_iter()
+            .map(|&j| {
+                let period = periods[j];
+                let mut out = vec![f64::NAN; len];
+                for (i, dst) in out.iter_mut().enumerate().skip(begin + period - 1) {
+                    let end = i + 1 - begin;
+                    *dst = pick(level[end - period], level[end - block]);
+                }
+                (j, out)
+            })
+            .collect();
+        for (j, out) in done {
+            outs[j] = out;
+        }
+        next += same_level;
     }
+    outs
 }
 
-pub fn ta_code2err(ret_code: TA_RetCode) -> PolarsResult<Series> {
+pub fn ta_code2err<T>(ret_code: TA_RetCode) -> PolarsResult<T> {
     Err(PolarsError::ComputeError(
         format!("Could not compute indicator, err: {:?}", ret_code).into(),
     ))
@@ -1,57 +1,354 @@
-use crate::utils::{cast_series_to_f64, get_series_f64_ptr, ta_code2err};
+use crate::scan::{scan_start, wilder_scan};
+use crate::utils::{
+    clean_begin, float_output, float_series, struct_fields_output, ta_code2err, EngineKwargs,
+    F64Input, OutDtype, OutDtypeKwargs, OutKwargs, SyncPtr,
+};
 use polars::prelude::*;
 use pyo3_polars::derive::polars_expr;
+use rayon::prelude::*;
+use serde::Deserialize;
+use talib::overlap::{ta_ma, ta_ma_lookback, MaKwargs};
 use talib::volatility::{ta_atr, ta_natr, ta_trange, ATRKwargs, NATRKwargs};
+use talib_sys::{TA_MAType, TA_RetCode};
 
-#[polars_expr(output_type=Float64)]
-fn atr(inputs: &[Series], kwargs: ATRKwargs) -> PolarsResult<Series> {
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let len = close.len();
-    let res = ta_atr(high_ptr, low_ptr, close_ptr, len, &kwargs);
+/// Wilder's smoothing of the true range as a parallel scan on a long series unless
+/// `engine="talib"`, within `SCAN_TOLERANCE` of TA-Lib.
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn atr(inputs: &[Series], kwargs: OutKwargs<EngineKwargs<ATRKwargs>>) -> PolarsResult<Series> {
+    let close = F64Input::new(&inputs[0])?;
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let (close_values, high_values, low_values) =
+        (close.as_slice(), high.as_slice(), low.as_slice());
+    let params = [("timeperiod", kwargs.timeperiod)];
+    let prices = [high_values, low_values, close_values];
+    let res = match scan_start(kwargs.engine, "atr", &params, &prices) {
+        Some((begin, lookback)) if kwargs.timeperiod > 1 => {
+            let tr = true_range(high_values, low_values, close_values, begin);
+            let period = kwargs.timeperiod as usize;
+            Ok(wilder_scan(&tr, begin + period, period, begin + lookback))
+        }
+        _ => ta_atr(high.ptr(), low.ptr(), close.ptr(), close.len(), &kwargs),
+    };
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn trange(inputs: &[Series]) -> PolarsResult<Series> {
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn trange(inputs: &[Series], kwargs: OutDtypeKwargs) -> PolarsResult<Series> {
+    let close = F64Input::new(&inputs[0])?;
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
+    let close_ptr = close.ptr();
     let len = close.len();
     let res = ta_trange(high_ptr, low_ptr, close_ptr, len);
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn natr(inputs: &[Series], kwargs: NATRKwargs) -> PolarsResult<Series> {
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn natr(inputs: &[Series], kwargs: OutKwargs<NATRKwargs>) -> PolarsResult<Series> {
+    let close = F64Input::new(&inputs[0])?;
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let high_ptr = high.ptr();
+    let low_ptr = low.ptr();
+    let close_ptr = close.ptr();
     let len = close.len();
 
     let res = ta_natr(high_ptr, low_ptr, close_ptr, len, &kwargs);
 
     match res {
-        Ok(out) => {
-            let out_ser = Float64Chunked::from_vec("", out);
-            Ok(out_ser.into_series())
-        }
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
+
+#[derive(Deserialize)]
+pub struct VolatilityField {
+    pub name: String,
+    pub kind: String,
+    #[serde(default)]
+    pub timeperiod: i32,
+    #[serde(default)]
+    pub nbdev: f64,
+}
+
+#[derive(Deserialize)]
+pub struct VolatilityAllKwargs {
+    pub fields: Vec<VolatilityField>,
+    pub matype: TA_MAType,
+    #[serde(default)]
+    pub out_dtype: OutDtype,
+}
+
+pub fn volatility_all_output(_: &[Field], kwargs: VolatilityAllKwargs) -> PolarsResult<Field> {
+    let names: Vec<String> = kwargs.fields.iter().map(|f| f.name.clone()).collect();
+    struct_fields_output(&names, kwargs.out_dtype)
+}
+
+/// TA-Lib's true range, defined from `begin + 1`.
+fn true_range(high: &[f64], low: &[f64], close: &[f64], begin: usize) -> Vec<f64> {
+    let mut out = vec![f64::NAN; close.len()];
+    out.par_iter_mut()
+        .enumerate()
+        .skip(begin + 1)
+        .for_each(|(i, dst)| {
+            let mut greatest = high[i] - low[i];
+            let val2 = (close[i - 1] - high[i]).abs();
+            if val2 > greatest {
+                greatest = val2;
+            }
+            let val3 = (close[i - 1] - low[i]).abs();
+            if val3 > greatest {
+                greatest = val3;
+            }
+            *dst = greatest;
+        });
+    out
+}
+
+/// Wilder's ATR over a true range starting at `begin + 1`, seeded with the mean of the
+/// first `timeperiod` true ranges as TA-Lib does. A period of 1 is the true range.
+fn wilder_atr(tr: &[f64], begin: usize, timeperiod: usize) -> Vec<f64> {
+    if timeperiod <= 1 {
+        return tr.to_vec();
+    }
+    let mut out = vec![f64::NAN; tr.len()];
+    let first = begin + timeperiod;
+    if first >= tr.len() {
+        return out;
+    }
+    let mut total = 0.0;
+    for v in tr[begin + 1..=first].iter() {
+        total += v;
+    }
+    let mut prev = total / timeperiod as f64;
+    out[first] = prev;
+    for i in first + 1..tr.len() {
+        prev *= (timeperiod - 1) as f64;
+        prev += tr[i];
+        prev /= timeperiod as f64;
+        out[i] = prev;
+    }
+    out
+}
+
+/// NATR from ATR, `(atr / close) * 100` and 0 on a zero close. TA-Lib's NATR returns the
+/// bare true range for a period of 1, and so does this.
+fn natr_from_atr(atr: &[f64], close: &[f64], begin: usize, timeperiod: usize) -> Vec<f64> {
+    if timeperiod <= 1 {
+        return atr.to_vec();
+    }
+    (0..atr.len())
+        .map(|i| {
+            if i < begin + timeperiod {
+                f64::NAN
+            } else if -0.00000001 < close[i] && close[i] < 0.00000001 {
+                0.0
+            } else {
+                (atr[i] / close[i]) * 100.0
+            }
+        })
+        .collect()
+}
+
+/// Rolling mean and variance `E[x^2] - E[x]^2` with the running sums of TA-Lib's SMA /
+/// VAR, started at `start`. These are the moments behind VAR, STDDEV and SMA BBANDS.
+fn rolling_moments(values: &[f64], start: usize, timeperiod: usize) -> (Vec<f64>, Vec<f64>) {
+    let mut mean = vec![f64::NAN; values.len()];
+    let mut var = vec![f64::NAN; values.len()];
+    let (mut total1, mut total2) = (0.0, 0.0);
+    let mut trailing = start;
+    for i in start..values.len() {
+        let v = values[i];
+        total1 += v;
+        total2 += v * v;
+        if i + 1 >= start + timeperiod {
+            let mean1 = total1 / timeperiod as f64;
+            let mean2 = total2 / timeperiod as f64;
+            mean[i] = mean1;
+            var[i] = mean2 - mean1 * mean1;
+            let t = values[trailing];
+            trailing += 1;
+            total1 -= t;
+            total2 -= t * t;
+        }
+    }
+    (mean, var)
+}
+
+/// TA-Lib's standard deviation from a variance, 0 below 1e-8.
+fn stddev_from_var(var: f64) -> f64 {
+    if var < 0.00000001 {
+        0.0
+    } else {
+        var.sqrt()
+    }
+}
+
+#[derive(Clone, Copy, PartialEq)]
+enum VolTask {
+    Atr(usize),
+    /// Moments over `timeperiod` with the running sums started at an index.
+    Moments(usize, usize),
+    Ma(i32),
+}
+
+enum VolOut {
+    Real(Vec<f64>),
+    Moments(Vec<f64>, Vec<f64>),
+}
+
+/// True range, ATR / NATR and rolling mean / variance / Bollinger Bands in one struct.
+///
+/// The true range is computed once, ATR once per distinct period (NATR divides it by
+/// close), and the rolling sums of close and close^2 once per distinct period; VAR,
+/// STDDEV and every requested band multiplier are derived from those moments. The
+/// arithmetic follows TA-Lib, so each field is bit-identical to its single function.
+#[polars_expr(output_type_func_with_kwargs=volatility_all_output)]
+fn volatility_all(inputs: &[Series], kwargs: VolatilityAllKwargs) -> PolarsResult<Series> {
+    let close = F64Input::new(&inputs[0])?;
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let (close_values, high_values, low_values) =
+        (close.as_slice(), high.as_slice(), low.as_slice());
+    let len = close.len();
+    let (hlc_begin, _) = clean_begin(&[high_values, low_values, close_values]);
+    let (close_begin, _) = clean_begin(&[close_values]);
+
+    // Running sums of the bands start where the middle band's moving average does, as
+    // TA-Lib's BBANDS asks STDDEV for output from there.
+    let band_start = |timeperiod: i32| {
+        let ma_lookback = ta_ma_lookback(&MaKwargs {
+            timeperiod,
+            matype: kwargs.matype,
+        });
+        close_begin + (ma_lookback - (timeperiod - 1)).max(0) as usize
+    };
+    let mut tasks: Vec<VolTask> = Vec::new();
+    let mut push = |task: VolTask| {
+        if !tasks.contains(&task) {
+            tasks.push(task);
+        }
+    };
+    for field in kwargs.fields.iter() {
+        let p = field.timeperiod;
+        let min_period = match field.kind.as_str() {
+            "trange" => 0,
+            "atr" | "natr" => 1,
+            "var" => 1,
+            "stddev" | "middleband" | "upperband" | "lowerband" => 2,
+            _ => {
+                return Err(PolarsError::ComputeError(
+                    format!("unknown volatility_all field kind `{}`", field.kind).into(),
+                ))
+            }
+        };
+        if field.kind != "trange" && !(min_period..=100000).contains(&p) {
+            return ta_code2err(TA_RetCode::TA_BAD_PARAM);
+        }
+        match field.kind.as_str() {
+            "trange" => {}
+            "atr" | "natr" => push(VolTask::Atr(p as usize)),
+            "var" | "stddev" => push(VolTask::Moments(p as usize, close_begin)),
+            _ => {
+                if kwargs.matype == 0 {
+                    push(VolTask::Moments(p as usize, close_begin));
+                } else {
+                    push(VolTask::Ma(p));
+                }
+                if field.kind != "middleband" {
+                    push(VolTask::Moments(p as usize, band_start(p)));
+                }
+            }
+        }
+    }
+
+    let tr = true_range(high_values, low_values, close_values, hlc_begin);
+    let close_ptr = SyncPtr(close.ptr());
+    let res: Result<Vec<VolOut>, TA_RetCode> = tasks
+        .par_iter()
+        .map(|task| match *task {
+            VolTask::Atr(p) => Ok(VolOut::Real(wilder_atr(&tr, hlc_begin, p))),
+            VolTask::Moments(p, start) => {
+                let (mean, var) = rolling_moments(close_values, start, p);
+                Ok(VolOut::Moments(mean, var))
+            }
+            VolTask::Ma(p) => {
+                let ma_kwargs = MaKwargs {
+                    timeperiod: p,
+                    matype: kwargs.matype,
+                };
+                ta_ma(close_ptr.ptr(), len, &ma_kwargs).map(VolOut::Real)
+            }
+        })
+        .collect();
+    let outs = match res {
+        Ok(outs) => outs,
+        Err(ret_code) => return ta_code2err(ret_code),
+    };
+    let out = |task: VolTask| &outs[tasks.iter().position(|t| *t == task).unwrap()];
+    let real = |task: VolTask| match out(task) {
+        VolOut::Real(v) => v,
+        VolOut::Moments(mean, _) => mean,
+    };
+    let var = |task: VolTask| match out(task) {
+        VolOut::Moments(_, var) => var,
+        VolOut::Real(_) => unreachable!(),
+    };
+    let middle = |p: i32| {
+        if kwargs.matype == 0 {
+            real(VolTask::Moments(p as usize, close_begin))
+        } else {
+            real(VolTask::Ma(p))
+        }
+    };
+
+    let mut fields = Vec::with_capacity(kwargs.fields.len());
+    for field in kwargs.fields.iter() {
+        let p = field.timeperiod;
+        let values: Vec<f64> = match field.kind.as_str() {
+            "trange" => tr.clone(),
+            "atr" => real(VolTask::Atr(p as usize)).clone(),
+            "natr" => natr_from_atr(
+                real(VolTask::Atr(p as usize)),
+                close_values,
+                hlc_begin,
+                p as usize,
+            ),
+            "var" => var(VolTask::Moments(p as usize, close_begin)).clone(),
+            "stddev" => var(VolTask::Moments(p as usize, close_begin))
+                .iter()
+                .map(|v| stddev_from_var(*v))
+                .collect(),
+            "middleband" => middle(p).clone(),
+            kind => {
+                let band_var = var(VolTask::Moments(p as usize, band_start(p)));
+                middle(p)
+                    .iter()
+                    .zip(band_var.iter())
+                    .map(|(m, v)| {
+                        let dev = stddev_from_var(*v) * field.nbdev;
+                        if kind == "upperband" {
+                            m + dev
+                        } else {
+                            m - dev
+                        }
+                    })
+                    .collect()
+            }
+        };
+        let mut s = float_series(values, kwargs.out_dtype);
+        s.rename(&field.name);
+        fields.push(s);
+    }
+    let out = StructChunked::new("", &fields)?;
+    Ok(out.into_series())
+}
@@ -1,54 +1,145 @@
-use crate::utils::{cast_series_to_f64, get_series_f64_ptr, ta_code2err};
+use crate::scan::{linear_scan, scan_start};
+use crate::utils::{
+    float_output, float_series, ta_code2err, EngineKwargs, F64Input, NoKwargs, OutKwargs,
+};
 use polars::prelude::*;
 use pyo3_polars::derive::polars_expr;
+use rayon::prelude::*;
 use talib::volume::{ta_ad, ta_adosc, ta_obv, ADOSCKwargs};
 
-#[polars_expr(output_type=Float64)]
-fn obv(inputs: &[Series]) -> PolarsResult<Series> {
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let volume = &mut cast_series_to_f64(&inputs[1])?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let (volume_ptr, _volume) = get_series_f64_ptr(volume)?;
-    let len = close.len();
-    let res = ta_obv(close_ptr, volume_ptr, len);
+// On a long series OBV, AD and ADOSC run as parallel scans of their recurrences unless
+// `engine="talib"`, within `SCAN_TOLERANCE` of TA-Lib.
+
+/// TA-Lib's OBV of `close[begin..]` and `volume[begin..]`: the first volume, then the
+/// volume added on a higher close and subtracted on a lower one.
+fn obv_scan(close: &[f64], volume: &[f64], begin: usize) -> Vec<f64> {
+    let mut out = vec![f64::NAN; close.len()];
+    out.par_iter_mut()
+        .enumerate()
+        .skip(begin + 1)
+        .for_each(|(i, dst)| {
+            *dst = if close[i] > close[i - 1] {
+                volume[i]
+            } else if close[i] < close[i - 1] {
+                -volume[i]
+            } else {
+                0.0
+            };
+        });
+    out[begin] = volume[begin];
+    linear_scan(1.0, volume[begin], &mut out[begin + 1..]);
+    out
+}
+
+/// TA-Lib's AD line of the rows from `begin`: the running sum of the close location
+/// value times the volume, nothing added on a bar without range.
+fn ad_scan(high: &[f64], low: &[f64], close: &[f64], volume: &[f64], begin: usize) -> Vec<f64> {
+    let mut out = vec![f64::NAN; close.len()];
+    out.par_iter_mut()
+        .enumerate()
+        .skip(begin)
+        .for_each(|(i, dst)| {
+            let range = high[i] - low[i];
+            *dst = if range > 0.0 {
+                (((close[i] - low[i]) - (high[i] - close[i])) / range) * volume[i]
+            } else {
+                0.0
+            };
+        });
+    linear_scan(1.0, 0.0, &mut out[begin..]);
+    out
+}
+
+/// EMA of the AD line as ADOSC runs it, seeded with the AD value at `begin`.
+fn ad_ema(ad: &[f64], begin: usize, period: i32) -> Vec<f64> {
+    let k = 2.0 / (period as f64 + 1.0);
+    let mut out = vec![f64::NAN; ad.len()];
+    out[begin] = ad[begin];
+    out.par_iter_mut()
+        .zip(ad.par_iter())
+        .skip(begin + 1)
+        .for_each(|(dst, v)| *dst = k * v);
+    linear_scan(1.0 - k, ad[begin], &mut out[begin + 1..]);
+    out
+}
+
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn obv(inputs: &[Series], kwargs: OutKwargs<EngineKwargs<NoKwargs>>) -> PolarsResult<Series> {
+    let close = F64Input::new(&inputs[0])?;
+    let volume = F64Input::new(&inputs[1])?;
+    let (close_values, volume_values) = (close.as_slice(), volume.as_slice());
+    let res = match scan_start(kwargs.engine, "obv", &[], &[close_values, volume_values]) {
+        Some((begin, _)) => Ok(obv_scan(close_values, volume_values, begin)),
+        None => ta_obv(close.ptr(), volume.ptr(), close.len()),
+    };
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn ad(inputs: &[Series]) -> PolarsResult<Series> {
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let volume = &mut cast_series_to_f64(&inputs[3])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let (volume_ptr, _volume) = get_series_f64_ptr(volume)?;
-    let len = high.len();
-    let res = ta_ad(high_ptr, low_ptr, close_ptr, volume_ptr, len);
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn ad(inputs: &[Series], kwargs: OutKwargs<EngineKwargs<NoKwargs>>) -> PolarsResult<Series> {
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let close = F64Input::new(&inputs[0])?;
+    let volume = F64Input::new(&inputs[3])?;
+    let prices = [
+        high.as_slice(),
+        low.as_slice(),
+        close.as_slice(),
+        volume.as_slice(),
+    ];
+    let res = match scan_start(kwargs.engine, "ad", &[], &prices) {
+        Some((begin, _)) => Ok(ad_scan(prices[0], prices[1], prices[2], prices[3], begin)),
+        None => ta_ad(high.ptr(), low.ptr(), close.ptr(), volume.ptr(), high.len()),
+    };
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
 
-#[polars_expr(output_type=Float64)]
-fn adosc(inputs: &[Series], kwargs: ADOSCKwargs) -> PolarsResult<Series> {
-    let close = &mut cast_series_to_f64(&inputs[0])?;
-    let high = &mut cast_series_to_f64(&inputs[1])?;
-    let low = &mut cast_series_to_f64(&inputs[2])?;
-    let volume = &mut cast_series_to_f64(&inputs[3])?;
-    let (high_ptr, _high) = get_series_f64_ptr(high)?;
-    let (low_ptr, _low) = get_series_f64_ptr(low)?;
-    let (close_ptr, _close) = get_series_f64_ptr(close)?;
-    let (volume_ptr, _volume) = get_series_f64_ptr(volume)?;
-    let len = high.len();
-    let res = ta_adosc(high_ptr, low_ptr, close_ptr, volume_ptr, len, &kwargs);
+#[polars_expr(output_type_func_with_kwargs=float_output)]
+fn adosc(inputs: &[Series], kwargs: OutKwargs<EngineKwargs<ADOSCKwargs>>) -> PolarsResult<Series> {
+    let close = F64Input::new(&inputs[0])?;
+    let high = F64Input::new(&inputs[1])?;
+    let low = F64Input::new(&inputs[2])?;
+    let volume = F64Input::new(&inputs[3])?;
+    let prices = [
+        high.as_slice(),
+        low.as_slice(),
+        close.as_slice(),
+        volume.as_slice(),
+    ];
+    let params = [
+        ("fastperiod", kwargs.fastperiod),
+        ("slowperiod", kwargs.slowperiod),
+    ];
+    let res = match scan_start(kwargs.engine, "adosc", &params, &prices) {
+        Some((begin, lookback)) => {
+            let ad = ad_scan(prices[0], prices[1], prices[2], prices[3], begin);
+            let fast = ad_ema(&ad, begin, kwargs.fastperiod);
+            let slow = ad_ema(&ad, begin, kwargs.slowperiod);
+            let mut out: Vec<f64> = fast
+                .par_iter()
+                .zip(slow.par_iter())
+                .map(|(f, s)| f - s)
+                .collect();
+            out[..begin + lookback].fill(f64::NAN);
+            Ok(out)
+        }
+        None => ta_adosc(
+            high.ptr(),
+            low.ptr(),
+            close.ptr(),
+            volume.ptr(),
+            high.len(),
+            &kwargs,
+        ),
+    };
     match res {
-        Ok(out) => Ok(Float64Chunked::from_vec("", out).into_series()),
+        Ok(out) => Ok(float_series(out, kwargs.out_dtype)),
         Err(ret_code) => ta_code2err(ret_code),
     }
 }
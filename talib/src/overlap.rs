@@ -1,5 +1,5 @@
 use crate::common::TimePeriodKwargs;
-use crate::utils::{check_begin_idx1, check_begin_idx2, make_vec};
+use crate::utils::{check_begin_idx1, check_begin_idx2, make_vec, TaReal};
 use derive_builder::Builder;
 use serde::Deserialize;
 use talib_sys::{
@@ -10,6 +10,9 @@ use talib_sys::{
     TA_BBANDS, TA_DEMA, TA_EMA, TA_HT_TRENDLINE, TA_KAMA, TA_MA, TA_MAMA, TA_MAVP, TA_MIDPOINT,
     TA_MIDPRICE, TA_SAR, TA_SAREXT, TA_SMA, TA_T3, TA_TEMA, TA_TRIMA, TA_WMA,
 };
+use talib_sys::{
+    TA_S_DEMA, TA_S_EMA, TA_S_KAMA, TA_S_MIDPOINT, TA_S_SMA, TA_S_TEMA, TA_S_TRIMA, TA_S_WMA,
+};
 
 #[derive(Builder, Deserialize)]
 pub struct BBANDSKwargs {
@@ -280,6 +283,58 @@ pub fn ta_ma(real_ptr: *const f64, len: usize, kwargs: &MaKwargs) -> Result<Vec<
     }
 }
 
+pub fn ta_ma_lookback(kwargs: &MaKwargs) -> i32 {
+    unsafe { TA_MA_Lookback(kwargs.timeperiod, kwargs.matype) }
+}
+
+/// `ta_ma` asked for output from `start_idx` (counted from the first non-NaN value)
+/// instead of from its own lookback. Recursive averages are seeded at `start_idx`,
+/// which is how TA-Lib computes the fast average inside MACDEXT.
+pub fn ta_ma_from(
+    real_ptr: *const f64,
+    len: usize,
+    start_idx: i32,
+    kwargs: &MaKwargs,
+) -> Result<Vec<f64>, TA_RetCode> {
+    let mut out_begin: TA_Integer = 0;
+    let mut out_size: TA_Integer = 0;
+    let begin_idx = check_begin_idx1(len, real_ptr) as i32;
+    let end_idx = len as i32 - begin_idx - 1;
+    if start_idx > end_idx {
+        return Ok(vec![f64::NAN; len]);
+    }
+    let lookback = begin_idx + start_idx.max(ta_ma_lookback(kwargs));
+    let (mut out, ptr) = make_vec(len, lookback);
+    let ret_code = unsafe {
+        TA_MA(
+            start_idx,
+            end_idx,
+            real_ptr.offset(begin_idx as isize),
+            kwargs.timeperiod,
+            kwargs.matype,
+            &mut out_begin,
+            &mut out_size,
+            ptr,
+        )
+    };
+    match ret_code {
+        TA_RetCode::TA_SUCCESS => {
+            let out_size_begin = (begin_idx + out_begin + out_size) as usize;
+            if out_size != 0 {
+                unsafe {
+                    out.set_len(out_size_begin);
+                }
+            } else {
+                unsafe {
+                    out.set_len(len);
+                }
+            }
+            Ok(out)
+        }
+        _ => Err(ret_code),
+    }
+}
+
 #[derive(Builder, Deserialize)]
 pub struct MamaKwargs {
     #[builder(default = "0.5")]
@@ -805,3 +860,163 @@ pub fn ta_wma(
         _ => Err(ret_code),
     }
 }
+
+pub type TimePeriodFn<T> = unsafe extern "C" fn(
+    TA_Integer,
+    TA_Integer,
+    *const T,
+    TA_Integer,
+    *mut TA_Integer,
+    *mut TA_Integer,
+    *mut f64,
+) -> TA_RetCode;
+
+fn ta_timeperiod_generic<T: TaReal>(
+    ta_func: TimePeriodFn<T>,
+    lookback: TA_Integer,
+    real_ptr: *const T,
+    len: usize,
+    kwargs: &TimePeriodKwargs,
+) -> Result<Vec<f64>, TA_RetCode> {
+    let mut out_begin: TA_Integer = 0;
+    let mut out_size: TA_Integer = 0;
+    let begin_idx = check_begin_idx1(len, real_ptr) as i32;
+    let end_idx = len as i32 - begin_idx - 1;
+    let lookback = begin_idx + lookback;
+    let (mut out, ptr) = make_vec(len, lookback);
+    let ret_code = unsafe {
+        ta_func(
+            0,
+            end_idx,
+            real_ptr.offset(begin_idx as isize),
+            kwargs.timeperiod,
+            &mut out_begin,
+            &mut out_size,
+            ptr,
+        )
+    };
+    let out_size_begin = (begin_idx + out_begin + out_size) as usize;
+    match ret_code {
+        TA_RetCode::TA_SUCCESS => {
+            if out_size != 0 {
+                unsafe {
+                    out.set_len(out_size_begin);
+                }
+            } else {
+                unsafe {
+                    out.set_len(len);
+                }
+            }
+            Ok(out)
+        }
+        _ => Err(ret_code),
+    }
+}
+
+pub type TimePeriodLookbackFn = unsafe extern "C" fn(TA_Integer) -> TA_Integer;
+
+/// `ta_func` over the `out.len()` values at `real_ptr`, written into `out` instead of a
+/// new vector. NaN before the first output row.
+pub fn ta_timeperiod_into(
+    ta_func: TimePeriodFn<f64>,
+    lookback_func: TimePeriodLookbackFn,
+    real_ptr: *const f64,
+    out: &mut [f64],
+    kwargs: &TimePeriodKwargs,
+) -> Result<(), TA_RetCode> {
+    let len = out.len();
+    let mut out_begin: TA_Integer = 0;
+    let mut out_size: TA_Integer = 0;
+    let begin_idx = check_begin_idx1(len, real_ptr) as i32;
+    let end_idx = len as i32 - begin_idx - 1;
+    let lookback = begin_idx + unsafe { lookback_func(kwargs.timeperiod) }.max(0);
+    out.fill(f64::NAN);
+    let ptr = out.as_mut_ptr().wrapping_add((lookback as usize).min(len));
+    let ret_code = unsafe {
+        ta_func(
+            0,
+            end_idx,
+            real_ptr.offset(begin_idx as isize),
+            kwargs.timeperiod,
+            &mut out_begin,
+            &mut out_size,
+            ptr,
+        )
+    };
+    match ret_code {
+        TA_RetCode::TA_SUCCESS => Ok(()),
+        _ => Err(ret_code),
+    }
+}
+
+pub fn ta_dema_f32(
+    real_ptr: *const f32,
+    len: usize,
+    kwargs: &TimePeriodKwargs,
+) -> Result<Vec<f64>, TA_RetCode> {
+    let lookback = unsafe { TA_DEMA_Lookback(kwargs.timeperiod) };
+    ta_timeperiod_generic(TA_S_DEMA, lookback, real_ptr, len, kwargs)
+}
+
+pub fn ta_ema_f32(
+    real_ptr: *const f32,
+    len: usize,
+    kwargs: &TimePeriodKwargs,
+) -> Result<Vec<f64>, TA_RetCode> {
+    let lookback = unsafe { TA_EMA_Lookback(kwargs.timeperiod) };
+    ta_timeperiod_generic(TA_S_EMA, lookback, real_ptr, len, kwargs)
+}
+
+pub fn ta_kama_f32(
+    real_ptr: *const f32,
+    len: usize,
+    kwargs: &TimePeriodKwargs,
+) -> Result<Vec<f64>, TA_RetCode> {
+    let lookback = unsafe { TA_KAMA_Lookback(kwargs.timeperiod) };
+    ta_timeperiod_generic(TA_S_KAMA, lookback, real_ptr, len, kwargs)
+}
+
+pub fn ta_midpoint_f32(
+    real_ptr: *const f32,
+    len: usize,
+    kwargs: &TimePeriodKwargs,
+) -> Result<Vec<f64>, TA_RetCode> {
+    let lookback = unsafe { TA_MIDPOINT_Lookback(kwargs.timeperiod) };
+    ta_timeperiod_generic(TA_S_MIDPOINT, lookback, real_ptr, len, kwargs)
+}
+
+pub fn ta_sma_f32(
+    real_ptr: *const f32,
+    len: usize,
+    kwargs: &TimePeriodKwargs,
+) -> Result<Vec<f64>, TA_RetCode> {
+    let lookback = unsafe { TA_SMA_Lookback(kwargs.timeperiod) };
+    ta_timeperiod_generic(TA_S_SMA, lookback, real_ptr, len, kwargs)
+}
+
+pub fn ta_tema_f32(
+    real_ptr: *const f32,
+    len: usize,
+    kwargs: &TimePeriodKwargs,
+) -> Result<Vec<f64>, TA_RetCode> {
+    let lookback = unsafe { TA_TEMA_Lookback(kwargs.timeperiod) };
+    ta_timeperiod_generic(TA_S_TEMA, lookback, real_ptr, len, kwargs)
+}
+
+pub fn ta_trima_f32(
+    real_ptr: *const f32,
+    len: usize,
+    kwargs: &TimePeriodKwargs,
+) -> Result<Vec<f64>, TA_RetCode> {
+    let lookback = unsafe { TA_TRIMA_Lookback(kwargs.timeperiod) };
+    ta_timeperiod_generic(TA_S_TRIMA, lookback, real_ptr, len, kwargs)
+}
+
+pub fn ta_wma_f32(
+    real_ptr: *const f32,
+    len: usize,
+    kwargs: &TimePeriodKwargs,
+) -> Result<Vec<f64>, TA_RetCode> {
+    let lookback = unsafe { TA_WMA_Lookback(kwargs.timeperiod) };
+    ta_timeperiod_generic(TA_S_WMA, lookback, real_ptr, len, kwargs)
+}
@@ -1,4 +1,4 @@
-use crate::utils::{check_begin_idx4, make_vec};
+use crate::utils::{check_begin_idx4, make_vec, TaReal};
 use derive_builder::Builder;
 use serde::Deserialize;
 use talib_sys::{TA_CDL2CROWS_Lookback, TA_CDL2CROWS};
@@ -63,6 +63,23 @@ use talib_sys::{TA_CDLUNIQUE3RIVER_Lookback, TA_CDLUNIQUE3RIVER};
 use talib_sys::{TA_CDLUPSIDEGAP2CROWS_Lookback, TA_CDLUPSIDEGAP2CROWS};
 use talib_sys::{TA_CDLXSIDEGAP3METHODS_Lookback, TA_CDLXSIDEGAP3METHODS};
 use talib_sys::{TA_Integer, TA_RetCode};
+use talib_sys::{
+    TA_S_CDL2CROWS, TA_S_CDL3BLACKCROWS, TA_S_CDL3INSIDE, TA_S_CDL3LINESTRIKE, TA_S_CDL3OUTSIDE,
+    TA_S_CDL3STARSINSOUTH, TA_S_CDL3WHITESOLDIERS, TA_S_CDLABANDONEDBABY, TA_S_CDLADVANCEBLOCK,
+    TA_S_CDLBELTHOLD, TA_S_CDLBREAKAWAY, TA_S_CDLCLOSINGMARUBOZU, TA_S_CDLCONCEALBABYSWALL,
+    TA_S_CDLCOUNTERATTACK, TA_S_CDLDARKCLOUDCOVER, TA_S_CDLDOJI, TA_S_CDLDOJISTAR,
+    TA_S_CDLDRAGONFLYDOJI, TA_S_CDLENGULFING, TA_S_CDLEVENINGDOJISTAR, TA_S_CDLEVENINGSTAR,
+    TA_S_CDLGAPSIDESIDEWHITE, TA_S_CDLGRAVESTONEDOJI, TA_S_CDLHAMMER, TA_S_CDLHANGINGMAN,
+    TA_S_CDLHARAMI, TA_S_CDLHARAMICROSS, TA_S_CDLHIGHWAVE, TA_S_CDLHIKKAKE, TA_S_CDLHIKKAKEMOD,
+    TA_S_CDLHOMINGPIGEON, TA_S_CDLIDENTICAL3CROWS, TA_S_CDLINNECK, TA_S_CDLINVERTEDHAMMER,
+    TA_S_CDLKICKING, TA_S_CDLKICKINGBYLENGTH, TA_S_CDLLADDERBOTTOM, TA_S_CDLLONGLEGGEDDOJI,
+    TA_S_CDLLONGLINE, TA_S_CDLMARUBOZU, TA_S_CDLMATCHINGLOW, TA_S_CDLMATHOLD,
+    TA_S_CDLMORNINGDOJISTAR, TA_S_CDLMORNINGSTAR, TA_S_CDLONNECK, TA_S_CDLPIERCING,
+    TA_S_CDLRICKSHAWMAN, TA_S_CDLRISEFALL3METHODS, TA_S_CDLSEPARATINGLINES, TA_S_CDLSHOOTINGSTAR,
+    TA_S_CDLSHORTLINE, TA_S_CDLSPINNINGTOP, TA_S_CDLSTALLEDPATTERN, TA_S_CDLSTICKSANDWICH,
+    TA_S_CDLTAKURI, TA_S_CDLTASUKIGAP, TA_S_CDLTHRUSTING, TA_S_CDLTRISTAR, TA_S_CDLUNIQUE3RIVER,
+    TA_S_CDLUPSIDEGAP2CROWS, TA_S_CDLXSIDEGAP3METHODS,
+};
 
 #[derive(Builder, Deserialize)]
 pub struct CDLKwargs {
@@ -2977,3 +2994,1295 @@ pub fn ta_cdlxsidegap3methods(
         _ => Err(ret_code),
     }
 }
+
+type CdlFn<T> = unsafe extern "C" fn(
+    TA_Integer,
+    TA_Integer,
+    *const T,
+    *const T,
+    *const T,
+    *const T,
+    *mut TA_Integer,
+    *mut TA_Integer,
+    *mut TA_Integer,
+) -> TA_RetCode;
+
+type CdlPenetrationFn<T> = unsafe extern "C" fn(
+    TA_Integer,
+    TA_Integer,
+    *const T,
+    *const T,
+    *const T,
+    *const T,
+    f64,
+    *mut TA_Integer,
+    *mut TA_Integer,
+    *mut TA_Integer,
+) -> TA_RetCode;
+
+fn ta_cdl_generic<T: TaReal>(
+    ta_func: CdlFn<T>,
+    lookback: TA_Integer,
+    open_ptr: *const T,
+    high_ptr: *const T,
+    low_ptr: *const T,
+    close_ptr: *const T,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let mut out_begin: TA_Integer = 0;
+    let mut out_size: TA_Integer = 0;
+    let begin_idx = check_begin_idx4(len, open_ptr, high_ptr, low_ptr, close_ptr) as i32;
+    let end_idx = len as i32 - begin_idx - 1;
+    let lookback = begin_idx + lookback;
+    let (mut out, ptr) = make_vec(len, lookback);
+    let ret_code = unsafe {
+        ta_func(
+            0,
+            end_idx,
+            open_ptr.offset(begin_idx as isize),
+            high_ptr.offset(begin_idx as isize),
+            low_ptr.offset(begin_idx as isize),
+            close_ptr.offset(begin_idx as isize),
+            &mut out_begin,
+            &mut out_size,
+            ptr,
+        )
+    };
+    let out_size_begin = (begin_idx + out_begin + out_size) as usize;
+    match ret_code {
+        TA_RetCode::TA_SUCCESS => {
+            if out_size != 0 {
+                unsafe {
+                    out.set_len(out_size_begin);
+                }
+            } else {
+                unsafe {
+                    out.set_len(len);
+                }
+            }
+            Ok(out)
+        }
+        _ => Err(ret_code),
+    }
+}
+
+fn ta_cdl_penetration_generic<T: TaReal>(
+    ta_func: CdlPenetrationFn<T>,
+    lookback: TA_Integer,
+    open_ptr: *const T,
+    high_ptr: *const T,
+    low_ptr: *const T,
+    close_ptr: *const T,
+    len: usize,
+    kwargs: &CDLKwargs,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let mut out_begin: TA_Integer = 0;
+    let mut out_size: TA_Integer = 0;
+    let begin_idx = check_begin_idx4(len, open_ptr, high_ptr, low_ptr, close_ptr) as i32;
+    let end_idx = len as i32 - begin_idx - 1;
+    let lookback = begin_idx + lookback;
+    let (mut out, ptr) = make_vec(len, lookback);
+    let ret_code = unsafe {
+        ta_func(
+            0,
+            end_idx,
+            open_ptr.offset(begin_idx as isize),
+            high_ptr.offset(begin_idx as isize),
+            low_ptr.offset(begin_idx as isize),
+            close_ptr.offset(begin_idx as isize),
+            kwargs.penetration,
+            &mut out_begin,
+            &mut out_size,
+            ptr,
+        )
+    };
+    let out_size_begin = (begin_idx + out_begin + out_size) as usize;
+    match ret_code {
+        TA_RetCode::TA_SUCCESS => {
+            if out_size != 0 {
+                unsafe {
+                    out.set_len(out_size_begin);
+                }
+            } else {
+                unsafe {
+                    out.set_len(len);
+                }
+            }
+            Ok(out)
+        }
+        _ => Err(ret_code),
+    }
+}
+
+pub fn ta_cdl2crows_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDL2CROWS_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDL2CROWS,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdl3blackcrows_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDL3BLACKCROWS_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDL3BLACKCROWS,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdl3inside_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDL3INSIDE_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDL3INSIDE,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdl3linestrike_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDL3LINESTRIKE_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDL3LINESTRIKE,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdl3outside_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDL3OUTSIDE_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDL3OUTSIDE,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdl3starsinsouth_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDL3STARSINSOUTH_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDL3STARSINSOUTH,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdl3whitesoldiers_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDL3WHITESOLDIERS_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDL3WHITESOLDIERS,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlabandonedbaby_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+    kwargs: &CDLKwargs,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLABANDONEDBABY_Lookback(kwargs.penetration) };
+    ta_cdl_penetration_generic(
+        TA_S_CDLABANDONEDBABY,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+        kwargs,
+    )
+}
+
+pub fn ta_cdladvanceblock_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLADVANCEBLOCK_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLADVANCEBLOCK,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlbelthold_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLBELTHOLD_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLBELTHOLD,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlbreakaway_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLBREAKAWAY_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLBREAKAWAY,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlclosingmarubozu_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLCLOSINGMARUBOZU_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLCLOSINGMARUBOZU,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlconcealbabyswall_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLCONCEALBABYSWALL_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLCONCEALBABYSWALL,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlcounterattack_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLCOUNTERATTACK_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLCOUNTERATTACK,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdldarkcloudcover_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+    kwargs: &CDLKwargs,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLDARKCLOUDCOVER_Lookback(kwargs.penetration) };
+    ta_cdl_penetration_generic(
+        TA_S_CDLDARKCLOUDCOVER,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+        kwargs,
+    )
+}
+
+pub fn ta_cdldojistar_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLDOJISTAR_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLDOJISTAR,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdldoji_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLDOJI_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLDOJI,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdldragonflydoji_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLDRAGONFLYDOJI_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLDRAGONFLYDOJI,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlengulfing_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLENGULFING_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLENGULFING,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdleveningdojistar_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+    kwargs: &CDLKwargs,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLEVENINGDOJISTAR_Lookback(kwargs.penetration) };
+    ta_cdl_penetration_generic(
+        TA_S_CDLEVENINGDOJISTAR,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+        kwargs,
+    )
+}
+
+pub fn ta_cdleveningstar_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+    kwargs: &CDLKwargs,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLEVENINGSTAR_Lookback(kwargs.penetration) };
+    ta_cdl_penetration_generic(
+        TA_S_CDLEVENINGSTAR,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+        kwargs,
+    )
+}
+
+pub fn ta_cdlgapsidesidewhite_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLGAPSIDESIDEWHITE_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLGAPSIDESIDEWHITE,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlgravestonedoji_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLGRAVESTONEDOJI_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLGRAVESTONEDOJI,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlhammer_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLHAMMER_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLHAMMER,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlhangingman_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLHANGINGMAN_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLHANGINGMAN,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlharamicross_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLHARAMICROSS_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLHARAMICROSS,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlharami_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLHARAMI_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLHARAMI,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlhighwave_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLHIGHWAVE_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLHIGHWAVE,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlhikkakemod_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLHIKKAKEMOD_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLHIKKAKEMOD,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlhikkake_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLHIKKAKE_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLHIKKAKE,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlhomingpigeon_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLHOMINGPIGEON_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLHOMINGPIGEON,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlidentical3crows_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLIDENTICAL3CROWS_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLIDENTICAL3CROWS,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlinneck_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLINNECK_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLINNECK,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlinvertedhammer_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLINVERTEDHAMMER_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLINVERTEDHAMMER,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlkickingbylength_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLKICKINGBYLENGTH_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLKICKINGBYLENGTH,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlkicking_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLKICKING_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLKICKING,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlladderbottom_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLLADDERBOTTOM_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLLADDERBOTTOM,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdllongleggeddoji_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLLONGLEGGEDDOJI_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLLONGLEGGEDDOJI,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdllongline_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLLONGLINE_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLLONGLINE,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlmarubozu_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLMARUBOZU_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLMARUBOZU,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlmatchinglow_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLMATCHINGLOW_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLMATCHINGLOW,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlmathold_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+    kwargs: &CDLKwargs,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLMATHOLD_Lookback(kwargs.penetration) };
+    ta_cdl_penetration_generic(
+        TA_S_CDLMATHOLD,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+        kwargs,
+    )
+}
+
+pub fn ta_cdlmorningdojistar_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+    kwargs: &CDLKwargs,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLMORNINGDOJISTAR_Lookback(kwargs.penetration) };
+    ta_cdl_penetration_generic(
+        TA_S_CDLMORNINGDOJISTAR,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+        kwargs,
+    )
+}
+
+pub fn ta_cdlmorningstar_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+    kwargs: &CDLKwargs,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLMORNINGSTAR_Lookback(kwargs.penetration) };
+    ta_cdl_penetration_generic(
+        TA_S_CDLMORNINGSTAR,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+        kwargs,
+    )
+}
+
+pub fn ta_cdlonneck_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLONNECK_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLONNECK,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlpiercing_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLPIERCING_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLPIERCING,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlrickshawman_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLRICKSHAWMAN_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLRICKSHAWMAN,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlrisefall3methods_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLRISEFALL3METHODS_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLRISEFALL3METHODS,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlseparatinglines_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLSEPARATINGLINES_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLSEPARATINGLINES,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlshootingstar_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLSHOOTINGSTAR_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLSHOOTINGSTAR,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlshortline_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLSHORTLINE_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLSHORTLINE,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlspinningtop_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLSPINNINGTOP_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLSPINNINGTOP,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlstalledpattern_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLSTALLEDPATTERN_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLSTALLEDPATTERN,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlsticksandwich_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLSTICKSANDWICH_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLSTICKSANDWICH,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdltakuri_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLTAKURI_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLTAKURI,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdltasukigap_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLTASUKIGAP_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLTASUKIGAP,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlthrusting_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLTHRUSTING_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLTHRUSTING,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdltristar_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLTRISTAR_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLTRISTAR,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlunique3river_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLUNIQUE3RIVER_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLUNIQUE3RIVER,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlupsidegap2crows_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLUPSIDEGAP2CROWS_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLUPSIDEGAP2CROWS,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
+
+pub fn ta_cdlxsidegap3methods_f32(
+    open_ptr: *const f32,
+    high_ptr: *const f32,
+    low_ptr: *const f32,
+    close_ptr: *const f32,
+    len: usize,
+) -> Result<Vec<i32>, TA_RetCode> {
+    let lookback = unsafe { TA_CDLXSIDEGAP3METHODS_Lookback() };
+    ta_cdl_generic(
+        TA_S_CDLXSIDEGAP3METHODS,
+        lookback,
+        open_ptr,
+        high_ptr,
+        low_ptr,
+        close_ptr,
+        len,
+    )
+}
@@ -14,6 +14,23 @@ impl CustomDefault for i32 {
     }
 }
 
+/// Input element types accepted by TA-Lib: `f64`, and `f32` for the `TA_S_*` functions.
+pub trait TaReal: Copy {
+    fn is_nan(self) -> bool;
+}
+
+impl TaReal for f64 {
+    fn is_nan(self) -> bool {
+        f64::is_nan(self)
+    }
+}
+
+impl TaReal for f32 {
+    fn is_nan(self) -> bool {
+        f32::is_nan(self)
+    }
+}
+
 pub fn make_vec<T>(len: usize, lookback: i32) -> (Vec<T>, *mut T)
 where
     T: Copy + CustomDefault,
@@ -26,7 +43,7 @@ where
     (vec, ptr)
 }
 
-pub fn check_begin_idx1(len: usize, arr_ptr: *const f64) -> usize {
+pub fn check_begin_idx1<T: TaReal>(len: usize, arr_ptr: *const T) -> usize {
     let mut begin_idx = 0;
     for i in 0..len {
         if unsafe { (*arr_ptr.offset(i as isize)).is_nan() } {
@@ -38,7 +55,7 @@ pub fn check_begin_idx1(len: usize, arr_ptr: *const f64) -> usize {
     begin_idx
 }
 
-pub fn check_begin_idx2(len: usize, arr1_ptr: *const f64, arr2_ptr: *const f64) -> usize {
+pub fn check_begin_idx2<T: TaReal>(len: usize, arr1_ptr: *const T, arr2_ptr: *const T) -> usize {
     let mut begin_idx = 0;
     for i in 0..len {
         if unsafe { (*arr1_ptr.offset(i as isize)).is_nan() }
@@ -52,11 +69,11 @@ pub fn check_begin_idx2(len: usize, arr1_ptr: *const f64, arr2_ptr: *const f64)
     begin_idx
 }
 
-pub fn check_begin_idx3(
+pub fn check_begin_idx3<T: TaReal>(
     len: usize,
-    arr1_ptr: *const f64,
-    arr2_ptr: *const f64,
-    arr3_ptr: *const f64,
+    arr1_ptr: *const T,
+    arr2_ptr: *const T,
+    arr3_ptr: *const T,
 ) -> usize {
     let mut begin_idx = 0;
     for i in 0..len {
@@ -72,12 +89,12 @@ pub fn check_begin_idx3(
     begin_idx
 }
 
-pub fn check_begin_idx4(
+pub fn check_begin_idx4<T: TaReal>(
     len: usize,
-    arr1_ptr: *const f64,
-    arr2_ptr: *const f64,
-    arr3_ptr: *const f64,
-    arr4_ptr: *const f64,
+    arr1_ptr: *const T,
+    arr2_ptr: *const T,
+    arr3_ptr: *const T,
+    arr4_ptr: *const T,
 ) -> usize {
     let mut begin_idx = 0;
     for i in 0..len {
@@ -92,4 +109,4 @@ pub fn check_begin_idx4(
         }
     }
     begin_idx
-}
\ No newline at end of file
+}
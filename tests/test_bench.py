@@ -1,5 +1,9 @@
+import os
+import subprocess
+import sys
 
 import polars as pl
+import pytest
 import polars_talib
 import talib
 
@@ -51,3 +55,38 @@ def test_natr_expr_with_null(benchmark, df_ohlc: pl.DataFrame):
         df_ohlc.select(
             pl.col("close").ta.natr(pl.col("high"), pl.col("low"), 3)
         )
+
+
+SCAN_BENCH = """
+import time
+import numpy as np
+import polars as pl
+import polars_talib
+
+n = 20_000_000
+close = np.cumsum(np.random.randint(-10, 12, size=n) / 10.0) + 5000.0
+df = pl.DataFrame({"close": close, "volume": np.random.randint(1, 1000, size=n) / 1.0})
+start = time.perf_counter()
+df.select(pl.col("close").ta.ema(30), pl.col("close").ta.obv(pl.col("volume")))
+print(time.perf_counter() - start)
+"""
+
+
+@pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="needs at least 4 cores")
+def test_scan_scaling(benchmark):
+    # 20M rows per thread count: only worth running as a benchmark
+    if benchmark.disabled:
+        pytest.skip("benchmarks are disabled")
+    # the rayon pool is sized once per process, so each thread count runs in its own process
+    timings = {}
+
+    def run():
+        for threads in [1, 2, 4, 8]:
+            env = dict(os.environ, RAYON_NUM_THREADS=str(threads))
+            out = subprocess.run(
+                [sys.executable, "-c", SCAN_BENCH], env=env, capture_output=True, check=True
+            )
+            timings[threads] = float(out.stdout)
+
+    benchmark.pedantic(run, rounds=1, iterations=1)
+    benchmark.extra_info.update({f"threads_{k}": v for k, v in timings.items()})
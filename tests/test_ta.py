@@ -1,5 +1,7 @@
+import math
 import pytest
 import polars as pl
+import numpy as np
 import polars_talib as plta
 import talib
 from talib import abstract
@@ -2304,3 +2306,901 @@ def test_cdlxsidegap3methods_eq(df_ohlc: pl.DataFrame):
         ).alias("talib"),
     ).select(((pl.col("expr") != pl.col("talib")).sum()).alias("not_eq"))["not_eq"][0]
     assert not_eq == 0
+
+
+@pytest.fixture
+def df_symbols(df_ohlc: pl.DataFrame):
+    return pl.concat(
+        [df_ohlc.slice(i * 7).with_columns(pl.lit(s).alias("symbol")) for i, s in enumerate("ABC")]
+    )
+
+
+@pytest.mark.parametrize(
+    "func", ["dema", "ema", "kama", "midpoint", "sma", "tema", "trima", "wma"]
+)
+def test_grouped_overlap_eq(df_symbols: pl.DataFrame, func: str):
+    not_eq = df_symbols.with_columns(
+        getattr(plta, func)(timeperiod=5, by="symbol").alias("expr"),
+        getattr(plta, func)(timeperiod=5).over("symbol").alias("over"),
+    ).select(((pl.col("expr") != pl.col("over")).sum()).alias("not_eq"))["not_eq"][0]
+    assert not_eq == 0
+
+
+@pytest.mark.parametrize("func", ["ema", "sma", "midpoint"])
+def test_grouped_overlap_not_contiguous(df_symbols: pl.DataFrame, func: str):
+    # interleave the symbols, every symbol then appears in many runs
+    df = df_symbols.with_columns(pl.int_range(pl.len()).over("symbol").alias("i")).sort(
+        "i", maintain_order=True
+    )
+    periods = {"A": 3, "B": 5, "C": 10}
+    df = df.with_columns(pl.col("symbol").replace(periods, default=None).alias("period"))
+    result = df.select(
+        getattr(plta, func)(timeperiod=5, by="symbol").alias("by"),
+        getattr(plta, func)(timeperiod=5).over("symbol").alias("over"),
+        getattr(plta, func)(timeperiod=pl.col("period"), by="symbol").alias("by_period"),
+        getattr(plta, func)(timeperiod=pl.col("period")).over("symbol").alias("over_period"),
+    )
+    assert result["by"].equals(result["over"], check_names=False)
+    assert result["by_period"].equals(result["over_period"], check_names=False)
+
+
+@pytest.mark.parametrize("func", ["ema", "kama", "sma", "wma"])
+def test_grouped_timeperiod_expr(df_symbols: pl.DataFrame, func: str):
+    periods = {"A": 3, "B": 5, "C": 10}
+    df = df_symbols.with_columns(pl.col("symbol").replace(periods, default=None).alias("period"))
+    result = df.select(
+        getattr(plta, func)(timeperiod=pl.col("period"), by="symbol").alias("by"),
+        getattr(plta, func)(timeperiod=pl.col("period")).over("symbol").alias("over"),
+    )
+    expected = pl.concat(
+        [
+            group.select(getattr(plta, func)(timeperiod=periods[group["symbol"][0]]))
+            for group in df.partition_by("symbol", maintain_order=True)
+        ]
+    ).to_series()
+    assert result["by"].equals(expected, check_names=False)
+    assert result["over"].equals(expected, check_names=False)
+
+
+def test_grouped_timeperiod_not_constant(df_symbols: pl.DataFrame):
+    df = df_symbols.with_columns(pl.int_range(pl.len()).alias("period"))
+    with pytest.raises(pl.ComputeError):
+        df.select(plta.ema(timeperiod=pl.col("period"), by="symbol"))
+
+
+def test_multi_chunk_input_eq(df_ohlc: pl.DataFrame):
+    df_chunked = pl.concat([df_ohlc.slice(0, 50), df_ohlc.slice(50)], rechunk=False)
+    assert df_chunked["close"].n_chunks() == 2
+    exprs = [
+        plta.sma(timeperiod=5).alias("sma"),
+        plta.sqrt().alias("sqrt"),
+        plta.atr().alias("atr"),
+    ]
+    expected = df_ohlc.select(exprs)
+
+    plta.reset_input_copy_stats()
+    df_ohlc.select(plta.sma(timeperiod=5))
+    assert plta.input_copy_stats()["copies"] == 0
+
+    result = df_chunked.select(exprs)
+    assert result.equals(expected)
+    stats = plta.input_copy_stats()
+    assert stats["copies"] > 0
+    assert stats["bytes"] > 0
+
+
+def test_float32_input_not_widened(df_base: pl.DataFrame):
+    df = df_base.with_columns(pl.col("open", "high", "low", "close").cast(pl.Float32))
+    plta.reset_input_copy_stats()
+    df.select(
+        plta.cdlengulfing().alias("cdlengulfing"),
+        plta.cdlmorningstar().alias("cdlmorningstar"),
+        plta.ema(timeperiod=5).alias("ema"),
+        *[
+            getattr(plta, f)(timeperiod=5).alias(f)
+            for f in ["dema", "kama", "tema", "trima", "sma", "wma"]
+        ],
+        plta.midpoint(timeperiod=5, engine="talib").alias("midpoint"),
+        plta.cdl_scan().alias("cdl_scan"),
+    )
+    assert plta.input_copy_stats()["copies"] == 0
+    # no single precision entry point: copied to Float64
+    df.select(plta.rsi(timeperiod=5))
+    assert plta.input_copy_stats()["copies"] == 1
+
+
+@pytest.mark.parametrize("func", ["sma", "ema", "rsi", "atr", "obv", "sqrt", "add"])
+def test_out_dtype_f32(df_ohlc: pl.DataFrame, func: str):
+    result = df_ohlc.select(
+        getattr(plta, func)(out_dtype="f32").alias("f32"),
+        getattr(plta, func)().cast(pl.Float32).alias("cast"),
+    )
+    assert result.schema["f32"] == pl.Float32
+    assert result["f32"].equals(result["cast"])
+
+
+def test_out_dtype_f32_long():
+    # longer than one narrowed chunk and many map_rows blocks
+    n = (5 << 20) // 2 + 3
+    close = np.cumsum(np.random.randint(-10, 12, size=n) / 10.0) + 5000.0
+    df = pl.DataFrame({"close": close})
+    exprs = {
+        "sma": lambda **kw: plta.sma(timeperiod=5, **kw),
+        "range": lambda **kw: plta.sma(timeperiod=5, start=10, end=n - 10, **kw),
+        "sqrt": lambda **kw: plta.sqrt(**kw),
+    }
+    for name, expr in exprs.items():
+        result = df.select(
+            expr(out_dtype="f32").alias("f32"), expr().cast(pl.Float32).alias("cast")
+        )
+        assert result.schema["f32"] == pl.Float32
+        assert result["f32"].equals(result["cast"]), name
+
+
+def test_grouped_out_dtype_f32(df_symbols: pl.DataFrame):
+    result = df_symbols.select(plta.ema(timeperiod=5, by="symbol", out_dtype="f32"))
+    assert result.dtypes == [pl.Float32]
+
+
+@pytest.mark.parametrize(
+    "func", ["cdlengulfing", "cdlhikkake", "cdldoji", "cdlmorningstar", "cdl3linestrike"]
+)
+def test_cdl_compact_out_dtype(df_ohlc: pl.DataFrame, func: str):
+    result = df_ohlc.select(
+        getattr(plta, func)().alias("i32"),
+        getattr(plta, func)(out_dtype="i16").alias("i16"),
+        getattr(plta, func)(out_dtype="i8").alias("i8"),
+    )
+    assert result.schema["i16"] == pl.Int16
+    assert result.schema["i8"] == pl.Int8
+    assert (result["i16"].cast(pl.Int32) != result["i32"]).sum() == 0
+    assert (result["i8"].cast(pl.Int32) * 100 != result["i32"]).sum() == 0
+
+
+def test_cdl_compact_out_dtype_long():
+    # longer than one narrowed chunk
+    n = (5 << 20) // 2 + 3
+    close = np.cumsum(np.random.randint(-10, 12, size=n) / 10.0) + 5000.0
+    df = pl.DataFrame(
+        {
+            "open": close + np.random.randint(-5, 5, size=n) / 10.0,
+            "high": close + np.random.randint(0, 12, size=n) / 10.0,
+            "low": close - np.random.randint(0, 12, size=n) / 10.0,
+            "close": close,
+        }
+    )
+    result = df.select(
+        plta.cdlengulfing().alias("i32"),
+        plta.cdlengulfing(out_dtype="i16").alias("i16"),
+        plta.cdlengulfing(out_dtype="i8").alias("i8"),
+    )
+    assert result["i16"].cast(pl.Int32).equals(result["i32"], check_names=False)
+    assert (result["i8"].cast(pl.Int32) * 100).equals(result["i32"], check_names=False)
+
+
+def test_cdl_scan_eq(df_ohlc: pl.DataFrame):
+    result = df_ohlc.select(plta.cdl_scan().alias("scan")).unnest("scan")
+    assert result.columns == plta.CDL_PATTERNS
+    for name in plta.CDL_PATTERNS:
+        expected = df_ohlc.select(getattr(plta, name)())
+        assert (result[name] != expected.to_series()).sum() == 0, name
+
+
+def test_cdl_scan_bitmask(df_ohlc: pl.DataFrame):
+    patterns = ["cdlengulfing", "cdlhikkake", "cdlmorningstar"]
+    scan = df_ohlc.select(plta.cdl_scan(patterns=patterns).alias("scan")).unnest("scan")
+    masks = df_ohlc.select(plta.cdl_scan(patterns=patterns, bitmask=True).alias("m")).unnest("m")
+    for name in patterns:
+        bit = 1 << plta.CDL_PATTERNS.index(name)
+        bull = (masks["bull"] & bit) != 0
+        bear = (masks["bear"] & bit) != 0
+        assert bull.equals(scan[name] > 0)
+        assert bear.equals(scan[name] < 0)
+
+
+def test_cdl_events_eq(df_ohlc: pl.DataFrame):
+    patterns = ["cdlengulfing", "cdlhikkake", "cdldoji"]
+    events = df_ohlc.select(plta.cdl_events(patterns=patterns).alias("e")).explode("e").unnest("e")
+    scan = df_ohlc.select(plta.cdl_scan(patterns=patterns).alias("s")).unnest("s")
+    expected = [
+        (row, plta.CDL_PATTERNS.index(name), scan[name][row] // 100)
+        for row in range(scan.height)
+        for name in patterns
+        if scan[name][row] != 0
+    ]
+    expected.sort(key=lambda e: (e[0], patterns.index(plta.CDL_PATTERNS[e[1]])))
+    assert list(events.iter_rows()) == expected
+
+
+def test_cdl_events_group_by(df_symbols: pl.DataFrame):
+    out = df_symbols.group_by("symbol", maintain_order=True).agg(
+        plta.cdl_events(patterns=["cdlengulfing"]).alias("events")
+    )
+    assert out.schema["events"] == pl.List(
+        pl.Struct({"row": pl.UInt32, "pattern": pl.UInt8, "signal": pl.Int8})
+    )
+
+
+def test_ht_all_eq(df_ohlc: pl.DataFrame):
+    result = df_ohlc.select(plta.ht_all().alias("ht")).unnest("ht")
+    assert result.columns == plta.HT_FIELDS
+    expected = df_ohlc.select(
+        plta.ht_dcperiod().alias("dcperiod"),
+        plta.ht_dcphase().alias("dcphase"),
+        plta.ht_phasor().alias("phasor"),
+        plta.ht_sine().alias("sine_"),
+        plta.ht_trendmode().alias("trendmode"),
+        plta.ht_trendline().alias("trendline"),
+    ).unnest("phasor", "sine_")
+    assert result.equals(expected.select(plta.HT_FIELDS))
+
+
+def test_ht_all_fields(df_ohlc: pl.DataFrame):
+    result = df_ohlc.select(
+        plta.ht_all(fields=["sine", "trendmode"], out_dtype="f32").alias("ht")
+    ).unnest("ht")
+    assert dict(result.schema) == {"sine": pl.Float32, "trendmode": pl.Int32}
+
+
+@pytest.mark.parametrize("n", [40, 70, 3000])
+def test_ht_all_talib_eq(n: int):
+    # short inputs end inside the lookbacks, flat stretches zero the detrender and I/Q
+    close = np.cumsum(np.random.randint(-10, 12, size=n) / 10.0) + 5000.0
+    close[n // 3 : n // 2] = close[n // 3]
+    close[:3] = np.nan
+    df = pl.DataFrame({"close": close})
+    result = df.select(plta.ht_all().alias("ht")).unnest("ht")
+    inphase, quadrature = talib.HT_PHASOR(close)
+    sine, leadsine = talib.HT_SINE(close)
+    expected = {
+        "dcperiod": talib.HT_DCPERIOD(close),
+        "dcphase": talib.HT_DCPHASE(close),
+        "inphase": inphase,
+        "quadrature": quadrature,
+        "sine": sine,
+        "leadsine": leadsine,
+        "trendmode": talib.HT_TRENDMODE(close),
+        "trendline": talib.HT_TRENDLINE(close),
+    }
+    for name, values in expected.items():
+        assert result[name].equals(pl.Series(name, values)), name
+
+
+def test_ht_all_inner_nan(df_ohlc: pl.DataFrame):
+    df = df_ohlc.with_columns(
+        pl.when(pl.int_range(pl.len()) == 100).then(None).otherwise(pl.col("close")).alias("close")
+    )
+    result = df.select(plta.ht_all(fields=["dcperiod", "trendline"]).alias("ht")).unnest("ht")
+    expected = df.select(
+        plta.ht_dcperiod().alias("dcperiod"), plta.ht_trendline().alias("trendline")
+    )
+    assert result.equals(expected)
+
+
+@pytest.mark.parametrize("timeperiod", [5, 14])
+def test_dmi_eq(df_ohlc: pl.DataFrame, timeperiod: int):
+    result = df_ohlc.select(plta.dmi(timeperiod=timeperiod).alias("dmi")).unnest("dmi")
+    assert result.columns == plta.DMI_FIELDS
+    expected = df_ohlc.select(
+        plta.plus_dm(timeperiod=timeperiod).alias("plus_dm"),
+        plta.minus_dm(timeperiod=timeperiod).alias("minus_dm"),
+        plta.plus_di(timeperiod=timeperiod).alias("plus_di"),
+        plta.minus_di(timeperiod=timeperiod).alias("minus_di"),
+        plta.dx(timeperiod=timeperiod).alias("dx"),
+        plta.adx(timeperiod=timeperiod).alias("adx"),
+        plta.adxr(timeperiod=timeperiod).alias("adxr"),
+    )
+    assert result.equals(expected)
+
+
+def test_dmi_fields(df_ohlc: pl.DataFrame):
+    result = df_ohlc.select(
+        plta.dmi(fields=["adxr", "plus_di"], out_dtype="f32").alias("dmi")
+    ).unnest("dmi")
+    assert dict(result.schema) == {"adxr": pl.Float32, "plus_di": pl.Float32}
+    with pytest.raises(ValueError):
+        plta.dmi(fields=["adx", "rsi"])
+
+
+@pytest.mark.parametrize("timeperiod", [2, 3, 14, 30])
+def test_dmi_talib_eq(timeperiod: int):
+    # flat stretches give zero true ranges and DI sums, NaN leading close only starts
+    # the fields that read it later
+    n = 3000
+    close = np.cumsum(np.random.randint(-10, 12, size=n) / 10.0) + 5000.0
+    high = close + np.random.randint(0, 12, size=n) / 10.0
+    low = close - np.random.randint(0, 12, size=n) / 10.0
+    for flat in [slice(0, 200), slice(1000, 2000)]:
+        close[flat] = high[flat] = low[flat] = close[flat.start]
+    close[:3] = np.nan
+    df = pl.DataFrame({"close": close, "high": high, "low": low})
+    result = df.select(plta.dmi(timeperiod=timeperiod).alias("dmi")).unnest("dmi")
+    expected = {
+        "plus_dm": talib.PLUS_DM(high, low, timeperiod),
+        "minus_dm": talib.MINUS_DM(high, low, timeperiod),
+        "plus_di": talib.PLUS_DI(high, low, close, timeperiod),
+        "minus_di": talib.MINUS_DI(high, low, close, timeperiod),
+        "dx": talib.DX(high, low, close, timeperiod),
+        "adx": talib.ADX(high, low, close, timeperiod),
+        "adxr": talib.ADXR(high, low, close, timeperiod),
+    }
+    for name, values in expected.items():
+        assert result[name].equals(pl.Series(name, values)), name
+
+
+@pytest.mark.parametrize("matype", [0, 1, 3])
+def test_macd_all_eq(df_ohlc: pl.DataFrame, matype: int):
+    result = df_ohlc.select(
+        plta.macd_all(fastperiod=3, slowperiod=10, signalperiod=4, matype=matype).alias("m")
+    ).unnest("m")
+    assert result.columns == plta.MACD_FIELDS
+    expected = df_ohlc.select(
+        plta.macdext(
+            fastperiod=3,
+            slowperiod=10,
+            signalperiod=4,
+            fastmatype=matype,
+            slowmatype=matype,
+            signalmatype=1,
+        ).alias("macd"),
+        plta.apo(fastperiod=3, slowperiod=10, matype=matype).alias("apo"),
+        plta.ppo(fastperiod=3, slowperiod=10, matype=matype).alias("ppo"),
+        plta.ma(timeperiod=3, matype=matype).alias("fast_ma"),
+        plta.ma(timeperiod=10, matype=matype).alias("slow_ma"),
+    ).unnest("macd")
+    assert result.equals(expected.select(plta.MACD_FIELDS))
+
+
+def test_macd_all_macd_fields(df_ohlc: pl.DataFrame):
+    result = df_ohlc.select(
+        plta.macd_all(3, 10, 16, fields=["macdhist", "macd"]).alias("m")
+    ).unnest("m")
+    expected = df_ohlc.select(plta.macd(fastperiod=3, slowperiod=10, signalperiod=16).alias("m"))
+    assert result.equals(expected.unnest("m").select("macdhist", "macd"))
+
+
+def test_macd_all_specs(df_ohlc: pl.DataFrame):
+    specs = [(3, 10, 4, 1), (3, 20, 5, 1), (20, 3, 4, 0)]
+    result = df_ohlc.select(
+        plta.macd_all(specs=specs, macdfix=[2, 9], fields=["macd", "macdhist", "fast_ma"]).alias(
+            "m"
+        )
+    ).unnest("m")
+    expected = []
+    for fast, slow, signal, matype in specs:
+        macd = plta.macdext(
+            fastperiod=fast,
+            slowperiod=slow,
+            signalperiod=signal,
+            fastmatype=matype,
+            slowmatype=matype,
+            signalmatype=1,
+        )
+        suffix = f"{fast}_{slow}_{signal}_{matype}"
+        expected += [
+            macd.struct.field("macd").alias(f"macd_{suffix}"),
+            macd.struct.field("macdhist").alias(f"macdhist_{suffix}"),
+            plta.ma(timeperiod=min(fast, slow), matype=matype).alias(f"fast_ma_{suffix}"),
+        ]
+    for signal in [2, 9]:
+        macd = plta.macdfix(signalperiod=signal)
+        expected += [
+            macd.struct.field("macd").alias(f"macd_fix_{signal}"),
+            macd.struct.field("macdhist").alias(f"macdhist_fix_{signal}"),
+        ]
+    expected = df_ohlc.select(expected)
+    assert result.drop("fast_ma_fix_2", "fast_ma_fix_9").equals(expected)
+    assert result["fast_ma_fix_2"].equals(result["fast_ma_fix_9"], check_names=False)
+    with pytest.raises(ValueError):
+        plta.macd_all(specs=[(1, 10, 4, 1)])
+    with pytest.raises(ValueError):
+        plta.macd_all(specs=[])
+
+
+@pytest.mark.parametrize("matype", [0, 1])
+def test_stoch_all_eq(df_ohlc: pl.DataFrame, matype: int):
+    kwargs = dict(fastk_period=5, fastd_period=3, fastd_matype=matype)
+    result = df_ohlc.select(
+        plta.stoch_all(
+            slowk_period=3,
+            slowk_matype=matype,
+            slowd_period=4,
+            slowd_matype=matype,
+            willr_period=7,
+            rsi_period=6,
+            **kwargs,
+        ).alias("s")
+    ).unnest("s")
+    assert result.columns == plta.STOCH_FIELDS
+    expected = df_ohlc.select(
+        plta.stoch(
+            fastk_period=5, slowk_period=3, slowk_matype=matype, slowd_period=4, slowd_matype=matype
+        ).alias("stoch"),
+        plta.stochf(**kwargs).alias("stochf"),
+        plta.willr(timeperiod=7).alias("willr"),
+        plta.stochrsi(timeperiod=6, **kwargs)
+        .struct.rename_fields(["stochrsi_fastk", "stochrsi_fastd"])
+        .alias("stochrsi"),
+    ).unnest("stoch", "stochf", "stochrsi")
+    assert result.equals(expected.select(plta.STOCH_FIELDS))
+
+
+def test_stoch_all_nan_fallback(df_ohlc: pl.DataFrame):
+    df = df_ohlc.with_columns(
+        pl.when(pl.int_range(0, pl.len()) == 20)
+        .then(float("nan"))
+        .otherwise(pl.col("high"))
+        .cast(df_ohlc["high"].dtype)
+        .alias("high")
+    )
+    result = df.select(plta.stoch_all(fields=["willr", "fastk"]).alias("s")).unnest("s")
+    expected = df.select(plta.willr().alias("willr"), plta.stochf().struct.field("fastk"))
+    assert result.equals(expected)
+
+
+@pytest.mark.parametrize("timeperiod", [3, 14])
+def test_linreg_all_eq(df_ohlc: pl.DataFrame, timeperiod: int):
+    result = df_ohlc.select(plta.linreg_all(timeperiod=timeperiod).alias("lr")).unnest("lr")
+    assert result.columns == plta.LINREG_FIELDS
+    expected = df_ohlc.select(
+        plta.linearreg(timeperiod=timeperiod).alias("linearreg"),
+        plta.linearreg_slope(timeperiod=timeperiod).alias("linearreg_slope"),
+        plta.linearreg_intercept(timeperiod=timeperiod).alias("linearreg_intercept"),
+        plta.linearreg_angle(timeperiod=timeperiod).alias("linearreg_angle"),
+        plta.tsf(timeperiod=timeperiod).alias("tsf"),
+    )
+    assert result.equals(expected)
+
+
+def test_linreg_all_fit_extras(df_ohlc: pl.DataFrame):
+    timeperiod = 7
+    result = df_ohlc.select(
+        plta.linreg_all(timeperiod=timeperiod, fields=["r2", "resid_std"]).alias("lr")
+    ).unnest("lr")
+    close = df_ohlc["close"].cast(pl.Float64).to_numpy()
+    # least squares fit of every window at once, centred on the window means
+    x = np.arange(timeperiod, dtype=float) - (timeperiod - 1) / 2
+    y = np.lib.stride_tricks.sliding_window_view(close, timeperiod)
+    y = y - y.mean(axis=1, keepdims=True)
+    slope = y @ x / (x @ x)
+    r2 = (y @ x) ** 2 / ((x @ x) * (y**2).sum(axis=1))
+    resid_std = (y - slope[:, None] * x).std(axis=1)
+    assert result["r2"][timeperiod - 1 :].to_numpy() == pytest.approx(r2, rel=1e-9)
+    assert result["resid_std"][timeperiod - 1 :].to_numpy() == pytest.approx(
+        resid_std, rel=1e-9, abs=1e-9
+    )
+    assert result.slice(0, timeperiod - 1).select(pl.all().is_nan().all()).row(0) == (True, True)
+
+
+@pytest.mark.parametrize("matype", [0, 3])
+def test_volatility_all_eq(df_ohlc: pl.DataFrame, matype: int):
+    result = df_ohlc.select(
+        plta.volatility_all(
+            atr_periods=[1, 5, 14],
+            band_periods=[5, 10],
+            nbdevs=[(2.0, 2.0), (1.5, 1.0)],
+            matype=matype,
+        ).alias("v")
+    ).unnest("v")
+    expected = [plta.trange().alias("trange")]
+    for p in [1, 5, 14]:
+        expected.append(plta.atr(timeperiod=p).alias(f"atr_{p}"))
+    for p in [1, 5, 14]:
+        expected.append(plta.natr(timeperiod=p).alias(f"natr_{p}"))
+    bands = {
+        (p, up, dn): plta.bbands(timeperiod=p, nbdevup=up, nbdevdn=dn, matype=matype)
+        for p in [5, 10]
+        for up, dn in [(2.0, 2.0), (1.5, 1.0)]
+    }
+    for p in [5, 10]:
+        expected.append(bands[(p, 2.0, 2.0)].struct.field("middleband").alias(f"middleband_{p}"))
+    for p in [5, 10]:
+        expected.append(bands[(p, 2.0, 2.0)].struct.field("upperband").alias(f"upperband_{p}_2"))
+        expected.append(bands[(p, 1.5, 1.0)].struct.field("upperband").alias(f"upperband_{p}_1.5"))
+    for p in [5, 10]:
+        expected.append(bands[(p, 2.0, 2.0)].struct.field("lowerband").alias(f"lowerband_{p}_2"))
+        expected.append(bands[(p, 1.5, 1.0)].struct.field("lowerband").alias(f"lowerband_{p}_1"))
+    for p in [5, 10]:
+        expected.append(plta.stddev(timeperiod=p).alias(f"stddev_{p}"))
+    for p in [5, 10]:
+        expected.append(plta.var(timeperiod=p).alias(f"var_{p}"))
+    assert result.equals(df_ohlc.select(expected))
+
+
+def test_volatility_all_fields(df_ohlc: pl.DataFrame):
+    result = df_ohlc.select(
+        plta.volatility_all(atr_periods=[3], fields=["natr", "atr"], out_dtype="f32").alias("v")
+    ).unnest("v")
+    assert dict(result.schema) == {"natr_3": pl.Float32, "atr_3": pl.Float32}
+    with pytest.raises(ValueError):
+        plta.volatility_all(fields=["atr", "adx"])
+
+
+@pytest.mark.parametrize("func", ["ema", "kama", "rsi", "sum", "trix"])
+def test_sweep_eq(df_ohlc: pl.DataFrame, func: str):
+    timeperiods = [2, 5, 9, 14]
+    result = df_ohlc.select(plta.sweep(func, timeperiods).alias("sweep"))
+    assert result.schema["sweep"] == pl.Array(pl.Float64, len(timeperiods))
+    for j, timeperiod in enumerate(timeperiods):
+        got = result.select(pl.col("sweep").arr.to_list().list.get(j)).to_series()
+        expected = df_ohlc.select(getattr(plta, func)(timeperiod=timeperiod)).to_series()
+        assert got.equals(expected)
+
+
+def test_sweep_variants(df_ohlc: pl.DataFrame):
+    result = df_ohlc.select(
+        pl.col("close").ta.ema_sweep(range(2, 6)).alias("ema"),
+        pl.col("close").ta.sweep("ema", range(2, 6)).alias("sweep"),
+        plta.sma_sweep([3, 4], out_dtype="f32").alias("sma"),
+    )
+    assert result["ema"].equals(result["sweep"], check_names=False)
+    assert result.schema["sma"] == pl.Array(pl.Float32, 2)
+    with pytest.raises(ValueError):
+        plta.sweep("macd", [3])
+
+
+@pytest.mark.parametrize("func", ["sma", "wma", "max", "mom", "rocp"])
+def test_range_stable_eq(df_ohlc: pl.DataFrame, func: str):
+    result = df_ohlc.select(
+        getattr(plta, func)(timeperiod=10, last_n=5).alias("last"),
+        getattr(plta, func)(timeperiod=10, start=20, end=30).alias("range"),
+        getattr(plta, func)(timeperiod=10).alias("full"),
+    )
+    assert result["last"].null_count() == len(result) - 5
+    assert result["last"].tail(5).to_list() == pytest.approx(result["full"].tail(5).to_list())
+    assert result["range"].null_count() == len(result) - 10
+    assert result["range"].slice(20, 10).to_list() == pytest.approx(
+        result["full"].slice(20, 10).to_list()
+    )
+
+
+@pytest.mark.parametrize("func", ["ema", "rsi", "kama"])
+def test_range_warmup(df_ohlc: pl.DataFrame, func: str):
+    lookback = abstract.Function(func.upper(), timeperiod=5).lookback
+    result = df_ohlc.select(getattr(plta, func)(timeperiod=5, last_n=3, warmup=10)).to_series()
+    expected = df_ohlc.tail(3 + lookback + 10).select(getattr(plta, func)(timeperiod=5))
+    assert result.tail(3).equals(expected.to_series().tail(3), check_names=False)
+    assert result.head(len(result) - 3).null_count() == len(result) - 3
+    # the default warmup leaves history before it a weight below 1e-8 (WARMUP_TOLERANCE),
+    # so values match those over the full input to about that, not bit for bit
+    default = df_ohlc.select(getattr(plta, func)(timeperiod=5, last_n=3)).to_series()
+    full = df_ohlc.select(getattr(plta, func)(timeperiod=5)).to_series()
+    assert default.tail(3).to_list() == pytest.approx(full.tail(3).to_list(), rel=1e-6)
+
+
+def test_range_invalid_args():
+    # warmup only applies to a range, the range and by= paths have no TA-Lib engine
+    with pytest.raises(ValueError):
+        plta.ema(timeperiod=5, warmup=10)
+    with pytest.raises(ValueError):
+        plta.mom(timeperiod=5, warmup=10)
+    with pytest.raises(ValueError):
+        plta.sma(timeperiod=5, last_n=3, engine="talib")
+    with pytest.raises(ValueError):
+        plta.rsi(timeperiod=5, agg="last", engine="talib")
+    with pytest.raises(ValueError):
+        plta.ema(timeperiod=5, by="symbol", engine="talib")
+    with pytest.raises(ValueError):
+        plta.wma(timeperiod=pl.col("period"), engine="talib")
+
+
+@pytest.mark.parametrize("func", ["sma", "ema", "rsi", "mom"])
+def test_agg_last(df_symbols: pl.DataFrame, func: str):
+    out = df_symbols.group_by("symbol", maintain_order=True).agg(
+        getattr(plta, func)(timeperiod=5, agg="last").alias("last")
+    )
+    assert out.schema["last"] == pl.Float64
+    expected = (
+        df_symbols.with_columns(getattr(plta, func)(timeperiod=5).over("symbol").alias("last"))
+        .group_by("symbol", maintain_order=True)
+        .agg(pl.col("last").last())
+    )
+    assert out["last"].to_list() == pytest.approx(expected["last"].to_list())
+    with pytest.raises(ValueError):
+        getattr(plta, func)(timeperiod=5, agg="first")
+
+
+@pytest.mark.parametrize("name", plta.get_functions())
+def test_lookback_eq(name: str):
+    assert plta.lookback(name) == abstract.Function(name.upper()).lookback
+    warmup = plta.warmup(name)
+    assert warmup is None or warmup >= plta.lookback(name)
+
+
+def test_lookback_params():
+    assert plta.lookback("macd", fastperiod=12, slowperiod=26, signalperiod=9) == 33
+    assert plta.lookback("bbands", timeperiod=20, matype=1) == 19
+    assert plta.warmup("sma", timeperiod=20) == plta.lookback("sma", timeperiod=20)
+    assert plta.warmup("ema", timeperiod=20) > plta.lookback("ema", timeperiod=20)
+    assert plta.warmup("obv") is None
+    with pytest.raises(ValueError):
+        plta.lookback("sma", period=20)
+    with pytest.raises(ValueError):
+        plta.lookback("not_a_function")
+
+
+@pytest.mark.parametrize("name, depth", [("ema", 1), ("dema", 2), ("tema", 3), ("t3", 6)])
+@pytest.mark.parametrize("timeperiod", [2, 5, 30])
+def test_warmup_cascade_weight(name: str, depth: int, timeperiod: int):
+    # weight `depth` cascaded EMAs leave to the rows before the warmup: fewer than `depth`
+    # of the rows since then were taken in by a stage
+    alpha = 2 / (timeperiod + 1)
+
+    def remaining(rows: int) -> float:
+        return sum(
+            math.comb(rows, j) * alpha**j * (1 - alpha) ** (rows - j) for j in range(depth)
+        )
+
+    rows = plta.warmup(name, timeperiod=timeperiod) - plta.lookback(name, timeperiod=timeperiod)
+    assert remaining(rows) <= 1e-8 < remaining(rows - 1)
+
+
+def test_scan_with_warmup(df_symbols: pl.DataFrame, tmp_path):
+    df = df_symbols.with_columns(pl.int_range(pl.len()).over("symbol").alias("date"))
+    path = tmp_path / "bars.parquet"
+    df.write_parquet(path)
+    spec = {"sma": ("sma", {"timeperiod": 5}), "mom": ("mom", {"timeperiod": 3})}
+    result = plta.scan_with_warmup(path, spec, start=30, end=40).collect()
+    expected = (
+        df.sort("symbol", "date")
+        .with_columns(
+            plta.sma(timeperiod=5).over("symbol").alias("sma"),
+            plta.mom(timeperiod=3).over("symbol").alias("mom"),
+        )
+        .filter(pl.col("date").is_between(30, 40))
+    )
+    assert result.select(expected.columns).shape == expected.shape
+    assert result["sma"].to_list() == pytest.approx(expected["sma"].to_list())
+    assert result["mom"].equals(expected["mom"])
+    assert plta.scan_with_warmup(df.lazy(), spec, start=30, end=30, by=None).collect().height == 3
+
+
+@pytest.mark.parametrize("func", ["sqrt", "ln", "add", "avgprice", "wclprice"])
+def test_elementwise_nulls(df_ohlc: pl.DataFrame, func: str):
+    df = df_ohlc.with_columns(
+        pl.when(pl.int_range(pl.len()) % 7 == 3).then(None).otherwise(pl.col(c)).alias(c)
+        for c in ["open", "close", "high"]
+    )
+    result = df.select(getattr(plta, func)().alias("expr"))["expr"]
+    assert result.is_null().to_list() == [i % 7 == 3 for i in range(df.height)]
+    # chunked input gives the same values as one chunk
+    chunked = pl.concat([df.head(17), df.tail(df.height - 17)], rechunk=False)
+    assert chunked["close"].n_chunks() == 2
+    assert chunked.select(getattr(plta, func)().alias("expr"))["expr"].equals(result)
+
+
+def test_elementwise_broadcast(df_ohlc: pl.DataFrame):
+    result = df_ohlc.select(pl.col("close").ta.add(pl.lit(1.0)).alias("expr"))["expr"]
+    expected = df_ohlc["close"].cast(pl.Float64) + 1.0
+    assert result.equals(expected, check_names=False)
+    # elementwise functions stay per row under a window
+    df = df_ohlc.with_columns(pl.int_range(pl.len()).mod(2).alias("g"))
+    over = df.select(plta.sqrt().over("g").alias("expr"))["expr"]
+    assert over.equals(df.select(plta.sqrt().alias("expr"))["expr"])
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        "max",
+        "min",
+        "maxindex",
+        "minindex",
+        "minmax",
+        "minmaxindex",
+        "midpoint",
+        "midprice",
+        "willr",
+        "aroon",
+        "aroonosc",
+    ],
+)
+@pytest.mark.parametrize("timeperiod", [2, 14, 252, 1000])
+def test_rolling_extreme_engine_eq(df_with_close: pl.DataFrame, func: str, timeperiod: int):
+    # a 0.1 step random walk: long trends and many equal extremes
+    df = df_with_close.with_columns(
+        (pl.col("close") + pl.int_range(pl.len()) % 3 / 10).alias("high"),
+        (pl.col("close") - pl.int_range(pl.len()) % 4 / 10).alias("low"),
+    )
+    row = pl.int_range(pl.len())
+    leading_nulls = df.with_columns(pl.when(row >= 3).then(pl.all()))
+    inner_nan = df.with_columns(pl.when(row != 500).then(pl.all()).otherwise(float("nan")))
+    for data in [df, leading_nulls, inner_nan]:
+        native = data.select(getattr(plta, func)(timeperiod=timeperiod).alias("expr"))
+        expected = data.select(
+            getattr(plta, func)(timeperiod=timeperiod, engine="talib").alias("expr")
+        )
+        assert native.equals(expected)
+
+
+@pytest.mark.parametrize("func", ["max", "min"])
+def test_extreme_multi_eq(df_with_close: pl.DataFrame, func: str):
+    df = df_with_close.with_columns(
+        pl.when(pl.int_range(pl.len()) >= 3).then(pl.col("close")).alias("close")
+    )
+    timeperiods = [55, 2, 10, 20, 20, 64, 252, 1000]
+    result = df.select(getattr(plta, f"{func}_multi")(timeperiods, real=pl.col("close")))
+    assert result.to_series().dtype == pl.Array(pl.Float64, len(timeperiods))
+    values = result.to_series().arr.to_list()
+    for j, timeperiod in enumerate(timeperiods):
+        got = values.list.get(j)
+        expected = getattr(talib, func.upper())(df["close"].to_numpy(), timeperiod=timeperiod)
+        assert got.equals(pl.Series(expected), check_names=False)
+    talib_engine = df.select(
+        getattr(pl.col("close").ta, f"{func}_multi")(timeperiods, engine="talib")
+    )
+    assert result.equals(talib_engine)
+    f32 = df.select(pl.col("close").ta.max_multi([3, 4], out_dtype="f32")).to_series()
+    assert f32.dtype == pl.Array(pl.Float32, 2)
+    with pytest.raises(ValueError):
+        plta.max_multi([])
+
+
+@pytest.mark.parametrize("func", ["sum", "sma", "var", "stddev"])
+def test_prefix_multi_eq(df_with_close: pl.DataFrame, func: str):
+    df = df_with_close.with_columns(
+        pl.when(pl.int_range(pl.len()) >= 3).then(pl.col("close") + 5000.0).alias("close")
+    )
+    close = df["close"].to_numpy()
+    timeperiods = [2, 3, 14, 20, 252, 1000]
+    kwargs = {"nbdev": 2.0} if func in ("var", "stddev") else {}
+    result = df.select(getattr(pl.col("close").ta, f"{func}_multi")(timeperiods, **kwargs))
+    assert result.to_series().dtype == pl.Array(pl.Float64, len(timeperiods))
+    values = result.to_series().arr.to_list()
+    for j, timeperiod in enumerate(timeperiods):
+        got = values.list.get(j).to_numpy()
+        expected = getattr(talib, func.upper())(close, timeperiod=timeperiod, **kwargs)
+        assert (np.isnan(got) == np.isnan(expected)).all()
+        if func in ("sum", "sma"):
+            scale = talib.SMA(np.abs(close), timeperiod) * (timeperiod if func == "sum" else 1)
+        else:
+            scale = talib.SMA(close * close, timeperiod)
+        if func == "stddev":
+            got, expected = (got / 2.0) ** 2, (expected / 2.0) ** 2
+        assert np.nanmax(np.abs(got - expected) / scale) <= plta.PREFIX_TOLERANCE
+    talib_engine = df.select(
+        getattr(plta, f"{func}_multi")(timeperiods, engine="talib", **kwargs)
+    ).to_series()
+    for j, timeperiod in enumerate(timeperiods):
+        expected = getattr(talib, func.upper())(close, timeperiod=timeperiod, **kwargs)
+        got = talib_engine.arr.to_list().list.get(j)
+        assert got.equals(pl.Series(expected), check_names=False)
+    with pytest.raises(ValueError):
+        plta.sma_multi([])
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        "max",
+        "min",
+        "midpoint",
+        "midprice",
+        "willr",
+        "mom",
+        "roc",
+        "rocp",
+        "rocr",
+        "rocr100",
+        "linearreg",
+        "linearreg_angle",
+        "linearreg_intercept",
+        "linearreg_slope",
+        "tsf",
+    ],
+)
+@pytest.mark.parametrize("timeperiod", [14, 1000])
+def test_parallel_chunks_eq(func: str, timeperiod: int):
+    # long enough to be split into chunks, with leading nulls
+    n = 5 * plta.PARALLEL_MIN_ROWS + 17
+    close = np.cumsum(np.random.randint(-10, 12, size=n) / 10.0) + 5000.0
+    close[:3] = np.nan
+    high = close + np.random.randint(0, 12, size=n) / 10.0
+    low = close - np.random.randint(0, 12, size=n) / 10.0
+    df = pl.DataFrame({"high": high, "low": low, "close": close}).fill_nan(None)
+    result = df.select(getattr(plta, func)(timeperiod=timeperiod)).to_series()
+    abstract_func = getattr(abstract, func.upper())
+    expected = abstract_func(
+        {"high": high, "low": low, "close": close}, timeperiod=timeperiod
+    )
+    assert result.equals(pl.Series(expected), check_names=False)
+
+
+@pytest.mark.parametrize(
+    "func, tolerance",
+    [
+        ("sma", 1e-11),
+        ("wma", 1e-8),
+        ("trima", 1e-11),
+        ("var", 1e-12),
+        ("stddev", 1e-12),
+        ("correl", 1e-11),
+    ],
+)
+@pytest.mark.parametrize("timeperiod", [14, 1000])
+def test_parallel_chunks_close(func: str, tolerance: float, timeperiod: int):
+    # running sums restart in each chunk: close to TA-Lib, exact with engine="talib"
+    n = 5 * plta.PARALLEL_MIN_ROWS + 17
+    close = np.cumsum(np.random.randint(-10, 12, size=n) / 10.0) + 5000.0
+    close[:3] = np.nan
+    high = close + np.random.randint(0, 12, size=n) / 10.0
+    low = close - np.random.randint(0, 12, size=n) / 10.0
+    prices = {"high": high, "low": low, "close": close}
+    df = pl.DataFrame(prices).fill_nan(None)
+    expected = getattr(abstract, func.upper())(prices, timeperiod=timeperiod)
+    got = df.select(getattr(plta, func)(timeperiod=timeperiod)).to_series().to_numpy()
+    assert (np.isnan(got) == np.isnan(expected)).all()
+    scale = np.fmax.accumulate(np.abs(close))
+    if func == "var":
+        scale = scale**2
+    elif func == "stddev":
+        # compare the variances, a standard deviation near zero amplifies the rounding
+        got, expected, scale = got**2, expected**2, scale**2
+    elif func == "correl":
+        # a window with almost no variance swings its correlation
+        std = df.select(
+            pl.col("high").rolling_std(timeperiod, ddof=0)
+            * pl.col("low").rolling_std(timeperiod, ddof=0)
+        )
+        scale = np.fmax.accumulate(np.abs(high)) * np.fmax.accumulate(np.abs(low))
+        scale = scale / std.to_series().to_numpy()
+    assert np.nanmax(np.abs(got - expected) / scale) <= tolerance
+    talib_engine = df.select(
+        getattr(plta, func)(timeperiod=timeperiod, engine="talib")
+    ).to_series()
+    assert talib_engine.equals(pl.Series(expected), check_names=False)
+
+
+@pytest.mark.parametrize(
+    "func", ["cdldoji", "cdlengulfing", "cdlhammer", "cdlmorningstar"]
+)
+def test_parallel_chunks_cdl(func: str):
+    n = 5 * plta.PARALLEL_MIN_ROWS + 17
+    close = np.cumsum(np.random.randint(-10, 12, size=n) / 10.0) + 5000.0
+    open = np.roll(close, 1) + np.random.randint(-5, 6, size=n) / 10.0
+    open[0] = close[0]
+    high = np.fmax(open, close) + np.random.randint(0, 12, size=n) / 10.0
+    low = np.fmin(open, close) - np.random.randint(0, 12, size=n) / 10.0
+    prices = {"open": open, "high": high, "low": low, "close": close}
+    df = pl.DataFrame(prices)
+    expected = getattr(abstract, func.upper())(prices)
+    got = df.select(getattr(plta, func)()).to_series().to_numpy()
+    # a bar can only flip when a range is within rounding of a candle average
+    assert (got != expected).sum() <= 2
+    talib_engine = df.select(getattr(plta, func)(engine="talib")).to_series()
+    assert talib_engine.equals(pl.Series(expected), check_names=False)
+
+
+@pytest.mark.parametrize("func", ["ema", "rsi", "atr", "obv", "ad", "adosc"])
+def test_scan_eq(func: str):
+    # long enough to run as a parallel scan, with leading nulls
+    n = 5 * plta.PARALLEL_MIN_ROWS + 17
+    close = np.cumsum(np.random.randint(-10, 12, size=n) / 10.0) + 5000.0
+    close[:3] = np.nan
+    high = close + np.random.randint(0, 12, size=n) / 10.0
+    low = close - np.random.randint(0, 12, size=n) / 10.0
+    volume = np.random.randint(1, 1000, size=n).astype(float)
+    prices = {"high": high, "low": low, "close": close, "volume": volume}
+    df = pl.DataFrame(prices).fill_nan(None)
+    expected = getattr(abstract, func.upper())(prices)
+    got = df.select(getattr(plta, func)()).to_series().to_numpy()
+    assert (np.isnan(got) == np.isnan(expected)).all()
+    if func == "ema":
+        scale = np.fmax.accumulate(np.abs(close))
+    elif func == "atr":
+        prev_close = np.roll(close, 1)
+        tr = np.fmax(high - low, np.fmax(np.abs(prev_close - high), np.abs(prev_close - low)))
+        scale = np.fmax.accumulate(tr)
+    elif func == "rsi":
+        # average gain + average loss is Wilder's smoothing of |change|
+        change = np.abs(np.diff(close, prepend=np.nan))
+        avg = np.full(n, np.nan)
+        avg[17] = change[4:18].mean()
+        for i in range(18, n):
+            avg[i] = (avg[i - 1] * 13 + change[i]) / 14
+        scale = 100 * np.fmax.accumulate(change) / avg
+    else:
+        scale = np.cumsum(np.where(np.isnan(close), 0.0, volume))
+    assert np.nanmax(np.abs(got - expected) / scale) <= plta.SCAN_TOLERANCE
+    talib_engine = df.select(getattr(plta, func)(engine="talib")).to_series()
+    assert talib_engine.equals(pl.Series(expected), check_names=False)